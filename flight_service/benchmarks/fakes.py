@@ -0,0 +1,134 @@
+"""
+Stand-ins used by the load tests so they run without a Selenium grid or a
+Redis server.
+"""
+import fnmatch
+import threading
+import time
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal
+
+from domain.models import SearchParams, FlightResults, Flight, Flights
+from infrastructure.scrappers.base import Scrapper
+
+
+class LatencyScrapper(Scrapper):
+    """
+    Dummy scrapper that sleeps ``latency`` seconds per scrape (a stand-in for
+    the browser session) and returns ``outbound`` x ``returns`` flights.
+    """
+
+    name = 'Benchmark'
+
+    def __init__(self, latency: float = 0.2, outbound: int = 3, returns: int = 5):
+        self.latency = latency
+        self.outbound = outbound
+        self.returns = returns
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_flights(self, search_params: SearchParams) -> FlightResults | None:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return make_flight_results(search_params, self.outbound, self.returns)
+
+
+def make_flight_results(
+    search_params: SearchParams, outbound: int, returns: int
+) -> FlightResults:
+    def _flight(date: datetime, index: int) -> Flight:
+        departure = dt_time(hour=(6 + index) % 24, minute=(index * 7) % 60)
+        duration = timedelta(minutes=60 + (index * 13) % 240)
+        landing = (datetime.combine(date, departure) + duration).time()
+        return Flight(
+            date=date,
+            departure_time=departure,
+            landing_time=landing,
+            price=Decimal(150_000 + (index * 37_351) % 900_000),
+            flight_time=duration,
+        )
+
+    return_date = search_params.return_date or search_params.departure
+    return FlightResults(results=[
+        Flights(
+            outbound_flight=_flight(search_params.departure, index),
+            return_flights=[_flight(return_date, index * returns + r) for r in range(returns)]
+        )
+        for index in range(outbound)
+    ])
+
+
+class FakeRedis:
+    """
+    In-process subset of the redis-py client used by flight_service
+    repositories (strings with expiry, lists, pub/sub publish and key
+    patterns). Thread safe; values are stored exactly as redis-py with
+    ``decode_responses=True`` would return them.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._data: dict[str, object] = {}
+        self._expires: dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._clock = clock
+        self.published: list[tuple[str, str]] = []
+
+    def _alive(self, key: str) -> bool:
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= self._clock():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def get(self, key: str):
+        with self._lock:
+            return self._data.get(key) if self._alive(key) else None
+
+    def set(self, key: str, value, ex: int = None, nx: bool = False):
+        with self._lock:
+            if nx and self._alive(key):
+                return None
+            self._data[key] = value if isinstance(value, (str, bytes)) else str(value)
+            if ex is not None:
+                self._expires[key] = self._clock() + ex
+            else:
+                self._expires.pop(key, None)
+            return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            removed = 0
+            for key in keys:
+                if self._alive(key):
+                    removed += 1
+                self._data.pop(key, None)
+                self._expires.pop(key, None)
+            return removed
+
+    def keys(self, pattern: str = '*') -> list[str]:
+        with self._lock:
+            return [key for key in list(self._data) if self._alive(key) and fnmatch.fnmatchcase(key, pattern)]
+
+    def expire(self, key: str, seconds: int) -> bool:
+        with self._lock:
+            if not self._alive(key):
+                return False
+            self._expires[key] = self._clock() + seconds
+            return True
+
+    def lpush(self, key: str, *values) -> int:
+        with self._lock:
+            items = self._data.setdefault(key, [])
+            for value in values:
+                items.insert(0, value)
+            return len(items)
+
+    def publish(self, channel: str, message) -> int:
+        self.published.append((channel, message))
+        return 0
+
+    def flushdb(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
@@ -0,0 +1,298 @@
+"""
+Load tests for the flight_service REST app.
+
+The app runs in-process on an ephemeral port with a latency-configurable
+fake scrapper, so no Selenium grid is needed. The cache is the memory
+repository, Redis (default) or both tiered; Redis is an in-process
+stand-in unless a real one is given with ``--redis-url``. Scenarios:
+
+* ``cache_hit``   every request repeats one warmed-up search
+* ``cache_miss``  every request is a search nobody asked for before
+* ``coalesced``   bursts of identical concurrent searches on a cold key
+
+Usage (from flight_service/)::
+
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --scenario cache_miss --latency 0.5
+    python -m benchmarks.load_test --save-baseline
+    python -m benchmarks.load_test --compare          # exit 1 on regression
+"""
+import argparse
+import http.client
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+os.environ.setdefault('OTEL_SDK_DISABLED', 'true')
+
+from werkzeug.serving import make_server  # noqa: E402
+
+import presentations.rest.main as rest  # noqa: E402
+from benchmarks.fakes import FakeRedis, LatencyScrapper  # noqa: E402
+from domain.search.google import GoogleFlightsFinder  # noqa: E402
+from infrastructure.publishers.memory.publisher import create_memory_publisher  # noqa: E402
+from infrastructure.repositories.memory.repository import FlightsMemoryRepository  # noqa: E402
+from infrastructure.repositories.redis.repository import RedisRepository  # noqa: E402
+from infrastructure.repositories.tiered.repository import TieredFlightsRepository  # noqa: E402
+
+BASELINES_PATH = Path(__file__).with_name('baselines.json')
+SCENARIOS = ('cache_hit', 'cache_miss', 'coalesced')
+AIRLINE = 'benchmark'
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    requests: int
+    concurrency: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    throughput_rps: float
+    error_rate: float
+    scrapes: int
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(
+    scenario: str, latencies: list[float], errors: int, elapsed: float,
+    concurrency: int, scrapes: int
+) -> ScenarioResult:
+    ordered = sorted(latencies)
+    return ScenarioResult(
+        scenario=scenario,
+        requests=len(latencies),
+        concurrency=concurrency,
+        p50_ms=round(percentile(ordered, 50) * 1000, 2),
+        p95_ms=round(percentile(ordered, 95) * 1000, 2),
+        p99_ms=round(percentile(ordered, 99) * 1000, 2),
+        throughput_rps=round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        error_rate=round(errors / len(latencies), 4) if latencies else 0.0,
+        scrapes=scrapes,
+    )
+
+
+def search_body(offset: int = 0) -> dict:
+    departure = date(2030, 1, 1) + timedelta(days=offset % 3000)
+    return {
+        'airline': AIRLINE,
+        'search_params': {
+            'origin': 'BOG',
+            'destination': ('MDE', 'CTG', 'CLO', 'SMR')[offset // 3000 % 4],
+            'departure': departure.isoformat(),
+            'return_date': (departure + timedelta(days=7)).isoformat(),
+        }
+    }
+
+
+class BenchmarkServer:
+    """The REST app wired to fakes and served from a background thread."""
+
+    def __init__(self, repository: str, latency: float, redis_url: Optional[str] = None):
+        self.scrapper = LatencyScrapper(latency=latency)
+        self.redis = self._redis_client(redis_url)
+        self.memory = FlightsMemoryRepository()
+        redis_repository = RedisRepository(client_factory=lambda database=0: self.redis)
+        self._tiered = TieredFlightsRepository(
+            l1=FlightsMemoryRepository(record_stats=False), l2=redis_repository
+        )
+        self._saved = rest.dependencies, rest.config
+        rest.dependencies = {
+            'scrappers': {AIRLINE: self.scrapper},
+            'finders': {AIRLINE: GoogleFlightsFinder},
+            'repositories': {
+                'memory': lambda: self.memory,
+                'redis': lambda: redis_repository,
+                'tiered': lambda: self._tiered,
+            },
+            'publishers': {'memory': create_memory_publisher},
+        }
+        rest.config = {
+            'Default': {'repository': repository, 'publisher': 'memory', 'airline': AIRLINE}
+        }
+        self._server = make_server('127.0.0.1', 0, rest.create_app(), threaded=True)
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @staticmethod
+    def _redis_client(redis_url: Optional[str]):
+        if not redis_url:
+            return FakeRedis()
+        import redis
+        return redis.Redis.from_url(redis_url, decode_responses=True)
+
+    def flush(self) -> None:
+        self.redis.flushdb()
+        self.memory.clear()
+        self._tiered.l1.clear()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        rest.dependencies, rest.config = self._saved
+
+
+def post(port: int, body: dict) -> tuple[float, bool]:
+    payload = json.dumps(body)
+    started = time.perf_counter()
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    try:
+        connection.request(
+            'POST', '/get_flights', payload, {'Content-Type': 'application/json'}
+        )
+        response = connection.getresponse()
+        response.read()
+        ok = 200 <= response.status < 300
+    except OSError:
+        ok = False
+    finally:
+        connection.close()
+    return time.perf_counter() - started, ok
+
+
+def drive(
+    port: int, bodies: Callable[[int], dict], requests: int, concurrency: int
+) -> tuple[list[float], int, float]:
+    """Closed-loop load: ``concurrency`` clients issue ``requests`` in total."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda i: post(port, bodies(i)), range(requests)))
+    elapsed = time.perf_counter() - started
+    latencies = [latency for latency, _ in outcomes]
+    errors = sum(1 for _, ok in outcomes if not ok)
+    return latencies, errors, elapsed
+
+
+def run_scenario(
+    server: BenchmarkServer, scenario: str, requests: int, concurrency: int
+) -> ScenarioResult:
+    server.flush()
+    scrapes_before = server.scrapper.calls
+
+    if scenario == 'cache_hit':
+        post(server.port, search_body())
+        scrapes_before = server.scrapper.calls
+        latencies, errors, elapsed = drive(server.port, lambda i: search_body(), requests, concurrency)
+    elif scenario == 'cache_miss':
+        offsets = itertools.count(1)
+        lock = threading.Lock()
+
+        def unique(_):
+            with lock:
+                return search_body(next(offsets))
+        latencies, errors, elapsed = drive(server.port, unique, requests, concurrency)
+    elif scenario == 'coalesced':
+        latencies, errors, elapsed = [], 0, 0.0
+        for burst in range(max(requests // concurrency, 1)):
+            server.flush()
+            burst_latencies, burst_errors, burst_elapsed = drive(
+                server.port, lambda i, b=burst: search_body(b), concurrency, concurrency
+            )
+            latencies += burst_latencies
+            errors += burst_errors
+            elapsed += burst_elapsed
+    else:
+        raise ValueError(f'Unknown scenario {scenario}')
+
+    return summarize(
+        scenario, latencies, errors, elapsed, concurrency,
+        server.scrapper.calls - scrapes_before
+    )
+
+
+def compare(results: list[ScenarioResult], baselines: dict, tolerance: float) -> list[str]:
+    """Regressions beyond ``tolerance`` (0.2 == 20%) against stored baselines."""
+    regressions = []
+    for result in results:
+        baseline = baselines.get(result.scenario)
+        if not baseline:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+            if getattr(result, metric) > baseline[metric] * (1 + tolerance):
+                regressions.append(
+                    f'{result.scenario}.{metric}: {getattr(result, metric)} > '
+                    f'{baseline[metric]} (+{tolerance:.0%})'
+                )
+        if result.throughput_rps < baseline['throughput_rps'] * (1 - tolerance):
+            regressions.append(
+                f'{result.scenario}.throughput_rps: {result.throughput_rps} < '
+                f'{baseline["throughput_rps"]} (-{tolerance:.0%})'
+            )
+        if result.error_rate > baseline['error_rate']:
+            regressions.append(
+                f'{result.scenario}.error_rate: {result.error_rate} > {baseline["error_rate"]}'
+            )
+    return regressions
+
+
+def print_table(results: list[ScenarioResult]) -> None:
+    header = f"{'scenario':<12}{'reqs':>7}{'conc':>6}{'p50 ms':>10}{'p95 ms':>10}" \
+             f"{'p99 ms':>10}{'rps':>10}{'errors':>8}{'scrapes':>9}"
+    print(header)
+    for r in results:
+        print(
+            f'{r.scenario:<12}{r.requests:>7}{r.concurrency:>6}{r.p50_ms:>10}{r.p95_ms:>10}'
+            f'{r.p99_ms:>10}{r.throughput_rps:>10}{r.error_rate:>8.2%}{r.scrapes:>9}'
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scenario', choices=(*SCENARIOS, 'all'), default='all')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.2, help='seconds per fake scrape')
+    parser.add_argument('--repository', choices=('redis', 'memory', 'tiered'), default='redis')
+    parser.add_argument('--redis-url', help='use a real Redis instead of the in-process stand-in')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--compare', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--output', help='write results as JSON to this file')
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    scenarios = SCENARIOS if args.scenario == 'all' else (args.scenario,)
+    with BenchmarkServer(args.repository, args.latency, args.redis_url) as server:
+        results = [
+            run_scenario(server, scenario, args.requests, args.concurrency)
+            for scenario in scenarios
+        ]
+    print_table(results)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps([asdict(r) for r in results], indent=2))
+
+    baselines = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    if args.save_baseline:
+        baselines.update({r.scenario: asdict(r) for r in results})
+        BASELINES_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+        print(f'Baselines saved to {BASELINES_PATH}')
+    if args.compare:
+        regressions = compare(results, baselines, args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
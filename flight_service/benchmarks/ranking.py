@@ -0,0 +1,89 @@
+"""
+Ranking benchmark: time every ``rank`` mode over synthetic result sets.
+
+``score`` and ``pareto`` run ``domain.ranking.rank``; ``cheapest`` runs
+``domain.combinations.cheapest_round_trips``, as ``/get_flights`` does. The
+pair arrays are built once per result set and cached with it (as they are
+for searches served from the in-process cache), so the build is timed
+separately from the ranking itself; ``cheapest`` does not use them.
+
+Usage (from flight_service/)::
+
+    python -m benchmarks.ranking
+    python -m benchmarks.ranking --pairs 10000 100000 --runs 50
+"""
+import argparse
+import math
+import statistics
+import sys
+import time
+from datetime import date, time as dt_time
+from typing import Optional
+
+from benchmarks.fakes import make_flight_results
+from domain.combinations import cheapest_round_trips
+from domain.models import SearchParams
+from domain.ranking import pair_arrays, rank
+from domain.results_query import ResultsIndex, ResultsQuery, RankMode, RankWeights
+
+
+def make_results(pairs: int):
+    """A result set with about ``pairs`` outbound x return combinations."""
+    side = max(int(math.sqrt(pairs)), 1)
+    results = make_flight_results(
+        SearchParams(origin='BOG', destination='MDE', departure=date(2030, 1, 1),
+                     return_date=date(2030, 1, 8)),
+        outbound=side, returns=max(pairs // side, 1)
+    )
+    results.index = ResultsIndex.build(results.results)
+    return results
+
+
+def measure(pairs: int, runs: int, mode: RankMode, limit: int) -> dict:
+    results = make_results(pairs)
+    started = time.perf_counter()
+    arrays = pair_arrays(results)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    query = ResultsQuery(
+        rank=mode, limit=limit,
+        weights=RankWeights(preferred_departure=dt_time(9, 0)),
+    )
+    ranker = cheapest_round_trips if mode == RankMode.CHEAPEST else rank
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        ranker(results, query)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        'pairs': len(arrays),
+        'mode': mode.value,
+        'build_ms': round(build_ms, 2),
+        'p50_ms': round(statistics.median(timings), 3),
+        'p95_ms': round(timings[min(int(len(timings) * 0.95), len(timings) - 1)], 3),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--pairs', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--runs', type=int, default=30)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=10.0,
+                        help='exit 1 when a p50 exceeds this')
+    args = parser.parse_args(argv)
+
+    print(f"{'pairs':>8}{'mode':>10}{'build ms':>10}{'p50 ms':>9}{'p95 ms':>9}")
+    over_budget = False
+    for pairs in args.pairs:
+        for mode in RankMode:
+            row = measure(pairs, args.runs, mode, args.limit)
+            over_budget |= row['p50_ms'] > args.budget_ms
+            print(f"{row['pairs']:>8}{row['mode']:>10}{row['build_ms']:>10}"
+                  f"{row['p50_ms']:>9}{row['p95_ms']:>9}")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
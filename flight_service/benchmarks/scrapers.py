@@ -0,0 +1,116 @@
+"""
+Scraper replay benchmark: extraction speed and correctness on recorded pages.
+
+Replays every cassette (see ``infrastructure.replay``) through its
+provider's scrapper, with each extraction mode, and reports rows per
+second and any row that differs from what the live run extracted. Needs
+no network: pages are parsed DOM-only by default, or loaded in a local
+headless browser from a local server with ``--engine browser``.
+
+The DOM engine counts the WebDriver commands each extraction issues;
+``grid ms`` adds ``--round-trip-ms`` per command to estimate the cost
+against a remote Selenium grid, where those round trips dominate.
+
+Record new cassettes by setting ``[Replay] record_dir`` and running searches.
+
+Usage (from flight_service/)::
+
+    python -m benchmarks.scrapers
+    python -m benchmarks.scrapers --cassettes /tmp/recorded --runs 20
+    python -m benchmarks.scrapers --extraction webdriver --round-trip-ms 10
+    python -m benchmarks.scrapers --engine browser --browser firefox
+"""
+import argparse
+import sys
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+from bootstrap import get_available_scrappers
+from infrastructure.replay.cassette import discover
+from infrastructure.replay.harness import browser_pages, dom_pages, replay
+from infrastructure.scrappers.base import Scrapper
+
+CASSETTES = Path(__file__).parent / 'cassettes'
+
+
+@contextmanager
+def local_browser(name: str):
+    from selenium import webdriver
+
+    if name == 'chrome':
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless=new')
+        driver = webdriver.Chrome(options=options)
+    else:
+        options = webdriver.FirefoxOptions()
+        options.add_argument('-headless')
+        driver = webdriver.Firefox(options=options)
+    try:
+        yield driver
+    finally:
+        driver.quit()
+
+
+def run(
+    cassettes: Path,
+    runs: int,
+    pages=dom_pages,
+    extractions: tuple[str, ...] = Scrapper.EXTRACTION_MODES,
+    round_trip_ms: float = 0.0,
+) -> int:
+    scrappers = get_available_scrappers()
+    failed = False
+    print(f"{'cassette':<24}{'step':<10}{'extraction':<13}{'rows':>5}{'trips':>7}"
+          f"{'ms':>8}{'grid ms':>9}{'rows/s':>9}  ok")
+    for cassette in discover(cassettes):
+        scrapper = scrappers.get(cassette.provider)
+        if scrapper is None:
+            print(f'{cassette.path.name:<24}no scrapper for {cassette.provider!r}')
+            failed = True
+            continue
+        if not scrapper.replayable:
+            print(f'{cassette.path.name:<24}{cassette.provider!r} cannot replay cassettes')
+            failed = True
+            continue
+        for extraction in extractions:
+            scrapper.extraction = extraction
+            report = replay(scrapper, cassette, pages=pages, runs=runs)
+            for step in report.steps:
+                # what the extraction would cost against a remote grid
+                grid_ms = step.seconds * 1000 + (step.round_trips or 0) * round_trip_ms
+                trips = '-' if step.round_trips is None else step.round_trips
+                print(f'{cassette.path.name:<24}{step.step:<10}{extraction:<13}{step.rows:>5}'
+                      f'{trips:>7}{step.seconds * 1000:>8.2f}{grid_ms:>9.1f}'
+                      f'{step.rows / grid_ms * 1000 if grid_ms else 0:>9.0f}  '
+                      f"{'yes' if not step.mismatches else 'NO'}")
+                for mismatch in step.mismatches:
+                    print(f'    {mismatch}')
+            failed |= not report.ok
+    return 1 if failed else 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--cassettes', type=Path, default=CASSETTES)
+    parser.add_argument('--runs', type=int, default=5,
+                        help='extractions per page; the best one is reported')
+    parser.add_argument('--engine', choices=('dom', 'browser'), default='dom')
+    parser.add_argument('--browser', choices=('firefox', 'chrome'), default='firefox')
+    parser.add_argument('--extraction', nargs='+', choices=Scrapper.EXTRACTION_MODES,
+                        default=list(Scrapper.EXTRACTION_MODES))
+    parser.add_argument('--round-trip-ms', type=float, default=5.0,
+                        help='WebDriver round trip to the grid, added per command (DOM engine)')
+    args = parser.parse_args(argv)
+
+    if args.engine == 'dom':
+        return run(args.cassettes, args.runs, extractions=tuple(args.extraction),
+                   round_trip_ms=args.round_trip_ms)
+    with local_browser(args.browser) as driver:
+        return run(args.cassettes, args.runs, pages=partial(browser_pages, driver=driver),
+                   extractions=tuple(args.extraction))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
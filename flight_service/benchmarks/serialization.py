@@ -0,0 +1,103 @@
+"""
+Serialization benchmark: encoding and compressing large result sets.
+
+For each payload size it times, and measures the peak memory of, the
+encoders a ``/get_flights`` response can go through:
+
+* ``flask``      the list of dicts through Flask's JSON provider (the old path)
+* ``bytes``      ``serialize_results``, the body cached for the fast path
+* ``stream``     ``stream_results`` chunks, consumed as a server would
+* ``gzip``/``br`` the streamed chunks compressed on the fly
+
+Usage (from flight_service/)::
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --flights 1000 50000 --runs 5
+"""
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date
+from typing import Callable, Optional
+
+from flask import Flask
+
+from benchmarks.fakes import make_flight_results
+from domain.models import SearchParams, FlightResults
+from presentations.rest.compression import compress_chunks, supported_encodings
+from utils.response_payload import serialize_results, stream_results, flight_count
+
+RETURNS_PER_OUTBOUND = 9
+
+
+def make_results(flights: int) -> FlightResults:
+    """About ``flights`` flights: outbound options with 9 returns each."""
+    return make_flight_results(
+        SearchParams(origin='BOG', destination='MDE', departure=date(2030, 1, 1),
+                     return_date=date(2030, 1, 8)),
+        outbound=max(flights // (RETURNS_PER_OUTBOUND + 1), 1),
+        returns=RETURNS_PER_OUTBOUND,
+    )
+
+
+def _consume(chunks) -> int:
+    # what a WSGI server does with a streamed body: write and forget
+    return sum(len(chunk) for chunk in chunks)
+
+
+def encoders(results: FlightResults) -> dict[str, Callable[[], int]]:
+    app = Flask(__name__)
+
+    def flask_json() -> int:
+        with app.app_context():
+            return len(app.json.response([r.to_dict() for r in results.results]).get_data())
+
+    methods = {
+        'flask': flask_json,
+        'bytes': lambda: len(serialize_results(results)),
+        'stream': lambda: _consume(stream_results(results)),
+    }
+    for encoding in supported_encodings():
+        methods[encoding] = (
+            lambda encoding=encoding: _consume(compress_chunks(stream_results(results), encoding))
+        )
+    return methods
+
+
+def measure(method: Callable[[], int], runs: int) -> dict:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        size = method()
+        timings.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    method()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'p50_ms': round(statistics.median(timings), 2),
+        'peak_mb': round(peak / 1024 / 1024, 2),
+        'bytes': size,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--flights', type=int, nargs='+', default=[1_000, 5_000, 10_000, 50_000])
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'flights':>8}{'method':>8}{'p50 ms':>10}{'peak MB':>10}{'bytes':>12}")
+    for flights in args.flights:
+        results = make_results(flights)
+        for name, method in encoders(results).items():
+            row = measure(method, args.runs)
+            print(f"{flight_count(results):>8}{name:>8}{row['p50_ms']:>10}"
+                  f"{row['peak_mb']:>10}{row['bytes']:>12}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
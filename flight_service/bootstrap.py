@@ -3,10 +3,14 @@ import inspect
 import logging
 
 from domain.search.base import FlightsFinder
+from infrastructure.admission.controller import create_admission_controller
+from infrastructure.circuit_breaker.breaker import create_circuit_breaker
 from infrastructure.publishers.kafka.publisher import  create_kafka_publisher
 from infrastructure.publishers.redis.publisher import  create_redis_publisher
 from infrastructure.repositories.memory.repository import  create_memory_repository
 from infrastructure.repositories.redis.repository import create_redis_repository
+from infrastructure.repositories.tiered.repository import create_tiered_repository
+from infrastructure.replay.recorder import create_scrape_recorder
 from infrastructure.scrappers.base import Scrapper, DriverFactory
 
 logger = logging.Logger(__name__)
@@ -21,6 +25,9 @@ def bootstrap():
         'finders': get_available_finders(),
         'repositories': get_available_repositories(),
         'publishers' : get_available_publishers(),
+        'admission': create_admission_controller(),
+        'circuit_breaker': create_circuit_breaker(),
+        'recorder': create_scrape_recorder(),
     }
     return dependencies
 
@@ -106,6 +113,7 @@ def get_available_repositories():
     return {
         'redis': create_redis_repository,
         'memory': create_memory_repository,
+        'tiered': create_tiered_repository,
     }
 
 
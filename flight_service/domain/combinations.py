@@ -0,0 +1,182 @@
+"""
+Top-k round trips without building the outbound x return product.
+
+Every constraint either concerns one leg or pairs a return flight with the
+single outbound it belongs to, so it is checked while each option's return
+list is scanned once. The k best round trips are then merged lazily: a heap
+holds the best remaining combination of every option and each pop only
+advances that option's own heap of returns, so the cost is
+O(flights + k log options) instead of O(outbound x returns).
+"""
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Iterator, Optional
+
+from domain.models import Flight, Flights, FlightResults
+from domain.results_query import (
+    ResultsPage, ResultsQuery, SortKey, TripConstraints, project_flight
+)
+
+
+@dataclass(frozen=True)
+class RoundTrip:
+    outbound: Flight
+    return_flight: Optional[Flight]
+
+    @property
+    def price(self) -> Decimal:
+        return self.outbound.price + (self.return_flight.price if self.return_flight else 0)
+
+    @property
+    def travel_time(self) -> timedelta:
+        travel_time = self.outbound.flight_time
+        if self.return_flight:
+            travel_time += self.return_flight.flight_time
+        return travel_time
+
+
+def departs_at(flight: Flight) -> datetime:
+    return datetime.combine(flight.date.date(), flight.departure_time)
+
+
+def lands_at(flight: Flight) -> datetime:
+    return departs_at(flight) + flight.flight_time
+
+
+def _leg_allowed(flight: Flight, constraints: TripConstraints, query: ResultsQuery) -> bool:
+    if query.max_duration is not None and flight.flight_time > query.max_duration:
+        return False
+    if constraints.same_day_arrival and lands_at(flight).date() != flight.date.date():
+        return False
+    return True
+
+
+def _outbound_allowed(flight: Flight, constraints: TripConstraints, query: ResultsQuery) -> bool:
+    if query.departure_from is not None and flight.departure_time < query.departure_from:
+        return False
+    if query.departure_to is not None and flight.departure_time > query.departure_to:
+        return False
+    if query.max_price is not None and flight.price > query.max_price:
+        return False
+    if (
+        constraints.max_travel_time is not None
+        and flight.flight_time > constraints.max_travel_time
+    ):
+        return False
+    return _leg_allowed(flight, constraints, query)
+
+
+def _cost(trip: RoundTrip, objective: SortKey) -> tuple:
+    if objective == SortKey.DURATION:
+        return trip.travel_time, trip.price
+    return trip.price, trip.travel_time
+
+
+def _valid_returns(
+    option: Flights, constraints: TripConstraints, query: ResultsQuery
+) -> list[Flight]:
+    outbound = option.outbound_flight
+    earliest_return = (
+        lands_at(outbound) + constraints.min_stay if constraints.min_stay else None
+    )
+    max_return_time = (
+        constraints.max_travel_time - outbound.flight_time
+        if constraints.max_travel_time is not None else None
+    )
+    valid = []
+    for flight in option.return_flights or []:
+        if not _leg_allowed(flight, constraints, query):
+            continue
+        if earliest_return is not None and departs_at(flight) < earliest_return:
+            continue
+        if max_return_time is not None and flight.flight_time > max_return_time:
+            continue
+        if query.max_price is not None and outbound.price + flight.price > query.max_price:
+            continue
+        valid.append(flight)
+    return valid
+
+
+def _trips_by_cost(
+    outbound: Flight, returns: list[Flight], objective: SortKey
+) -> Iterator[tuple[tuple, RoundTrip]]:
+    """An option's round trips in cost order, popping only what is consumed."""
+    heap = [
+        (_cost(trip, objective), position, trip)
+        for position, trip in enumerate(RoundTrip(outbound, flight) for flight in returns)
+    ]
+    heapq.heapify(heap)
+    while heap:
+        cost, _, trip = heapq.heappop(heap)
+        yield cost, trip
+
+
+def best_round_trips(
+    flights: list[Flights],
+    k: Optional[int],
+    query: Optional[ResultsQuery] = None,
+    objective: SortKey = SortKey.PRICE,
+) -> tuple[list[RoundTrip], int]:
+    """
+    The ``k`` best round trips by ``objective`` (price or total travel
+    time, the other breaking ties) meeting ``query``'s filters and trip
+    constraints, and how many combinations are valid. Options without
+    return flights count as one-way trips.
+    """
+    if objective == SortKey.DEPARTURE:
+        raise ValueError('Round trips are ranked by price or duration')
+    query = query or ResultsQuery()
+    constraints = query.constraints
+
+    merge, total = [], 0
+    for index, option in enumerate(flights):
+        outbound = option.outbound_flight
+        if not _outbound_allowed(outbound, constraints, query):
+            continue
+        if not option.return_flights:
+            one_way = RoundTrip(outbound, None)
+            trips = iter([(_cost(one_way, objective), one_way)])
+            total += 1
+        else:
+            returns = _valid_returns(option, constraints, query)
+            if not returns:
+                continue
+            total += len(returns)
+            trips = _trips_by_cost(outbound, returns, objective)
+        cost, trip = next(trips)
+        merge.append((cost, index, trip, trips))
+    heapq.heapify(merge)
+
+    best = []
+    while merge and (k is None or len(best) < k):
+        _, index, trip, trips = merge[0]
+        best.append(trip)
+        following = next(trips, None)
+        if following is None:
+            heapq.heappop(merge)
+        else:
+            heapq.heapreplace(merge, (following[0], index, following[1], trips))
+    return best, total
+
+
+def cheapest_round_trips(results: FlightResults, query: ResultsQuery) -> ResultsPage:
+    """``best_round_trips`` in the ``Flights.flatten_results`` item shape."""
+    objective = query.sort if query.sort == SortKey.DURATION else SortKey.PRICE
+    trips, total = best_round_trips(results.results or [], query.limit, query, objective)
+    return ResultsPage(
+        items=[
+            {
+                'outbound': project_flight(trip.outbound, query.fields),
+                'return_in': (
+                    project_flight(trip.return_flight, query.fields)
+                    if trip.return_flight else []
+                ),
+                'total_price': str(trip.price),
+                'travel_time': str(trip.travel_time.total_seconds()),
+            }
+            for trip in trips
+        ],
+        total=total,
+    )
@@ -0,0 +1,26 @@
+class NoFlightsFoundError(ValueError):
+    """The provider answered, but there are no flights for the search."""
+
+
+class ScrapeRejectedError(Exception):
+    """A scrape was not started because the provider is saturated.
+
+    ``status_code`` is 429 when the admission queue is full and 503 when the
+    request waited past its deadline; ``retry_after`` is in seconds.
+    """
+
+    def __init__(self, provider: str, reason: str, status_code: int, retry_after: int):
+        super().__init__(f'Scrape for {provider} rejected: {reason}')
+        self.provider = provider
+        self.reason = reason
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class ProviderUnavailableError(Exception):
+    """The provider's circuit is open; the scrape was skipped."""
+
+    def __init__(self, provider: str, retry_after: int):
+        super().__init__(f'Circuit open for {provider}')
+        self.provider = provider
+        self.retry_after = retry_after
@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta, time
 from decimal import Decimal
+from enum import Enum
 from functools import cached_property
-from typing import Optional, ClassVar
+from typing import Optional, ClassVar, TYPE_CHECKING
 
 from typing_extensions import Self
 
+if TYPE_CHECKING:
+    from domain.results_query import ResultsIndex
+
 
 @dataclass
 class SearchParams:
@@ -132,6 +136,44 @@ class FlightResult:
     pass
 
 
+class SearchOutcome(str, Enum):
+    """Why a search produced no results; negative cache entries store it."""
+    NO_FLIGHTS = 'no_flights'
+    PROVIDER_ERROR = 'provider_error'
+    CIRCUIT_OPEN = 'circuit_open'
+
+
+class CacheStatus(str, Enum):
+    HIT = 'hit'
+    NEGATIVE_HIT = 'negative_hit'
+    MISS = 'miss'
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    A result set already serialized as the REST response body. ``version``
+    is the body format, ``digest`` identifies the content and
+    ``expires_at`` (epoch seconds) is when the cache entry goes away.
+    """
+    body: bytes
+    version: str
+    digest: str
+    expires_at: Optional[int] = None
+
+    @property
+    def etag(self) -> str:
+        """Strong validator, unquoted: changes with the content and the format."""
+        return f'{self.version}-{self.digest}'
+
+    def max_age(self, now: float) -> int:
+        return max(int(self.expires_at - now), 0) if self.expires_at else 0
+
+
 @dataclass
 class FlightResults:
     results: Optional[list[Flights]] = None
+    outcome: Optional[SearchOutcome] = None
+    cache_status: Optional[CacheStatus] = None
+    # sorted positions kept next to cached results, see domain.results_query
+    index: Optional['ResultsIndex'] = None
@@ -0,0 +1,205 @@
+"""
+Vectorized ranking of outbound x return pairs.
+
+The pairs of a result set are loaded once into NumPy arrays (price in
+cents, duration in minutes, outbound departure minute of day) and cached
+with the result set's ``ResultsIndex``, so ranking a cached search only
+runs array operations: filters are boolean masks, scores are weighted sums
+of min-max normalized criteria and the Pareto set (price vs. total travel
+time) is a sort plus a running minimum.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from domain.models import Flight, Flights, FlightResults
+from domain.results_query import (
+    ResultsPage, ResultsQuery, RankMode, RankWeights, project_flight
+)
+
+_PAIRS_KEY = 'pairs'
+_MINUTES_PER_DAY = 24 * 60
+
+
+@dataclass(frozen=True)
+class PairArrays:
+    """
+    One row per outbound x return pair. ``return_position`` indexes the
+    option's return flights and is -1 for options without them; the per-leg
+    return columns are 0 for those.
+    """
+    outbound_index: np.ndarray
+    return_position: np.ndarray
+    price_cents: np.ndarray
+    outbound_minutes: np.ndarray
+    return_minutes: np.ndarray
+    departure_minute: np.ndarray
+    # rows by price, then total duration; the Pareto front walks this order
+    price_order: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.outbound_index)
+
+    @property
+    def duration_minutes(self) -> np.ndarray:
+        return self.outbound_minutes + self.return_minutes
+
+    @classmethod
+    def from_flights(cls, flights: list[Flights]) -> 'PairArrays':
+        outbound = [option.outbound_flight for option in flights]
+        returns = [flight for option in flights for flight in option.return_flights or []]
+        counts = np.fromiter(
+            (len(option.return_flights or []) for option in flights),
+            dtype=np.int64, count=len(flights)
+        )
+        pair_counts = np.maximum(counts, 1)
+        outbound_index = np.repeat(np.arange(len(flights)), pair_counts)
+        # position of each pair inside its option, then in the flat return list
+        local = np.arange(len(outbound_index)) - np.repeat(
+            np.cumsum(pair_counts) - pair_counts, pair_counts
+        )
+        has_returns = counts[outbound_index] > 0
+        return_start = np.cumsum(counts) - counts
+        return_index = np.where(has_returns, return_start[outbound_index] + local, -1)
+
+        # a trailing 0 makes index -1 (no return flight) contribute nothing
+        return_price = np.append(_cents(returns), 0)
+        return_minutes = np.append(_minutes(returns), 0)
+        price_cents = _cents(outbound)[outbound_index] + return_price[return_index]
+        outbound_minutes = _minutes(outbound)[outbound_index]
+        return_minutes = return_minutes[return_index]
+        return cls(
+            outbound_index=outbound_index,
+            return_position=np.where(has_returns, local, -1),
+            price_cents=price_cents,
+            outbound_minutes=outbound_minutes,
+            return_minutes=return_minutes,
+            departure_minute=np.fromiter(
+                (f.departure_time.hour * 60 + f.departure_time.minute for f in outbound),
+                dtype=np.int32, count=len(outbound)
+            )[outbound_index],
+            price_order=np.lexsort((outbound_minutes + return_minutes, price_cents)),
+        )
+
+
+def _cents(flights: list[Flight]) -> np.ndarray:
+    return np.fromiter(
+        (int(f.price * 100) for f in flights), dtype=np.int64, count=len(flights)
+    )
+
+
+def _minutes(flights: list[Flight]) -> np.ndarray:
+    return np.fromiter(
+        (int(f.flight_time.total_seconds() // 60) for f in flights),
+        dtype=np.int32, count=len(flights)
+    )
+
+
+def pair_arrays(results: FlightResults) -> PairArrays:
+    """The result set's pairs, cached with its index when it has one."""
+    flights = results.results or []
+    if results.index is None:
+        return PairArrays.from_flights(flights)
+    pairs = results.index.derived.get(_PAIRS_KEY)
+    if pairs is None:
+        pairs = results.index.derived[_PAIRS_KEY] = PairArrays.from_flights(flights)
+    return pairs
+
+
+def filter_mask(pairs: PairArrays, query: ResultsQuery) -> np.ndarray:
+    mask = np.ones(len(pairs), dtype=bool)
+    if query.max_price is not None:
+        mask &= pairs.price_cents <= int(query.max_price * 100)
+    if query.departure_from is not None:
+        mask &= pairs.departure_minute >= _minute_of_day(query.departure_from)
+    if query.departure_to is not None:
+        mask &= pairs.departure_minute <= _minute_of_day(query.departure_to)
+    if query.max_duration is not None:
+        limit = query.max_duration.total_seconds() // 60
+        mask &= (pairs.outbound_minutes <= limit) & (pairs.return_minutes <= limit)
+    return mask
+
+
+def _minute_of_day(value) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _normalized(values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.float64)
+    if not len(values):
+        return values
+    low, high = values.min(), values.max()
+    if high == low:
+        return np.zeros_like(values)
+    return (values - low) / (high - low)
+
+
+def scores(pairs: PairArrays, weights: RankWeights, rows: np.ndarray) -> np.ndarray:
+    """Weighted sum of normalized criteria for ``rows``; lower is better."""
+    score = weights.price * _normalized(pairs.price_cents[rows])
+    score += weights.duration * _normalized(pairs.duration_minutes[rows])
+    if weights.preferred_departure is not None and weights.departure:
+        distance = np.abs(
+            pairs.departure_minute[rows] - _minute_of_day(weights.preferred_departure)
+        )
+        distance = np.minimum(distance, _MINUTES_PER_DAY - distance)
+        score += weights.departure * _normalized(distance)
+    return score
+
+
+def pareto_rows(pairs: PairArrays, mask: np.ndarray) -> np.ndarray:
+    """
+    Rows of ``mask`` not dominated on (price, total duration). Walking the
+    rows by price then duration, a pair is on the front when it is strictly
+    faster than every pair before it.
+    """
+    rows = pairs.price_order[mask[pairs.price_order]]
+    if not len(rows):
+        return rows
+    duration = pairs.duration_minutes[rows]
+    previous_best = np.minimum.accumulate(duration)
+    on_front = np.empty(len(rows), dtype=bool)
+    on_front[0] = True
+    on_front[1:] = duration[1:] < previous_best[:-1]
+    return rows[on_front]
+
+
+def top_k(score: np.ndarray, k: Optional[int]) -> np.ndarray:
+    """Positions of the ``k`` lowest scores, best first."""
+    if k is not None and k < len(score):
+        candidates = np.argpartition(score, k)[:k]
+        return candidates[np.argsort(score[candidates], kind='stable')]
+    return np.argsort(score, kind='stable')
+
+
+def rank(results: FlightResults, query: ResultsQuery) -> ResultsPage:
+    """
+    Best outbound x return pairs for ``query.rank``: every pair matching the
+    filters by score, or only the Pareto-optimal ones. Items follow the
+    ``Flights.flatten_results`` shape plus their ``score``.
+    """
+    flights = results.results or []
+    pairs = pair_arrays(results)
+    mask = filter_mask(pairs, query)
+    if query.rank == RankMode.PARETO:
+        rows = pareto_rows(pairs, mask)
+    else:
+        rows = np.flatnonzero(mask)
+
+    score = scores(pairs, query.weights, rows)
+    best = top_k(score, query.limit)
+    items = []
+    for position in best:
+        row = rows[position]
+        option = flights[pairs.outbound_index[row]]
+        return_position = pairs.return_position[row]
+        return_in = []
+        if return_position >= 0:
+            return_in = project_flight(option.return_flights[return_position], query.fields)
+        items.append({
+            'outbound': project_flight(option.outbound_flight, query.fields),
+            'return_in': return_in,
+            'score': round(float(score[position]), 4),
+        })
+    return ResultsPage(items=items, total=len(rows))
@@ -0,0 +1,238 @@
+import base64
+import binascii
+import hashlib
+from dataclasses import dataclass, field
+from datetime import time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+
+from domain.models import Flight, Flights, FlightResults
+
+FLIGHT_FIELDS = ('date', 'departure_time', 'landing_time', 'price', 'flight_time')
+
+
+class SortKey(str, Enum):
+    PRICE = 'price'
+    DURATION = 'duration'
+    DEPARTURE = 'departure'
+
+
+class RankMode(str, Enum):
+    """
+    Rank outbound x return pairs instead of listing options: by weighted
+    score or Pareto set (domain.ranking), or the k cheapest/fastest under
+    trip constraints (domain.combinations).
+    """
+    SCORE = 'score'
+    PARETO = 'pareto'
+    CHEAPEST = 'cheapest'
+
+
+@dataclass(frozen=True)
+class RankWeights:
+    price: float = 1.0
+    duration: float = 0.5
+    departure: float = 0.25
+    # departure weight only counts when a preferred outbound time is given
+    preferred_departure: Optional[time] = None
+
+
+@dataclass(frozen=True)
+class TripConstraints:
+    """
+    ``min_stay`` is measured from the outbound landing to the return
+    departure, ``max_travel_time`` bounds both legs together and
+    ``same_day_arrival`` drops legs landing the day after they depart.
+    """
+    min_stay: Optional[timedelta] = None
+    max_travel_time: Optional[timedelta] = None
+    same_day_arrival: bool = False
+
+
+def _flight_key(flight: Flight, sort: SortKey):
+    if sort == SortKey.PRICE:
+        return flight.price
+    if sort == SortKey.DURATION:
+        return flight.flight_time
+    return flight.departure_time
+
+
+def _option_key(option: Flights, sort: SortKey):
+    # price ranks an option by its cheapest round trip, the rest by the outbound
+    if sort == SortKey.PRICE and option.return_flights:
+        return option.outbound_flight.price + min(f.price for f in option.return_flights)
+    return _flight_key(option.outbound_flight, sort)
+
+
+@dataclass(frozen=True)
+class ResultsIndex:
+    """
+    Positions of the outbound options, and of each option's return flights,
+    in ascending order of every sort key. Built once per cached result set
+    so a query only walks positions instead of re-sorting flights.
+    """
+    options: dict[SortKey, tuple[int, ...]]
+    returns: dict[SortKey, tuple[tuple[int, ...], ...]]
+    # other per result set structures built on first use (ranking arrays)
+    derived: dict = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def build(cls, flights: list[Flights]) -> 'ResultsIndex':
+        options, returns = {}, {}
+        for sort in SortKey:
+            options[sort] = tuple(sorted(
+                range(len(flights)), key=lambda i: _option_key(flights[i], sort)
+            ))
+            returns[sort] = tuple(
+                tuple(sorted(
+                    range(len(option.return_flights or [])),
+                    key=lambda i, o=option: _flight_key(o.return_flights[i], sort)
+                ))
+                for option in flights
+            )
+        return cls(options=options, returns=returns)
+
+
+@dataclass
+class ResultsQuery:
+    """
+    Filters, order and page applied to a result set before serialization.
+
+    ``max_price`` bounds the round trip (outbound plus return),
+    ``departure_from``/``departure_to`` the outbound departure time and
+    ``max_duration`` every leg. Without ``sort`` results keep their cached
+    order.
+    """
+    max_price: Optional[Decimal] = None
+    departure_from: Optional[time] = None
+    departure_to: Optional[time] = None
+    max_duration: Optional[timedelta] = None
+    sort: Optional[SortKey] = None
+    descending: bool = False
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    fields: Optional[list[str]] = None
+    rank: Optional[RankMode] = None
+    weights: RankWeights = field(default_factory=RankWeights)
+    constraints: TripConstraints = field(default_factory=TripConstraints)
+
+    def __post_init__(self):
+        unknown = set(self.fields or []) - set(FLIGHT_FIELDS)
+        if unknown:
+            raise ValueError(f'Unknown fields: {", ".join(sorted(unknown))}')
+        if self.rank is not None and self.cursor is not None:
+            raise ValueError('Ranked results are not paginated, use limit')
+
+    @property
+    def is_empty(self) -> bool:
+        return self == ResultsQuery()
+
+    def fingerprint(self) -> str:
+        """Identifies the filters and order a cursor was issued for."""
+        parts = (
+            self.max_price, self.departure_from, self.departure_to,
+            self.max_duration, self.sort, self.descending,
+        )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()[:12]
+
+
+@dataclass
+class ResultsPage:
+    items: list[dict] = field(default_factory=list)
+    total: int = 0
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(offset: int, query: ResultsQuery) -> str:
+    raw = f'{offset}:{query.fingerprint()}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, query: ResultsQuery) -> int:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        offset, fingerprint = raw.split(':', 1)
+        offset = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Invalid cursor')
+    if fingerprint != query.fingerprint() or offset < 0:
+        raise ValueError('Cursor does not match the query')
+    return offset
+
+
+def _leg_matches(flight: Flight, query: ResultsQuery) -> bool:
+    return query.max_duration is None or flight.flight_time <= query.max_duration
+
+
+def _outbound_matches(flight: Flight, query: ResultsQuery) -> bool:
+    if query.departure_from is not None and flight.departure_time < query.departure_from:
+        return False
+    if query.departure_to is not None and flight.departure_time > query.departure_to:
+        return False
+    if query.max_price is not None and flight.price > query.max_price:
+        return False
+    return _leg_matches(flight, query)
+
+
+def project_flight(flight: Flight, fields: Optional[list[str]]) -> dict:
+    data = flight.to_dict()
+    return {name: data[name] for name in fields} if fields else data
+
+
+def _select(
+    option: Flights, return_order: tuple[int, ...], query: ResultsQuery
+) -> Optional[tuple[Flight, list[Flight]]]:
+    outbound = option.outbound_flight
+    if not _outbound_matches(outbound, query):
+        return None
+    return_flights = []
+    for position in return_order:
+        flight = option.return_flights[position]
+        if not _leg_matches(flight, query):
+            continue
+        if query.max_price is not None and outbound.price + flight.price > query.max_price:
+            continue
+        return_flights.append(flight)
+    if option.return_flights and not return_flights:
+        return None
+    return outbound, return_flights
+
+
+def _serialize(outbound: Flight, return_flights: list[Flight], fields) -> dict:
+    return {
+        'outbound': project_flight(outbound, fields),
+        'return_flights': [project_flight(flight, fields) for flight in return_flights],
+    }
+
+
+def apply_query(results: FlightResults, query: ResultsQuery) -> ResultsPage:
+    flights = results.results or []
+    if query.sort is not None:
+        index = results.index or ResultsIndex.build(flights)
+        order = index.options[query.sort]
+        return_orders = index.returns[query.sort]
+        if query.descending:
+            order = order[::-1]
+            return_orders = tuple(positions[::-1] for positions in return_orders)
+    else:
+        order = range(len(flights))
+        return_orders = tuple(
+            tuple(range(len(option.return_flights or []))) for option in flights
+        )
+
+    offset = decode_cursor(query.cursor, query) if query.cursor else 0
+    # filter on the flight objects, serialize only the requested page
+    selected = [
+        item for item in (
+            _select(flights[position], return_orders[position], query)
+            for position in order
+        )
+        if item is not None
+    ]
+    end = len(selected) if query.limit is None else offset + query.limit
+    return ResultsPage(
+        items=[_serialize(*item, query.fields) for item in selected[offset:end]],
+        total=len(selected),
+        next_cursor=encode_cursor(end, query) if end < len(selected) else None,
+    )
@@ -1,7 +1,15 @@
+import logging
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from domain.models import SearchParams, FlightResults
+from domain.exceptions import (
+    NoFlightsFoundError, ProviderUnavailableError, ScrapeRejectedError
+)
+from domain.models import (
+    SearchParams, FlightResults, SearchOutcome, CacheStatus, CachedResponse
+)
+
+logger = logging.getLogger(__name__)
 
 
 class FlightsFinder(ABC):
@@ -12,3 +20,50 @@ class FlightsFinder(ABC):
         Get flights based on search parameters
         """
         ...
+
+    def get_cached_response(self, search_params: SearchParams) -> Optional[CachedResponse]:
+        """Cached results already serialized as the response body, if any."""
+        return self._repository.get_cached_response(search_params)
+
+    def _get_cached_or_scrape(self, search_params: SearchParams) -> FlightResults:
+        """
+        Return cached results (positive or negative) or scrape and cache
+        the outcome. Empty and failed scrapes are cached with a short TTL so
+        impossible routes don't hit the Selenium grid on every request.
+        """
+        saved_results = self._repository.get_flight_results(search_params)
+        if saved_results and (saved_results.results or saved_results.outcome):
+            return saved_results
+
+        try:
+            flights = self._scrapper.get_flights(search_params)
+        except NoFlightsFoundError as e:
+            logger.info(f'No flights found: {e}')
+            flights = FlightResults(results=[], outcome=SearchOutcome.NO_FLIGHTS)
+        except ProviderUnavailableError as e:
+            # circuit open: answer right away instead of waiting on timeouts
+            logger.info(str(e))
+            return FlightResults(
+                results=[],
+                outcome=SearchOutcome.CIRCUIT_OPEN,
+                cache_status=CacheStatus.MISS
+            )
+        except ScrapeRejectedError:
+            # load shedding says nothing about the route itself
+            raise
+        except Exception as e:
+            # answered like the cached PROVIDER_ERROR that follows it
+            logger.exception(f'Scrape failed: {e}')
+            flights = None
+
+        if flights is None:
+            flights = FlightResults(results=[], outcome=SearchOutcome.PROVIDER_ERROR)
+
+        if flights.results:
+            self._repository.save_flight(flights, search_params)
+        else:
+            flights.outcome = flights.outcome or SearchOutcome.NO_FLIGHTS
+            self._repository.save_negative_result(search_params, flights.outcome)
+
+        flights.cache_status = CacheStatus.MISS
+        return flights
@@ -22,15 +22,7 @@ class GoogleFlightsFinder(FlightsFinder):
     def get_flights(self, search_params: SearchParams) -> Optional[FlightResults]:
         """
         Get flights from the scrapper and save them to the repository.
-        If flights are already saved, return them.
+        If flights (or a recent empty/failed outcome) are already saved,
+        return them.
         """
-        saved_results = self._repository.get_flight_results(search_params)
-        if saved_results.results:
-            return saved_results
-
-        flights = self._scrapper.get_flights(search_params)
-        if flights.results:
-            self._repository.save_flight(flights, search_params)
-            #self._publisher.publish(results)
-
-        return flights
\ No newline at end of file
+        return self._get_cached_or_scrape(search_params)
@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+from constants import config
+from domain.exceptions import ScrapeRejectedError
+from domain.models import SearchParams, FlightResults
+from infrastructure.admission.redis_slots import RedisSlots
+from infrastructure.scrappers.base import Scrapper
+from telemetry import get_meter
+
+logger = logging.getLogger(__name__)
+
+_meter = get_meter(__name__)
+if _meter:
+    _queue_depth = _meter.create_up_down_counter(
+        'admission.queue_depth', description='Scrapes waiting for a slot, by provider'
+    )
+    _wait_time = _meter.create_histogram(
+        'admission.wait_time', unit='s', description='Time spent waiting for a scrape slot'
+    )
+    _rejections = _meter.create_counter(
+        'admission.rejected', description='Scrapes shed by admission control, by reason'
+    )
+else:
+    _queue_depth = _wait_time = _rejections = None
+
+
+@dataclass
+class _ProviderState:
+    semaphore: threading.BoundedSemaphore
+    waiting: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class AdmissionController:
+    """
+    Bounds concurrent scrapes per provider on this worker and, when
+    ``global_slots`` is set, across every replica sharing the Selenium grid.
+
+    Requests beyond a provider's limit wait in a bounded queue; when the
+    queue is full they are rejected straight away (429) and when they wait
+    past ``queue_timeout`` they are rejected with 503.
+    """
+
+    def __init__(
+        self,
+        provider_limits: Optional[dict[str, int]] = None,
+        default_limit: int = 2,
+        queue_size: int = 10,
+        queue_timeout: float = 20,
+        retry_after: int = 5,
+        global_slots: Optional[RedisSlots] = None,
+    ):
+        self.provider_limits = provider_limits or {}
+        self.default_limit = default_limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.global_slots = global_slots
+        self._providers: dict[str, _ProviderState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, provider: str) -> _ProviderState:
+        with self._lock:
+            if provider not in self._providers:
+                limit = self.provider_limits.get(provider, self.default_limit)
+                self._providers[provider] = _ProviderState(
+                    semaphore=threading.BoundedSemaphore(limit)
+                )
+            return self._providers[provider]
+
+    def _reject(self, provider: str, reason: str, status_code: int) -> ScrapeRejectedError:
+        logger.warning(f'Shedding scrape for {provider}: {reason}')
+        if _rejections is not None:
+            _rejections.add(1, {'provider': provider, 'reason': reason})
+        return ScrapeRejectedError(provider, reason, status_code, self.retry_after)
+
+    def _enqueue(self, state: _ProviderState, provider: str, delta: int) -> None:
+        state.waiting += delta
+        if _queue_depth is not None:
+            _queue_depth.add(delta, {'provider': provider})
+
+    def queue_depth(self, provider: str) -> int:
+        return self._state(provider).waiting
+
+    def _wait_for_slot(self, state: _ProviderState, provider: str) -> None:
+        with state.lock:
+            if state.waiting >= self.queue_size:
+                raise self._reject(provider, 'queue_full', 429)
+            self._enqueue(state, provider, 1)
+        try:
+            acquired = state.semaphore.acquire(timeout=self.queue_timeout)
+        finally:
+            with state.lock:
+                self._enqueue(state, provider, -1)
+        if not acquired:
+            raise self._reject(provider, 'queue_timeout', 503)
+
+    @contextmanager
+    def admit(self, provider: str) -> Iterator[None]:
+        state = self._state(provider)
+        started = time.monotonic()
+        if not state.semaphore.acquire(blocking=False):
+            self._wait_for_slot(state, provider)
+
+        token = None
+        try:
+            if self.global_slots is not None:
+                remaining = max(self.queue_timeout - (time.monotonic() - started), 0)
+                token = self._acquire_global(provider, remaining)
+
+            if _wait_time is not None:
+                _wait_time.record(time.monotonic() - started, {'provider': provider})
+            yield
+        finally:
+            if token:
+                self._release_global(token)
+            state.semaphore.release()
+
+    def _acquire_global(self, provider: str, timeout: float) -> Optional[str]:
+        try:
+            token = self.global_slots.acquire(timeout)
+        except Exception as e:
+            # Redis being down must not take scraping down with it; the
+            # per-worker limit still applies.
+            logger.warning(f'Global admission unavailable, admitting locally: {e}')
+            return None
+        if token is None:
+            raise self._reject(provider, 'global_limit', 503)
+        return token
+
+    def _release_global(self, token: str) -> None:
+        try:
+            self.global_slots.release(token)
+        except Exception as e:
+            # the lease expires on its own
+            logger.warning(f'Could not release global admission slot: {e}')
+
+    def guard(self, provider: str, scrapper: Scrapper) -> Scrapper:
+        return AdmittedScrapper(provider, scrapper, self)
+
+
+class AdmittedScrapper(Scrapper):
+    """Scrapper decorator that runs every scrape inside an admission slot."""
+
+    def __init__(self, provider: str, scrapper: Scrapper, admission: AdmissionController):
+        self.provider = provider
+        self.scrapper = scrapper
+        self.admission = admission
+
+    def get_flights(self, search_params: SearchParams) -> FlightResults | None:
+        with self.admission.admit(self.provider):
+            return self.scrapper.get_flights(search_params)
+
+
+def _provider_limits() -> dict[str, int]:
+    prefix = 'Scrappers.'
+    return {
+        section[len(prefix):].lower(): config.getint(section, 'max_concurrency')
+        for section in config.sections()
+        if section.startswith(prefix) and config.has_option(section, 'max_concurrency')
+    }
+
+
+def create_admission_controller(
+    client_factory: Callable = None,
+) -> Optional[AdmissionController]:
+    if not config.getboolean('Admission', 'enabled', fallback=False):
+        return None
+
+    global_slots = None
+    global_limit = config.getint('Admission', 'global_limit', fallback=0)
+    if global_limit:
+        if client_factory is None:
+            from utils.connections.redis_client import get_redis_client
+            client_factory = get_redis_client
+        global_slots = RedisSlots(
+            client_factory=client_factory,
+            limit=global_limit,
+            lease_seconds=config.getint('Admission', 'lease_seconds', fallback=180),
+        )
+
+    return AdmissionController(
+        provider_limits=_provider_limits(),
+        default_limit=config.getint('Admission', 'provider_limit', fallback=2),
+        queue_size=config.getint('Admission', 'queue_size', fallback=10),
+        queue_timeout=config.getfloat('Admission', 'queue_timeout', fallback=20),
+        retry_after=config.getint('Admission', 'retry_after', fallback=5),
+        global_slots=global_slots,
+    )
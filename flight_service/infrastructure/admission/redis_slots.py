@@ -0,0 +1,67 @@
+import logging
+import time
+import uuid
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Slots are members of a sorted set scored by their lease expiry, so a worker
+# that dies mid-scrape only holds its slot until the lease runs out.
+_ACQUIRE_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local expires_at = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, expires_at, ARGV[4])
+    redis.call('EXPIRE', key, math.ceil(expires_at - now))
+    return 1
+end
+return 0
+"""
+
+
+class RedisSlots:
+    """Counting semaphore shared by every flight_service replica."""
+
+    def __init__(
+        self,
+        client_factory: Callable,
+        limit: int,
+        lease_seconds: int = 180,
+        poll_interval: float = 0.2,
+        key: str = 'admission:selenium',
+        clock: Callable[[], float] = time.time,
+    ):
+        self.client = client_factory()
+        self.limit = limit
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.key = key
+        self._clock = clock
+
+    def _try_acquire(self, token: str) -> bool:
+        now = self._clock()
+        return bool(self.client.eval(
+            _ACQUIRE_SCRIPT, 1, self.key,
+            now, self.limit, now + self.lease_seconds, token
+        ))
+
+    def acquire(self, timeout: float) -> Optional[str]:
+        """Wait up to ``timeout`` seconds for a slot; returns its token or None."""
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._try_acquire(token):
+                return token
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(self.poll_interval, remaining))
+
+    def release(self, token: str) -> None:
+        self.client.zrem(self.key, token)
+
+    def in_use(self) -> int:
+        return self.client.zcount(self.key, self._clock(), '+inf')
@@ -0,0 +1,212 @@
+import logging
+import math
+import time
+from enum import Enum
+from typing import Callable, Optional
+
+from constants import config
+from domain.exceptions import (
+    NoFlightsFoundError, ProviderUnavailableError, ScrapeRejectedError
+)
+from domain.models import SearchParams, FlightResults, SearchOutcome
+from infrastructure.circuit_breaker.stores import BreakerStore, RedisBreakerStore
+from infrastructure.scrappers.base import Scrapper
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreakerState(str, Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker driven by the error rate over a rolling
+    window. Once at least ``min_requests`` scrapes fall in the window and
+    ``failure_rate`` of them failed, the circuit opens; after
+    ``open_seconds`` a single probe is let through (half-open) and its
+    outcome closes or re-opens the circuit.
+
+    Store failures never block scraping: the breaker then admits everything.
+    """
+
+    def __init__(
+        self,
+        store: BreakerStore,
+        window_seconds: int = 120,
+        bucket_seconds: int = 10,
+        min_requests: int = 5,
+        failure_rate: float = 0.5,
+        open_seconds: int = 60,
+        probe_timeout: int = 90,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = store
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.min_requests = min_requests
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.probe_timeout = probe_timeout
+        self._clock = clock
+
+    def _buckets(self, now: float) -> list[int]:
+        current = int(now // self.bucket_seconds)
+        count = math.ceil(self.window_seconds / self.bucket_seconds)
+        return list(range(current - count + 1, current + 1))
+
+    @property
+    def _bucket_ttl(self) -> int:
+        return self.window_seconds + self.bucket_seconds
+
+    def state(self, provider: str) -> CircuitBreakerState:
+        state, _ = self.store.get_state(provider)
+        return CircuitBreakerState(state or CircuitBreakerState.CLOSED)
+
+    def error_rate(self, provider: str) -> float:
+        successes, failures = self.store.counts(provider, self._buckets(self._clock()))
+        total = successes + failures
+        return failures / total if total else 0.0
+
+    def retry_after(self, provider: str) -> int:
+        _, opened_at = self.store.get_state(provider)
+        return max(math.ceil(opened_at + self.open_seconds - self._clock()), 1)
+
+    def allow(self, provider: str) -> bool:
+        try:
+            state, opened_at = self.store.get_state(provider)
+            if state in (None, CircuitBreakerState.CLOSED):
+                return True
+            if self._clock() - opened_at < self.open_seconds:
+                return False
+            if not self.store.try_probe(provider, self.probe_timeout):
+                return False
+            self.store.set_state(provider, CircuitBreakerState.HALF_OPEN, opened_at)
+            logger.info(f'Circuit Breaker :: {provider} HALF-OPEN, probing')
+            return True
+        except Exception as e:
+            logger.warning(f'Circuit Breaker :: state unavailable for {provider}: {e}')
+            return True
+
+    def record_success(self, provider: str) -> None:
+        try:
+            now = self._clock()
+            # only the probe closes the circuit: a scrape admitted before it
+            # opened may still succeed while it is open
+            if self.state(provider) == CircuitBreakerState.HALF_OPEN:
+                self.store.reset(provider, self._buckets(now))
+                self.store.set_state(provider, CircuitBreakerState.CLOSED, 0)
+                self.store.release_probe(provider)
+                logger.warning(f'Circuit Breaker :: {provider} CLOSED')
+            self.store.record(provider, self._buckets(now)[-1], True, self._bucket_ttl)
+        except Exception as e:
+            logger.warning(f'Circuit Breaker :: could not record success for {provider}: {e}')
+
+    def record_failure(self, provider: str) -> None:
+        try:
+            now = self._clock()
+            self.store.record(provider, self._buckets(now)[-1], False, self._bucket_ttl)
+            state = self.state(provider)
+            if state == CircuitBreakerState.HALF_OPEN:
+                self._open(provider, now, 'probe failed')
+                return
+            if state == CircuitBreakerState.OPEN:
+                return
+            successes, failures = self.store.counts(provider, self._buckets(now))
+            total = successes + failures
+            if total >= self.min_requests and failures / total >= self.failure_rate:
+                self._open(provider, now, f'{failures}/{total} scrapes failed')
+        except Exception as e:
+            logger.warning(f'Circuit Breaker :: could not record failure for {provider}: {e}')
+
+    def release(self, provider: str) -> None:
+        """Give up a half-open probe whose outcome says nothing about the provider."""
+        try:
+            if self.state(provider) == CircuitBreakerState.HALF_OPEN:
+                self.store.release_probe(provider)
+        except Exception as e:
+            logger.warning(f'Circuit Breaker :: could not release probe for {provider}: {e}')
+
+    def _open(self, provider: str, now: float, reason: str) -> None:
+        self.store.set_state(provider, CircuitBreakerState.OPEN, now)
+        self.store.release_probe(provider)
+        logger.warning(f'Circuit Breaker :: {provider} OPENED ({reason})')
+
+    def order(self, providers: list[str]) -> list[str]:
+        """
+        Fallback order for fan-out searches: providers with an open circuit
+        are skipped, the rest are tried healthiest first (stable for ties).
+        """
+        available = [provider for provider in providers if self.is_available(provider)]
+        return sorted(available, key=self._error_rate_or_zero)
+
+    def is_available(self, provider: str) -> bool:
+        """Like ``allow`` but without claiming the half-open probe."""
+        try:
+            state, opened_at = self.store.get_state(provider)
+        except Exception:
+            return True
+        if state in (None, CircuitBreakerState.CLOSED):
+            return True
+        return self._clock() - opened_at >= self.open_seconds
+
+    def _error_rate_or_zero(self, provider: str) -> float:
+        try:
+            return self.error_rate(provider)
+        except Exception:
+            return 0.0
+
+    def guard(self, provider: str, scrapper: Scrapper) -> Scrapper:
+        return BreakerScrapper(provider, scrapper, self)
+
+
+class BreakerScrapper(Scrapper):
+    """Scrapper decorator that skips providers whose circuit is open."""
+
+    def __init__(self, provider: str, scrapper: Scrapper, breaker: CircuitBreaker):
+        self.provider = provider
+        self.scrapper = scrapper
+        self.breaker = breaker
+
+    def get_flights(self, search_params: SearchParams) -> FlightResults | None:
+        if not self.breaker.allow(self.provider):
+            raise ProviderUnavailableError(
+                self.provider, self.breaker.retry_after(self.provider)
+            )
+        try:
+            results = self.scrapper.get_flights(search_params)
+        except NoFlightsFoundError:
+            self.breaker.record_success(self.provider)
+            raise
+        except ScrapeRejectedError:
+            self.breaker.release(self.provider)
+            raise
+        except Exception:
+            self.breaker.record_failure(self.provider)
+            raise
+
+        if results is None or results.outcome == SearchOutcome.PROVIDER_ERROR:
+            self.breaker.record_failure(self.provider)
+        else:
+            self.breaker.record_success(self.provider)
+        return results
+
+
+def create_circuit_breaker(client_factory: Callable = None) -> Optional[CircuitBreaker]:
+    if not config.getboolean('CircuitBreaker', 'enabled', fallback=False):
+        return None
+    if client_factory is None:
+        from utils.connections.redis_client import get_redis_client
+        client_factory = get_redis_client
+
+    return CircuitBreaker(
+        store=RedisBreakerStore(client_factory=client_factory),
+        window_seconds=config.getint('CircuitBreaker', 'window_seconds', fallback=120),
+        bucket_seconds=config.getint('CircuitBreaker', 'bucket_seconds', fallback=10),
+        min_requests=config.getint('CircuitBreaker', 'min_requests', fallback=5),
+        failure_rate=config.getfloat('CircuitBreaker', 'failure_rate', fallback=0.5),
+        open_seconds=config.getint('CircuitBreaker', 'open_seconds', fallback=60),
+        probe_timeout=config.getint('CircuitBreaker', 'probe_timeout', fallback=90),
+    )
@@ -0,0 +1,134 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Callable, Optional
+
+
+class BreakerStore(ABC):
+    """
+    Where circuit state and the rolling outcome window live. Outcomes are
+    counted in fixed-size time buckets; the breaker sums the buckets that
+    fall inside its window.
+    """
+
+    @abstractmethod
+    def record(self, provider: str, bucket: int, success: bool, ttl: int) -> None:
+        ...
+
+    @abstractmethod
+    def counts(self, provider: str, buckets: list[int]) -> tuple[int, int]:
+        """(successes, failures) over the given buckets"""
+        ...
+
+    @abstractmethod
+    def get_state(self, provider: str) -> tuple[Optional[str], float]:
+        """(state, opened_at); state is None when never tripped"""
+        ...
+
+    @abstractmethod
+    def set_state(self, provider: str, state: str, opened_at: float) -> None:
+        ...
+
+    @abstractmethod
+    def try_probe(self, provider: str, ttl: int) -> bool:
+        """Claim the single half-open probe; False if someone else holds it"""
+        ...
+
+    @abstractmethod
+    def release_probe(self, provider: str) -> None:
+        ...
+
+    @abstractmethod
+    def reset(self, provider: str, buckets: list[int]) -> None:
+        """Forget the outcome window, e.g. once the circuit closes again"""
+        ...
+
+
+class MemoryBreakerStore(BreakerStore):
+    """Single-worker store; probe claims never expire, which is fine in tests."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, dict[int, list[int]]] = defaultdict(dict)
+        self._states: dict[str, tuple[str, float]] = {}
+        self._probes: set[str] = set()
+
+    def record(self, provider: str, bucket: int, success: bool, ttl: int) -> None:
+        with self._lock:
+            counts = self._buckets[provider].setdefault(bucket, [0, 0])
+            counts[0 if success else 1] += 1
+
+    def counts(self, provider: str, buckets: list[int]) -> tuple[int, int]:
+        with self._lock:
+            stored = self._buckets[provider]
+            for bucket in [b for b in stored if b < min(buckets)]:
+                del stored[bucket]
+            selected = [stored.get(b, [0, 0]) for b in buckets]
+        return sum(c[0] for c in selected), sum(c[1] for c in selected)
+
+    def get_state(self, provider: str) -> tuple[Optional[str], float]:
+        return self._states.get(provider, (None, 0.0))
+
+    def set_state(self, provider: str, state: str, opened_at: float) -> None:
+        self._states[provider] = (state, opened_at)
+
+    def try_probe(self, provider: str, ttl: int) -> bool:
+        with self._lock:
+            if provider in self._probes:
+                return False
+            self._probes.add(provider)
+            return True
+
+    def release_probe(self, provider: str) -> None:
+        self._probes.discard(provider)
+
+    def reset(self, provider: str, buckets: list[int]) -> None:
+        with self._lock:
+            self._buckets.pop(provider, None)
+
+
+class RedisBreakerStore(BreakerStore):
+    """Shares breaker state between every worker and replica."""
+
+    def __init__(self, client_factory: Callable, prefix: str = 'breaker'):
+        self.client = client_factory()
+        self.prefix = prefix
+
+    def _key(self, provider: str, *parts) -> str:
+        return ':'.join([self.prefix, provider, *map(str, parts)])
+
+    def record(self, provider: str, bucket: int, success: bool, ttl: int) -> None:
+        key = self._key(provider, 'bucket', bucket)
+        pipe = self.client.pipeline()
+        pipe.hincrby(key, 'ok' if success else 'fail', 1)
+        pipe.expire(key, ttl)
+        pipe.execute()
+
+    def counts(self, provider: str, buckets: list[int]) -> tuple[int, int]:
+        pipe = self.client.pipeline()
+        for bucket in buckets:
+            pipe.hmget(self._key(provider, 'bucket', bucket), 'ok', 'fail')
+        successes = failures = 0
+        for ok, fail in pipe.execute():
+            successes += int(ok or 0)
+            failures += int(fail or 0)
+        return successes, failures
+
+    def get_state(self, provider: str) -> tuple[Optional[str], float]:
+        state, opened_at = self.client.hmget(self._key(provider, 'state'), 'state', 'opened_at')
+        return state, float(opened_at or 0)
+
+    def set_state(self, provider: str, state: str, opened_at: float) -> None:
+        self.client.hset(
+            self._key(provider, 'state'), mapping={'state': state, 'opened_at': opened_at}
+        )
+
+    def try_probe(self, provider: str, ttl: int) -> bool:
+        return bool(self.client.set(self._key(provider, 'probe'), 1, nx=True, ex=ttl))
+
+    def release_probe(self, provider: str) -> None:
+        self.client.delete(self._key(provider, 'probe'))
+
+    def reset(self, provider: str, buckets: list[int]) -> None:
+        # older buckets are outside the window and expire on their own
+        self.client.delete(*(self._key(provider, 'bucket', bucket) for bucket in buckets))
@@ -0,0 +1,138 @@
+"""
+Recorded scrapes ("cassettes") for offline replay.
+
+A cassette is a directory holding the HTML of every page a scrapper read
+flights from, plus ``cassette.json`` with the search params and, per step,
+the flights the live run extracted from that page::
+
+    avianca-bog-mde-20300101-1718000000000/
+        cassette.json
+        00-outbound.html
+        01-return.html
+"""
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from domain.models import Flight, SearchParams
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = 'cassette.json'
+_DATE_FMT = '%Y-%m-%d'
+
+_recording: ContextVar[Optional['Cassette']] = ContextVar('recording', default=None)
+
+
+@dataclass
+class CassetteStep:
+    name: str
+    page: str
+    flights: list[dict[str, str]]
+    url: Optional[str] = None
+
+
+@dataclass
+class Cassette:
+    path: Path
+    provider: str
+    search_params: SearchParams
+    steps: list[CassetteStep] = field(default_factory=list)
+    recorded_at: Optional[str] = None
+
+    @classmethod
+    def create(cls, directory: Path, provider: str, search_params: SearchParams) -> 'Cassette':
+        name = '-'.join((
+            provider,
+            search_params.origin,
+            search_params.destination,
+            search_params.departure.strftime('%Y%m%d'),
+            str(int(time.time() * 1000)),
+        )).lower()
+        return cls(
+            path=Path(directory) / name,
+            provider=provider,
+            search_params=search_params,
+            recorded_at=datetime.now().isoformat(timespec='seconds'),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'Cassette':
+        path = Path(path)
+        manifest = json.loads((path / MANIFEST).read_text())
+        params = manifest['search_params']
+        return cls(
+            path=path,
+            provider=manifest['provider'],
+            search_params=SearchParams(
+                origin=params['origin'],
+                destination=params['destination'],
+                departure=datetime.strptime(params['departure'], _DATE_FMT),
+                return_date=datetime.strptime(params['return_date'], _DATE_FMT),
+                passengers=params.get('passengers', 1),
+            ),
+            steps=[CassetteStep(**step) for step in manifest['steps']],
+            recorded_at=manifest.get('recorded_at'),
+        )
+
+    def add_step(
+        self, name: str, html: str, flights: list[Flight], url: Optional[str] = None
+    ) -> CassetteStep:
+        self.path.mkdir(parents=True, exist_ok=True)
+        page = f'{len(self.steps):02d}-{name}.html'
+        (self.path / page).write_text(html)
+        step = CassetteStep(
+            name=name,
+            page=page,
+            flights=[flight.to_dict() for flight in flights],
+            url=url,
+        )
+        self.steps.append(step)
+        return step
+
+    def save(self) -> None:
+        if not self.steps:
+            # nothing was extracted (the scrape failed before any results page)
+            return
+        params = self.search_params
+        manifest = {
+            'provider': self.provider,
+            'recorded_at': self.recorded_at,
+            'search_params': {
+                'origin': params.origin,
+                'destination': params.destination,
+                'departure': params.departure.strftime(_DATE_FMT),
+                'return_date': params.return_date.strftime(_DATE_FMT),
+                'passengers': params.passengers,
+            },
+            'steps': [step.__dict__ for step in self.steps],
+        }
+        (self.path / MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+    def page(self, step: CassetteStep) -> str:
+        return (self.path / step.page).read_text()
+
+
+def discover(root: Path) -> list[Cassette]:
+    """Every cassette under ``root``, in path order."""
+    return [Cassette.load(manifest.parent) for manifest in sorted(Path(root).rglob(MANIFEST))]
+
+
+@contextmanager
+def recording(cassette: Cassette) -> Iterator[Cassette]:
+    """Make ``cassette`` the one scrappers record into on this thread."""
+    token = _recording.set(cassette)
+    try:
+        yield cassette
+    finally:
+        _recording.reset(token)
+
+
+def active_cassette() -> Optional[Cassette]:
+    return _recording.get()
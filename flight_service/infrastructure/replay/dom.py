@@ -0,0 +1,131 @@
+"""
+DOM-only stand-in for a WebDriver, backed by lxml.
+
+``DomDriver`` implements the read-only part of the WebDriver API the
+scrappers' extraction code uses (``find_element(s)``, ``text``,
+``get_attribute``, ``page_source``), so a recorded page can be parsed
+without a browser. It counts the commands it serves, which on a remote
+driver would each be a round trip to the grid.
+"""
+from typing import Optional
+
+from lxml import html as lxml_html
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+_BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'br', 'dd', 'div', 'dl', 'dt', 'footer',
+    'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+    'nav', 'ol', 'p', 'section', 'table', 'tr', 'ul',
+})
+_HIDDEN_TAGS = frozenset({'script', 'style', 'template', 'noscript'})
+
+
+def _class_xpath(name: str) -> str:
+    return f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+def rendered_text(node) -> str:
+    """
+    Roughly what ``WebElement.text`` returns: whitespace collapsed, block
+    elements on their own lines.
+    """
+    parts = []
+
+    def walk(el):
+        if not isinstance(el.tag, str) or el.tag in _HIDDEN_TAGS:
+            return
+        block = el.tag in _BLOCK_TAGS
+        if block:
+            parts.append('\n')
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append('\n')
+
+    walk(node)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class _Searchable:
+
+    _node = None
+    # shared by a driver and its elements: one entry per call that would be
+    # a round trip to a remote WebDriver
+    _calls: list
+
+    def find_elements(self, by: str, value: str) -> list['DomElement']:
+        self._calls.append(by)
+        if by == By.XPATH:
+            nodes = self._node.xpath(value)
+        elif by == By.CLASS_NAME:
+            nodes = self._node.xpath(_class_xpath(value))
+        elif by == By.ID:
+            nodes = self._node.xpath(f".//*[@id='{value}']")
+        elif by == By.TAG_NAME:
+            nodes = self._node.xpath(f'.//{value}')
+        elif by == By.CSS_SELECTOR:
+            nodes = self._node.cssselect(value)
+        else:
+            raise ValueError(f'Unsupported locator strategy: {by}')
+        return [
+            DomElement(node, self._calls)
+            for node in nodes if isinstance(getattr(node, 'tag', None), str)
+        ]
+
+    def find_element(self, by: str, value: str) -> 'DomElement':
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f'No element for {by}={value!r}')
+        return elements[0]
+
+
+class DomElement(_Searchable):
+
+    def __init__(self, node, calls: list):
+        self._node = node
+        self._calls = calls
+
+    @property
+    def tag_name(self) -> str:
+        self._calls.append('tag_name')
+        return self._node.tag
+
+    @property
+    def text(self) -> str:
+        self._calls.append('text')
+        return rendered_text(self._node)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        self._calls.append('get_attribute')
+        if name == 'textContent':
+            return self._node.text_content()
+        if name == 'innerHTML':
+            return (self._node.text or '') + ''.join(
+                lxml_html.tostring(child, encoding='unicode') for child in self._node
+            )
+        return self._node.get(name)
+
+
+class DomDriver(_Searchable):
+
+    def __init__(self, page_source: str, current_url: Optional[str] = None):
+        self._page_source = page_source
+        self.current_url = current_url
+        self._node = lxml_html.document_fromstring(page_source)
+        self._calls = []
+
+    @property
+    def page_source(self) -> str:
+        self._calls.append('page_source')
+        return self._page_source
+
+    @property
+    def calls(self) -> int:
+        """WebDriver commands issued so far (each a round trip on a real grid)."""
+        return len(self._calls)
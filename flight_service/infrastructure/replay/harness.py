@@ -0,0 +1,110 @@
+"""
+Replays cassettes through a scrapper's extraction code and checks the
+flights against the ones the live run extracted.
+
+Pages are opened either DOM-only (``dom_pages``, lxml, no browser) or in
+a local browser pointed at a ``ReplayServer`` (``browser_pages``).
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from infrastructure.replay.cassette import Cassette, CassetteStep
+from infrastructure.replay.dom import DomDriver
+from infrastructure.replay.server import ReplayServer
+from infrastructure.scrappers.base import Scrapper
+
+PageOpener = Callable[[CassetteStep], Any]
+
+
+@dataclass
+class StepReport:
+    step: str
+    rows: int
+    seconds: float
+    mismatches: list[str] = field(default_factory=list)
+    # WebDriver commands per extraction, when the driver counts them
+    round_trips: Optional[int] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float('inf')
+
+
+@dataclass
+class ReplayReport:
+    cassette: Cassette
+    steps: list[StepReport] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        return sum(step.rows for step in self.steps)
+
+    @property
+    def seconds(self) -> float:
+        return sum(step.seconds for step in self.steps)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float('inf')
+
+    @property
+    def ok(self) -> bool:
+        return not any(step.mismatches for step in self.steps)
+
+
+@contextmanager
+def dom_pages(cassette: Cassette) -> Iterator[PageOpener]:
+    yield lambda step: DomDriver(cassette.page(step), current_url=step.url)
+
+
+@contextmanager
+def browser_pages(cassette: Cassette, driver) -> Iterator[PageOpener]:
+    with ReplayServer(cassette) as server:
+        def open_page(step: CassetteStep):
+            driver.get(server.url(step))
+            return driver
+        yield open_page
+
+
+def _mismatches(expected: list[dict], actual: list[dict]) -> list[str]:
+    problems = []
+    if len(expected) != len(actual):
+        problems.append(f'expected {len(expected)} rows, got {len(actual)}')
+    for index, (want, got) in enumerate(zip(expected, actual)):
+        if want != got:
+            problems.append(f'row {index}: expected {want}, got {got}')
+    return problems
+
+
+def replay(
+    scrapper: Scrapper,
+    cassette: Cassette,
+    pages: Callable[[Cassette], Any] = dom_pages,
+    runs: int = 1,
+) -> ReplayReport:
+    """
+    Extract every step of ``cassette`` with ``scrapper``; a step's time is
+    the best of ``runs`` extractions and excludes opening the page.
+    """
+    if not scrapper.replayable:
+        raise ValueError(f'{type(scrapper).__name__} cannot replay cassettes')
+    report = ReplayReport(cassette)
+    with pages(cassette) as open_page:
+        for step in cassette.steps:
+            driver = open_page(step)
+            best = float('inf')
+            calls = getattr(driver, 'calls', None)
+            for _ in range(max(runs, 1)):
+                started = time.perf_counter()
+                flights = scrapper.extract_step(driver, step.name, cassette.search_params)
+                best = min(best, time.perf_counter() - started)
+            report.steps.append(StepReport(
+                step=step.name,
+                rows=len(flights),
+                seconds=best,
+                mismatches=_mismatches(step.flights, [flight.to_dict() for flight in flights]),
+                round_trips=(driver.calls - calls) // max(runs, 1) if calls is not None else None,
+            ))
+    return report
@@ -0,0 +1,60 @@
+import logging
+from pathlib import Path
+from typing import Optional
+
+from constants import config
+from domain.models import SearchParams, FlightResults, Flight
+from infrastructure.replay.cassette import Cassette, recording
+from infrastructure.scrappers.base import Scrapper
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeRecorder:
+    """
+    Records live scrapes as cassettes under ``directory``: the HTML of each
+    results page and the flights extracted from it.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def start(self, provider: str, search_params: SearchParams) -> Cassette:
+        return Cassette.create(self.directory, provider, search_params)
+
+    def guard(self, provider: str, scrapper: Scrapper) -> Scrapper:
+        return RecordingScrapper(provider, scrapper, self)
+
+
+class RecordingScrapper(Scrapper):
+    """Scrapper decorator that records every scrape into a new cassette."""
+
+    def __init__(self, provider: str, scrapper: Scrapper, recorder: ScrapeRecorder):
+        self.provider = provider
+        self.scrapper = scrapper
+        self.recorder = recorder
+
+    @property
+    def replayable(self) -> bool:
+        return self.scrapper.replayable
+
+    def get_flights(self, search_params: SearchParams) -> FlightResults | None:
+        cassette = self.recorder.start(self.provider, search_params)
+        with recording(cassette):
+            try:
+                return self.scrapper.get_flights(search_params)
+            finally:
+                try:
+                    cassette.save()
+                except OSError as e:
+                    logger.warning(f'Could not save cassette {cassette.path}: {e}')
+
+    def extract_step(self, driver, step: str, search_params: SearchParams) -> list[Flight]:
+        return self.scrapper.extract_step(driver, step, search_params)
+
+
+def create_scrape_recorder() -> Optional[ScrapeRecorder]:
+    directory = config.get('Replay', 'record_dir', fallback='')
+    if not directory:
+        return None
+    return ScrapeRecorder(Path(directory))
@@ -0,0 +1,45 @@
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from infrastructure.replay.cassette import Cassette, CassetteStep
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer:
+    """
+    Serves a cassette's pages from a local static server, for replaying
+    them in a real (headless, local) browser.
+    """
+
+    def __init__(self, cassette: Cassette, host: str = '127.0.0.1', port: int = 0):
+        handler = partial(_QuietHandler, directory=str(cassette.path))
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def url(self, step: CassetteStep) -> str:
+        return f'{self.base_url}/{step.page}'
+
+    def start(self) -> 'ReplayServer':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'ReplayServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -1,5 +1,7 @@
 from abc import abstractmethod, ABC
-from domain.models import FlightResults, SearchParams
+from typing import Optional
+
+from domain.models import FlightResults, SearchParams, SearchOutcome, CachedResponse
 
 
 class FlightsRepository(ABC):
@@ -18,3 +20,26 @@ class FlightsRepository(ABC):
         save a flight with all information
         """
         ...
+
+    def save_negative_result(
+        self, search_params: SearchParams, outcome: SearchOutcome
+    ) -> None:
+        """
+        remember that a search came back empty or failed; repositories
+        without a negative cache ignore it
+        """
+        ...
+
+    def get_cached_response(self, search_params: SearchParams) -> Optional[CachedResponse]:
+        """
+        the cached results already serialized as the response body, so a
+        hit skips decoding and re-encoding; None when there is none
+        """
+        return None
+
+    def find_cached_response(self, key: str) -> Optional[CachedResponse]:
+        """
+        ``get_cached_response`` by cache key, for callers that only know the
+        search id
+        """
+        return None
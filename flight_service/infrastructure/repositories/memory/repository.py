@@ -1,38 +1,223 @@
-from decimal import Decimal
-from datetime import datetime, time, timedelta
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
 
-from domain.models import FlightResults, SearchParams, Flight, Flights
+from constants import config
+from domain.models import (
+    FlightResults, SearchParams, SearchOutcome, CacheStatus, CachedResponse
+)
+from domain.results_query import ResultsIndex
 from infrastructure.repositories.base import FlightsRepository
+from utils.cache_stats import CacheStats, cache_stats
+from utils.flight_hash import create_search_params_hash
+from utils.response_payload import build_response, is_streamed
+from utils.search_key import route_key
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = config.getint('MemoryCache', 'max_entries', fallback=2048)
+MAX_BYTES = config.getint('MemoryCache', 'max_bytes', fallback=64 * 1024 * 1024)
+TTL = config.getint('MemoryCache', 'ttl', fallback=300)
+NO_FLIGHTS_TTL = config.getint('Cache', 'no_flights_ttl', fallback=300)
+PROVIDER_ERROR_TTL = config.getint('Cache', 'provider_error_ttl', fallback=60)
+
+# Rough in-memory footprint of one Flight (dataclass, datetime, time x2,
+# Decimal, timedelta) and of an entry's bookkeeping; good enough to bound
+# memory without serializing anything.
+_FLIGHT_BYTES = 600
+_ENTRY_BYTES = 400
+
+
+@dataclass
+class _Entry:
+    # None for a response copied from another layer (see store_response)
+    results: Optional[FlightResults]
+    expires_at: float
+    size: int
+    # serialized on the first fast-path hit, unless streamed
+    response: Optional[CachedResponse] = None
+    streamed: bool = False
+
+
+def estimate_size(results: FlightResults) -> int:
+    flights = sum(
+        1 + len(result.return_flights or [])
+        for result in results.results or []
+    )
+    return _ENTRY_BYTES + flights * _FLIGHT_BYTES
 
 
 class FlightsMemoryRepository(FlightsRepository):
+    """
+    In-process LRU cache of flight results with a TTL, bounded by entry
+    count and approximate size. Results are kept as objects, so a hit costs
+    neither a network hop nor a JSON decode.
+    """
 
-    def get_flight_results(self, search_params: SearchParams) -> FlightResults:
-        outbound = Flight(
-            date=datetime.now(),
-            departure_time=time(hour=8, minute=0),
-            landing_time=time(hour=10, minute=30),
-            price=Decimal('250.00'),
-            flight_time=timedelta(hours=2, minutes=30)
+    def __init__(
+        self,
+        max_entries: int = MAX_ENTRIES,
+        max_bytes: int = MAX_BYTES,
+        ttl: int = TTL,
+        negative_ttls: dict[SearchOutcome, int] = None,
+        record_stats: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.negative_ttls = negative_ttls or {
+            SearchOutcome.NO_FLIGHTS: NO_FLIGHTS_TTL,
+            SearchOutcome.PROVIDER_ERROR: PROVIDER_ERROR_TTL,
+        }
+        self.record_stats = record_stats
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def _live_entry(self, key: str) -> Optional[_Entry]:
+        # callers hold the lock
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def lookup(self, key: str) -> Optional[FlightResults]:
+        with self._lock:
+            entry = self._live_entry(key)
+        if entry is None or entry.results is None:
+            return None
+        cached = entry.results
+        return FlightResults(
+            results=cached.results,
+            outcome=cached.outcome,
+            cache_status=CacheStatus.NEGATIVE_HIT if cached.outcome else CacheStatus.HIT,
+            index=cached.index,
         )
 
-        return_flights = [
-            Flight(
-                date=datetime.now() + timedelta(days=1),
-                departure_time=time(hour=15, minute=0),
-                landing_time=time(hour=16, minute=45),
-                price=Decimal('200.00'),
-                flight_time=timedelta(hours=1, minutes=45)
+    def store(self, key: str, results: FlightResults, ttl: int) -> None:
+        size = estimate_size(results)
+        if size > self.max_bytes:
+            logger.info(f'Not caching {key} in memory: {size} bytes')
+            return
+        # the sorted index is built once per write and served with every hit
+        index = results.index
+        if index is None and results.results:
+            index = ResultsIndex.build(results.results)
+        self._put(key, _Entry(
+            results=FlightResults(
+                results=results.results, outcome=results.outcome, index=index
+            ),
+            expires_at=self._clock() + ttl,
+            size=size,
+            streamed=is_streamed(results),
+        ))
+
+    def store_response(self, key: str, response: CachedResponse) -> None:
+        """
+        Keep a response served by another layer, for the rest of its
+        lifetime there (at most this cache's TTL). lookup() treats such an
+        entry as a miss, until a store() replaces it.
+        """
+        ttl = min(response.max_age(time.time()), self.ttl)
+        size = _ENTRY_BYTES + len(response.body)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        self._put(key, _Entry(
+            results=None, expires_at=self._clock() + ttl, size=size, response=response
+        ))
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def lookup_response(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._live_entry(key)
+        if entry is None:
+            return None
+        if entry.results is None:
+            return entry.response
+        if not entry.results.results or entry.streamed:
+            return None
+        if entry.response is None:
+            entry.response = build_response(
+                entry.results, ttl=entry.expires_at - self._clock()
             )
-        ]
+        return entry.response
 
-        return FlightResults(
-            results=[Flights(outbound_flight=outbound, return_flights=return_flights)]
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def get_flight_results(self, search_params: SearchParams) -> FlightResults:
+        results = self.lookup(create_search_params_hash(search_params))
+        if self.record_stats:
+            outcome = CacheStats.HIT if results else CacheStats.MISS
+            cache_stats.record(route_key(search_params), outcome, layer='memory')
+        return results or FlightResults(results=[])
+
+    def find_cached_response(self, key: str) -> Optional[CachedResponse]:
+        return self.lookup_response(key)
+
+    def get_cached_response(self, search_params: SearchParams) -> Optional[CachedResponse]:
+        response = self.lookup_response(create_search_params_hash(search_params))
+        if response and self.record_stats:
+            cache_stats.hit(route_key(search_params), layer='memory')
+        return response
+
+    def save_flight(self, flights: FlightResults, search_params: SearchParams) -> None:
+        self.store(create_search_params_hash(search_params), flights, self.ttl)
+
+    def save_negative_result(
+        self, search_params: SearchParams, outcome: SearchOutcome
+    ) -> None:
+        ttl = min(self.negative_ttls[outcome], self.ttl)
+        self.store(
+            create_search_params_hash(search_params),
+            FlightResults(results=[], outcome=outcome),
+            ttl
         )
 
-    def save_flight(self, flight: FlightResults, search_params: SearchParams) -> str:
-        pass
+
+_repository: Optional[FlightsMemoryRepository] = None
+_repository_lock = threading.Lock()
 
 
 def create_memory_repository() -> FlightsMemoryRepository:
-    return FlightsMemoryRepository()
\ No newline at end of file
+    # one cache per process: the REST layer asks for a repository per request
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = FlightsMemoryRepository()
+        return _repository
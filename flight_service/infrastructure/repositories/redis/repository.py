@@ -2,51 +2,127 @@ import json
 import logging
 from typing import Callable
 
+from constants import config
 from infrastructure.repositories.base import FlightsRepository
-from domain.models import FlightResults, SearchParams, Flights
+from domain.models import (
+    FlightResults, SearchParams, Flights, SearchOutcome, CacheStatus, CachedResponse
+)
+from utils.search_key import route_key
+from utils.cache_stats import cache_stats
 from utils.flight_hash import create_search_params_hash
 from utils.json_decoders import FlightsJSONEncoder
+from utils.response_payload import (
+    build_response, pack_response, unpack_response, is_streamed
+)
 
 logger = logging.getLogger(__name__)
 
+RESULTS_TTL = config.getint('Cache', 'results_ttl', fallback=1800)
+NO_FLIGHTS_TTL = config.getint('Cache', 'no_flights_ttl', fallback=300)
+PROVIDER_ERROR_TTL = config.getint('Cache', 'provider_error_ttl', fallback=60)
+
 
 class RedisRepository(FlightsRepository):
 
-    def __init__(self, client_factory: Callable, database: int = 0):
+    def __init__(
+        self,
+        client_factory: Callable,
+        database: int = 0,
+        results_ttl: int = RESULTS_TTL,
+        negative_ttls: dict[SearchOutcome, int] = None,
+    ):
         self.client = client_factory(database=database)
+        self.results_ttl = results_ttl
+        self.negative_ttls = negative_ttls or {
+            SearchOutcome.NO_FLIGHTS: NO_FLIGHTS_TTL,
+            SearchOutcome.PROVIDER_ERROR: PROVIDER_ERROR_TTL,
+        }
 
     def _make_hash(self, search_params: SearchParams) -> str:
         return create_search_params_hash(search_params)
 
+    @staticmethod
+    def _negative_key(hash_: str) -> str:
+        return f'{hash_}:negative'
+
+    @staticmethod
+    def _response_key(hash_: str) -> str:
+        return f'{hash_}:response'
+
+    @staticmethod
+    def _result_index(key) -> int:
+        if isinstance(key, bytes):
+            key = key.decode()
+        return int(key.rpartition(':')[2])
+
+    def get_cached_response(self, search_params: SearchParams) -> CachedResponse | None:
+        response = self.find_cached_response(self._make_hash(search_params))
+        if response:
+            cache_stats.hit(route_key(search_params))
+        return response
+
+    def find_cached_response(self, key: str) -> CachedResponse | None:
+        return unpack_response(self.client.get(self._response_key(key)))
+
     def get_flight_results(
         self, search_params: SearchParams
     ) -> FlightResults | list[None]:
         hash_ = self._make_hash(search_params)
-        pattern = f'{hash_}:*'
+        pattern = f'{hash_}:[0-9]*'
         keys = self.client.keys(pattern)
         if not keys:
+            outcome = self.client.get(self._negative_key(hash_))
+            if outcome:
+                logger.info(f'Negative result {outcome} cached for {hash_}')
+                cache_stats.hit(route_key(search_params))
+                return FlightResults(
+                    results=[],
+                    outcome=SearchOutcome(outcome),
+                    cache_status=CacheStatus.NEGATIVE_HIT,
+                )
             logger.info(f'No flights found for {hash_}')
+            cache_stats.miss(route_key(search_params))
             return FlightResults(results=[])
+        cache_stats.hit(route_key(search_params))
         flights = []
 
-        for key in keys:
+        # KEYS order is unspecified: restore the saved order from the index suffix
+        for key in sorted(keys, key=self._result_index):
             element = self.client.get(key)
             results = json.loads(element)
             flight_results = Flights.unflatten_results(results)
             flights.append(flight_results)
-        return FlightResults(results=flights)
+        return FlightResults(results=flights, cache_status=CacheStatus.HIT)
 
     def save_flight(self, flights: FlightResults, search_params) -> None:
         hash_ = self._make_hash(search_params)
         for index, result in enumerate(flights.results):
             flattened_results = result.flatten_results
             payload = json.dumps(flattened_results, cls=FlightsJSONEncoder)
-            self.client.set(f'{hash_}:{index}', payload, ex=1800)
+            self.client.set(f'{hash_}:{index}', payload, ex=self.results_ttl)
+        if is_streamed(flights):
+            # served in chunks from the results above, never encoded whole
+            self.client.delete(self._response_key(hash_))
+        else:
+            # the response body as served, so hits need a single GET and no decoding
+            self.client.set(
+                self._response_key(hash_),
+                pack_response(build_response(flights, ttl=self.results_ttl)),
+                ex=self.results_ttl
+            )
 
         # put search params into a list
         self.client.lpush('search_params', hash_)
         logger.info(f'Flights {hash_} saved')
 
+    def save_negative_result(
+        self, search_params: SearchParams, outcome: SearchOutcome
+    ) -> None:
+        hash_ = self._make_hash(search_params)
+        ttl = self.negative_ttls[outcome]
+        self.client.set(self._negative_key(hash_), outcome.value, ex=ttl)
+        logger.info(f'Negative result {outcome.value} saved for {hash_} ({ttl}s)')
+
 
 def create_redis_repository(
     client_factory: Callable = None,
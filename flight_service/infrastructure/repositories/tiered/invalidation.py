@@ -0,0 +1,46 @@
+import logging
+import os
+import uuid
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = 'flights:invalidate'
+
+
+class RedisInvalidationBus:
+    """
+    Broadcasts cache keys that changed so every worker drops its in-process
+    copy. Messages are ``<worker id>|<key>``; a worker ignores its own.
+    """
+
+    def __init__(self, client_factory: Callable, channel: str = INVALIDATION_CHANNEL):
+        self.client = client_factory()
+        self.channel = channel
+        self.worker_id = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+        self._thread = None
+
+    def publish(self, key: str) -> None:
+        try:
+            self.client.publish(self.channel, f'{self.worker_id}|{key}')
+        except Exception as e:
+            # other workers converge anyway once their L1 entry expires
+            logger.warning(f'Could not publish invalidation for {key}: {e}')
+
+    def subscribe(self, on_invalidate: Callable[[str], None]) -> None:
+        def handler(message):
+            worker_id, _, key = message['data'].partition('|')
+            if worker_id != self.worker_id and key:
+                on_invalidate(key)
+
+        try:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: handler})
+            self._thread = pubsub.run_in_thread(sleep_time=1, daemon=True)
+        except Exception as e:
+            logger.warning(f'Cache invalidation listener not started: {e}')
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
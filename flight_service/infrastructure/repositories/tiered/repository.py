@@ -0,0 +1,106 @@
+import logging
+import threading
+from typing import Callable, Optional
+
+from domain.models import FlightResults, SearchParams, SearchOutcome, CachedResponse
+from infrastructure.repositories.base import FlightsRepository
+from infrastructure.repositories.memory.repository import FlightsMemoryRepository
+from infrastructure.repositories.redis.repository import RedisRepository
+from infrastructure.repositories.tiered.invalidation import RedisInvalidationBus
+from utils.cache_stats import cache_stats
+from utils.flight_hash import create_search_params_hash
+from utils.search_key import route_key
+
+logger = logging.getLogger(__name__)
+
+
+class TieredFlightsRepository(FlightsRepository):
+    """
+    In-process L1 in front of a shared L2 (Redis). Reads go L1, then L2,
+    filling L1 on the way back; writes go to both and tell the other
+    workers to drop their L1 copy of the key.
+    """
+
+    def __init__(
+        self,
+        l1: FlightsMemoryRepository,
+        l2: FlightsRepository,
+        invalidation: Optional[RedisInvalidationBus] = None,
+    ):
+        self.l1 = l1
+        self.l2 = l2
+        self.invalidation = invalidation
+
+    def get_flight_results(self, search_params: SearchParams) -> FlightResults:
+        key = create_search_params_hash(search_params)
+        cached = self.l1.lookup(key)
+        if cached:
+            cache_stats.hit(route_key(search_params), layer='memory')
+            return cached
+
+        results = self.l2.get_flight_results(search_params)
+        if results and results.results:
+            self.l1.store(key, results, self.l1.ttl)
+        elif results and results.outcome:
+            self.l1.save_negative_result(search_params, results.outcome)
+        return results
+
+    def get_cached_response(self, search_params: SearchParams) -> Optional[CachedResponse]:
+        key = create_search_params_hash(search_params)
+        response = self.l1.lookup_response(key)
+        if response:
+            cache_stats.hit(route_key(search_params), layer='memory')
+            return response
+        response = self.l2.get_cached_response(search_params)
+        if response:
+            self.l1.store_response(key, response)
+        return response
+
+    def find_cached_response(self, key: str) -> Optional[CachedResponse]:
+        response = self.l1.lookup_response(key)
+        if response is None:
+            response = self.l2.find_cached_response(key)
+            if response:
+                self.l1.store_response(key, response)
+        return response
+
+    def save_flight(self, flights: FlightResults, search_params: SearchParams) -> None:
+        self.l2.save_flight(flights, search_params)
+        self.l1.save_flight(flights, search_params)
+        self._invalidate(search_params)
+
+    def save_negative_result(
+        self, search_params: SearchParams, outcome: SearchOutcome
+    ) -> None:
+        self.l2.save_negative_result(search_params, outcome)
+        self.l1.save_negative_result(search_params, outcome)
+        self._invalidate(search_params)
+
+    def _invalidate(self, search_params: SearchParams) -> None:
+        if self.invalidation is not None:
+            self.invalidation.publish(create_search_params_hash(search_params))
+
+
+_repository: Optional[TieredFlightsRepository] = None
+_repository_lock = threading.Lock()
+
+
+def create_tiered_repository(
+    client_factory: Callable = None,
+) -> TieredFlightsRepository:
+    # the L1 and its invalidation listener live for the whole process
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            if client_factory is None:
+                from utils.connections.redis_client import get_redis_client
+                client_factory = get_redis_client
+            l1 = FlightsMemoryRepository(record_stats=False)
+            invalidation = RedisInvalidationBus(client_factory=client_factory)
+            invalidation.subscribe(l1.invalidate)
+            _repository = TieredFlightsRepository(
+                l1=l1,
+                l2=RedisRepository(client_factory=client_factory),
+                invalidation=invalidation,
+            )
+        return _repository
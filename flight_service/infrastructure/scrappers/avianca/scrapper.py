@@ -4,15 +4,15 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from dateutil import parser
 from selenium.webdriver.common.by import By
 from selenium.common import exceptions
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from infrastructure.scrappers.avianca import parsing
 from infrastructure.scrappers.base import Scrapper, DriverFactory
-from domain.models import FlightResults, Flight, SearchParams, Flights
+from domain.models import FlightResults, Flight, SearchParams, Flights, SearchOutcome
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,8 @@ class AviancaScrapper(Scrapper):
 
     driver = None
     name = 'Avianca'
+    replayable = True
+    ROWS_XPATH = parsing.ROWS_XPATH
     capabilities: dict[str, Any] = {
         'se:name': name,
         'acceptInsecureCerts': True,
@@ -94,13 +96,14 @@ class AviancaScrapper(Scrapper):
 
                 _outbound_flights = wait.until(
                     EC.presence_of_all_elements_located(
-                        (By.XPATH, "//div[contains(@class, 'journey-select_list_item')]")
+                        (By.XPATH, self.ROWS_XPATH)
                     )
                 )
                 if not _outbound_flights:
-                    return FlightResults(results=[])
+                    return FlightResults(results=[], outcome=SearchOutcome.NO_FLIGHTS)
 
-                outbound_flights = self._process_flights(_outbound_flights, params)
+                outbound_flights = self.extract_step(driver, 'outbound', params)
+                self._record(driver, 'outbound', outbound_flights)
                 # take the first flight as an example for return flights
                 flight = _outbound_flights[0]
                 WebDriverWait(driver, 10).until(
@@ -123,13 +126,14 @@ class AviancaScrapper(Scrapper):
                 driver.execute_script("arguments[0].click()", button)  # could not be scrolled into viewpoint
                 _, *_return_flights = WebDriverWait(driver, timeout=60).until(
                     EC.presence_of_all_elements_located(
-                        (By.XPATH, "//div[contains(@class, 'journey-select_list_item')]")
+                        (By.XPATH, self.ROWS_XPATH)
                     )
                 )
                 if not _return_flights:
-                    return FlightResults(results=[])
+                    return FlightResults(results=[], outcome=SearchOutcome.NO_FLIGHTS)
 
-                return_flights = self._process_flights(_return_flights, params, return_in=True)
+                return_flights = self.extract_step(driver, 'return', params)
+                self._record(driver, 'return', return_flights)
                 return FlightResults(
                     results=[
                         Flights(
@@ -141,8 +145,21 @@ class AviancaScrapper(Scrapper):
                 logger.exception(str(e))
             except exceptions.WebDriverException as e:
                 logger.exception(str(e))
-
-        return FlightResults(results=[])
+            except ValueError as e:
+                # a row the parser does not understand: the page changed
+                logger.exception(f'Could not parse Avianca results: {e}')
+
+        return FlightResults(results=[], outcome=SearchOutcome.PROVIDER_ERROR)
+
+    def extract_step(self, driver, step: str, params: SearchParams) -> list[Flight]:
+        return_in = step == 'return'
+        # the first row of the return page is the outbound flight already picked
+        skip = 1 if return_in else 0
+        if self.extraction == 'page_source':
+            date = params.return_date if return_in else params.departure
+            return parsing.parse_flights(driver.page_source, date, skip)
+        rows = driver.find_elements(By.XPATH, self.ROWS_XPATH)
+        return self._process_flights(rows[skip:], params, return_in=return_in)
 
     def select_dates(self, driver, params: SearchParams):
 
@@ -217,26 +234,22 @@ class AviancaScrapper(Scrapper):
         params: SearchParams,
         return_in: bool = False
     ) -> list[Flight]:
-
-        def _extract_time(time_str: str) -> time:
-            dt = parser.parse(time_str.replace('.', '').strip())
-            return dt.time()
-
+        """Per-element extraction: four WebDriver round trips per row."""
         results = []
         for flight in flights:
-            departure_time = _extract_time(
+            departure_time = parsing.parse_clock(
                 flight.find_element(
-                    By.XPATH, ".//div[contains(@class, 'journey-schedule_time-departure')]"
+                    By.XPATH, parsing.DEPARTURE_XPATH
                 ).get_attribute('textContent').strip()
             )
-            landing_time = _extract_time(
+            landing_time = parsing.parse_clock(
                 flight.find_element(
-                    By.XPATH, ".//div[contains(@class, 'journey-schedule_time-return')]"
+                    By.XPATH, parsing.LANDING_XPATH
                 ).get_attribute('textContent').strip()
             )
-            flight_time = _extract_time(
+            flight_time = parsing.parse_duration(
                 flight.find_element(
-                    By.XPATH, ".//div[@class='journey-schedule_duration_time']"
+                    By.XPATH, parsing.DURATION_XPATH
                 ).get_attribute('textContent')
             )
             results.append(
@@ -247,7 +260,7 @@ class AviancaScrapper(Scrapper):
                     flight_time=flight_time,
                     price=Decimal(
                         flight.find_element(
-                            By.XPATH, ".//span[@class='price text-space-gap']"
+                            By.XPATH, parsing.PRICE_XPATH
                         ).get_attribute('textContent').strip()
                     )
                 )
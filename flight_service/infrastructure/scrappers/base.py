@@ -8,8 +8,10 @@ from selenium.webdriver.common.options import ArgOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 
-from domain.models import FlightResults, SearchParams
+from domain.models import FlightResults, SearchParams, Flight
 from constants import config
+from infrastructure.replay.cassette import active_cassette
+from infrastructure.scrappers.tabs import SharedBrowser
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +102,16 @@ class Scrapper(ABC):
     drivers_factory: DriverFactory
     capabilities: dict[str, Any]
     name: str
+    # 'page_source': fetch the results page once and parse it locally;
+    # 'webdriver': read every field of every row through the driver
+    EXTRACTION_MODES = ('page_source', 'webdriver')
+    extraction: str = 'page_source'
+    # concurrent scrapes sharing one browser, a tab each; 1 starts a
+    # browser per scrape
+    tabs: int = 1
+    # implements extract_step, so recorded cassettes can be replayed
+    replayable: bool = False
+    _shared_browser: Optional[SharedBrowser] = None
 
     def _initialize_config(self):
         assert self.name, 'Scrapper class needs name attribute'
@@ -112,14 +124,35 @@ class Scrapper(ABC):
             {**config[config_key]}
         )
         self.config()
+        self.extraction = config.get(config_key, 'extraction', fallback=self.extraction)
+        if self.extraction not in self.EXTRACTION_MODES:
+            raise ValueError(
+                f"Unsupported extraction for {self.name}: {self.extraction}. "
+                f"Supported: {list(self.EXTRACTION_MODES)}"
+            )
+        self.tabs = config.getint(config_key, 'tabs', fallback=self.tabs)
+        if self.tabs > 1:
+            self._shared_browser = SharedBrowser(
+                lambda: self._create_driver(config["Default"]["scrapper_driver"]),
+                tabs=self.tabs,
+            )
+
+    def _create_driver(self, driver_name: str) -> webdriver.Remote:
+        driver = self.drivers_factory.create_driver(driver_name)
+        if driver_name == 'chrome':
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', { get: () => undefined });")
+        return driver
 
     def _initialize_driver(self, driver_name: str = None):
+        if self._shared_browser is not None:
+            with self._shared_browser.tab() as tab:
+                yield tab
+            return
+
         driver_name = driver_name or config["Default"]["scrapper_driver"]
         driver = None
         try:
-            driver = self.drivers_factory.create_driver(driver_name)
-            if driver_name == 'chrome':
-                driver.execute_script("Object.defineProperty(navigator, 'webdriver', { get: () => undefined });")
+            driver = self._create_driver(driver_name)
             yield driver
         except exceptions.WebDriverException as e:
             logger.error(f'Failed to initialize {driver_name}: {e}')
@@ -134,6 +167,27 @@ class Scrapper(ABC):
         except exceptions.WebDriverException as e:
             logger.error(f"Error while quitting WebDriver: {str(e)}")
 
+    def _record(self, driver, step: str, flights: list[Flight]) -> None:
+        """
+        Snapshot the page ``flights`` were extracted from when the scrape is
+        being recorded (see ``infrastructure.replay``); a no-op otherwise.
+        """
+        cassette = active_cassette()
+        if cassette is None:
+            return
+        try:
+            cassette.add_step(step, driver.page_source, flights, url=driver.current_url)
+        except Exception as e:
+            logger.warning(f'Could not record step {step}: {e}')
+
+    def extract_step(self, driver, step: str, search_params: SearchParams) -> list[Flight]:
+        """
+        Extract the flights of a recorded ``step`` from the page ``driver``
+        shows, without navigating; used to replay cassettes. Scrappers that
+        implement it set ``replayable``.
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not support replay')
+
     @abstractmethod
     def get_flights(self, search_params: SearchParams) -> FlightResults | None:
         ...
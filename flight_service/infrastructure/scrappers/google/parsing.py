@@ -0,0 +1,104 @@
+"""
+Google Flights results rows parsed locally from the page source, so a
+results page costs one WebDriver round trip instead of six per row.
+"""
+import logging
+import re
+from datetime import datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Optional
+
+from dateutil import parser
+from lxml import etree, html as lxml_html
+
+from domain.models import Flight
+from infrastructure.replay.dom import rendered_text
+
+logger = logging.getLogger(__name__)
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+OUTBOUND_ITEM_CLASS = 'yR1fYc'
+FLIGHT_ROW_CLASS = 'KhL0De'
+HOURS_CLASS = 'mv1WYe'
+DURATION_CLASS = 'Ak5kof'
+PRICE_CLASSES = ('U3gSDe', 'YMlIz')
+DEPARTURE_XPATH = ".//span[contains(@aria-label, 'Hora de salida')]"
+LANDING_XPATH = ".//span[contains(@aria-label, 'Hora de llegada')]"
+
+_outbound_items = etree.XPath(f'//*[{_has_class(OUTBOUND_ITEM_CLASS)}]')
+_flight_rows = etree.XPath(f'//*[{_has_class(FLIGHT_ROW_CLASS)}]')
+_item_row = etree.XPath(f'.//*[{_has_class(FLIGHT_ROW_CLASS)}]')
+_hours = etree.XPath(f'.//*[{_has_class(HOURS_CLASS)}]')
+_departure = etree.XPath(DEPARTURE_XPATH)
+_landing = etree.XPath(LANDING_XPATH)
+_duration = etree.XPath(f'.//*[{_has_class(DURATION_CLASS)}]')
+_price = etree.XPath(
+    f'.//*[{_has_class(PRICE_CLASSES[0])}]//*[{_has_class(PRICE_CLASSES[1])}]'
+)
+
+
+def parse_clock(time_str: str) -> time:
+    # "6:10 p.m."
+    return parser.parse(time_str.replace('.', '')).time()
+
+
+def parse_duration(duration_str: str) -> timedelta:
+    m = re.match(r'(?:(\d+)\s*h)?\s*(?:(\d+)\s*min)?', duration_str)
+    if not m:
+        raise ValueError(f"Couldn't parse duration from {duration_str!r}")
+    _hours = int(m.group(1)) if m.group(1) else 0
+    _minutes = int(m.group(2)) if m.group(2) else 0
+    return timedelta(hours=_hours, minutes=_minutes)
+
+
+def parse_price(price_str: str) -> Decimal:
+    # "COP 289900"
+    _, _, amount = price_str.partition(' ')
+    try:
+        return Decimal(re.sub(r'[^\d.]', '', amount))
+    except InvalidOperation:
+        raise ValueError(f"Couldn't parse price from {price_str!r}") from None
+
+
+def _first(node, xpath: etree.XPath):
+    nodes = xpath(node)
+    if not nodes:
+        raise ValueError(f'No {xpath.path!r} in flight row')
+    return nodes[0]
+
+
+def parse_row(row, date: datetime) -> Flight:
+    hours = _first(row, _hours)
+    return Flight(
+        date=date,
+        departure_time=parse_clock(rendered_text(_first(hours, _departure))),
+        landing_time=parse_clock(rendered_text(_first(hours, _landing))),
+        price=parse_price(rendered_text(_first(row, _price))),
+        flight_time=parse_duration(rendered_text(_first(row, _duration)).split('\n')[0]),
+    )
+
+
+def parse_outbound(page_source: str, date: datetime) -> list[Optional[Flight]]:
+    """
+    One flight per outbound result, in page order; None for a result that
+    can't be parsed, so indexes still line up with the clickable rows.
+    """
+    flights = []
+    for item in _outbound_items(lxml_html.document_fromstring(page_source)):
+        try:
+            flights.append(parse_row(_first(item, _item_row), date))
+        except ValueError as e:
+            logger.error(f'Error extracting outbound flight data: {e}')
+            flights.append(None)
+    return flights
+
+
+def parse_returns(page_source: str, date: datetime) -> list[Flight]:
+    return [
+        parse_row(row, date)
+        for row in _flight_rows(lxml_html.document_fromstring(page_source))
+    ]
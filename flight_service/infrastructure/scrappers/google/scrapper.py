@@ -1,16 +1,15 @@
 import logging
-import re
 import time
-from datetime import datetime, timedelta
-from decimal import Decimal
+from datetime import datetime
 from typing import Any, Optional
-from dateutil import parser
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 
+from domain.exceptions import NoFlightsFoundError
 from domain.models import SearchParams, FlightResults, Flights, Flight
 from infrastructure.scrappers.base import Scrapper, DriverFactory
+from infrastructure.scrappers.google import parsing
 from selenium.webdriver.support import expected_conditions as EC
 
 
@@ -20,6 +19,7 @@ class GoogleFlightsScrapper(Scrapper):
 
     driver = None
     name = 'Google'
+    replayable = True
     capabilities: dict[str, Any] = {
         'se:name': name,
         'acceptInsecureCerts': True,
@@ -96,7 +96,7 @@ class GoogleFlightsScrapper(Scrapper):
 
             flights = self.get_outbound_flights(driver, search_params)
             if not flights:
-                raise ValueError("No flights found")
+                raise NoFlightsFoundError("No flights found")
             return FlightResults(results=flights)
         return None
 
@@ -149,16 +149,22 @@ class GoogleFlightsScrapper(Scrapper):
 
     def get_outbound_flights(self, driver, search_params: SearchParams):
         wait = WebDriverWait(driver, timeout=10)
-        outbound_flights = len(wait.until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, 'yR1fYc'))
-        ))
+        wait.until(
+            EC.presence_of_all_elements_located((By.CLASS_NAME, parsing.OUTBOUND_ITEM_CLASS))
+        )
+        outbound = self._outbound_rows(driver, search_params)
+        self._record(driver, 'outbound', [flight for flight in outbound if flight])
         flights = []
-        for index in range(outbound_flights):
+        for index, outbound_flight in enumerate(outbound):
+            if outbound_flight is None:
+                continue
             try:
                 flight = wait.until(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, 'yR1fYc'))
+                    EC.presence_of_all_elements_located((By.CLASS_NAME, parsing.OUTBOUND_ITEM_CLASS))
                 )[index]
-                flight_data = self.extract_flight_data(driver, flight, search_params)
+                flight_data = self.extract_flight_data(
+                    driver, flight, outbound_flight, search_params, index
+                )
                 if not flight_data:
                     continue
                 flights.append(flight_data)
@@ -167,68 +173,75 @@ class GoogleFlightsScrapper(Scrapper):
                 break
         return flights
 
-    def extract_flight_data(self, driver, flight_element, search_params: SearchParams) -> Optional[Flights]:
-        wait = WebDriverWait(driver, timeout=10)
+    def extract_step(self, driver, step: str, search_params: SearchParams) -> list[Flight]:
+        if step == 'outbound':
+            return [flight for flight in self._outbound_rows(driver, search_params) if flight]
+        if self.extraction == 'page_source':
+            return parsing.parse_returns(driver.page_source, search_params.return_date)
+        return [
+            self._extract_data(row, search_params, outbound=False)
+            for row in driver.find_elements(By.CLASS_NAME, parsing.FLIGHT_ROW_CLASS)
+        ]
+
+    def _outbound_rows(self, driver, search_params: SearchParams) -> list[Optional[Flight]]:
+        """Outbound flights in page order, None where a row couldn't be read."""
+        if self.extraction == 'page_source':
+            return parsing.parse_outbound(driver.page_source, search_params.departure)
+        rows = []
+        for item in driver.find_elements(By.CLASS_NAME, parsing.OUTBOUND_ITEM_CLASS):
+            try:
+                rows.append(self._extract_data(
+                    item.find_element(By.CLASS_NAME, parsing.FLIGHT_ROW_CLASS),
+                    search_params,
+                    outbound=True
+                ))
+            except Exception as e:
+                logger.error(f"Error extracting outbound flight data: {e}")
+                rows.append(None)
+        return rows
+
+    def _extract_data(self, flight, search_params: SearchParams, outbound: bool) -> Flight:
+        """Per-element extraction: six WebDriver round trips per row."""
+        hours = flight.find_element(By.CLASS_NAME, parsing.HOURS_CLASS)
+        departure_time = parsing.parse_clock(
+            hours.find_element(By.XPATH, parsing.DEPARTURE_XPATH).text
+        )
+        landing_time = parsing.parse_clock(
+            hours.find_element(By.XPATH, parsing.LANDING_XPATH).text
+        )
+        time_duration = flight.find_element(By.CLASS_NAME, parsing.DURATION_CLASS).text.split('\n')[0]
+        price_class, amount_class = parsing.PRICE_CLASSES
+        price = flight.find_element(
+                By.CLASS_NAME, price_class
+        ).find_element(By.CLASS_NAME, amount_class).text
+
+        return Flight(
+            date=search_params.departure if outbound else search_params.return_date,
+            departure_time=departure_time,
+            landing_time=landing_time,
+            price=parsing.parse_price(price),
+            flight_time=parsing.parse_duration(time_duration),
+        )
 
-        def _extract_time(time_str: str) -> time:
-            time_str = time_str.replace('.', '')
-            dt = parser.parse(time_str)
-            return dt.time()
-
-        def _parse_duration(duration_str: str) -> timedelta:
-            m = re.match(r'(?:(\d+)\s*h)?\s*(?:(\d+)\s*min)?', duration_str)
-            if not m:
-                raise ValueError(f"Couldn't parse duration from {duration_str!r}")
-            _hours = int(m.group(1)) if m.group(1) else 0
-            _minutes = int(m.group(2)) if m.group(2) else 0
-            return timedelta(hours=_hours, minutes=_minutes)
-
-        def _extract_data(flight, outbound: bool ) -> Optional[Flight]:
-            hours = flight.find_element(By.CLASS_NAME, 'mv1WYe')
-            _departure_time = hours.find_element(
-                By.XPATH, ".//span[contains(@aria-label, 'Hora de salida')]"
-            ).text
-            departure_time = _extract_time(_departure_time)
-
-            _landing_time = hours.find_element(
-                By.XPATH, ".//span[contains(@aria-label, 'Hora de llegada')]"
-            ).text
-            landing_time = _extract_time(_landing_time)
-
-            time_duration = flight.find_element(By.CLASS_NAME, 'Ak5kof').text.split('\n')[0]
-            flight_time = _parse_duration(time_duration)
-
-            price = flight.find_element(
-                    By.CLASS_NAME, 'U3gSDe'
-            ).find_element(By.CLASS_NAME, 'YMlIz').text.split(' ')[1]
-
-            return Flight(
-                date=search_params.departure if outbound else search_params.return_date,
-                departure_time=departure_time,
-                landing_time=landing_time,
-                price=Decimal(re.sub(r'[^\d.]', '', price)),
-                flight_time=flight_time,
-            )
+    def extract_flight_data(
+        self, driver, flight_element, outbound_flight: Flight,
+        search_params: SearchParams, index: int = 0
+    ) -> Optional[Flights]:
+        wait = WebDriverWait(driver, timeout=10)
 
         try:
-            flight = _extract_data(
-                flight_element.find_element(By.CLASS_NAME, 'KhL0De'),
-                outbound=True
-            )
-
             flight_element.click()
             time.sleep(0.5)
 
+            wait.until(
+                EC.presence_of_all_elements_located((By.CLASS_NAME, parsing.FLIGHT_ROW_CLASS))
+            )
+            step = f'return-{index}'
             flights = Flights(
-                outbound_flight=flight,
-                return_flights=[]
+                outbound_flight=outbound_flight,
+                return_flights=self.extract_step(driver, step, search_params)
             )
-            flights.return_flights.extend([
-                _extract_data(return_flight, outbound=False)
-                for return_flight in wait.until(
-                    EC.presence_of_all_elements_located((By.CLASS_NAME, 'KhL0De'))
-                )
-            ])
+            self._record(driver, step, flights.return_flights)
 
             driver.back()
             time.sleep(1)
@@ -0,0 +1,146 @@
+"""
+One remote browser shared by several concurrent scrapes, one tab each.
+
+A WebDriver session only has one active window, so every command a tab
+sends takes the browser lock and switches to the tab's window first (only
+when another tab was the last to run). Waits (``WebDriverWait`` polling,
+sleeps between clicks) happen outside the lock, so while one search waits
+for a page the others keep driving their own tabs.
+"""
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from selenium.common import exceptions
+from selenium.webdriver.remote.webelement import WebElement
+
+logger = logging.getLogger(__name__)
+
+
+class SharedBrowser:
+
+    def __init__(self, driver_factory: Callable[[], Any], tabs: int):
+        self._driver_factory = driver_factory
+        self._tabs = threading.BoundedSemaphore(tabs)
+        self._lock = threading.RLock()
+        self._driver = None
+        self._idle_handles: list[str] = []
+        self._current: Optional[str] = None
+        self.max_tabs = tabs
+        atexit.register(self.close)
+
+    @contextmanager
+    def tab(self) -> Iterator['TabDriver']:
+        """A tab of the shared browser, for the duration of one scrape."""
+        with self._tabs:
+            handle = self._open_tab()
+            try:
+                yield TabDriver(self, handle)
+            except exceptions.InvalidSessionIdException:
+                self._discard()
+                raise
+            finally:
+                self._release_tab(handle)
+
+    def run(self, handle: str, command: Callable[[Any], Any]) -> Any:
+        """Run ``command`` against the driver with ``handle``'s window active."""
+        with self._lock:
+            driver = self._driver
+            if driver is None:
+                raise exceptions.InvalidSessionIdException('Shared browser was closed')
+            if self._current != handle:
+                driver.switch_to.window(handle)
+                self._current = handle
+            return command(driver)
+
+    def _open_tab(self) -> str:
+        with self._lock:
+            if self._driver is None:
+                self._driver = self._driver_factory()
+                self._current = self._driver.current_window_handle
+                self._idle_handles = [self._current]
+            if self._idle_handles:
+                return self._idle_handles.pop()
+            self._driver.switch_to.new_window('tab')
+            self._current = self._driver.current_window_handle
+            return self._current
+
+    def _release_tab(self, handle: str) -> None:
+        with self._lock:
+            if self._driver is None:
+                return
+            try:
+                # don't keep the last search's page (and its scripts) running
+                self.run(handle, lambda driver: driver.get('about:blank'))
+                self._idle_handles.append(handle)
+            except exceptions.WebDriverException as e:
+                logger.warning(f'Dropping shared browser after a failed tab reset: {e}')
+                self._discard()
+
+    def _discard(self) -> None:
+        with self._lock:
+            driver, self._driver = self._driver, None
+            self._idle_handles = []
+            self._current = None
+        if driver is not None:
+            try:
+                driver.quit()
+            except exceptions.WebDriverException as e:
+                logger.error(f'Error while quitting WebDriver: {e}')
+
+    def close(self) -> None:
+        self._discard()
+
+
+def _wrap(browser: SharedBrowser, handle: str, value: Any) -> Any:
+    if isinstance(value, WebElement):
+        return TabElement(browser, handle, value)
+    if isinstance(value, list) and value and isinstance(value[0], WebElement):
+        return [TabElement(browser, handle, element) for element in value]
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    return value._target if isinstance(value, _TabProxy) else value
+
+
+class _TabProxy:
+    """Forwards attribute reads and method calls to ``_target`` inside its tab."""
+
+    def __init__(self, browser: SharedBrowser, handle: str, target: Any = None):
+        self._browser = browser
+        self._handle = handle
+        self._target = target
+
+    def _resolve(self, driver):
+        return driver
+
+    def __getattr__(self, name: str) -> Any:
+        value = self._browser.run(
+            self._handle, lambda driver: getattr(self._resolve(driver), name)
+        )
+        if not callable(value):
+            return _wrap(self._browser, self._handle, value)
+
+        def call(*args, **kwargs):
+            args = [_unwrap(arg) for arg in args]
+            kwargs = {key: _unwrap(arg) for key, arg in kwargs.items()}
+            return _wrap(self._browser, self._handle, self._browser.run(
+                self._handle, lambda driver: getattr(self._resolve(driver), name)(*args, **kwargs)
+            ))
+        return call
+
+
+class TabDriver(_TabProxy):
+
+    @property
+    def window_handle(self) -> str:
+        return self._handle
+
+
+class TabElement(_TabProxy):
+
+    def _resolve(self, driver):
+        return self._target
@@ -0,0 +1,119 @@
+"""
+Negotiated response compression for the REST app.
+
+Bodies of at least ``min_size`` bytes are compressed with brotli (when the
+``brotli`` package is installed) or gzip, whichever the client prefers.
+Streamed responses are compressed chunk by chunk, so they stay streamed.
+"""
+import logging
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from flask import Flask, Response, request
+
+from constants import config
+
+logger = logging.getLogger(__name__)
+
+MIN_SIZE = config.getint('Http', 'compression_min_size', fallback=1024)
+GZIP_LEVEL = config.getint('Http', 'gzip_level', fallback=6)
+BROTLI_QUALITY = config.getint('Http', 'brotli_quality', fallback=4)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+    logger.info('brotli not installed; responses are compressed with gzip only')
+
+
+def supported_encodings() -> tuple[str, ...]:
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate(accept_encoding, encodings: tuple[str, ...]) -> Optional[str]:
+    """The client's preferred encoding among ``encodings``, ties go to the first."""
+    best, best_quality = None, 0
+    for encoding in encodings:
+        quality = accept_encoding[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor:
+
+    def __init__(self, encoding: str):
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            # wbits 16 + 15: gzip container
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        self._encoding = encoding
+
+    def compress(self, data: bytes) -> bytes:
+        if self._encoding == 'br':
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        if self._encoding == 'br':
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    compressor = _Compressor(encoding)
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    compressor = _Compressor(encoding)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _compressible(response: Response) -> bool:
+    return (
+        response.status_code in (200, 304)
+        and 'Content-Encoding' not in response.headers
+        and response.mimetype == 'application/json'
+        and request.method != 'HEAD'
+    )
+
+
+def _weaken_etag(response: Response) -> None:
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+
+def compress_response(response: Response, min_size: int = MIN_SIZE) -> Response:
+    if not _compressible(response):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate(request.accept_encodings, supported_encodings())
+    if encoding is None:
+        return response
+    # a compressed body is a different representation: keep the validator
+    # usable for revalidation (weak comparison) without claiming byte identity.
+    # Decided on the request alone, so a 304 carries the same form as the 200.
+    _weaken_etag(response)
+    if response.status_code == 304:
+        return response
+    if not response.is_streamed and response.calculate_content_length() < min_size:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_chunks(response.response, encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(compress(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def install_compression(app: Flask, min_size: int = MIN_SIZE) -> None:
+    app.after_request(lambda response: compress_response(response, min_size))
@@ -1,15 +1,32 @@
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from typing import Iterator
 
-from flask import Flask, request
+from flask import Flask, Response, request
 from pydantic import ValidationError
 
 from constants import config
-from domain.models import SearchParams
+from domain.exceptions import ScrapeRejectedError
+from domain.models import SearchParams, FlightResults, CacheStatus, CachedResponse
+from domain.combinations import cheapest_round_trips
+from domain.ranking import rank
+from domain.results_query import (
+    ResultsQuery, RankMode, RankWeights, TripConstraints, apply_query, decode_cursor
+)
+from domain.search.base import FlightsFinder
 from infrastructure.feature_flag.flags import feature_flag_client
 from infrastructure.feature_flag.memory_provider import WELCOME_MESSAGE_FLAG
 from main import dependencies
-from presentations.rest.models.inputs import Inputs, SearchParamsInputModel
+from presentations.rest.models.inputs import (
+    Inputs, SearchParamsInputModel, ResultsQueryInputModel
+)
+from utils.cache_stats import cache_stats
+from presentations.rest.compression import install_compression
+from utils.response_payload import (
+    serialize_results, response_for_body, stream_results, is_streamed
+)
+from utils.search_key import search_id, key_for_search_id
 
 
 logger = logging.getLogger(__name__)
@@ -41,8 +58,144 @@ def validate(token):
     return True
 
 
+def _cache_headers(results: FlightResults) -> dict[str, str]:
+    headers = {}
+    if results.cache_status:
+        headers['X-Cache'] = results.cache_status.value
+    if results.outcome:
+        headers['X-Search-Outcome'] = results.outcome.value
+    return headers
+
+
+def _results_query(args) -> ResultsQuery:
+    options = ResultsQueryInputModel(**args.to_dict())
+    query = ResultsQuery(
+        max_price=options.max_price,
+        departure_from=options.departure_from,
+        departure_to=options.departure_to,
+        max_duration=(
+            timedelta(minutes=options.max_duration) if options.max_duration else None
+        ),
+        sort=options.sort,
+        descending=options.order == 'desc',
+        limit=options.limit,
+        cursor=options.cursor,
+        fields=options.fields,
+        rank=options.rank,
+        weights=RankWeights(
+            price=options.price_weight,
+            duration=options.duration_weight,
+            departure=options.departure_weight,
+            preferred_departure=options.preferred_departure,
+        ),
+        constraints=TripConstraints(
+            min_stay=(
+                timedelta(hours=options.min_stay) if options.min_stay is not None else None
+            ),
+            max_travel_time=(
+                timedelta(minutes=options.max_travel_time) if options.max_travel_time else None
+            ),
+            same_day_arrival=options.same_day_arrival,
+        ),
+    )
+    if query.cursor:
+        decode_cursor(query.cursor, query)
+    return query
+
+
+def _json_response(body: bytes | Iterator[bytes], headers: dict[str, str]) -> Response:
+    return Response(body, status=200, mimetype='application/json', headers=headers)
+
+
+def _cacheable_response(
+    cached: CachedResponse, search_params: SearchParams, headers: dict[str, str]
+) -> Response:
+    """Full body with its validator and the URL it can be re-fetched from."""
+    response = _json_response(cached.body, headers)
+    response.set_etag(cached.etag)
+    response.headers['Content-Location'] = f'/searches/{search_id(search_params)}'
+    return response
+
+
+def _full_results(
+    results: FlightResults, search_params: SearchParams, headers: dict[str, str]
+) -> Response:
+    if is_streamed(results):
+        # chunked: peak memory stays flat, at the cost of the ETag; no body is
+        # cached for /searches either
+        return _json_response(stream_results(results), headers)
+    # same bytes the repositories cache for the fast path
+    body = serialize_results(results)
+    if not results.results:
+        return _json_response(body, headers)
+    return _cacheable_response(response_for_body(body), search_params, headers)
+
+
+def _page(results: FlightResults, query: ResultsQuery) -> tuple[list[dict], dict]:
+    if query.rank == RankMode.CHEAPEST:
+        page = cheapest_round_trips(results, query)
+    elif query.rank:
+        page = rank(results, query)
+    else:
+        page = apply_query(results, query)
+    headers = {'X-Total-Count': str(page.total)}
+    if page.next_cursor:
+        headers['X-Next-Cursor'] = page.next_cursor
+    return page.items, headers
+
+
+def _build_finder(airline: str, repository_name: str, publisher_name: str) -> FlightsFinder:
+    scrapper = dependencies['scrappers'][airline]
+    recorder = dependencies.get('recorder')
+    if recorder:
+        scrapper = recorder.guard(airline, scrapper)
+    admission = dependencies.get('admission')
+    if admission:
+        scrapper = admission.guard(airline, scrapper)
+    circuit_breaker = dependencies.get('circuit_breaker')
+    if circuit_breaker:
+        scrapper = circuit_breaker.guard(airline, scrapper)
+    repository = dependencies['repositories'][repository_name]()
+    publisher = dependencies['publishers'][publisher_name]()
+    return dependencies['finders'].get(airline)(
+        scrapper=scrapper,
+        repository=repository,
+        publisher=publisher
+    )
+
+
+def _fallback_order(params: Inputs) -> list[str]:
+    if not params.airlines:
+        return [params.airline]
+    circuit_breaker = dependencies.get('circuit_breaker')
+    if not circuit_breaker:
+        return params.airlines
+    # every circuit open: still ask the first provider, it may be cached
+    return circuit_breaker.order(params.airlines) or params.airlines[:1]
+
+
+def _search(
+    finders: list[tuple[str, FlightsFinder]], search_params: SearchParams
+) -> tuple[str, FlightResults]:
+    """Return the first provider's results with flights, else the first empty answer."""
+    fallback = None
+    for index, (airline, finder) in enumerate(finders):
+        try:
+            results = finder.get_flights(search_params)
+        except Exception as e:
+            if index == len(finders) - 1 and fallback is None:
+                raise
+            logger.warning(f'Search with {airline} failed, trying the next provider: {e}')
+            continue
+        if results.results:
+            return airline, results
+        fallback = fallback or (airline, results)
+    return fallback
+
+
 def create_app():
     app = Flask(__name__)
+    install_compression(app)
     repository_name = config['Default']['repository']
     publisher_name = config['Default']['publisher']
 
@@ -51,38 +204,84 @@ def create_app():
         try:
             params = Inputs(
                 airline=request.json.get('airline', config['Default']['airline']),
+                airlines=request.json.get('airlines'),
                 search_params=SearchParamsInputModel(**request.json.get('search_params', {}))
             )
+            query = _results_query(request.args)
         except ValidationError as e:
             logger.error(e)
             return e.errors(), 400
+        except ValueError as e:
+            return {'errors': {'query': str(e)}}, 400
         except KeyError as e:
             logger.error(e)
             return {'errors': {'airline': f"Missing value"}}, 400
 
         try:
-            scrapper = dependencies['scrappers'][params.airline]
-            repository = dependencies['repositories'][repository_name]()
-            publisher = dependencies['publishers'][publisher_name]()
-            finder = dependencies['finders'].get(params.airline)(
-                scrapper=scrapper,
-                repository=repository,
-                publisher=publisher
-            )
+            finders = [
+                (airline, _build_finder(airline, repository_name, publisher_name))
+                for airline in _fallback_order(params)
+            ]
         except KeyError as e:
             return {'error': f'Dependency {e} dont available'}, 400
 
         try:
-            results = finder.get_flights(
-                SearchParams(
-                    **params.search_params.model_dump()
-                )
+            search_params = SearchParams(**params.search_params.model_dump())
+            if query.is_empty:
+                # cache hit fast path: the stored body goes out untouched
+                airline, finder = finders[0]
+                cached = finder.get_cached_response(search_params)
+                if cached:
+                    return _cacheable_response(
+                        cached, search_params,
+                        {'X-Cache': CacheStatus.HIT.value, 'X-Provider': airline}
+                    )
+
+            airline, results = _search(finders, search_params)
+            headers = {**_cache_headers(results), 'X-Provider': airline}
+            if query.is_empty:
+                return _full_results(results, search_params, headers)
+            # pages are bounded by limit, they are encoded in one go
+            items, page_headers = _page(results, query)
+            return items, 200, {**headers, **page_headers}
+        except ScrapeRejectedError as e:
+            return (
+                {'message': str(e)},
+                e.status_code,
+                {'Retry-After': str(e.retry_after)}
             )
-            return [result.to_dict() for result in results.results], 200
         except Exception as e:
             logger.error(e)
             return {'message': 'Something went wrong'}, 400
 
+    @app.route("/searches/<resource_id>", methods=['GET'])
+    def get_search(resource_id):
+        """
+        Cached results of a search by id (the ``Content-Location`` of
+        ``/get_flights``). Public and cacheable until the entry expires;
+        answers 304 to a matching ``If-None-Match``.
+        """
+        try:
+            key = key_for_search_id(resource_id)
+        except ValueError as e:
+            return {'message': str(e)}, 400
+        repository = dependencies['repositories'][repository_name]()
+        cached = repository.find_cached_response(key)
+        if not cached:
+            return {'message': 'Search not cached, POST it to /get_flights'}, 404, {
+                'Cache-Control': 'no-store'
+            }
+
+        response = _json_response(cached.body, {'X-Cache': CacheStatus.HIT.value})
+        response.set_etag(cached.etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = cached.max_age(time.time())
+        return response.make_conditional(request)
+
+    @app.route("/cache_stats", methods=['GET'])
+    def get_cache_stats():
+        return cache_stats.snapshot(), 200
+
     @app.route("/")
     def hello_world():
         is_message_on = feature_flag_client.get_boolean_value(WELCOME_MESSAGE_FLAG, False)
@@ -1,7 +1,10 @@
-from datetime import datetime
+from datetime import datetime, time
+from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from domain.results_query import SortKey, RankMode, FLIGHT_FIELDS
 
 
 class SearchParamsInputModel(BaseModel):
@@ -17,4 +20,40 @@ class SearchParamsInputModel(BaseModel):
 
 class Inputs(BaseModel):
     airline: str
+    # fan-out search: providers tried in order of circuit health until one
+    # returns flights; ``airline`` is used when not given
+    airlines: Optional[list[str]] = Field(default=None)
     search_params: SearchParamsInputModel
+
+
+class ResultsQueryInputModel(BaseModel):
+    """Query string options of ``/get_flights``, see ``domain.results_query``."""
+    max_price: Optional[Decimal] = Field(default=None, ge=0)
+    departure_from: Optional[time] = Field(default=None)
+    departure_to: Optional[time] = Field(default=None)
+    # minutes
+    max_duration: Optional[int] = Field(default=None, gt=0)
+    sort: Optional[SortKey] = Field(default=None)
+    order: str = Field(default='asc', pattern='^(asc|desc)$')
+    limit: Optional[int] = Field(default=None, gt=0, le=500)
+    cursor: Optional[str] = Field(default=None)
+    fields: Optional[list[str]] = Field(default=None)
+    rank: Optional[RankMode] = Field(default=None)
+    price_weight: float = Field(default=1.0, ge=0)
+    duration_weight: float = Field(default=0.5, ge=0)
+    departure_weight: float = Field(default=0.25, ge=0)
+    preferred_departure: Optional[time] = Field(default=None)
+    # rank=cheapest constraints: hours, minutes
+    min_stay: Optional[float] = Field(default=None, ge=0)
+    max_travel_time: Optional[int] = Field(default=None, gt=0)
+    same_day_arrival: bool = Field(default=False)
+
+    @field_validator('fields', mode='before')
+    @classmethod
+    def split_fields(cls, value):
+        if isinstance(value, str):
+            value = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = set(value or []) - set(FLIGHT_FIELDS)
+        if unknown:
+            raise ValueError(f'unknown fields {sorted(unknown)}, expected {list(FLIGHT_FIELDS)}')
+        return value
@@ -154,3 +154,16 @@ def _configure_sdk(service_name: str, endpoint: str, app: object | None) -> None
     LoggingInstrumentor().instrument(set_logging_format=False)
     RequestsInstrumentor().instrument()
     FlaskInstrumentor().instrument(tracer_provider=tracer_provider, meter_provider=meter_provider)
+
+
+def get_meter(name: str):
+    """Return an OpenTelemetry meter, or ``None`` when the API is not installed.
+
+    Instruments created from it are no-ops until ``setup_telemetry`` registers
+    a real MeterProvider, so callers can create them at import time.
+    """
+    try:
+        from opentelemetry import metrics
+    except ImportError:
+        return None
+    return metrics.get_meter(name)
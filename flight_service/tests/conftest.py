@@ -65,6 +65,7 @@ def test_client(bootstrap_fixture, mock_config):
 @pytest.fixture
 def mock_redis(monkeypatch):
     mock = Mock(spec=Redis)
+    mock.get.return_value = None
     return mock
 
 
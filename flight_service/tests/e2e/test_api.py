@@ -1,13 +1,16 @@
+import gzip
 import json
 from datetime import datetime, timedelta, time
 from decimal import Decimal
 from unittest.mock import Mock
 
 import pytest
+from domain.exceptions import ScrapeRejectedError
 from domain.models import FlightResults, Flight, Flights
 from domain.search.google import GoogleFlightsFinder
 from infrastructure.repositories.redis.repository import RedisRepository
 from utils.json_decoders import FlightsJSONEncoder
+from utils.response_payload import build_response, pack_response, serialize_results, response_for_body
 
 
 class TestGetFlightsAPI:
@@ -100,7 +103,8 @@ class TestGetFlightsAPI:
         repository = mock_config['Default']['repository']
         keys, redis_side_effects = self._configure_redis_response(mock_flights_results)
         mock_redis.keys.return_value = keys
-        mock_redis.get.side_effect = redis_side_effects
+        # results cached before responses were stored pre-serialized
+        mock_redis.get.side_effect = [None, *redis_side_effects]
         bootstrap_fixture(
             finders=GoogleFlightsFinder,
             scrappers=mock_scrapper(
@@ -152,6 +156,42 @@ class TestGetFlightsAPI:
         })
         assert response.status_code == 200
         assert response.json == []
+        assert response.headers['X-Cache'] == 'miss'
+        assert response.headers['X-Search-Outcome'] == 'no_flights'
+
+    def test_get_flights_provider_error_is_answered_alike_fresh_and_cached(
+        self, test_client, bootstrap_fixture, mock_scrapper,
+        mock_create_driver_function, mock_redis
+    ):
+        mock_redis.keys.return_value = []
+        bootstrap_fixture(
+            'test_airline',
+            finders=GoogleFlightsFinder,
+            scrappers=mock_scrapper(create_driver=Mock(), side_effect=TimeoutError('grid timeout')),
+            repositories={'redis': Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))},
+            publishers={'redis': Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))}
+        )
+        payload = {
+            'airline': 'test_airline',
+            'search_params': {
+                'origin': 'origin',
+                'destination': 'destination',
+                'departure': '2023-10-10',
+                'return_date': '2023-10-20'
+            }
+        }
+
+        fresh = test_client.post(self.endpoint, json=payload)
+        mock_redis.get.side_effect = lambda key: (
+            'provider_error' if key.endswith(':negative') else None
+        )
+        cached = test_client.post(self.endpoint, json=payload)
+
+        for response, cache_status in ((fresh, 'miss'), (cached, 'negative_hit')):
+            assert response.status_code == 200
+            assert response.json == []
+            assert response.headers['X-Search-Outcome'] == 'provider_error'
+            assert response.headers['X-Cache'] == cache_status
 
     def test_get_flights_unavailable_airline(
         self, test_client, bootstrap_fixture,
@@ -211,3 +251,230 @@ class TestGetFlightsAPI:
         for error in response.json:
             error['msg'] == 'Field Required'
             error['type'] == 'missing'
+
+    def test_get_flights_shed_load_returns_retry_after(
+        self, test_client, bootstrap_fixture, mock_scrapper,
+        mock_create_driver_function, mock_redis
+    ):
+        mock_redis.keys.return_value = []
+        bootstrap_fixture(
+            'test_airline',
+            finders=GoogleFlightsFinder,
+            scrappers=mock_scrapper(
+                create_driver=Mock(),
+                side_effect=ScrapeRejectedError('test_airline', 'queue_full', 429, 5)
+            ),
+            repositories={'redis': Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))},
+            publishers={'redis': Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))}
+        )
+        response = test_client.post(self.endpoint, json={
+            'airline': 'test_airline',
+            'search_params': {
+                'origin': 'origin',
+                'destination': 'destination',
+                'departure': '2023-10-10',
+                'return_date': '2023-10-20'
+            }
+        })
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == '5'
+        mock_redis.set.assert_not_called()
+
+    def test_get_flights_query_options(
+        self, test_client, mock_scrapper, mock_flights_results,
+        bootstrap_fixture, mock_create_driver_function, mock_redis
+    ):
+        keys, redis_side_effects = self._configure_redis_response(mock_flights_results)
+        mock_redis.keys.return_value = keys
+        mock_redis.get.side_effect = redis_side_effects
+        bootstrap_fixture(
+            'test_airline',
+            finders=GoogleFlightsFinder,
+            scrappers=mock_scrapper(create_driver=Mock()),
+            repositories={'redis': Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))},
+            publishers={'redis': Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))}
+        )
+        response = test_client.post(
+            f'{self.endpoint}?sort=price&limit=10&fields=price,departure_time',
+            json={
+                'airline': 'test_airline',
+                'search_params': {
+                    'origin': 'origin',
+                    'destination': 'destination',
+                    'departure': '2023-10-10',
+                    'return_date': '2023-10-20'
+                }
+            }
+        )
+        assert response.status_code == 200
+        assert response.headers['X-Total-Count'] == '1'
+        assert response.json[0]['outbound'] == {'price': '250.00', 'departure_time': '08:00'}
+
+    def test_get_flights_invalid_query_options(
+        self, test_client, bootstrap_fixture, mock_scrapper, mock_create_driver_function
+    ):
+        bootstrap_fixture('test_airline', scrappers=mock_scrapper(create_driver=Mock()))
+        response = test_client.post(f'{self.endpoint}?sort=airline&cursor=abc', json={
+            'airline': 'test_airline',
+            'search_params': {
+                'origin': 'origin',
+                'destination': 'destination',
+                'departure': '2023-10-10',
+                'return_date': '2023-10-20'
+            }
+        })
+        assert response.status_code == 400
+
+    def test_get_flights_cache_hit_fast_path(
+        self, test_client, mock_scrapper, mock_flights_results,
+        bootstrap_fixture, mock_create_driver_function, mock_redis
+    ):
+        body = serialize_results(mock_flights_results)
+        mock_redis.get.return_value = pack_response(build_response(mock_flights_results)).decode()
+        scrapper = mock_scrapper(create_driver=Mock())
+        bootstrap_fixture(
+            'test_airline',
+            finders=GoogleFlightsFinder,
+            scrappers=scrapper,
+            repositories={'redis': Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))},
+            publishers={'redis': Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))}
+        )
+        response = test_client.post(self.endpoint, json={
+            'airline': 'test_airline',
+            'search_params': {
+                'origin': 'origin',
+                'destination': 'destination',
+                'departure': '2023-10-10',
+                'return_date': '2023-10-20'
+            }
+        })
+        assert response.status_code == 200
+        assert response.data == body
+        assert response.headers['X-Cache'] == 'hit'
+        mock_redis.keys.assert_not_called()
+        scrapper.get_flights.assert_not_called()
+
+    def test_get_flights_large_results_are_streamed(
+        self, test_client, mock_scrapper, mock_flights_results,
+        bootstrap_fixture, mock_create_driver_function, mock_redis, mock_config, monkeypatch
+    ):
+        repository = mock_config['Default']['repository']
+        publisher = mock_config['Default']['publisher']
+        monkeypatch.setattr('utils.response_payload.STREAM_MIN_FLIGHTS', 1)
+        mock_redis.keys.return_value = []
+        bootstrap_fixture(
+            'test_airline',
+            finders=GoogleFlightsFinder,
+            scrappers=mock_scrapper(create_driver=Mock(), returned_value=mock_flights_results),
+            repositories={repository: Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))},
+            publishers={publisher: Mock(side_effect=lambda: self._mock_redis_repo(mock_redis))}
+        )
+        response = test_client.post(self.endpoint, json={
+            'airline': 'test_airline',
+            'search_params': {
+                'origin': 'origin',
+                'destination': 'destination',
+                'departure': '2023-10-10',
+                'return_date': '2023-10-20'
+            }
+        }, headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert 'ETag' not in response.headers
+        assert 'Content-Location' not in response.headers
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.data) == serialize_results(mock_flights_results)
+
+
+class TestSearchResourceAPI:
+
+    search_id = 'a' * 64
+
+    @pytest.fixture
+    def cached_response(self):
+        return response_for_body(b'[{"outbound":{}}]', ttl=600)
+
+    @pytest.fixture
+    def client(self, test_client, bootstrap_fixture, mock_scrapper, mock_redis):
+        bootstrap_fixture(
+            'test_airline',
+            scrappers=mock_scrapper(create_driver=Mock()),
+            repositories={'redis': Mock(side_effect=lambda: RedisRepository(
+                client_factory=Mock(return_value=mock_redis)
+            ))},
+        )
+        return test_client
+
+    def test_cached_search_is_public_and_validated(self, client, mock_redis, cached_response):
+        mock_redis.get.return_value = pack_response(cached_response).decode()
+
+        response = client.get(f'/searches/{self.search_id}')
+
+        assert response.status_code == 200
+        assert response.data == cached_response.body
+        assert response.headers['ETag'] == f'"{cached_response.etag}"'
+        assert response.cache_control.public
+        assert 590 <= response.cache_control.max_age <= 600
+        mock_redis.get.assert_called_once_with(f'flights:v1:{self.search_id}:response')
+
+    def test_matching_etag_is_not_modified(self, client, mock_redis, cached_response):
+        mock_redis.get.return_value = pack_response(cached_response).decode()
+
+        response = client.get(
+            f'/searches/{self.search_id}',
+            headers={'If-None-Match': f'"{cached_response.etag}"'}
+        )
+
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == f'"{cached_response.etag}"'
+
+    def test_compressed_search_revalidates_with_the_same_etag(self, client, mock_redis):
+        cached = response_for_body(b'[' + b'{"outbound":{}},' * 200 + b'{}]', ttl=600)
+        mock_redis.get.return_value = pack_response(cached).decode()
+
+        full = client.get(f'/searches/{self.search_id}', headers={'Accept-Encoding': 'gzip'})
+        revalidated = client.get(f'/searches/{self.search_id}', headers={
+            'Accept-Encoding': 'gzip', 'If-None-Match': full.headers['ETag']
+        })
+
+        assert full.headers['Content-Encoding'] == 'gzip'
+        assert full.headers['ETag'] == f'W/"{cached.etag}"'
+        assert revalidated.status_code == 304
+        assert revalidated.headers['ETag'] == full.headers['ETag']
+        assert 'Accept-Encoding' in revalidated.headers['Vary']
+
+    def test_stale_etag_gets_the_body(self, client, mock_redis, cached_response):
+        mock_redis.get.return_value = pack_response(cached_response).decode()
+
+        response = client.get(f'/searches/{self.search_id}', headers={'If-None-Match': '"r2-old"'})
+
+        assert response.status_code == 200
+        assert response.data == cached_response.body
+
+    def test_unknown_search(self, client, mock_redis):
+        response = client.get(f'/searches/{self.search_id}')
+
+        assert response.status_code == 404
+        assert response.headers['Cache-Control'] == 'no-store'
+
+    def test_invalid_search_id(self, client):
+        assert client.get('/searches/not-a-hash').status_code == 400
+
+    def test_post_points_to_the_resource(self, client, mock_redis, cached_response):
+        mock_redis.get.return_value = pack_response(cached_response).decode()
+
+        response = client.post('/get_flights', json={
+            'airline': 'test_airline',
+            'search_params': {
+                'origin': 'BOG',
+                'destination': 'MDE',
+                'departure': '2023-10-10',
+                'return_date': '2023-10-20'
+            }
+        })
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] == f'"{cached_response.etag}"'
+        assert response.headers['Content-Location'].startswith('/searches/')
+        assert len(response.headers['Content-Location']) == len('/searches/') + 64
@@ -0,0 +1,121 @@
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from redis import Redis
+from redis.exceptions import ConnectionError
+
+from domain.exceptions import ScrapeRejectedError
+from domain.models import SearchParams, FlightResults
+from infrastructure.admission.controller import AdmissionController
+from infrastructure.admission.redis_slots import RedisSlots
+from infrastructure.scrappers.base import Scrapper
+
+
+class TestAdmissionController:
+
+    @pytest.fixture
+    def search_params(self):
+        return SearchParams(
+            origin="BOG",
+            destination="MDE",
+            departure=datetime(2024, 5, 1),
+            return_date=datetime(2024, 5, 10),
+        )
+
+    def _redis_slots(self, client):
+        return RedisSlots(
+            client_factory=Mock(return_value=client), limit=1, poll_interval=0.01
+        )
+
+    def test_guarded_scrapper_runs_inside_a_slot(self, search_params):
+        admission = AdmissionController(default_limit=1)
+        scrapper = Mock(Scrapper)
+        scrapper.get_flights.return_value = FlightResults(results=[])
+
+        results = admission.guard('google', scrapper).get_flights(search_params)
+
+        assert results.results == []
+        scrapper.get_flights.assert_called_once_with(search_params)
+
+    def test_full_queue_is_rejected_with_429(self):
+        admission = AdmissionController(default_limit=1, queue_size=0, retry_after=7)
+
+        with admission.admit('avianca'):
+            with pytest.raises(ScrapeRejectedError) as exc_info:
+                with admission.admit('avianca'):
+                    pass
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retry_after == 7
+
+    def test_waiting_past_the_deadline_is_rejected_with_503(self):
+        admission = AdmissionController(default_limit=1, queue_size=1, queue_timeout=0.01)
+
+        with admission.admit('avianca'):
+            with pytest.raises(ScrapeRejectedError) as exc_info:
+                with admission.admit('avianca'):
+                    pass
+
+        assert exc_info.value.status_code == 503
+        assert admission.queue_depth('avianca') == 0
+
+    def test_providers_have_independent_limits(self):
+        admission = AdmissionController(provider_limits={'google': 1}, queue_size=0)
+
+        with admission.admit('google'):
+            with admission.admit('avianca'):
+                pass
+
+    def test_queued_request_is_admitted_when_a_slot_frees(self):
+        admission = AdmissionController(default_limit=1, queue_size=1, queue_timeout=2)
+        held, release = threading.Event(), threading.Event()
+        holder = threading.Thread(target=self._hold, args=(admission, held, release))
+        holder.start()
+        held.wait()
+        threading.Timer(0.05, release.set).start()
+
+        with admission.admit('google'):
+            pass
+        holder.join()
+
+    @staticmethod
+    def _hold(admission, held, release):
+        with admission.admit('google'):
+            held.set()
+            release.wait()
+
+    def test_global_limit_rejects_with_503(self):
+        client = Mock(spec=Redis)
+        client.eval.return_value = 0
+        admission = AdmissionController(
+            queue_timeout=0.05, global_slots=self._redis_slots(client)
+        )
+
+        with pytest.raises(ScrapeRejectedError) as exc_info:
+            with admission.admit('google'):
+                pass
+
+        assert exc_info.value.reason == 'global_limit'
+        assert exc_info.value.status_code == 503
+
+    def test_global_slot_is_released(self):
+        client = Mock(spec=Redis)
+        client.eval.return_value = 1
+        admission = AdmissionController(global_slots=self._redis_slots(client))
+
+        with admission.admit('google'):
+            pass
+
+        client.zrem.assert_called_once()
+
+    def test_redis_outage_falls_back_to_local_limits(self):
+        client = Mock(spec=Redis)
+        client.eval.side_effect = ConnectionError('redis down')
+        admission = AdmissionController(global_slots=self._redis_slots(client))
+
+        with admission.admit('google'):
+            pass
+
+        client.zrem.assert_not_called()
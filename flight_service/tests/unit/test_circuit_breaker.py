@@ -0,0 +1,213 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from redis import Redis
+
+from domain.exceptions import NoFlightsFoundError, ProviderUnavailableError
+from domain.models import SearchParams, FlightResults, SearchOutcome, CacheStatus
+from domain.search.google import GoogleFlightsFinder
+from infrastructure.circuit_breaker.breaker import CircuitBreaker, CircuitBreakerState
+from infrastructure.circuit_breaker.stores import MemoryBreakerStore, RedisBreakerStore
+from infrastructure.publishers.memory.publisher import MemoryPublisher
+from infrastructure.repositories.base import FlightsRepository
+from infrastructure.scrappers.base import Scrapper
+from presentations.rest.main import _search
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker(
+            store=MemoryBreakerStore(),
+            window_seconds=60,
+            bucket_seconds=10,
+            min_requests=4,
+            failure_rate=0.5,
+            open_seconds=30,
+            clock=clock,
+        )
+
+    @pytest.fixture
+    def search_params(self):
+        return SearchParams(
+            origin="BOG",
+            destination="MDE",
+            departure=datetime(2024, 5, 1),
+            return_date=datetime(2024, 5, 10),
+        )
+
+    def _trip(self, breaker, provider='avianca'):
+        for _ in range(2):
+            breaker.record_success(provider)
+        for _ in range(2):
+            breaker.record_failure(provider)
+
+    def test_opens_once_error_rate_crosses_threshold(self, breaker):
+        breaker.record_failure('avianca')
+        breaker.record_failure('avianca')
+        assert breaker.state('avianca') == CircuitBreakerState.CLOSED
+
+        breaker.record_success('avianca')
+        breaker.record_failure('avianca')
+
+        assert breaker.state('avianca') == CircuitBreakerState.OPEN
+        assert breaker.allow('avianca') is False
+
+    def test_old_failures_leave_the_window(self, breaker, clock):
+        breaker.record_failure('avianca')
+        breaker.record_failure('avianca')
+        breaker.record_failure('avianca')
+        clock.now += 120
+
+        breaker.record_failure('avianca')
+
+        assert breaker.state('avianca') == CircuitBreakerState.CLOSED
+
+    def test_half_open_allows_a_single_probe(self, breaker, clock):
+        self._trip(breaker)
+        clock.now += 31
+
+        assert breaker.allow('avianca') is True
+        assert breaker.state('avianca') == CircuitBreakerState.HALF_OPEN
+        assert breaker.allow('avianca') is False
+
+    def test_successful_probe_closes_the_circuit(self, breaker, clock):
+        self._trip(breaker)
+        clock.now += 31
+        breaker.allow('avianca')
+
+        breaker.record_success('avianca')
+
+        assert breaker.state('avianca') == CircuitBreakerState.CLOSED
+        assert breaker.error_rate('avianca') == 0.0
+
+    def test_late_success_does_not_close_an_open_circuit(self, breaker):
+        self._trip(breaker)
+
+        # a scrape admitted before the circuit opened
+        breaker.record_success('avianca')
+
+        assert breaker.state('avianca') == CircuitBreakerState.OPEN
+        assert breaker.allow('avianca') is False
+
+    def test_redis_reset_deletes_the_window_buckets(self, clock):
+        client = Mock(spec=Redis)
+        client.hmget.return_value = [CircuitBreakerState.HALF_OPEN.value, clock.now]
+        breaker = CircuitBreaker(
+            store=RedisBreakerStore(client_factory=Mock(return_value=client)),
+            window_seconds=30, bucket_seconds=10, clock=clock,
+        )
+
+        breaker.record_success('avianca')
+
+        client.keys.assert_not_called()
+        client.scan.assert_not_called()
+        client.delete.assert_any_call(
+            'breaker:avianca:bucket:98', 'breaker:avianca:bucket:99', 'breaker:avianca:bucket:100'
+        )
+
+    def test_failed_probe_reopens_the_circuit(self, breaker, clock):
+        self._trip(breaker)
+        clock.now += 31
+        breaker.allow('avianca')
+
+        breaker.record_failure('avianca')
+
+        assert breaker.state('avianca') == CircuitBreakerState.OPEN
+        assert breaker.retry_after('avianca') == 30
+
+    def test_order_skips_open_providers_and_prefers_healthy_ones(self, breaker):
+        self._trip(breaker, 'avianca')
+        breaker.record_success('google')
+        breaker.record_failure('dummy')
+
+        assert breaker.order(['avianca', 'dummy', 'google']) == ['google', 'dummy']
+
+    def test_store_outage_admits_requests(self, breaker):
+        breaker.store = Mock(MemoryBreakerStore)
+        breaker.store.get_state.side_effect = ConnectionError('redis down')
+
+        assert breaker.allow('avianca') is True
+
+    def test_guarded_scrapper_records_outcomes(self, breaker, search_params):
+        scrapper = Mock(Scrapper)
+        scrapper.get_flights.return_value = FlightResults(
+            results=[], outcome=SearchOutcome.PROVIDER_ERROR
+        )
+        guarded = breaker.guard('avianca', scrapper)
+        for _ in range(4):
+            guarded.get_flights(search_params)
+
+        with pytest.raises(ProviderUnavailableError):
+            guarded.get_flights(search_params)
+        assert scrapper.get_flights.call_count == 4
+
+    def test_no_flights_is_not_a_failure(self, breaker, search_params):
+        scrapper = Mock(Scrapper)
+        scrapper.get_flights.side_effect = NoFlightsFoundError('No flights found')
+        guarded = breaker.guard('google', scrapper)
+        for _ in range(4):
+            with pytest.raises(NoFlightsFoundError):
+                guarded.get_flights(search_params)
+
+        assert breaker.state('google') == CircuitBreakerState.CLOSED
+
+    def test_open_circuit_gives_an_immediate_degraded_response(self, breaker, search_params):
+        self._trip(breaker, 'google')
+        scrapper = Mock(Scrapper)
+        repository = Mock(FlightsRepository)
+        repository.get_flight_results.return_value = FlightResults(results=[])
+        finder = GoogleFlightsFinder(
+            scrapper=breaker.guard('google', scrapper),
+            repository=repository,
+            publisher=Mock(MemoryPublisher)
+        )
+
+        results = finder.get_flights(search_params)
+
+        assert results.results == []
+        assert results.outcome == SearchOutcome.CIRCUIT_OPEN
+        assert results.cache_status == CacheStatus.MISS
+        scrapper.get_flights.assert_not_called()
+        repository.save_negative_result.assert_not_called()
+
+
+class TestFallbackSearch:
+
+    def _finder(self, **kwargs):
+        finder = Mock(GoogleFlightsFinder)
+        finder.get_flights.configure_mock(**kwargs)
+        return finder
+
+    def test_first_provider_with_flights_wins(self):
+        found = FlightResults(results=[Mock()])
+        finders = [
+            ('avianca', self._finder(side_effect=TimeoutError('grid'))),
+            ('dummy', self._finder(return_value=FlightResults(results=[]))),
+            ('google', self._finder(return_value=found)),
+        ]
+
+        assert _search(finders, Mock(SearchParams)) == ('google', found)
+
+    def test_falls_back_to_first_empty_answer(self):
+        empty = FlightResults(results=[], outcome=SearchOutcome.NO_FLIGHTS)
+        finders = [
+            ('dummy', self._finder(return_value=empty)),
+            ('google', self._finder(side_effect=TimeoutError('grid'))),
+        ]
+
+        assert _search(finders, Mock(SearchParams)) == ('dummy', empty)
@@ -0,0 +1,153 @@
+import random
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+
+from domain.combinations import best_round_trips, cheapest_round_trips, RoundTrip
+from domain.models import Flight, Flights, FlightResults
+from domain.results_query import ResultsQuery, RankMode, SortKey, TripConstraints
+
+
+def _flight(day: int, departure: time, price: str, minutes: int) -> Flight:
+    return Flight(
+        date=datetime(2024, 5, day),
+        departure_time=departure,
+        landing_time=time(0, 0),
+        price=Decimal(price),
+        flight_time=timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture
+def flights():
+    return [
+        Flights(
+            outbound_flight=_flight(1, time(22, 0), '100', 180),  # lands 01:00 next day
+            return_flights=[
+                _flight(2, time(6, 0), '50', 60),
+                _flight(8, time(9, 0), '70', 60),
+            ],
+        ),
+        Flights(
+            outbound_flight=_flight(1, time(8, 0), '200', 60),
+            return_flights=[
+                _flight(8, time(23, 0), '10', 120),  # lands the next day
+                _flight(8, time(12, 0), '90', 300),
+            ],
+        ),
+    ]
+
+
+def _brute_force(flights, k, predicate=lambda trip: True, key=lambda trip: (trip.price, trip.travel_time)):
+    trips = [
+        RoundTrip(option.outbound_flight, flight)
+        for option in flights
+        for flight in option.return_flights or [None]
+    ]
+    return sorted(filter(predicate, trips), key=key)[:k]
+
+
+class TestBestRoundTrips:
+
+    def test_cheapest_first(self, flights):
+        trips, total = best_round_trips(flights, k=3)
+
+        assert [trip.price for trip in trips] == [Decimal(150), Decimal(170), Decimal(210)]
+        assert total == 4
+
+    def test_fastest_first(self, flights):
+        trips, _ = best_round_trips(flights, k=1, objective=SortKey.DURATION)
+
+        assert trips[0].travel_time == timedelta(minutes=180)
+        assert trips[0].price == Decimal(210)
+
+    def test_min_stay(self, flights):
+        query = ResultsQuery(constraints=TripConstraints(min_stay=timedelta(days=1)))
+
+        trips, total = best_round_trips(flights, k=None, query=query)
+
+        assert total == 3
+        assert all(trip.return_flight.date.day == 8 for trip in trips)
+
+    def test_max_travel_time(self, flights):
+        query = ResultsQuery(constraints=TripConstraints(max_travel_time=timedelta(minutes=240)))
+
+        trips, _ = best_round_trips(flights, k=None, query=query)
+
+        assert [trip.travel_time for trip in trips] == [timedelta(minutes=240)] * 2 + [timedelta(minutes=180)]
+
+    def test_same_day_arrival(self, flights):
+        query = ResultsQuery(constraints=TripConstraints(same_day_arrival=True))
+
+        trips, total = best_round_trips(flights, k=None, query=query)
+
+        assert total == 1
+        assert trips[0].return_flight.price == Decimal(90)
+
+    def test_result_filters_apply(self, flights):
+        trips, _ = best_round_trips(flights, k=None, query=ResultsQuery(max_price=Decimal(180)))
+
+        assert [trip.price for trip in trips] == [Decimal(150), Decimal(170)]
+
+    def test_one_way_options(self):
+        flights = [Flights(outbound_flight=_flight(1, time(8, 0), '80', 60), return_flights=None)]
+
+        trips, total = best_round_trips(flights, k=5)
+
+        assert total == 1
+        assert trips[0].return_flight is None
+
+    def test_departure_objective_is_rejected(self, flights):
+        with pytest.raises(ValueError):
+            best_round_trips(flights, k=1, objective=SortKey.DEPARTURE)
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_matches_the_full_product(self, seed):
+        generator = random.Random(seed)
+
+        def flight(day):
+            return _flight(
+                day, time(generator.randrange(24), generator.randrange(60)),
+                str(generator.randrange(50, 400)), generator.randrange(40, 400)
+            )
+
+        flights = [
+            Flights(outbound_flight=flight(1), return_flights=[flight(generator.randrange(1, 5)) for _ in range(8)])
+            for _ in range(12)
+        ]
+        constraints = TripConstraints(
+            min_stay=timedelta(hours=12), max_travel_time=timedelta(minutes=500), same_day_arrival=True
+        )
+
+        def allowed(trip):
+            outbound, back = trip.outbound, trip.return_flight
+            landing = datetime.combine(outbound.date.date(), outbound.departure_time) + outbound.flight_time
+            back_departure = datetime.combine(back.date.date(), back.departure_time)
+            return (
+                back_departure - landing >= constraints.min_stay
+                and trip.travel_time <= constraints.max_travel_time
+                and landing.date() == outbound.date.date()
+                and (back_departure + back.flight_time).date() == back.date.date()
+            )
+
+        trips, _ = best_round_trips(flights, k=10, query=ResultsQuery(constraints=constraints))
+
+        expected = _brute_force(flights, 10, allowed)
+        assert [(t.price, t.travel_time) for t in trips] == [(t.price, t.travel_time) for t in expected]
+
+
+class TestCheapestRoundTrips:
+
+    def test_items_follow_the_flatten_results_shape(self, flights):
+        query = ResultsQuery(rank=RankMode.CHEAPEST, limit=1, fields=['price'])
+
+        page = cheapest_round_trips(FlightResults(results=flights), query)
+
+        assert page.items == [{
+            'outbound': {'price': '100'},
+            'return_in': {'price': '50'},
+            'total_price': '150',
+            'travel_time': '14400.0',
+        }]
+        assert page.total == 4
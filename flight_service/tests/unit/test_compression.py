@@ -0,0 +1,143 @@
+import gzip
+import json
+
+import pytest
+from flask import Flask, Response, request
+from werkzeug.http import parse_accept_header
+
+from benchmarks import serialization
+from presentations.rest import compression
+from presentations.rest.compression import (
+    compress_chunks, install_compression, negotiate
+)
+from utils.response_payload import serialize_results, stream_json_array, stream_results
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    install_compression(app, min_size=100)
+    big = [{'price': str(i), 'departure_time': '08:00'} for i in range(200)]
+
+    @app.route('/big')
+    def big_body():
+        response = Response(json.dumps(big), mimetype='application/json')
+        response.set_etag('r2-abc')
+        return response.make_conditional(request)
+
+    @app.route('/small')
+    def small_body():
+        return {'status': 'ok'}
+
+    @app.route('/streamed')
+    def streamed():
+        return Response(stream_json_array(iter(big)), mimetype='application/json')
+
+    app.big = big
+    return app
+
+
+class TestNegotiation:
+
+    @pytest.mark.parametrize('header, expected', [
+        ('gzip', 'gzip'),
+        ('br;q=1.0, gzip;q=0.8', 'br'),
+        ('br;q=0.5, gzip', 'gzip'),
+        ('identity', None),
+        ('*', 'br'),
+        ('', None),
+    ])
+    def test_preferred_encoding(self, header, expected):
+        assert negotiate(parse_accept_header(header), ('br', 'gzip')) == expected
+
+
+class TestCompressedResponses:
+
+    def test_large_bodies_are_gzipped(self, app):
+        response = app.test_client().get('/big', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert json.loads(gzip.decompress(response.data)) == app.big
+        assert int(response.headers['Content-Length']) == len(response.data)
+
+    def test_strong_etag_becomes_weak(self, app):
+        response = app.test_client().get('/big', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['ETag'] == 'W/"r2-abc"'
+
+    def test_not_modified_carries_the_same_etag(self, app):
+        client = app.test_client()
+        full = client.get('/big', headers={'Accept-Encoding': 'gzip'})
+
+        revalidated = client.get('/big', headers={
+            'Accept-Encoding': 'gzip', 'If-None-Match': full.headers['ETag']
+        })
+
+        assert revalidated.status_code == 304
+        assert revalidated.headers['ETag'] == full.headers['ETag'] == 'W/"r2-abc"'
+        assert 'Content-Encoding' not in revalidated.headers
+
+    def test_small_bodies_are_left_alone(self, app):
+        response = app.test_client().get('/small', headers={'Accept-Encoding': 'gzip'})
+
+        assert 'Content-Encoding' not in response.headers
+        assert response.json == {'status': 'ok'}
+
+    def test_without_accept_encoding(self, app):
+        response = app.test_client().get('/big')
+
+        assert 'Content-Encoding' not in response.headers
+        assert response.headers['ETag'] == '"r2-abc"'
+
+    def test_streamed_bodies_stay_streamed(self, app):
+        response = app.test_client().get('/streamed', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.is_streamed
+        assert 'Content-Length' not in response.headers
+        assert json.loads(gzip.decompress(response.get_data())) == app.big
+
+    def test_brotli(self, app):
+        brotli = pytest.importorskip('brotli')
+
+        response = app.test_client().get('/big', headers={'Accept-Encoding': 'br, gzip'})
+
+        assert response.headers['Content-Encoding'] == 'br'
+        assert json.loads(brotli.decompress(response.data)) == app.big
+
+    def test_gzip_only_without_brotli(self, monkeypatch):
+        monkeypatch.setattr(compression, 'brotli', None)
+
+        assert compression.supported_encodings() == ('gzip',)
+
+
+class TestStreamingEncoder:
+
+    @pytest.mark.parametrize('count', [0, 1, 63, 64, 65, 200])
+    def test_chunks_join_to_the_compact_encoding(self, count):
+        items = [{'i': i} for i in range(count)]
+
+        assert b''.join(stream_json_array(items)) == json.dumps(items, separators=(',', ':')).encode()
+
+    def test_stream_results_matches_serialize_results(self):
+        results = serialization.make_results(500)
+
+        assert b''.join(stream_results(results)) == serialize_results(results)
+
+    def test_compressed_chunks_decompress(self):
+        chunks = [b'[', b'1,2', b',3', b']']
+
+        assert gzip.decompress(b''.join(compress_chunks(chunks, 'gzip'))) == b'[1,2,3]'
+
+
+class TestSerializationBenchmark:
+
+    def test_main_runs(self, capsys):
+        assert serialization.main(['--flights', '100', '--runs', '1']) == 0
+        out = capsys.readouterr().out
+        assert 'stream' in out and 'gzip' in out
+
+    def test_make_results_size(self):
+        results = serialization.make_results(1000)
+
+        assert sum(1 + len(r.return_flights) for r in results.results) == 1000
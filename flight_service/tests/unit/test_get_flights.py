@@ -5,7 +5,7 @@ from unittest.mock import Mock
 
 from domain.search.avianca import AviancaFlightsFinder
 from infrastructure.publishers.memory.publisher import MemoryPublisher
-from domain.models import SearchParams, FlightResults, Flight, Flights
+from domain.models import SearchParams, FlightResults, Flight, Flights, SearchOutcome
 from datetime import datetime, time, timedelta
 
 from infrastructure.repositories.base import FlightsRepository
@@ -135,6 +135,11 @@ class TestFlightsFinder:
             scrapper=scrapper, repository=fake_repository, publisher=publisher
         )
 
-        with pytest.raises(Exception):
-            flight_finder.get_flights(mock_search_params)
+        results = flight_finder.get_flights(mock_search_params)
+
+        assert results.results == []
+        assert results.outcome == SearchOutcome.PROVIDER_ERROR
         scrapper.get_flights.assert_called_once_with(mock_search_params)
+        fake_repository.save_negative_result.assert_called_once_with(
+            mock_search_params, SearchOutcome.PROVIDER_ERROR
+        )
@@ -0,0 +1,42 @@
+import pytest
+
+from benchmarks.fakes import FakeRedis
+from benchmarks.load_test import BenchmarkServer, compare, run_scenario, summarize
+
+
+class TestLoadTestHarness:
+
+    @pytest.fixture
+    def server(self):
+        with BenchmarkServer('redis', latency=0) as server:
+            yield server
+
+    def test_cache_hit_scenario_never_scrapes(self, server):
+        result = run_scenario(server, 'cache_hit', requests=6, concurrency=2)
+
+        assert result.requests == 6
+        assert result.error_rate == 0.0
+        assert result.scrapes == 0
+
+    def test_cache_miss_scenario_scrapes_every_request(self, server):
+        result = run_scenario(server, 'cache_miss', requests=6, concurrency=2)
+
+        assert result.error_rate == 0.0
+        assert result.scrapes == 6
+
+    def test_compare_flags_latency_regressions(self):
+        baseline = summarize('cache_hit', [0.010] * 10, 0, 1.0, 1, 0)
+        slower = summarize('cache_hit', [0.020] * 10, 0, 1.0, 1, 0)
+
+        regressions = compare([slower], {'cache_hit': baseline.__dict__}, tolerance=0.25)
+
+        assert any(r.startswith('cache_hit.p95_ms') for r in regressions)
+
+    def test_fake_redis_expires_keys(self):
+        now = [0.0]
+        client = FakeRedis(clock=lambda: now[0])
+        client.set('flights:v1:a:0', 'x', ex=10)
+        assert client.keys('flights:v1:a:[0-9]*') == ['flights:v1:a:0']
+
+        now[0] = 11
+        assert client.get('flights:v1:a:0') is None
@@ -0,0 +1,281 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+import time as time_module
+from unittest.mock import Mock
+
+import pytest
+from redis import Redis
+
+from domain.models import (
+    SearchParams, FlightResults, Flights, Flight, SearchOutcome, CacheStatus, CachedResponse
+)
+from infrastructure.repositories.base import FlightsRepository
+from infrastructure.repositories.memory.repository import FlightsMemoryRepository, estimate_size
+from infrastructure.repositories.tiered.invalidation import RedisInvalidationBus
+from infrastructure.repositories.tiered.repository import TieredFlightsRepository
+from utils.flight_hash import create_search_params_hash
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _params(destination='MDE'):
+    return SearchParams(
+        origin='BOG',
+        destination=destination,
+        departure=datetime(2024, 5, 1),
+        return_date=datetime(2024, 5, 10),
+    )
+
+
+def _results(returns=1):
+    flight = Flight(
+        date=datetime(2024, 5, 1),
+        departure_time=time(6, 0),
+        landing_time=time(7, 0),
+        price=Decimal(200_000),
+        flight_time=timedelta(hours=1),
+    )
+    return FlightResults(results=[Flights(outbound_flight=flight, return_flights=[flight] * returns)])
+
+
+class TestFlightsMemoryRepository:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def repository(self, clock):
+        return FlightsMemoryRepository(
+            max_entries=2, max_bytes=10_000_000, ttl=60, record_stats=False, clock=clock
+        )
+
+    def test_miss_returns_empty_results(self, repository):
+        results = repository.get_flight_results(_params())
+
+        assert results.results == []
+        assert results.outcome is None
+
+    def test_hit_after_save(self, repository):
+        repository.save_flight(_results(), _params())
+
+        results = repository.get_flight_results(_params())
+
+        assert len(results.results) == 1
+        assert results.cache_status == CacheStatus.HIT
+
+    def test_entries_expire_after_ttl(self, repository, clock):
+        repository.save_flight(_results(), _params())
+        clock.now += 61
+
+        assert repository.get_flight_results(_params()).results == []
+        assert len(repository) == 0
+
+    def test_least_recently_used_entry_is_evicted(self, repository):
+        repository.save_flight(_results(), _params('MDE'))
+        repository.save_flight(_results(), _params('CTG'))
+        repository.get_flight_results(_params('MDE'))
+
+        repository.save_flight(_results(), _params('CLO'))
+
+        assert repository.get_flight_results(_params('MDE')).results
+        assert repository.get_flight_results(_params('CTG')).results == []
+        assert repository.get_flight_results(_params('CLO')).results
+
+    def test_size_bound_evicts_oldest(self, clock):
+        size = estimate_size(_results(returns=10))
+        repository = FlightsMemoryRepository(
+            max_entries=100, max_bytes=size * 2, ttl=60, record_stats=False, clock=clock
+        )
+        for destination in ('MDE', 'CTG', 'CLO'):
+            repository.save_flight(_results(returns=10), _params(destination))
+
+        assert len(repository) == 2
+        assert repository.size_bytes <= size * 2
+        assert repository.get_flight_results(_params('MDE')).results == []
+
+    def test_entry_larger_than_bound_is_not_cached(self, clock):
+        repository = FlightsMemoryRepository(max_bytes=100, record_stats=False, clock=clock)
+
+        repository.save_flight(_results(), _params())
+
+        assert len(repository) == 0
+
+    def test_negative_result_uses_outcome_ttl(self, clock):
+        repository = FlightsMemoryRepository(
+            ttl=300, record_stats=False, clock=clock,
+            negative_ttls={SearchOutcome.NO_FLIGHTS: 30, SearchOutcome.PROVIDER_ERROR: 5},
+        )
+        repository.save_negative_result(_params(), SearchOutcome.PROVIDER_ERROR)
+
+        results = repository.get_flight_results(_params())
+        assert results.outcome == SearchOutcome.PROVIDER_ERROR
+        assert results.cache_status == CacheStatus.NEGATIVE_HIT
+
+        clock.now += 6
+        assert repository.get_flight_results(_params()).outcome is None
+
+
+class TestTieredFlightsRepository:
+
+    @pytest.fixture
+    def l1(self):
+        return FlightsMemoryRepository(ttl=60, record_stats=False, clock=FakeClock())
+
+    @pytest.fixture
+    def l2(self):
+        l2 = Mock(FlightsRepository)
+        l2.get_flight_results.return_value = FlightResults(results=[])
+        return l2
+
+    @pytest.fixture
+    def bus(self):
+        return Mock(RedisInvalidationBus)
+
+    @pytest.fixture
+    def repository(self, l1, l2, bus):
+        return TieredFlightsRepository(l1=l1, l2=l2, invalidation=bus)
+
+    def test_l1_hit_skips_l2(self, repository, l1, l2):
+        l1.save_flight(_results(), _params())
+
+        results = repository.get_flight_results(_params())
+
+        assert results.results
+        l2.get_flight_results.assert_not_called()
+
+    def test_l2_hit_fills_l1(self, repository, l1, l2):
+        l2.get_flight_results.return_value = FlightResults(
+            results=_results().results, cache_status=CacheStatus.HIT
+        )
+
+        repository.get_flight_results(_params())
+        repository.get_flight_results(_params())
+
+        l2.get_flight_results.assert_called_once()
+        assert len(l1) == 1
+
+    def test_l2_negative_hit_fills_l1(self, repository, l1, l2):
+        l2.get_flight_results.return_value = FlightResults(
+            results=[], outcome=SearchOutcome.NO_FLIGHTS
+        )
+
+        repository.get_flight_results(_params())
+
+        assert repository.get_flight_results(_params()).outcome == SearchOutcome.NO_FLIGHTS
+        l2.get_flight_results.assert_called_once()
+
+    def test_miss_in_both_layers(self, repository, l1, l2):
+        results = repository.get_flight_results(_params())
+
+        assert results.results == []
+        assert len(l1) == 0
+
+    def test_l2_response_hit_fills_l1(self, repository, l1, l2):
+        response = CachedResponse(
+            body=b'{}', version='v1', digest='abc', expires_at=int(time_module.time()) + 30
+        )
+        l2.get_cached_response.return_value = response
+
+        assert repository.get_cached_response(_params()) == response
+        assert repository.get_cached_response(_params()) == response
+        assert repository.find_cached_response(create_search_params_hash(_params())) == response
+
+        l2.get_cached_response.assert_called_once()
+        l2.find_cached_response.assert_not_called()
+
+    def test_l1_response_entry_does_not_hide_results(self, repository, l1, l2):
+        l2.get_cached_response.return_value = CachedResponse(
+            body=b'{}', version='v1', digest='abc', expires_at=int(time_module.time()) + 30
+        )
+        l2.get_flight_results.return_value = FlightResults(
+            results=_results().results, cache_status=CacheStatus.HIT
+        )
+
+        repository.get_cached_response(_params())
+
+        assert repository.get_flight_results(_params()).results
+        l2.get_flight_results.assert_called_once()
+
+    def test_expired_l2_response_is_not_kept(self, repository, l1, l2):
+        l2.get_cached_response.return_value = CachedResponse(
+            body=b'{}', version='v1', digest='abc', expires_at=int(time_module.time()) - 1
+        )
+
+        repository.get_cached_response(_params())
+
+        assert len(l1) == 0
+
+    def test_save_writes_through_and_invalidates(self, repository, l1, l2, bus):
+        flights = _results()
+
+        repository.save_flight(flights, _params())
+
+        l2.save_flight.assert_called_once_with(flights, _params())
+        assert l1.get_flight_results(_params()).results
+        bus.publish.assert_called_once_with(create_search_params_hash(_params()))
+
+    def test_save_negative_writes_through_and_invalidates(self, repository, l2, bus):
+        repository.save_negative_result(_params(), SearchOutcome.PROVIDER_ERROR)
+
+        l2.save_negative_result.assert_called_once_with(_params(), SearchOutcome.PROVIDER_ERROR)
+        bus.publish.assert_called_once()
+
+
+class TestRedisInvalidationBus:
+
+    @pytest.fixture
+    def client(self):
+        return Mock(spec=Redis)
+
+    @pytest.fixture
+    def bus(self, client):
+        return RedisInvalidationBus(client_factory=Mock(return_value=client))
+
+    def _handler(self, client):
+        return client.pubsub.return_value.subscribe.call_args.kwargs['flights:invalidate']
+
+    def test_publish_tags_message_with_worker(self, bus, client):
+        bus.publish('flights:v1:abc')
+
+        client.publish.assert_called_once_with(
+            'flights:invalidate', f'{bus.worker_id}|flights:v1:abc'
+        )
+
+    def test_other_workers_messages_invalidate(self, bus, client):
+        on_invalidate = Mock()
+        bus.subscribe(on_invalidate)
+
+        self._handler(client)({'data': 'other-worker|flights:v1:abc'})
+
+        on_invalidate.assert_called_once_with('flights:v1:abc')
+
+    def test_own_messages_are_ignored(self, bus, client):
+        on_invalidate = Mock()
+        bus.subscribe(on_invalidate)
+
+        self._handler(client)({'data': f'{bus.worker_id}|flights:v1:abc'})
+
+        on_invalidate.assert_not_called()
+
+    def test_invalidation_drops_l1_entry(self, bus, client):
+        l1 = FlightsMemoryRepository(record_stats=False)
+        l1.save_flight(_results(), _params())
+        bus.subscribe(l1.invalidate)
+
+        self._handler(client)({'data': f'other|{create_search_params_hash(_params())}'})
+
+        assert len(l1) == 0
+
+    def test_redis_errors_do_not_propagate(self, bus, client):
+        client.publish.side_effect = ConnectionError('down')
+        client.pubsub.side_effect = ConnectionError('down')
+
+        bus.publish('flights:v1:abc')
+        bus.subscribe(Mock())
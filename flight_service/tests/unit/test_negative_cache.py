@@ -0,0 +1,96 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from redis import Redis
+
+from domain.exceptions import NoFlightsFoundError
+from domain.models import SearchParams, FlightResults, SearchOutcome, CacheStatus
+from domain.search.google import GoogleFlightsFinder
+from infrastructure.publishers.memory.publisher import MemoryPublisher
+from infrastructure.repositories.redis.repository import RedisRepository
+from infrastructure.scrappers.base import Scrapper
+
+
+class TestNegativeCache:
+
+    @pytest.fixture
+    def search_params(self):
+        return SearchParams(
+            origin="BOG",
+            destination="XXX",
+            departure=datetime(2024, 5, 1),
+            return_date=datetime(2024, 5, 10),
+        )
+
+    @pytest.fixture
+    def redis_client(self):
+        client = Mock(spec=Redis)
+        client.keys.return_value = []
+        client.get.return_value = None
+        return client
+
+    @pytest.fixture
+    def repository(self, redis_client):
+        return RedisRepository(
+            client_factory=Mock(return_value=redis_client),
+            negative_ttls={
+                SearchOutcome.NO_FLIGHTS: 300,
+                SearchOutcome.PROVIDER_ERROR: 60,
+            }
+        )
+
+    def _finder(self, repository, scrapper):
+        return GoogleFlightsFinder(
+            scrapper=scrapper, repository=repository, publisher=Mock(MemoryPublisher)
+        )
+
+    def test_no_flights_is_cached_with_its_ttl(self, repository, redis_client, search_params):
+        scrapper = Mock(Scrapper)
+        scrapper.get_flights.side_effect = NoFlightsFoundError('No flights found')
+
+        results = self._finder(repository, scrapper).get_flights(search_params)
+
+        assert results.results == []
+        assert results.outcome == SearchOutcome.NO_FLIGHTS
+        assert results.cache_status == CacheStatus.MISS
+        key, value = redis_client.set.call_args.args
+        assert key.endswith(':negative')
+        assert value == 'no_flights'
+        assert redis_client.set.call_args.kwargs == {'ex': 300}
+
+    def test_provider_error_is_cached_and_answered_like_a_cached_one(
+        self, repository, redis_client, search_params
+    ):
+        scrapper = Mock(Scrapper)
+        scrapper.get_flights.side_effect = TimeoutError('grid timeout')
+
+        results = self._finder(repository, scrapper).get_flights(search_params)
+
+        assert results.results == []
+        assert results.outcome == SearchOutcome.PROVIDER_ERROR
+        assert results.cache_status == CacheStatus.MISS
+        assert redis_client.set.call_args.args[1] == 'provider_error'
+        assert redis_client.set.call_args.kwargs == {'ex': 60}
+
+    def test_empty_provider_result_keeps_its_outcome(self, repository, redis_client, search_params):
+        scrapper = Mock(Scrapper)
+        scrapper.get_flights.return_value = FlightResults(
+            results=[], outcome=SearchOutcome.PROVIDER_ERROR
+        )
+
+        results = self._finder(repository, scrapper).get_flights(search_params)
+
+        assert results.outcome == SearchOutcome.PROVIDER_ERROR
+        assert redis_client.set.call_args.kwargs == {'ex': 60}
+
+    def test_negative_hit_skips_the_scrapper(self, repository, redis_client, search_params):
+        redis_client.get.return_value = 'no_flights'
+        scrapper = Mock(Scrapper)
+
+        results = self._finder(repository, scrapper).get_flights(search_params)
+
+        assert results.results == []
+        assert results.outcome == SearchOutcome.NO_FLIGHTS
+        assert results.cache_status == CacheStatus.NEGATIVE_HIT
+        scrapper.get_flights.assert_not_called()
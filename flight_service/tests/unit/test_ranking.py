@@ -0,0 +1,199 @@
+import random
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from benchmarks import ranking as ranking_benchmark
+from domain.models import Flight, Flights, FlightResults
+from domain.ranking import PairArrays, pair_arrays, rank
+from domain.results_query import ResultsIndex, ResultsQuery, RankMode, RankWeights
+
+
+def _flight(departure: time, price: str, minutes: int) -> Flight:
+    return Flight(
+        date=datetime(2024, 5, 1),
+        departure_time=departure,
+        landing_time=time(23, 0),
+        price=Decimal(price),
+        flight_time=timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture
+def results():
+    return FlightResults(results=[
+        Flights(
+            outbound_flight=_flight(time(6, 0), '100.50', 60),
+            return_flights=[_flight(time(18, 0), '50', 120), _flight(time(9, 0), '80', 60)],
+        ),
+        Flights(
+            outbound_flight=_flight(time(9, 0), '300', 45),
+            return_flights=None,
+        ),
+        Flights(
+            outbound_flight=_flight(time(21, 0), '90', 200),
+            return_flights=[_flight(time(7, 0), '400', 200)],
+        ),
+    ])
+
+
+def _random_results(seed: int, options: int = 15) -> FlightResults:
+    generator = random.Random(seed)
+
+    def flight():
+        return _flight(
+            time(generator.randrange(24), generator.randrange(60)),
+            str(generator.randrange(50, 500)),
+            generator.randrange(30, 300),
+        )
+
+    return FlightResults(results=[
+        Flights(outbound_flight=flight(), return_flights=[flight() for _ in range(generator.randrange(0, 6))])
+        for _ in range(options)
+    ])
+
+
+def _brute_force_pairs(results: FlightResults) -> list[tuple[Decimal, int]]:
+    pairs = []
+    for option in results.results:
+        for return_flight in option.return_flights or [None]:
+            price = option.outbound_flight.price + (return_flight.price if return_flight else 0)
+            minutes = option.outbound_flight.flight_time.total_seconds() // 60
+            minutes += return_flight.flight_time.total_seconds() // 60 if return_flight else 0
+            pairs.append((price, int(minutes)))
+    return pairs
+
+
+class TestPairArrays:
+
+    def test_one_row_per_pair(self, results):
+        pairs = PairArrays.from_flights(results.results)
+
+        assert len(pairs) == 4
+        assert pairs.price_cents.tolist() == [15050, 18050, 30000, 49000]
+        assert pairs.duration_minutes.tolist() == [180, 120, 45, 400]
+        assert pairs.return_position.tolist() == [0, 1, -1, 0]
+        assert pairs.departure_minute.tolist() == [360, 360, 540, 1260]
+
+    def test_arrays_are_cached_with_the_index(self, results):
+        results.index = ResultsIndex.build(results.results)
+
+        assert pair_arrays(results) is pair_arrays(results)
+
+
+class TestRank:
+
+    def test_price_only_score_orders_by_round_trip_price(self, results):
+        query = ResultsQuery(rank=RankMode.SCORE, weights=RankWeights(price=1, duration=0))
+
+        page = rank(results, query)
+
+        prices = [
+            Decimal(item['outbound']['price']) + Decimal(item['return_in']['price'] if item['return_in'] else 0)
+            for item in page.items
+        ]
+        assert prices == sorted(prices)
+        assert page.items[0]['score'] == 0
+        assert page.total == 4
+
+    def test_limit_keeps_the_best(self, results):
+        query = ResultsQuery(rank=RankMode.SCORE, limit=1, weights=RankWeights(price=0, duration=1))
+
+        page = rank(results, query)
+
+        assert len(page.items) == 1
+        assert page.items[0]['outbound']['departure_time'] == '09:00'
+        assert page.items[0]['return_in'] == []
+
+    def test_preferred_departure(self, results):
+        weights = RankWeights(price=0, duration=0, departure=1, preferred_departure=time(20, 30))
+
+        page = rank(results, ResultsQuery(rank=RankMode.SCORE, limit=1, weights=weights))
+
+        assert page.items[0]['outbound']['departure_time'] == '21:00'
+
+    def test_filters_are_applied(self, results):
+        query = ResultsQuery(
+            rank=RankMode.SCORE, max_price=Decimal(200), max_duration=timedelta(minutes=100)
+        )
+
+        page = rank(results, query)
+
+        assert page.total == 1
+        assert page.items[0]['return_in']['departure_time'] == '09:00'
+
+    def test_projection(self, results):
+        page = rank(results, ResultsQuery(rank=RankMode.SCORE, limit=1, fields=['price']))
+
+        assert page.items[0]['outbound'] == {'price': '100.50'}
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_pareto_matches_brute_force(self, seed):
+        results = _random_results(seed)
+        pairs = _brute_force_pairs(results)
+        front = {
+            pair for pair in pairs
+            if not any(
+                other[0] <= pair[0] and other[1] <= pair[1] and other != pair
+                for other in pairs
+            )
+        }
+
+        page = rank(results, ResultsQuery(rank=RankMode.PARETO))
+
+        ranked = {
+            (
+                Decimal(item['outbound']['price'])
+                + Decimal(item['return_in']['price'] if item['return_in'] else 0),
+                int(float(item['outbound']['flight_time']) // 60)
+                + (int(float(item['return_in']['flight_time']) // 60) if item['return_in'] else 0),
+            )
+            for item in page.items
+        }
+        assert ranked == front
+        assert page.total == len(front)
+
+    def test_score_ranks_every_pair(self):
+        results = _random_results(7)
+
+        page = rank(results, ResultsQuery(rank=RankMode.SCORE))
+
+        assert page.total == len(_brute_force_pairs(results))
+        scores = [item['score'] for item in page.items]
+        assert scores == sorted(scores)
+
+    def test_empty_results(self):
+        page = rank(FlightResults(results=[]), ResultsQuery(rank=RankMode.PARETO))
+
+        assert page.items == []
+        assert page.total == 0
+
+    def test_rank_does_not_paginate(self):
+        with pytest.raises(ValueError):
+            ResultsQuery(rank=RankMode.SCORE, cursor='abc')
+
+
+class TestRankingBenchmark:
+
+    def test_measure_reports_timings(self):
+        row = ranking_benchmark.measure(pairs=400, runs=3, mode=RankMode.PARETO, limit=5)
+
+        assert row['pairs'] == 400
+        assert row['p50_ms'] <= row['p95_ms']
+
+    def test_cheapest_is_timed_with_cheapest_round_trips(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            ranking_benchmark, 'cheapest_round_trips', lambda *args: calls.append(args)
+        )
+        monkeypatch.setattr(ranking_benchmark, 'rank', Mock(side_effect=AssertionError))
+
+        ranking_benchmark.measure(pairs=100, runs=3, mode=RankMode.CHEAPEST, limit=5)
+
+        assert len(calls) == 3
+
+    def test_main_runs(self, capsys):
+        assert ranking_benchmark.main(['--pairs', '100', '--runs', '2', '--budget-ms', '1000']) == 0
+        assert 'pareto' in capsys.readouterr().out
@@ -0,0 +1,169 @@
+import urllib.request
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from benchmarks import scrapers as scrapers_benchmark
+from domain.models import Flight, FlightResults, Flights, SearchParams
+from infrastructure.replay.cassette import Cassette, active_cassette, discover
+from infrastructure.replay.dom import DomDriver
+from infrastructure.replay.harness import replay
+from infrastructure.replay.recorder import ScrapeRecorder, create_scrape_recorder
+from infrastructure.replay.server import ReplayServer
+from infrastructure.scrappers.avianca.scrapper import AviancaScrapper
+from infrastructure.scrappers.base import DriverFactory, Scrapper
+from infrastructure.scrappers.google.scrapper import GoogleFlightsScrapper
+
+PAGE = '''<html><body>
+<div class="row first"><span class="price"> 100 </span><div>1 h</div><div>BOG</div></div>
+<div class="row"><span class="price">200</span><script>ignored()</script></div>
+<p id="note">a <b>b</b> c</p>
+</body></html>'''
+
+
+@pytest.fixture
+def search_params():
+    return SearchParams(
+        origin='BOG', destination='MDE',
+        departure=datetime(2030, 1, 1), return_date=datetime(2030, 1, 8)
+    )
+
+
+def _flight(price: str) -> Flight:
+    return Flight(
+        date=datetime(2030, 1, 1),
+        departure_time=time(8, 0),
+        landing_time=time(9, 0),
+        price=Decimal(price),
+        flight_time=timedelta(hours=1),
+    )
+
+
+class PageScrapper(Scrapper):
+    """Reads the prices of ``PAGE`` and records the page like a live scrapper."""
+
+    name = 'Page'
+    replayable = True
+
+    def get_flights(self, search_params: SearchParams) -> FlightResults | None:
+        driver = DomDriver(PAGE, current_url='https://example.invalid/')
+        flights = self.extract_step(driver, 'outbound', search_params)
+        self._record(driver, 'outbound', flights)
+        return FlightResults(results=[Flights(outbound_flight=flights[0], return_flights=[])])
+
+    def extract_step(self, driver, step, search_params):
+        return [
+            _flight(row.get_attribute('textContent').strip())
+            for row in driver.find_elements(By.CLASS_NAME, 'price')
+        ]
+
+
+class TestDomDriver:
+
+    def test_locators(self):
+        driver = DomDriver(PAGE)
+
+        assert len(driver.find_elements(By.CLASS_NAME, 'row')) == 2
+        assert len(driver.find_elements(By.XPATH, "//div[contains(@class, 'row')]")) == 2
+        assert driver.find_element(By.CSS_SELECTOR, 'div.first .price').text == '100'
+        assert driver.find_element(By.ID, 'note').tag_name == 'p'
+
+    def test_element_scoped_search(self):
+        second = DomDriver(PAGE).find_elements(By.CLASS_NAME, 'row')[1]
+
+        assert second.find_element(By.XPATH, ".//span").text == '200'
+
+    def test_text_is_rendered_like_webdriver(self):
+        driver = DomDriver(PAGE)
+
+        assert driver.find_element(By.CLASS_NAME, 'first').text == '100\n1 h\nBOG'
+        assert driver.find_element(By.ID, 'note').text == 'a b c'
+        assert driver.find_element(By.CLASS_NAME, 'first').get_attribute('class') == 'row first'
+
+    def test_missing_element(self):
+        with pytest.raises(NoSuchElementException):
+            DomDriver(PAGE).find_element(By.CLASS_NAME, 'missing')
+
+
+class TestRecording:
+
+    def test_recorded_scrape_replays(self, tmp_path, search_params):
+        scrapper = ScrapeRecorder(tmp_path).guard('page', PageScrapper())
+
+        scrapper.get_flights(search_params)
+
+        [cassette] = discover(tmp_path)
+        assert cassette.provider == 'page'
+        assert cassette.search_params.origin == 'BOG'
+        assert [step.name for step in cassette.steps] == ['outbound']
+        assert [f['price'] for f in cassette.steps[0].flights] == ['100', '200']
+        assert active_cassette() is None
+        assert replay(scrapper, cassette).ok
+
+    def test_nothing_is_written_without_steps(self, tmp_path, search_params):
+        class Failing(PageScrapper):
+            def get_flights(self, search_params):
+                raise RuntimeError('grid down')
+
+        with pytest.raises(RuntimeError):
+            ScrapeRecorder(tmp_path).guard('page', Failing()).get_flights(search_params)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_not_recording_by_default(self, search_params):
+        assert create_scrape_recorder() is None
+        # _record is a no-op outside a recording
+        PageScrapper().get_flights(search_params)
+
+    def test_replay_reports_mismatches(self, tmp_path, search_params):
+        cassette = Cassette.create(tmp_path, 'page', search_params)
+        cassette.add_step('outbound', PAGE, [_flight('100'), _flight('300')])
+
+        report = replay(PageScrapper(), cassette)
+
+        assert not report.ok
+        assert report.rows == 2
+        assert 'row 1' in report.steps[0].mismatches[0]
+
+
+    def test_scrappers_without_extract_step_are_rejected(self, tmp_path, search_params):
+        class Unreplayable(PageScrapper):
+            replayable = False
+
+        cassette = Cassette.create(tmp_path, 'page', search_params)
+        cassette.add_step('outbound', PAGE, [_flight('100')])
+
+        with pytest.raises(ValueError, match='cannot replay'):
+            replay(ScrapeRecorder(tmp_path).guard('page', Unreplayable()), cassette)
+
+
+class TestRecordedCassettes:
+
+    @pytest.fixture(scope='class')
+    def cassettes(self):
+        return {cassette.provider: cassette for cassette in discover(scrapers_benchmark.CASSETTES)}
+
+    @pytest.mark.parametrize('provider, scrapper_cls', [
+        ('avianca', AviancaScrapper),
+        ('google', GoogleFlightsScrapper),
+    ])
+    def test_extraction_matches_recording(self, cassettes, provider, scrapper_cls):
+        report = replay(scrapper_cls(drivers_factory=DriverFactory), cassettes[provider])
+
+        assert report.ok, [step.mismatches for step in report.steps]
+        assert report.rows > 0
+
+    def test_server_serves_pages(self, cassettes):
+        cassette = cassettes['avianca']
+        step = cassette.steps[0]
+
+        with ReplayServer(cassette) as server:
+            with urllib.request.urlopen(server.url(step)) as response:
+                assert response.read().decode() == cassette.page(step)
+
+    def test_benchmark_runs(self, capsys):
+        assert scrapers_benchmark.main(['--runs', '1']) == 0
+        assert 'avianca-bog-mde' in capsys.readouterr().out
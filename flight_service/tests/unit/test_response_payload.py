@@ -0,0 +1,153 @@
+import json
+from dataclasses import replace
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from redis import Redis
+
+from domain.models import SearchParams, FlightResults, Flights, Flight
+from infrastructure.repositories.memory.repository import FlightsMemoryRepository
+from infrastructure.repositories.redis.repository import RedisRepository
+from infrastructure.repositories.tiered.repository import TieredFlightsRepository
+from utils.response_payload import (
+    build_response, pack_response, unpack_response, serialize_results, RESPONSE_VERSION
+)
+
+
+@pytest.fixture
+def search_params():
+    return SearchParams(
+        origin='BOG', destination='MDE',
+        departure=datetime(2024, 5, 1), return_date=datetime(2024, 5, 10),
+    )
+
+
+@pytest.fixture
+def results():
+    flight = Flight(
+        date=datetime(2024, 5, 1), departure_time=time(6, 0), landing_time=time(7, 0),
+        price=Decimal('199.90'), flight_time=timedelta(hours=1),
+    )
+    return FlightResults(results=[Flights(outbound_flight=flight, return_flights=[flight])])
+
+
+class TestResponsePayload:
+
+    def test_body_is_the_unfiltered_response(self, results):
+        body = serialize_results(results)
+
+        assert json.loads(body) == [result.to_dict() for result in results.results]
+
+    def test_pack_round_trip(self, results):
+        response = build_response(results)
+
+        # redis-py with decode_responses hands the value back as str
+        unpacked = unpack_response(pack_response(response).decode())
+
+        assert unpacked == response
+        assert unpacked.version == RESPONSE_VERSION
+
+    def test_expiry_travels_with_the_body(self, results):
+        response = build_response(results, ttl=120)
+
+        unpacked = unpack_response(pack_response(response))
+
+        assert unpacked.expires_at == response.expires_at
+        assert unpacked.max_age(response.expires_at - 30) == 30
+        assert unpacked.max_age(response.expires_at + 5) == 0
+
+    def test_same_content_same_digest(self, results):
+        assert build_response(results).digest == build_response(results).digest
+
+    @pytest.mark.parametrize('value', [None, '', 'r1:abc\n[]', '[{"outbound": {}}]', Mock()])
+    def test_other_versions_and_garbage_are_ignored(self, value):
+        assert unpack_response(value) is None
+
+
+class TestRepositoriesKeepResponses:
+
+    def test_redis_saves_and_serves_the_body(self, results, search_params):
+        client = Mock(spec=Redis)
+        repository = RedisRepository(client_factory=Mock(return_value=client))
+
+        repository.save_flight(results, search_params)
+        key, value = next(
+            call.args for call in client.set.call_args_list if call.args[0].endswith(':response')
+        )
+        client.get.return_value = value.decode()
+
+        response = repository.get_cached_response(search_params)
+
+        client.get.assert_called_once_with(key)
+        client.keys.assert_not_called()
+        assert response.body == serialize_results(results)
+
+    def test_redis_results_keep_their_saved_order(self, results, search_params):
+        client = Mock(spec=Redis)
+        repository = RedisRepository(client_factory=Mock(return_value=client))
+        options = [
+            Flights(
+                outbound_flight=replace(results.results[0].outbound_flight, price=Decimal(n)),
+                return_flights=[],
+            )
+            for n in range(12)
+        ]
+        repository.save_flight(FlightResults(results=options), search_params)
+        stored = {
+            call.args[0]: call.args[1] for call in client.set.call_args_list
+            if not call.args[0].endswith(':response')
+        }
+        client.keys.return_value = sorted(stored)  # '...:10' before '...:2'
+        client.get.side_effect = stored.get
+
+        loaded = repository.get_flight_results(search_params)
+
+        assert [option.outbound_flight.price for option in loaded.results] == list(range(12))
+
+    def test_redis_miss(self, search_params):
+        client = Mock(spec=Redis)
+        client.get.return_value = None
+        repository = RedisRepository(client_factory=Mock(return_value=client))
+
+        assert repository.get_cached_response(search_params) is None
+
+    def test_memory_serializes_once(self, results, search_params):
+        repository = FlightsMemoryRepository(record_stats=False)
+        repository.save_flight(results, search_params)
+
+        first = repository.get_cached_response(search_params)
+
+        assert first is repository.get_cached_response(search_params)
+        assert first.body == serialize_results(results)
+
+    def test_redis_does_not_keep_streamed_bodies(self, results, search_params, monkeypatch):
+        monkeypatch.setattr('utils.response_payload.STREAM_MIN_FLIGHTS', 2)
+        client = Mock(spec=Redis)
+        repository = RedisRepository(client_factory=Mock(return_value=client))
+
+        repository.save_flight(results, search_params)
+
+        assert not any(call.args[0].endswith(':response') for call in client.set.call_args_list)
+        client.delete.assert_called_once_with(f'{repository._make_hash(search_params)}:response')
+
+    def test_memory_does_not_serialize_streamed_results(self, results, search_params, monkeypatch):
+        monkeypatch.setattr('utils.response_payload.STREAM_MIN_FLIGHTS', 2)
+        repository = FlightsMemoryRepository(record_stats=False)
+        repository.save_flight(results, search_params)
+
+        assert repository.get_cached_response(search_params) is None
+        assert repository.get_flight_results(search_params).results == results.results
+
+    def test_tiered_prefers_l1(self, results, search_params):
+        l1 = FlightsMemoryRepository(record_stats=False)
+        l2 = Mock(RedisRepository)
+        l2.get_cached_response.return_value = None
+        repository = TieredFlightsRepository(l1=l1, l2=l2)
+
+        assert repository.get_cached_response(search_params) is None
+        l1.save_flight(results, search_params)
+
+        assert repository.get_cached_response(search_params).body == serialize_results(results)
+        l2.get_cached_response.assert_called_once()
@@ -0,0 +1,122 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+
+from domain.models import Flight, Flights, FlightResults
+from domain.results_query import (
+    ResultsIndex, ResultsQuery, SortKey, apply_query, encode_cursor, decode_cursor
+)
+
+
+def _flight(departure: time, price: int, minutes: int) -> Flight:
+    return Flight(
+        date=datetime(2024, 5, 1),
+        departure_time=departure,
+        landing_time=time(23, 0),
+        price=Decimal(price),
+        flight_time=timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture
+def results():
+    return FlightResults(results=[
+        Flights(
+            outbound_flight=_flight(time(6, 0), 300, 60),
+            return_flights=[_flight(time(18, 0), 250, 70), _flight(time(9, 0), 100, 90)],
+        ),
+        Flights(
+            outbound_flight=_flight(time(12, 0), 100, 150),
+            return_flights=[_flight(time(20, 0), 150, 60)],
+        ),
+        Flights(
+            outbound_flight=_flight(time(21, 0), 200, 55),
+            return_flights=[_flight(time(7, 0), 400, 65)],
+        ),
+    ])
+
+
+def _outbound_times(page):
+    return [item['outbound']['departure_time'] for item in page.items]
+
+
+class TestResultsQuery:
+
+    def test_empty_query_keeps_everything_in_order(self, results):
+        page = apply_query(results, ResultsQuery())
+
+        assert _outbound_times(page) == ['06:00', '12:00', '21:00']
+        assert page.total == 3
+        assert page.next_cursor is None
+
+    def test_sort_by_cheapest_round_trip(self, results):
+        page = apply_query(results, ResultsQuery(sort=SortKey.PRICE))
+
+        # 100 + 150, 300 + 100, 200 + 400
+        assert _outbound_times(page) == ['12:00', '06:00', '21:00']
+        assert [f['price'] for f in page.items[1]['return_flights']] == ['100', '250']
+
+    def test_descending_duration(self, results):
+        page = apply_query(results, ResultsQuery(sort=SortKey.DURATION, descending=True))
+
+        assert _outbound_times(page) == ['12:00', '06:00', '21:00']
+
+    def test_max_price_bounds_the_round_trip(self, results):
+        page = apply_query(results, ResultsQuery(max_price=Decimal(400)))
+
+        assert _outbound_times(page) == ['06:00', '12:00']
+        assert [f['price'] for f in page.items[0]['return_flights']] == ['100']
+
+    def test_departure_window_and_max_duration(self, results):
+        query = ResultsQuery(
+            departure_from=time(5, 0), departure_to=time(22, 0),
+            max_duration=timedelta(minutes=80),
+        )
+
+        page = apply_query(results, query)
+
+        assert _outbound_times(page) == ['06:00', '21:00']
+        assert len(page.items[0]['return_flights']) == 1
+
+    def test_pagination_walks_all_results(self, results):
+        query = ResultsQuery(sort=SortKey.DEPARTURE, limit=2)
+
+        first = apply_query(results, query)
+        query.cursor = first.next_cursor
+        second = apply_query(results, query)
+
+        assert _outbound_times(first) == ['06:00', '12:00']
+        assert _outbound_times(second) == ['21:00']
+        assert second.next_cursor is None
+        assert first.total == second.total == 3
+
+    def test_projection(self, results):
+        page = apply_query(results, ResultsQuery(fields=['price']))
+
+        assert page.items[0]['outbound'] == {'price': '300'}
+        assert page.items[0]['return_flights'][0] == {'price': '250'}
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError):
+            ResultsQuery(fields=['airline'])
+
+    def test_cursor_from_another_query_is_rejected(self):
+        cursor = encode_cursor(2, ResultsQuery(sort=SortKey.PRICE))
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, ResultsQuery(sort=SortKey.DURATION))
+        with pytest.raises(ValueError):
+            decode_cursor('not a cursor', ResultsQuery())
+
+    def test_precomputed_index_is_used(self, results):
+        index = ResultsIndex.build(results.results)
+        results.index = index
+        # an index that puts the last option first proves it is not rebuilt
+        results.index = ResultsIndex(
+            options={**index.options, SortKey.PRICE: (2, 1, 0)}, returns=index.returns
+        )
+
+        page = apply_query(results, ResultsQuery(sort=SortKey.PRICE))
+
+        assert _outbound_times(page) == ['21:00', '12:00', '06:00']
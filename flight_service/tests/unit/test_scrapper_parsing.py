@@ -0,0 +1,144 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from benchmarks.scrapers import CASSETTES
+from domain.models import SearchOutcome
+from infrastructure.replay.cassette import discover
+from infrastructure.replay.dom import DomDriver
+from infrastructure.scrappers.avianca import parsing as avianca_parsing
+from infrastructure.scrappers.avianca.scrapper import AviancaScrapper
+from infrastructure.scrappers.base import DriverFactory
+from infrastructure.scrappers.google import parsing as google_parsing
+from infrastructure.scrappers.google.scrapper import GoogleFlightsScrapper
+
+GOOGLE_ROW = '''
+<li class="yR1fYc"><div class="KhL0De">
+  <div class="mv1WYe">
+    <span aria-label="Hora de salida: 6:10 a. m.">6:10 a.m.</span> –
+    <span aria-label="Hora de llegada: 7:15 a. m.">7:15 a.m.</span>
+  </div>
+  <div class="Ak5kof"><div>1 h 5 min</div><div>BOG–MDE</div></div>
+  <div class="U3gSDe"><div class="YMlIz"><span>COP 289900</span></div></div>
+</div></li>'''
+BROKEN_ROW = '<li class="yR1fYc"><div class="KhL0De"><div class="mv1WYe"></div></div></li>'
+
+
+@pytest.fixture(scope='module')
+def cassettes():
+    return {cassette.provider: cassette for cassette in discover(CASSETTES)}
+
+
+def _scrapper(cls, extraction):
+    scrapper = cls(drivers_factory=DriverFactory)
+    scrapper.extraction = extraction
+    return scrapper
+
+
+class TestParsing:
+
+    def test_google_row(self):
+        [flight] = google_parsing.parse_outbound(
+            f'<html><body><ul>{GOOGLE_ROW}</ul></body></html>', datetime(2030, 1, 1)
+        )
+
+        assert flight.departure_time == time(6, 10)
+        assert flight.landing_time == time(7, 15)
+        assert flight.flight_time == timedelta(hours=1, minutes=5)
+        assert flight.price == Decimal('289900')
+
+    def test_google_unreadable_outbound_keeps_its_index(self):
+        flights = google_parsing.parse_outbound(
+            f'<html><body><ul>{BROKEN_ROW}{GOOGLE_ROW}</ul></body></html>', datetime(2030, 1, 1)
+        )
+
+        assert flights[0] is None
+        assert flights[1].price == Decimal('289900')
+
+    @pytest.mark.parametrize('price', ['289900', 'COP —', 'COP 1.2.3'])
+    def test_google_malformed_price_keeps_its_index(self, price):
+        malformed = GOOGLE_ROW.replace('COP 289900', price)
+
+        flights = google_parsing.parse_outbound(
+            f'<html><body><ul>{malformed}{GOOGLE_ROW}</ul></body></html>', datetime(2030, 1, 1)
+        )
+
+        assert flights[0] is None
+        assert flights[1].price == Decimal('289900')
+
+    def test_avianca_skips_the_picked_outbound(self, cassettes):
+        cassette = cassettes['avianca']
+        page = cassette.page(cassette.steps[1])
+
+        flights = avianca_parsing.parse_flights(page, datetime(2030, 1, 8), skip=1)
+
+        assert [f.to_dict() for f in flights] == cassette.steps[1].flights
+
+    @pytest.mark.parametrize('text, expected', [
+        ('1:05', timedelta(hours=1, minutes=5)),
+        (' 12:40 ', timedelta(hours=12, minutes=40)),
+    ])
+    def test_avianca_duration(self, text, expected):
+        assert avianca_parsing.parse_duration(text) == expected
+
+
+class TestMalformedResults:
+
+    def test_avianca_unparseable_rows_are_a_provider_error(self, cassettes, monkeypatch):
+        from infrastructure.scrappers.avianca import scrapper as avianca_scrapper
+        params = cassettes['avianca'].search_params
+        # every wait finds the searched stations, the destination input and result rows
+        element = MagicMock()
+        element.get_attribute.return_value = 'Hacia'
+        element.__iter__.side_effect = lambda: iter(
+            [Mock(text=params.origin), Mock(text=params.destination)]
+        )
+        monkeypatch.setattr(
+            avianca_scrapper, 'WebDriverWait', Mock(return_value=Mock(until=Mock(return_value=element)))
+        )
+        scrapper = _scrapper(AviancaScrapper, 'page_source')
+        monkeypatch.setattr(scrapper, '_initialize_driver', lambda: iter([MagicMock()]))
+        monkeypatch.setattr(scrapper, 'select_dates', Mock())
+        monkeypatch.setattr(scrapper, 'select_passengers', Mock())
+        monkeypatch.setattr(
+            scrapper, 'extract_step', Mock(side_effect=ValueError("No 'price' in flight row"))
+        )
+
+        results = scrapper.get_flights(params)
+
+        assert results.results == []
+        assert results.outcome == SearchOutcome.PROVIDER_ERROR
+
+
+class TestExtractionModes:
+
+    @pytest.mark.parametrize('provider, cls', [
+        ('avianca', AviancaScrapper),
+        ('google', GoogleFlightsScrapper),
+    ])
+    def test_modes_agree_and_page_source_is_one_round_trip(self, cassettes, provider, cls):
+        cassette = cassettes[provider]
+        for step in cassette.steps:
+            results = {}
+            for extraction in ('page_source', 'webdriver'):
+                driver = DomDriver(cassette.page(step))
+                flights = _scrapper(cls, extraction).extract_step(
+                    driver, step.name, cassette.search_params
+                )
+                results[extraction] = ([f.to_dict() for f in flights], driver.calls)
+
+            assert results['page_source'][0] == results['webdriver'][0] == step.flights
+            assert results['page_source'][1] == 1
+            assert results['webdriver'][1] > len(step.flights) * 4
+
+    def test_default_mode_is_page_source(self):
+        assert AviancaScrapper(drivers_factory=DriverFactory).extraction == 'page_source'
+
+    def test_unknown_mode(self, monkeypatch):
+        from constants import config
+        monkeypatch.setitem(config['Scrappers.Google'], 'extraction', 'telepathy')
+
+        with pytest.raises(ValueError):
+            GoogleFlightsScrapper(drivers_factory=DriverFactory)
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+
+from domain.models import SearchParams
+from utils.cache_stats import CacheStats
+from utils.search_key import (
+    SEARCH_KEY_NAMESPACE,
+    SEARCH_KEY_VERSION,
+    canonical_search_params,
+    route_key,
+    search_key,
+)
+
+
+class TestSearchKey:
+
+    @pytest.fixture
+    def search_params(self):
+        return SearchParams(
+            origin="BOG",
+            destination="MDE",
+            departure=datetime(2024, 5, 1),
+            return_date=datetime(2024, 5, 10),
+            passengers=2,
+            currency="COP"
+        )
+
+    def test_key_is_versioned(self, search_params):
+        key = search_key(search_params)
+        assert key.startswith(f'{SEARCH_KEY_NAMESPACE}:{SEARCH_KEY_VERSION}:')
+
+    def test_equivalent_searches_share_a_key(self, search_params):
+        equivalent = SearchParams(
+            origin=" bog",
+            destination="mde ",
+            departure=datetime(2024, 5, 1, 13, 45),
+            return_date=datetime(2024, 5, 10, 23, 59),
+            passengers=2,
+            currency="cop"
+        )
+        assert search_key(equivalent) == search_key(search_params)
+
+    @pytest.mark.parametrize(
+        'field, value',
+        [
+            ('currency', 'USD'),
+            ('checked_baggage', 1),
+            ('carry_on_baggage', 1),
+            ('passengers', 3),
+            ('return_date', datetime(2024, 5, 11)),
+        ]
+    )
+    def test_fare_relevant_fields_change_the_key(self, search_params, field, value):
+        other = SearchParams(**{**search_params.__dict__, field: value})
+        assert search_key(other) != search_key(search_params)
+
+    def test_one_way_search_has_empty_return_date(self, search_params):
+        one_way = SearchParams(
+            origin="BOG", destination="MDE", departure=datetime(2024, 5, 1)
+        )
+        assert canonical_search_params(one_way)['return_date'] == ''
+
+    def test_route_key(self, search_params):
+        assert route_key(search_params) == 'BOG-MDE'
+
+
+class TestCacheStats:
+
+    def test_ratio_per_route(self):
+        stats = CacheStats()
+        stats.hit('BOG-MDE')
+        stats.hit('BOG-MDE')
+        stats.miss('BOG-MDE')
+        stats.miss('BOG-CTG')
+
+        snapshot = stats.snapshot()
+        assert snapshot['BOG-MDE'] == {'hits': 2, 'misses': 1, 'hit_ratio': 0.6667}
+        assert stats.ratio('BOG-CTG') == 0.0
+        assert stats.ratio('unknown') == 0.0
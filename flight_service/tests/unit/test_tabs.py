@@ -0,0 +1,161 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from selenium.common import exceptions
+from selenium.webdriver.remote.webelement import WebElement
+
+from infrastructure.scrappers.base import DriverFactory
+from infrastructure.scrappers.google.scrapper import GoogleFlightsScrapper
+from infrastructure.scrappers.tabs import SharedBrowser, TabElement
+
+
+class FakeElement(WebElement):
+    """An element that only answers while its window is the active one."""
+
+    def __init__(self, driver: 'FakeBrowser', handle: str):
+        super().__init__(driver, f'element-{handle}')
+        self._browser = driver
+        self._handle = handle
+
+    @property
+    def text(self) -> str:
+        if self._browser.current_window_handle != self._handle:
+            raise exceptions.NoSuchElementException('element is in another window')
+        return self._browser.urls[self._handle]
+
+
+class FakeBrowser:
+
+    def __init__(self):
+        self.urls = {'w0': 'about:blank'}
+        self.current_window_handle = 'w0'
+        self.commands = []
+        self.quit = Mock()
+        browser = self
+
+        class SwitchTo:
+            def window(self, handle):
+                browser.commands.append('switch')
+                browser.current_window_handle = handle
+
+            def new_window(self, kind):
+                handle = f'w{len(browser.urls)}'
+                browser.urls[handle] = 'about:blank'
+                browser.current_window_handle = handle
+
+        self.switch_to = SwitchTo()
+
+    def get(self, url):
+        self.commands.append('get')
+        self.urls[self.current_window_handle] = url
+
+    @property
+    def current_url(self):
+        return self.urls[self.current_window_handle]
+
+    def find_element(self, by, value):
+        return FakeElement(self, self.current_window_handle)
+
+    def execute_script(self, script, *args):
+        return [arg.__class__.__name__ for arg in args]
+
+
+@pytest.fixture
+def browser():
+    fake = FakeBrowser()
+    factory = Mock(return_value=fake)
+    shared = SharedBrowser(factory, tabs=3)
+    yield shared, fake, factory
+    shared.close()
+
+
+class TestSharedBrowser:
+
+    def test_commands_run_in_their_own_tab(self, browser):
+        shared, fake, factory = browser
+        errors, pages = [], {}
+
+        def search(index):
+            try:
+                with shared.tab() as tab:
+                    tab.get(f'https://example.invalid/{index}')
+                    element = tab.find_element('id', 'results')
+                    for _ in range(5):
+                        time.sleep(0.01)  # waits interleave with the other tabs
+                        assert tab.current_url == f'https://example.invalid/{index}'
+                        pages[index] = element.text
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=search, args=(i,)) for i in range(3)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+
+        assert errors == []
+        assert pages == {i: f'https://example.invalid/{i}' for i in range(3)}
+        factory.assert_called_once()
+        assert len(fake.urls) == 3
+
+    def test_tabs_are_reused_and_reset(self, browser):
+        shared, fake, factory = browser
+
+        with shared.tab() as first:
+            first.get('https://example.invalid/a')
+        with shared.tab() as second:
+            assert second.window_handle == first.window_handle
+            assert second.current_url == 'about:blank'
+
+        assert len(fake.urls) == 1
+
+    def test_no_switch_when_the_tab_is_already_active(self, browser):
+        shared, fake, _ = browser
+
+        with shared.tab() as tab:
+            tab.get('https://example.invalid/a')
+            tab.get('https://example.invalid/b')
+
+        assert 'switch' not in fake.commands
+
+    def test_elements_are_wrapped_and_unwrapped(self, browser):
+        shared, _, _ = browser
+
+        with shared.tab() as tab:
+            element = tab.find_element('id', 'button')
+            assert isinstance(element, TabElement)
+            assert tab.execute_script('arguments[0].click()', element) == ['FakeElement']
+
+    def test_dead_session_is_replaced(self, browser):
+        shared, fake, factory = browser
+        replacement = FakeBrowser()
+        factory.side_effect = [fake, replacement]
+
+        with pytest.raises(exceptions.InvalidSessionIdException):
+            with shared.tab():
+                raise exceptions.InvalidSessionIdException('gone')
+        with shared.tab() as tab:
+            tab.get('https://example.invalid/c')
+            assert replacement.current_url == 'https://example.invalid/c'
+
+        fake.quit.assert_called_once()
+
+
+class TestScrapperTabs:
+
+    def test_single_tab_by_default(self):
+        assert GoogleFlightsScrapper(drivers_factory=DriverFactory)._shared_browser is None
+
+    def test_tabs_share_one_driver(self, monkeypatch):
+        from constants import config
+        monkeypatch.setitem(config['Scrappers.Google'], 'tabs', '2')
+        drivers_factory = Mock()
+        drivers_factory.create_driver.return_value = FakeBrowser()
+        scrapper = GoogleFlightsScrapper(drivers_factory=drivers_factory)
+
+        for _ in range(2):
+            for tab in scrapper._initialize_driver():
+                tab.get('https://example.invalid/')
+
+        drivers_factory.create_driver.assert_called_once()
+        scrapper._shared_browser.close()
@@ -0,0 +1,66 @@
+import threading
+from collections import defaultdict
+
+from telemetry import get_meter
+
+_meter = get_meter(__name__)
+_lookups = _meter.create_counter(
+    'flight_cache.lookups',
+    description='Flight result cache lookups, by route, layer and outcome (hit/miss)',
+) if _meter else None
+
+
+class CacheStats:
+    """Per-route cache hit/miss counters.
+
+    Kept in-process so ``/cache_stats`` can report ratios without a metrics
+    backend; every lookup is also exported as an OTel counter when telemetry
+    is enabled.
+    """
+
+    HIT = 'hit'
+    MISS = 'miss'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = defaultdict(
+            lambda: {self.HIT: 0, self.MISS: 0}
+        )
+
+    def record(self, route: str, outcome: str, layer: str = 'redis') -> None:
+        with self._lock:
+            self._counts[route][outcome] += 1
+        if _lookups is not None:
+            _lookups.add(1, {'route': route, 'outcome': outcome, 'layer': layer})
+
+    def hit(self, route: str, layer: str = 'redis') -> None:
+        self.record(route, self.HIT, layer)
+
+    def miss(self, route: str, layer: str = 'redis') -> None:
+        self.record(route, self.MISS, layer)
+
+    def ratio(self, route: str) -> float:
+        with self._lock:
+            counts = dict(self._counts.get(route, {self.HIT: 0, self.MISS: 0}))
+        total = counts[self.HIT] + counts[self.MISS]
+        return counts[self.HIT] / total if total else 0.0
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            counts = {route: dict(c) for route, c in self._counts.items()}
+        report = {}
+        for route, c in sorted(counts.items()):
+            total = c[self.HIT] + c[self.MISS]
+            report[route] = {
+                'hits': c[self.HIT],
+                'misses': c[self.MISS],
+                'hit_ratio': round(c[self.HIT] / total, 4) if total else 0.0,
+            }
+        return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+cache_stats = CacheStats()
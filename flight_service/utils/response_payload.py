@@ -0,0 +1,96 @@
+import hashlib
+import json
+import time
+from typing import Iterable, Iterator, Optional
+
+from constants import config
+from domain.models import CachedResponse, FlightResults
+
+# bump when the response body or header format changes: older cached bodies
+# are ignored
+RESPONSE_VERSION = 'r2'
+# items encoded per chunk when streaming
+STREAM_BATCH_SIZE = 64
+# unfiltered results with at least this many flights are streamed, and their
+# body is never cached
+STREAM_MIN_FLIGHTS = config.getint('Http', 'stream_min_flights', fallback=2000)
+
+_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+def serialize_results(results: FlightResults) -> bytes:
+    """The ``/get_flights`` body for an unfiltered result set."""
+    return json.dumps(
+        [result.to_dict() for result in results.results or []],
+        separators=(',', ':'),
+    ).encode()
+
+
+def stream_json_array(
+    items: Iterable[dict], batch_size: int = STREAM_BATCH_SIZE
+) -> Iterator[bytes]:
+    """
+    Encode ``items`` as a JSON array a few items at a time; the chunks join
+    to exactly what ``json.dumps`` with compact separators returns.
+    """
+    yield b'['
+    batch, first = [], True
+    for item in items:
+        batch.append(_encoder.encode(item))
+        if len(batch) == batch_size:
+            yield (('' if first else ',') + ','.join(batch)).encode()
+            batch, first = [], False
+    if batch:
+        yield (('' if first else ',') + ','.join(batch)).encode()
+    yield b']'
+
+
+def stream_results(results: FlightResults) -> Iterator[bytes]:
+    """``serialize_results`` in chunks, converting one option at a time."""
+    return stream_json_array(result.to_dict() for result in results.results or [])
+
+
+def flight_count(results: FlightResults) -> int:
+    return sum(1 + len(result.return_flights or []) for result in results.results or [])
+
+
+def is_streamed(results: FlightResults) -> bool:
+    return flight_count(results) >= STREAM_MIN_FLIGHTS
+
+
+def response_for_body(body: bytes, ttl: Optional[float] = None) -> CachedResponse:
+    return CachedResponse(
+        body=body,
+        version=RESPONSE_VERSION,
+        digest=hashlib.sha256(body).hexdigest()[:32],
+        expires_at=int(time.time() + ttl) if ttl is not None else None,
+    )
+
+
+def build_response(results: FlightResults, ttl: Optional[float] = None) -> CachedResponse:
+    return response_for_body(serialize_results(results), ttl)
+
+
+def pack_response(response: CachedResponse) -> bytes:
+    """``<version>:<digest>:<expires at>\\n<body>``, stored as one Redis string."""
+    header = f'{response.version}:{response.digest}:{response.expires_at or ""}\n'
+    return header.encode() + response.body
+
+
+def unpack_response(value) -> Optional[CachedResponse]:
+    """Inverse of ``pack_response``; None for other versions or garbage."""
+    if isinstance(value, str):
+        value = value.encode()
+    if not isinstance(value, bytes):
+        return None
+    header, separator, body = value.partition(b'\n')
+    version, _, rest = header.decode(errors='replace').partition(':')
+    digest, _, expires_at = rest.partition(':')
+    if not separator or version != RESPONSE_VERSION or not digest:
+        return None
+    return CachedResponse(
+        body=body,
+        version=version,
+        digest=digest,
+        expires_at=int(expires_at) if expires_at.isdigit() else None,
+    )
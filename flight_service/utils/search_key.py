@@ -0,0 +1,87 @@
+"""Canonical cache keys for flight searches.
+
+Searches a traveller would consider identical (``bog`` vs ``BOG``, a departure
+at midnight vs one at 13:45 on the same day) must map to the same key, while
+anything that changes the fare (currency, baggage, passengers) must not.
+Bump ``SEARCH_KEY_VERSION`` whenever the canonical form changes: entries
+written under the previous layout are then simply never read again.
+"""
+import re
+from datetime import date, datetime
+from hashlib import sha256
+from typing import Any
+
+from domain.models import SearchParams
+
+SEARCH_KEY_NAMESPACE = 'flights'
+SEARCH_KEY_VERSION = 'v1'
+
+KEY_FIELDS = (
+    'origin',
+    'destination',
+    'departure',
+    'return_date',
+    'passengers',
+    'checked_baggage',
+    'carry_on_baggage',
+    'currency',
+)
+
+
+def normalize_iata(code: str | None) -> str:
+    return (code or '').strip().upper()
+
+
+def normalize_date(value: Any) -> str:
+    """Reduce a datetime/date/ISO string to ``YYYY-MM-DD`` (empty when unset)."""
+    if not value:
+        return ''
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return datetime.fromisoformat(str(value).strip()).date().isoformat()
+
+
+def canonical_search_params(search_params: SearchParams) -> dict[str, str]:
+    canonical = {
+        'origin': normalize_iata(search_params.origin),
+        'destination': normalize_iata(search_params.destination),
+        'departure': normalize_date(search_params.departure),
+        'return_date': normalize_date(search_params.return_date),
+        'passengers': str(int(search_params.passengers or 1)),
+        'checked_baggage': str(int(search_params.checked_baggage or 0)),
+        'carry_on_baggage': str(int(search_params.carry_on_baggage or 0)),
+        'currency': normalize_iata(search_params.currency or 'COP'),
+    }
+    return {field: canonical[field] for field in KEY_FIELDS}
+
+
+def canonical_search_string(search_params: SearchParams) -> str:
+    canonical = canonical_search_params(search_params)
+    return '|'.join(f'{field}={canonical[field]}' for field in KEY_FIELDS)
+
+
+def search_key(search_params: SearchParams) -> str:
+    """``flights:<version>:<sha256 of the canonical form>``"""
+    digest = sha256(canonical_search_string(search_params).encode()).hexdigest()
+    return f'{SEARCH_KEY_NAMESPACE}:{SEARCH_KEY_VERSION}:{digest}'
+
+
+def search_id(search_params: SearchParams) -> str:
+    """The digest part of ``search_key``; identifies the search in URLs."""
+    return search_key(search_params).rsplit(':', 1)[1]
+
+
+def key_for_search_id(id_: str) -> str:
+    if not re.fullmatch(r'[0-9a-f]{64}', id_ or ''):
+        raise ValueError(f'Invalid search id {id_!r}')
+    return f'{SEARCH_KEY_NAMESPACE}:{SEARCH_KEY_VERSION}:{id_}'
+
+
+def route_key(search_params: SearchParams) -> str:
+    """Low-cardinality label used for per-route metrics, e.g. ``BOG-MDE``."""
+    return (
+        f'{normalize_iata(search_params.origin)}-'
+        f'{normalize_iata(search_params.destination)}'
+    )
@@ -0,0 +1,157 @@
+"""
+Budget tracking benchmark: incremental spent vs full recompute.
+
+Builds one in-memory trip with ``--activities`` activities (plus a flight
+and an accommodation per hundred activities) and times ``--transitions``
+random child status changes two ways:
+
+* incremental: the aggregate's update_*_status, which adds or subtracts
+  the child's amount on moves into or out of its committed state;
+* recompute: the same moves followed by the full pass over every child
+  that status changes used to trigger (Trip._recalculate_budget).
+
+A status request first loads the whole trip, so it also times ``--loads``
+loads of the trip's ORM graph (TripOrmMapper.to_domain) and reports the
+per-request cost, load plus transition.
+
+Both runs replay the same seeded moves and must end on the same spent.
+No database is involved.
+
+Usage (from vacation_stay_scrapper/)::
+
+    python -m benchmarks.budget_tracking
+    python -m benchmarks.budget_tracking --activities 20000 --transitions 5000
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from src.trips.domain.entities.accommodation import Accommodation
+from src.trips.domain.entities.activity import Activity
+from src.trips.domain.entities.flight import Flight
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.services.child_status_transition import (
+    AccommodationStatusTransitionValidator,
+    ActivityStatusTransitionValidator,
+    FlightStatusTransitionValidator,
+)
+from src.trips.domain.value_objects.airport import Airport
+from src.trips.domain.value_objects.budget import Budget
+from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_status import TripStatus
+from src.trips.infrastructure.persistence.mappers.trip_orm_mapper import TripOrmMapper
+
+CHILD_KINDS = [
+    ("flights", FlightStatusTransitionValidator, Trip.update_flight_status),
+    ("accommodations", AccommodationStatusTransitionValidator, Trip.update_accommodation_status),
+    ("activities", ActivityStatusTransitionValidator, Trip.update_activity_status),
+]
+
+
+def build_trip(activities: int) -> Trip:
+    trip = Trip(
+        id=1,
+        owner_id="bench",
+        name="Benchmark",
+        destination="Lisbon",
+        start_date=date(2025, 7, 1),
+        end_date=date(2025, 7, 30),
+        status=TripStatus.PLANNING,
+        budget=Budget(total=Money(Decimal("10000000")), spent=Money.zero()),
+    )
+    for n in range(activities):
+        trip.add_activity(Activity(
+            id=f"act{n}", name=f"Activity {n}", date=date(2025, 7, 1 + n % 30),
+            cost=Money(Decimal(25 + n % 200)), category="sightseeing",
+        ))
+    for n in range(max(1, activities // 100)):
+        trip.add_flight(Flight(
+            id=f"f{n}", airline="TAP", flight_number=f"TP{n}",
+            departure_airport=Airport(code="MAD", city="Madrid"),
+            departure_time=datetime(2025, 7, 1, 10, 0),
+            arrival_airport=Airport(code="LIS", city="Lisbon"),
+            arrival_time=datetime(2025, 7, 1, 11, 30),
+            duration="1h 30m", price=Money(Decimal("120")),
+        ))
+        trip.add_accommodation(Accommodation(
+            id=f"a{n}", name=f"Hotel {n}", type="hotel",
+            check_in=date(2025, 7, 1), check_out=date(2025, 7, 5),
+            price_per_night=Money(Decimal("90")), total_price=Money(Decimal("360")),
+            rating=4.0, amenities=[],
+        ))
+    return trip
+
+
+def plan_moves(trip: Trip, transitions: int, seed: int) -> List[Tuple]:
+    """Legal (update method, child id, status) moves, replayable on a fresh trip"""
+    rng = random.Random(seed)
+    statuses = {
+        collection: {child.id: child.status for child in getattr(trip, collection)}
+        for collection, _, _ in CHILD_KINDS
+    }
+    moves = []
+    for _ in range(transitions):
+        collection, validator, update = rng.choice(CHILD_KINDS)
+        child_id = rng.choice(list(statuses[collection]))
+        target = rng.choice(sorted(validator.VALID_TRANSITIONS[statuses[collection][child_id]]))
+        statuses[collection][child_id] = target
+        moves.append((update, child_id, target))
+    return moves
+
+
+def replay(trip: Trip, moves: List[Tuple], recompute: bool) -> float:
+    """Wall time of applying every move, in milliseconds"""
+    start = time.perf_counter()
+    for update, child_id, target in moves:
+        update(trip, child_id, target)
+        if recompute:
+            trip._recalculate_budget()
+    return (time.perf_counter() - start) * 1000
+
+
+def load(trip: Trip, loads: int) -> float:
+    """Mean wall time of mapping the trip's ORM graph to a Trip, in milliseconds"""
+    model = TripOrmMapper.to_model(trip)
+    start = time.perf_counter()
+    for _ in range(loads):
+        TripOrmMapper.to_domain(model)
+    return (time.perf_counter() - start) * 1000 / loads
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--activities", type=int, default=5_000)
+    parser.add_argument("--transitions", type=int, default=2_000)
+    parser.add_argument("--loads", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    moves = plan_moves(build_trip(args.activities), args.transitions, args.seed)
+    incremental, recomputed = build_trip(args.activities), build_trip(args.activities)
+    rows = [
+        ("incremental", replay(incremental, moves, recompute=False)),
+        ("full recompute", replay(recomputed, moves, recompute=True)),
+    ]
+
+    load_ms = load(build_trip(args.activities), args.loads)
+
+    print(f"{args.activities} activities, {args.transitions} transitions\n")
+    print(f"load (to_domain): {load_ms * 1000:.1f} us\n")
+    print(f"{'spent tracking':<18}{'total ms':>12}{'us/transition':>16}{'us/request':>14}")
+    for name, ms in rows:
+        per_transition = ms * 1000 / args.transitions
+        print(f"{name:<18}{ms:>12.2f}{per_transition:>16.1f}{load_ms * 1000 + per_transition:>14.1f}")
+
+    if incremental.budget.spent != recomputed.budget.spent:
+        print(f"\nMISMATCH: {incremental.budget.spent} != {recomputed.budget.spent}")
+        return 1
+    print(f"\nBoth end on spent = {incremental.budget.spent}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Trip list benchmark: keyset pages vs OFFSET pages vs the unpaged list.
+
+Seeds ``--trips`` trips (100k by default) into a scratch PostgreSQL
+database: one power user owns ``--power-trips`` of them, with a couple of
+activities each, and the rest are spread across other owners. It then
+times, for the power user:
+
+* the first summary page, and the same page filtered by status;
+* walking every page with the keyset cursor vs. the same pages by OFFSET;
+* the on-demand total;
+* the old unpaged, fully loaded list (find_all_by_owner).
+
+Seeded rows are owned by ``bench-*`` users and deleted afterwards unless
+``--keep`` is given. Never point this at a database you care about.
+
+Usage (from vacation_stay_scrapper/)::
+
+    alembic upgrade head   # against the scratch database
+    python -m benchmarks.trip_list --database-url postgresql+asyncpg://...
+    python -m benchmarks.trip_list --database-url ... --trips 20000 --explain
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.trips.domain.value_objects.trip_query import TripQuery
+from src.trips.domain.value_objects.trip_status import TripStatus
+from src.trips.infrastructure.persistence.postgres_trip_repository import (
+    SUMMARY_COLUMNS,
+    PostgresTripRepository,
+    _filtered,
+    _paged,
+)
+from src.trips.infrastructure.persistence.models.trip import Trip as TripOrm
+
+POWER_USER = "bench-power"
+
+SEED_TRIPS = text("""
+    INSERT INTO trips (owner_id, name, destination, start_date, end_date, status,
+                       budget_total_amount, budget_total_currency,
+                       budget_spent_amount, budget_spent_currency, created_at, updated_at)
+    SELECT CASE WHEN n <= :power_trips THEN :power_user
+                ELSE 'bench-' || (n % :owners) END,
+           'Trip ' || n,
+           (ARRAY['Barcelona', 'Lisbon', 'Tokyo', 'Lima', 'Oslo'])[n % 5 + 1],
+           DATE '2020-01-01' + (n % 2500),
+           DATE '2020-01-01' + (n % 2500) + 7,
+           (ARRAY['planning', 'confirmed', 'in_progress', 'completed', 'cancelled'])[n % 5 + 1],
+           5000, 'USD', 0, 'USD', CURRENT_DATE, CURRENT_DATE
+    FROM generate_series(1, :trips) AS n
+""")
+
+SEED_ACTIVITIES = text("""
+    INSERT INTO activities (id, trip_id, name, date, cost_amount, cost_currency, category, status)
+    SELECT 'bench-' || t.id || '-' || k, t.id, 'Activity ' || k, t.start_date,
+           25 * k, 'USD', 'sightseeing', CASE WHEN k % 2 = 0 THEN 'booked' ELSE 'pending' END
+    FROM trips t, generate_series(1, :per_trip) AS k
+    WHERE t.owner_id = :power_user
+""")
+
+
+async def best_of(runs: int, call: Callable[[], Awaitable]) -> float:
+    """Best wall time of ``runs`` calls, in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+async def seed(session: AsyncSession, trips: int, power_trips: int, owners: int) -> None:
+    await session.execute(SEED_TRIPS, {
+        "trips": trips, "power_trips": power_trips, "power_user": POWER_USER, "owners": owners,
+    })
+    await session.execute(SEED_ACTIVITIES, {"per_trip": 2, "power_user": POWER_USER})
+    await session.commit()
+    await session.execute(text("ANALYZE trips"))
+    await session.execute(text("ANALYZE activities"))
+
+
+async def cleanup(session: AsyncSession) -> None:
+    await session.execute(text("DELETE FROM trips WHERE owner_id LIKE 'bench-%'"))
+    await session.commit()
+
+
+async def walk_keyset(repository: PostgresTripRepository, page_size: int) -> List[float]:
+    timings, query = [], TripQuery(limit=page_size)
+    while True:
+        start = time.perf_counter()
+        page = await repository.find_summaries_by_owner(POWER_USER, query)
+        timings.append((time.perf_counter() - start) * 1000)
+        if page.next_cursor is None:
+            return timings
+        query = TripQuery(limit=page_size, after=page.next_cursor)
+
+
+async def walk_offset(session: AsyncSession, page_size: int, pages: int) -> List[float]:
+    timings, query = [], TripQuery()
+    for number in range(pages):
+        statement = (
+            _paged(_filtered(select(*SUMMARY_COLUMNS), POWER_USER, query), query)
+            .limit(page_size)
+            .offset(number * page_size)
+        )
+        start = time.perf_counter()
+        (await session.execute(statement)).mappings().all()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def explain(session: AsyncSession, query: TripQuery) -> None:
+    statement = _paged(_filtered(select(TripOrm.id_), POWER_USER, query), query)
+    compiled = statement.compile(
+        dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = await session.execute(text(f"EXPLAIN {compiled}"))
+    for (line,) in result:
+        print(f"    {line}")
+
+
+async def run(args: argparse.Namespace) -> int:
+    engine = create_async_engine(args.database_url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with sessions() as session:
+            await cleanup(session)
+            print(f"Seeding {args.trips} trips ({args.power_trips} for {POWER_USER})...")
+            await seed(session, args.trips, args.power_trips, args.owners)
+
+        async with sessions() as session:
+            repository = PostgresTripRepository(session)
+            first = TripQuery(limit=args.page_size)
+            confirmed = TripQuery(limit=args.page_size, status=TripStatus.CONFIRMED)
+            counted = TripQuery(limit=args.page_size, include_total=True)
+
+            rows = [
+                ("first summary page", await best_of(
+                    args.runs, lambda: repository.find_summaries_by_owner(POWER_USER, first))),
+                ("first page, status=confirmed", await best_of(
+                    args.runs, lambda: repository.find_summaries_by_owner(POWER_USER, confirmed))),
+                ("first page + total", await best_of(
+                    args.runs, lambda: repository.find_summaries_by_owner(POWER_USER, counted))),
+            ]
+            keyset = await walk_keyset(repository, args.page_size)
+            offset = await walk_offset(session, args.page_size, len(keyset))
+            rows += [
+                (f"keyset, mean of {len(keyset)} pages", statistics.mean(keyset)),
+                ("keyset, last page", keyset[-1]),
+                (f"offset, mean of {len(offset)} pages", statistics.mean(offset)),
+                ("offset, last page", offset[-1]),
+                ("unpaged full list (old)", await best_of(
+                    1, lambda: repository.find_all_by_owner(POWER_USER))),
+            ]
+
+            print(f"\n{'query':<34}{'ms':>10}")
+            for name, ms in rows:
+                print(f"{name:<34}{ms:>10.2f}")
+
+            if args.explain:
+                print("\nPlan, first page:")
+                await explain(session, first)
+                print("Plan, first page with status filter:")
+                await explain(session, confirmed)
+    finally:
+        if not args.keep:
+            async with sessions() as session:
+                await cleanup(session)
+        await engine.dispose()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", required=True,
+                        help="scratch database, already migrated (alembic upgrade head)")
+    parser.add_argument("--trips", type=int, default=100_000)
+    parser.add_argument("--power-trips", type=int, default=5_000,
+                        help="trips owned by the benchmarked user")
+    parser.add_argument("--owners", type=int, default=1_000,
+                        help="owners sharing the remaining trips")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5,
+                        help="repetitions per single-page query; the best one is reported")
+    parser.add_argument("--explain", action="store_true", help="print query plans")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,7 @@ from starlette import status
 from src.shared.infrastructure.logging.logger import setup_logger
 # Import from new shared infrastructure
 from src.shared.infrastructure.auth.dependencies import get_current_user
+from src.shared.infrastructure.database.session import dispose_engines
 from src.shared.presentation.middleware import setup_middleware
 from src.shared.infrastructure.http.http_connector import HTTPConnector
 from src.shared.infrastructure.telemetry.otel import setup_telemetry
@@ -38,6 +39,7 @@ async def lifespan(app: FastAPI):
         logger.exception("Database migration failed: %s", exc)
         raise
     yield
+    await dispose_engines()
 
 
 # Create FastAPI app
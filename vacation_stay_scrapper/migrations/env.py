@@ -14,6 +14,7 @@ import src.trips.infrastructure.persistence.models.flight  # noqa: F401
 import src.trips.infrastructure.persistence.models.accommodation  # noqa: F401
 import src.trips.infrastructure.persistence.models.activity  # noqa: F401
 import src.trips.infrastructure.persistence.models.budget_category  # noqa: F401
+import src.trips.infrastructure.persistence.models.trip_category_spend  # noqa: F401
 
 config = context.config
 
@@ -0,0 +1,52 @@
+"""trip list indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00.000000
+
+Composite indexes for keyset pagination of an owner's trips on
+(start_date, id), with and without a status filter. Built CONCURRENTLY so
+existing deployments keep serving writes while they build.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_trips_owner_id_start_date_id",
+            "trips",
+            ["owner_id", "start_date", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_trips_owner_id_status_start_date_id",
+            "trips",
+            ["owner_id", "status", "start_date", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_trips_owner_id_status_start_date_id",
+            table_name="trips",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_trips_owner_id_start_date_id",
+            table_name="trips",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,83 @@
+"""trip child indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00.000000
+
+Index every child table's trip_id: find_by_owner's selectin loads
+(``WHERE trip_id IN (...)``), the ON DELETE CASCADE from trips and the trip
+list's count/spent subqueries all scanned the child tables sequentially.
+Flights, accommodations and activities are keyed on (trip_id, status) and
+carry their amount, so the committed-spend subqueries are index-only.
+
+Owner lookups on trips are served by 0002's composite indexes, which lead
+with owner_id. The (owner_id, start_date, id) one is rebuilt to cover the
+summary projection, so list pages are read from the index alone.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns, covered columns)
+CHILD_INDEXES = [
+    ("ix_travelers_trip_id", "travelers", ["trip_id"], []),
+    ("ix_flights_trip_id_status", "flights", ["trip_id", "status"], ["price_amount"]),
+    ("ix_accommodations_trip_id_status", "accommodations", ["trip_id", "status"], ["total_price_amount"]),
+    ("ix_activities_trip_id_status", "activities", ["trip_id", "status"], ["cost_amount"]),
+    ("ix_budget_categories_trip_id", "budget_categories", ["trip_id"], []),
+]
+
+TRIP_SUMMARY_COLUMNS = [
+    "name", "destination", "end_date", "status", "budget_total_amount", "budget_total_currency",
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in CHILD_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.create_index(
+            "ix_trips_owner_id_start_date_id_summary",
+            "trips",
+            ["owner_id", "start_date", "id"],
+            postgresql_include=TRIP_SUMMARY_COLUMNS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_trips_owner_id_start_date_id",
+            table_name="trips",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_trips_owner_id_start_date_id",
+            "trips",
+            ["owner_id", "start_date", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_trips_owner_id_start_date_id_summary",
+            table_name="trips",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        for name, table, _, _ in reversed(CHILD_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,119 @@
+"""trip category spend
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00.000000
+
+Summary table of committed spend per (trip, category), maintained by row
+triggers on the child tables so that trip lists and spend breakdowns read
+a handful of rows instead of aggregating every child:
+
+* confirmed flights count towards "flights";
+* confirmed accommodations towards "accommodation";
+* booked activities towards their own category.
+
+One trigger function serves all three tables; each trigger passes its
+amount column, committed status and (for flights and accommodations) the
+fixed category. A row leaving its committed state subtracts with a plain
+UPDATE, so the cascade from a deleted trip never re-inserts a row for it.
+Creating the triggers locks the child tables against writes until the
+backfill commits, so no change falls between the two.
+"""
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, amount column, committed status, category or None for the row's own)
+CHILD_SOURCES = [
+    ("flights", "price_amount", "confirmed", "flights"),
+    ("accommodations", "total_price_amount", "confirmed", "accommodation"),
+    ("activities", "cost_amount", "booked", None),
+]
+
+SYNC_FUNCTION = """
+CREATE OR REPLACE FUNCTION trip_category_spend_sync() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    amount_column text := TG_ARGV[0];
+    committed_status text := TG_ARGV[1];
+    fixed_category text := TG_ARGV[2];
+    old_row jsonb;
+    new_row jsonb;
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        old_row := to_jsonb(OLD);
+        IF old_row ->> 'status' = committed_status THEN
+            UPDATE trip_category_spend
+               SET spent_amount = spent_amount - (old_row ->> amount_column)::numeric
+             WHERE trip_id = (old_row ->> 'trip_id')::bigint
+               AND category = COALESCE(fixed_category, old_row ->> 'category');
+        END IF;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        new_row := to_jsonb(NEW);
+        IF new_row ->> 'status' = committed_status THEN
+            INSERT INTO trip_category_spend (trip_id, category, spent_amount)
+            VALUES ((new_row ->> 'trip_id')::bigint,
+                    COALESCE(fixed_category, new_row ->> 'category'),
+                    (new_row ->> amount_column)::numeric)
+            ON CONFLICT (trip_id, category) DO UPDATE
+               SET spent_amount = trip_category_spend.spent_amount + EXCLUDED.spent_amount;
+        END IF;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def _trigger(table: str) -> str:
+    return f"{table}_category_spend"
+
+
+def _committed_rows(table: str, amount: str, committed: str, category: Optional[str]) -> str:
+    category_column = f"'{category}'" if category else "category"
+    return (
+        f"SELECT trip_id, {category_column} AS category, {amount} AS amount "
+        f"FROM {table} WHERE status = '{committed}'"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trip_category_spend",
+        sa.Column("trip_id", sa.BigInteger(), nullable=False),
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("spent_amount", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["trip_id"], ["trips.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("trip_id", "category"),
+    )
+    op.execute(SYNC_FUNCTION)
+
+    for table, amount, committed, category in CHILD_SOURCES:
+        watched = ["status", amount, "trip_id"] + (["category"] if category is None else [])
+        arguments = ", ".join(f"'{arg}'" for arg in (amount, committed, category) if arg)
+        op.execute(
+            f"CREATE TRIGGER {_trigger(table)} "
+            f"AFTER INSERT OR DELETE OR UPDATE OF {', '.join(watched)} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION trip_category_spend_sync({arguments})"
+        )
+
+    sources = " UNION ALL ".join(_committed_rows(*source) for source in CHILD_SOURCES)
+    op.execute(
+        "INSERT INTO trip_category_spend (trip_id, category, spent_amount) "
+        f"SELECT trip_id, category, sum(amount) FROM ({sources}) AS committed "
+        "GROUP BY trip_id, category"
+    )
+
+
+def downgrade() -> None:
+    for table, _, _, _ in reversed(CHILD_SOURCES):
+        op.execute(f"DROP TRIGGER IF EXISTS {_trigger(table)} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS trip_category_spend_sync()")
+    op.drop_table("trip_category_spend")
@@ -0,0 +1,39 @@
+"""reserved activity categories
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 00:00:00.000000
+
+"flights" and "accommodation" are the trip_category_spend buckets of the
+children without a category of their own (migration 0005), so activities
+may no longer use them. Existing activities in those categories are moved
+to "<category> (activity)"; the category triggers move their committed
+spend out of the fixed buckets along with them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RESERVED_CATEGORIES = ("flights", "accommodation")
+SUFFIX = " (activity)"
+
+
+def upgrade() -> None:
+    for category in RESERVED_CATEGORIES:
+        op.execute(
+            f"UPDATE activities SET category = '{category}{SUFFIX}' "
+            f"WHERE category = '{category}'"
+        )
+
+
+def downgrade() -> None:
+    for category in RESERVED_CATEGORIES:
+        op.execute(
+            f"UPDATE activities SET category = '{category}' "
+            f"WHERE category = '{category}{SUFFIX}'"
+        )
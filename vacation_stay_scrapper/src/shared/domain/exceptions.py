@@ -72,6 +72,20 @@ class InvalidStatusTransition(ValidationError):
     pass
 
 
+class ConcurrentModification(DomainException):
+    """
+    Raised when an aggregate was changed by someone else since it was loaded
+    (optimistic locking: its version no longer matches).
+    """
+
+    def __init__(self, entity_type: str, entity_id: str):
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        super().__init__(
+            f"{entity_type} with id '{entity_id}' was modified concurrently"
+        )
+
+
 class UnauthorizedAccess(DomainException):
     """Raised when a user attempts to access a resource they don't own"""
 
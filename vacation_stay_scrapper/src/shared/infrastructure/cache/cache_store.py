@@ -0,0 +1,86 @@
+"""
+Cache Store
+
+Minimal async key/value interface for shared (out-of-process) caches, and
+an in-memory implementation for tests and single-process runs.
+"""
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class CacheStore(ABC):
+    """
+    Shared cache: string keys and values, every entry with a TTL in seconds
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """
+        Read several keys in one round trip
+
+        Args:
+            keys: Keys to read
+
+        Returns:
+            One value per key, None where the key is missing or expired
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a value, replacing any existing one"""
+        pass
+
+    @abstractmethod
+    async def add(self, key: str, value: str, ttl: float) -> bool:
+        """
+        Store a value only if the key is absent
+
+        Returns:
+            True if the value was stored, False if the key already existed
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a key, if present"""
+        pass
+
+
+class InMemoryCacheStore(CacheStore):
+    """
+    CacheStore in a dict, for tests and single-process development
+
+    ``clock`` returns seconds and defaults to time.monotonic; tests pass
+    their own to expire entries without sleeping.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._entries: Dict[str, Tuple[str, float]] = {}
+
+    def _get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        return [self._get(key) for key in keys]
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self._entries[key] = (value, self._clock() + ttl)
+
+    async def add(self, key: str, value: str, ttl: float) -> bool:
+        if self._get(key) is not None:
+            return False
+        self._entries[key] = (value, self._clock() + ttl)
+        return True
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
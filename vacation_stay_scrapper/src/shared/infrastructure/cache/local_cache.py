@@ -0,0 +1,95 @@
+"""
+Local Cache
+
+Small in-process caching helpers: a TTL-bounded LRU dict, and single-flight
+deduplication of concurrent loads.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class LocalCache:
+    """
+    Process-local LRU cache whose entries expire after ``ttl`` seconds
+
+    Meant as a short-lived first level in front of a shared cache: it saves
+    the network round trip for hot keys, at the price of serving a value up
+    to ``ttl`` seconds after another process invalidated it.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self._ttl <= 0 or self._max_entries <= 0:
+            return
+        self._entries[key] = (value, self._clock() + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight(Generic[T]):
+    """
+    Collapse concurrent calls for the same key into one
+
+    The first caller for a key runs ``load``; callers arriving while it is
+    in flight await its result (or its exception) instead of loading again.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, "asyncio.Future[T]"] = {}
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            try:
+                # shielded: a cancelled follower must not cancel the leader's load
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # the leader was cancelled, not us: load again
+                return await self.do(key, load)
+
+        future: "asyncio.Future[T]" = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # nobody may be waiting; don't log "exception never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
@@ -0,0 +1,45 @@
+"""
+Redis Cache Store
+
+CacheStore backed by Redis (redis-py's asyncio client).
+"""
+from typing import List, Optional, Sequence
+
+from .cache_store import CacheStore
+
+
+def _milliseconds(ttl: float) -> int:
+    return max(1, int(ttl * 1000))
+
+
+class RedisCacheStore(CacheStore):
+    """CacheStore on a Redis server; TTLs are set with millisecond precision"""
+
+    def __init__(self, url: str):
+        """
+        Initialize the store
+
+        The client connects lazily, on the first command.
+
+        Args:
+            url: Redis URL, e.g. redis://localhost:6379/0
+        """
+        # Imported here so the redis package is only needed when a cache is configured
+        from redis.asyncio import Redis
+
+        self._client = Redis.from_url(url, decode_responses=True)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        return await self._client.mget(list(keys))
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._client.set(key, value, px=_milliseconds(ttl))
+
+    async def add(self, key: str, value: str, ttl: float) -> bool:
+        return bool(await self._client.set(key, value, px=_milliseconds(ttl), nx=True))
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def close(self) -> None:
+        await self._client.aclose()
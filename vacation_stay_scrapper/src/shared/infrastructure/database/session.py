@@ -1,12 +1,36 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List, Optional
 
-
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 
 from config.settings import settings
 
 
+def engine_options(database_url: str, pool_name: str) -> dict:
+    """create_async_engine arguments for a database URL, from the settings"""
+    options = dict(
+        echo=settings.database_echo,
+        future=True,
+        pool_logging_name=pool_name,  # also the pool.name of its OTel metrics
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+    )
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        # Statements prepared per connection; 0 disables the cache, as needed
+        # behind PgBouncer in transaction mode.
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.database_statement_cache_size,
+        }
+    return options
+
+
+def create_engine(database_url: str, pool_name: str) -> AsyncEngine:
+    return create_async_engine(database_url, **engine_options(database_url, pool_name))
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
@@ -17,13 +41,54 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    future=True,
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for requests that only read: on the read replica when one is
+    configured, in a READ ONLY transaction that is never committed (closing
+    the session rolls it back).
+    """
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+engine = create_engine(settings.database_url, "primary")
+# Replicas lag behind the primary, so a read right after a write may not see it.
+replica_engine: Optional[AsyncEngine] = (
+    create_engine(settings.database_read_replica_url, "replica")
+    if settings.database_read_replica_url
+    else None
 )
+read_engine = (replica_engine or engine).execution_options(postgresql_readonly=True)
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+def engines() -> List[AsyncEngine]:
+    """Every distinct engine, for instrumentation and shutdown"""
+    return [engine] if replica_engine is None else [engine, replica_engine]
+
+
+async def dispose_engines() -> None:
+    for async_engine in engines():
+        await async_engine.dispose()
+
+
+def pool_max_connections(async_engine: AsyncEngine) -> Optional[int]:
+    """
+    Most connections the engine's pool opens (size plus overflow); None
+    when unbounded, or for pools without a size
+    """
+    pool = async_engine.pool
+    if not hasattr(pool, "size") or settings.database_max_overflow < 0:
+        return None
+    return pool.size() + settings.database_max_overflow
+
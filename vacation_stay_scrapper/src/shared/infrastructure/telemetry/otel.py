@@ -151,10 +151,11 @@ def _configure_sdk(service_name: str, endpoint: str, app: object | None) -> None
     try:
         from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 
-        from src.shared.infrastructure.database.session import engine
+        from src.shared.infrastructure.database.session import engines
 
         # Async engines expose the underlying sync engine for instrumentation.
-        SQLAlchemyInstrumentor().instrument(engine=engine.sync_engine)
+        SQLAlchemyInstrumentor().instrument(engines=[engine.sync_engine for engine in engines()])
+        register_pool_metrics(meter_provider)
     except Exception as exc:  # noqa: BLE001 - DB instrumentation is best-effort
         logger.warning(f"SQLAlchemy instrumentation skipped: {exc!r}")
 
@@ -162,3 +163,31 @@ def _configure_sdk(service_name: str, endpoint: str, app: object | None) -> None
         from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
         FastAPIInstrumentor.instrument_app(app, tracer_provider=tracer_provider, meter_provider=meter_provider)
+
+
+def register_pool_metrics(meter_provider) -> None:
+    """Report each connection pool's capacity next to its usage.
+
+    SQLAlchemy instrumentation already counts ``db.client.connections.usage``
+    by ``state`` (idle/used). Dividing the ``used`` series by
+    ``db.client.connections.max`` gives the pool's saturation; both carry
+    the same ``pool.name``.
+    """
+    meter = meter_provider.get_meter(__name__)
+    meter.create_observable_gauge(
+        "db.client.connections.max",
+        callbacks=[observe_pool_max_connections],
+        unit="{connection}",
+        description="Most connections the pool may open (pool size plus overflow)",
+    )
+
+
+def observe_pool_max_connections(options=None):
+    from opentelemetry.metrics import Observation
+
+    from src.shared.infrastructure.database.session import engines, pool_max_connections
+
+    for engine in engines():
+        max_connections = pool_max_connections(engine)
+        if max_connections is not None:
+            yield Observation(max_connections, {"pool.name": engine.pool.logging_name})
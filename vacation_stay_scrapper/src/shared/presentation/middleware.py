@@ -15,6 +15,7 @@ from src.shared.domain.exceptions import (
     EntityNotFound,
     ValidationError,
     BusinessRuleViolation,
+    ConcurrentModification,
     ServiceUnavailable,
     UnauthorizedAccess
 )
@@ -119,6 +120,21 @@ def setup_exception_handlers(app: FastAPI):
             }
         )
     
+    @app.exception_handler(ConcurrentModification)
+    async def concurrent_modification_handler(
+        request: Request,
+        exc: ConcurrentModification
+    ):
+        logger.warning(f"Concurrent modification: {exc}")
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={
+                "message": str(exc),
+                "entity_type": exc.entity_type,
+                "entity_id": exc.entity_id
+            }
+        )
+
     @app.exception_handler(ServiceUnavailable)
     async def service_unavailable_handler(
         request: Request,
@@ -7,6 +7,8 @@ from typing import List, Optional
 
 from ...domain.entities.trip import Trip
 from ...domain.repositories.trip_repository import ITripRepository
+from ...domain.value_objects.category_spend import CategorySpend
+from ...domain.value_objects.trip_query import TripPage, TripQuery
 from ....shared.domain.exceptions import EntityNotFound
 
 
@@ -73,3 +75,76 @@ class GetAllTripsUseCase:
             List of trips owned by the user
         """
         return await self._repository.find_all_by_owner(owner_id)
+
+    async def page(self, owner_id: str, query: TripQuery) -> TripPage:
+        """
+        Get one page of the authenticated owner's trips.
+
+        Args:
+            owner_id: Authenticated user ID (JWT sub claim)
+            query: Filters, page size and cursor
+
+        Returns:
+            Page of full trips
+        """
+        return await self._repository.find_page_by_owner(owner_id, query)
+
+
+class GetTripSummariesUseCase:
+    """Use case for listing trips without loading their children"""
+
+    def __init__(self, repository: ITripRepository):
+        """
+        Initialize use case
+
+        Args:
+            repository: Trip repository implementation
+        """
+        self._repository = repository
+
+    async def execute(self, owner_id: str, query: Optional[TripQuery] = None) -> TripPage:
+        """
+        Get summaries of the authenticated owner's trips.
+
+        Args:
+            owner_id: Authenticated user ID (JWT sub claim)
+            query: Filters, page size and cursor (all trips when omitted)
+
+        Returns:
+            Page of trip summaries owned by the user
+        """
+        return await self._repository.find_summaries_by_owner(owner_id, query)
+
+
+class GetTripSpendUseCase:
+    """Use case for a trip's committed spend per category"""
+
+    def __init__(self, repository: ITripRepository):
+        """
+        Initialize use case
+
+        Args:
+            repository: Trip repository implementation
+        """
+        self._repository = repository
+
+    async def execute(self, trip_id: str, owner_id: str) -> List[CategorySpend]:
+        """
+        Get the spend breakdown of a trip owned by the authenticated user.
+
+        Read from per-category totals, without loading the trip's children.
+
+        Args:
+            trip_id: Trip identifier string
+            owner_id: Authenticated user ID (JWT sub claim)
+
+        Returns:
+            Committed spend per category
+
+        Raises:
+            EntityNotFound: If trip doesn't exist or is not owned by the user
+        """
+        spend = await self._repository.find_category_spend(int(trip_id), owner_id)
+        if spend is None:
+            raise EntityNotFound(entity_type="Trip", entity_id=trip_id)
+        return spend
@@ -1,5 +1,3 @@
-from datetime import date
-
 from ...domain.entities.trip import Trip
 from ...domain.repositories.trip_repository import ITripRepository
 from ...domain.value_objects.trip_status import TripStatus
@@ -14,9 +12,11 @@ class UpdateTripUseCase:
         """
         Update a trip owned by the authenticated user.
 
-        Verifies the trip exists and belongs to the given owner before
-        applying the update. Both "not found" and "wrong owner" raise
-        EntityNotFound to avoid leaking trip existence to other users.
+        ``updated_trip`` is the trip the caller already loaded for this owner
+        (GetTripUseCase) with the changes applied, so it is not fetched
+        again: the repository scopes the write itself to the trip's owner.
+        Both "not found" and "wrong owner" raise EntityNotFound to avoid
+        leaking trip existence to other users.
 
         Args:
             trip_id: Trip identifier string
@@ -29,10 +29,7 @@ class UpdateTripUseCase:
         Raises:
             EntityNotFound: If trip doesn't exist or is not owned by the user
         """
-        trip_id_int = int(trip_id)
-
-        existing_trip = await self._repository.find_by_owner(trip_id_int, owner_id)
-        if existing_trip is None:
+        if updated_trip.id != int(trip_id) or updated_trip.owner_id != owner_id:
             raise EntityNotFound(entity_type="Trip", entity_id=trip_id)
 
         return await self._repository.save(updated_trip)
@@ -41,9 +38,8 @@ class UpdateTripUseCase:
         """
         Update the status of a trip owned by the authenticated user.
 
-        Verifies the trip exists and belongs to the given owner before
-        applying the status update. Uses the repository's update_status method
-        to avoid SQLAlchemy identity map conflicts.
+        A single owner-scoped write: the repository updates and returns the
+        trip only if it exists and belongs to the given owner.
 
         Args:
             trip_id: Trip identifier string
@@ -56,18 +52,8 @@ class UpdateTripUseCase:
         Raises:
             EntityNotFound: If trip doesn't exist or is not owned by the user
         """
-        trip_id_int = int(trip_id)
-
-        trip = await self._repository.find_by_owner(trip_id_int, owner_id)
+        trip = await self._repository.update_status(int(trip_id), owner_id, str(new_status))
         if trip is None:
             raise EntityNotFound(entity_type="Trip", entity_id=trip_id)
 
-        updated = await self._repository.update_status(trip_id_int, str(new_status))
-
-        if not updated:
-            raise EntityNotFound(entity_type="Trip", entity_id=trip_id)
-
-        trip.status = new_status
-        trip.updated_at = date.today()
-
         return trip
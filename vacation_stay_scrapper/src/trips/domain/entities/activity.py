@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 
+from ..value_objects.category_spend import RESERVED_CATEGORIES
 from ..value_objects.money import Money
 
 
@@ -34,6 +35,8 @@ class Activity:
             raise ValueError("Activity name cannot be empty")
         if not self.category or not self.category.strip():
             raise ValueError("Activity category cannot be empty")
+        if self.category in RESERVED_CATEGORIES:
+            raise ValueError(f"Activity category '{self.category}' is reserved")
         if self.status not in ["booked", "pending", "cancelled"]:
             raise ValueError(f"Invalid activity status: {self.status}")
     
@@ -10,6 +10,8 @@ from typing import List, Optional
 
 from ..value_objects.trip_status import TripStatus
 from ..value_objects.budget import Budget
+from ..value_objects.money import Money
+from ..value_objects.trip_changes import TripChanges, TripSnapshot
 from ..services.child_status_transition import (
     FlightStatusTransitionValidator,
     AccommodationStatusTransitionValidator,
@@ -51,6 +53,12 @@ class Trip:
     # Metadata
     created_at: Optional[date] = None
     updated_at: Optional[date] = None
+    version: int = 1  # bumped by every write, for optimistic locking
+
+    # Persisted state, for change tracking (see mark_clean)
+    _snapshot: Optional[TripSnapshot] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Validate trip data"""
@@ -110,8 +118,9 @@ class Trip:
         if flight is None:
             raise ChildNotFound("Flight", flight_id)
         FlightStatusTransitionValidator().validate(flight.status, new_status)
+        was_committed = flight.is_confirmed()
         flight.status = new_status
-        self._recalculate_budget()
+        self._track_commitment(flight.price, was_committed, flight.is_confirmed())
     
     # Accommodation management
     
@@ -145,8 +154,11 @@ class Trip:
         AccommodationStatusTransitionValidator().validate(
             accommodation.status, new_status
         )
+        was_committed = accommodation.is_confirmed()
         accommodation.status = new_status
-        self._recalculate_budget()
+        self._track_commitment(
+            accommodation.total_price, was_committed, accommodation.is_confirmed()
+        )
     
     @property
     def total_accommodation_cost(self) -> float:
@@ -181,8 +193,9 @@ class Trip:
         if activity is None:
             raise ChildNotFound("Activity", activity_id)
         ActivityStatusTransitionValidator().validate(activity.status, new_status)
+        was_committed = activity.is_booked()
         activity.status = new_status
-        self._recalculate_budget()
+        self._track_commitment(activity.cost, was_committed, activity.is_booked())
     
     # Budget management
     
@@ -190,17 +203,55 @@ class Trip:
         """Set the trip budget"""
         self.budget = budget
 
+    def _track_commitment(self, amount: Money, was_committed: bool, is_committed: bool):
+        """
+        Keep budget.spent current after a child status change (ADR-003).
+
+        Adds the child's amount when it enters its committed state and
+        subtracts it when it leaves, so a transition costs O(1) instead of
+        a pass over every child. Falls back to a full recompute when the
+        running total cannot absorb the change (it would go negative, or
+        the currencies differ), i.e. when it was already inconsistent.
+        No-op when the trip has no budget.
+        """
+        if self.budget is None or was_committed == is_committed:
+            return
+        try:
+            if is_committed:
+                self.budget = self.budget.commit(amount)
+            else:
+                self.budget = self.budget.release(amount)
+        except ValueError:
+            self._recalculate_budget()
+
     def _recalculate_budget(self):
         """
         Recompute budget.spent from the current child statuses.
 
-        No-op when the trip has no budget. Called after any child status
-        change so that spent reflects only committed children (ADR-003).
+        No-op when the trip has no budget. The full pass behind the
+        incremental tracking and reconcile_budget().
         """
         if self.budget is not None:
             self.budget = self.budget.recalculate_spent(
                 self.flights, self.accommodations, self.activities
             )
+
+    def reconcile_budget(self) -> bool:
+        """
+        Check the running spent total against a full recompute.
+
+        Replaces spent with the recomputed value when the two disagree, e.g.
+        for a trip stored before spent was maintained, or with children
+        added already committed.
+
+        Returns:
+            True if spent was already consistent (or there is no budget)
+        """
+        if self.budget is None:
+            return True
+        spent = self.budget.spent
+        self._recalculate_budget()
+        return self.budget.spent == spent
     
     @property
     def total_spent(self) -> float:
@@ -216,6 +267,28 @@ class Trip:
             return False
         return self.budget.is_over_budget
     
+    # Change tracking
+
+    def mark_clean(self):
+        """
+        Record the current state as persisted.
+
+        Repositories call this after loading or saving the trip; changes()
+        reports everything modified since.
+        """
+        self._snapshot = TripSnapshot.of(self)
+
+    def changes(self) -> Optional[TripChanges]:
+        """
+        Dirty fields and added/removed/modified children since mark_clean().
+
+        Returns None for a trip that was never marked clean, whose persisted
+        state is unknown.
+        """
+        if self._snapshot is None:
+            return None
+        return self._snapshot.diff(self)
+    
     # Status checks
     
     def is_confirmed(self) -> bool:
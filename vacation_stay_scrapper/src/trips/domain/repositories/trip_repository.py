@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from ..entities.trip import Trip
+from ..value_objects.category_spend import CategorySpend
+from ..value_objects.trip_query import TripPage, TripQuery
 
 
 class ITripRepository(ABC):
@@ -21,12 +23,17 @@ class ITripRepository(ABC):
     async def save(self, trip: Trip) -> Trip:
         """
         Save a trip
-        
+
+        Writes to an existing trip are scoped to the trip's owner.
+
         Args:
             trip: Trip to save
-            
+
         Returns:
             Saved trip
+
+        Raises:
+            EntityNotFound: If an existing trip was deleted or has another owner
         """
         pass
     
@@ -69,7 +76,61 @@ class ITripRepository(ABC):
             List of trips owned by the user
         """
         pass
-    
+
+    @abstractmethod
+    async def find_page_by_owner(self, owner_id: str, query: TripQuery) -> TripPage:
+        """
+        Get one page of an owner's trips, filtered and ordered by
+        (start_date, id).
+
+        Args:
+            owner_id: Owner user ID
+            query: Filters, page size and cursor
+
+        Returns:
+            Page of full Trip aggregates
+        """
+        pass
+
+    @abstractmethod
+    async def find_summaries_by_owner(
+        self, owner_id: str, query: Optional[TripQuery] = None
+    ) -> TripPage:
+        """
+        Get one page of summaries of an owner's trips, filtered and ordered
+        by (start_date, id).
+
+        Cheaper than find_page_by_owner: child collections are counted and
+        totalled, never loaded.
+
+        Args:
+            owner_id: Owner user ID
+            query: Filters, page size and cursor (all trips when omitted)
+
+        Returns:
+            Page of TripSummary read models
+        """
+        pass
+
+    @abstractmethod
+    async def find_category_spend(
+        self, trip_id: int, owner_id: str
+    ) -> Optional[List[CategorySpend]]:
+        """
+        Committed spend of an owner's trip, per category
+
+        Implementations should not need to load the trip's children.
+
+        Args:
+            trip_id: Trip identifier
+            owner_id: Owner user ID
+
+        Returns:
+            Categories with a non-zero spend, ordered by name, or None if
+            the trip is not found or owned by another user
+        """
+        pass
+
     @abstractmethod
     async def delete(self, trip_id: int) -> bool:
         """
@@ -97,15 +158,18 @@ class ITripRepository(ABC):
         pass
 
     @abstractmethod
-    async def update_status(self, trip_id: int, status: str) -> bool:
+    async def update_status(self, trip_id: int, owner_id: str, status: str) -> Optional[Trip]:
         """
-        Update the status of a trip
+        Update the status of a trip owned by the given user
+
+        Ownership is part of the write itself, so no prior lookup is needed.
 
         Args:
             trip_id: Trip identifier
+            owner_id: Owner user ID
             status: New status value
 
         Returns:
-            True if updated, False if not found
+            Updated trip, or None if not found or owned by another user
         """
         pass
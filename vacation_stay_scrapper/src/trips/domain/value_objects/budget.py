@@ -91,6 +91,19 @@ class Budget:
             categories=self.categories,
         )
 
+    def commit(self, amount: Money) -> "Budget":
+        """Return a new Budget with ``amount`` added to ``spent``"""
+        return Budget(total=self.total, spent=self.spent + amount, categories=self.categories)
+
+    def release(self, amount: Money) -> "Budget":
+        """
+        Return a new Budget with ``amount`` taken off ``spent``.
+
+        Raises:
+            ValueError: if spent would go negative or currencies differ
+        """
+        return Budget(total=self.total, spent=self.spent - amount, categories=self.categories)
+
     def add_category(self, category: BudgetCategory):
         """Add a budget category"""
         # Note: This creates a new Budget since it's frozen
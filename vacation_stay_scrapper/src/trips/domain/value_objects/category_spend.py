@@ -0,0 +1,58 @@
+"""
+Category Spend Value Object
+
+Committed spend of a trip broken down by category: flights and
+accommodations each form a category of their own, activities count
+towards their own category.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, List
+
+from .money import Money
+
+if TYPE_CHECKING:
+    from ..entities.trip import Trip
+
+# Categories of the children that have none of their own; activities may
+# not use them, or their spend would merge into these
+FLIGHTS_CATEGORY = "flights"
+ACCOMMODATION_CATEGORY = "accommodation"
+RESERVED_CATEGORIES = frozenset({FLIGHTS_CATEGORY, ACCOMMODATION_CATEGORY})
+
+
+@dataclass(frozen=True)
+class CategorySpend:
+    """
+    Committed spend of one category of a trip
+
+    Follows the same rule as ``Budget.recalculate_spent`` (ADR-003): only
+    confirmed flights and accommodations and booked activities count.
+    """
+    category: str
+    spent: Money
+
+    @classmethod
+    def of(cls, trip: "Trip") -> List["CategorySpend"]:
+        """Breakdown of a fully loaded Trip aggregate, ordered by category"""
+        totals: Dict[str, Decimal] = {}
+
+        def add(category: str, amount: Money) -> None:
+            totals[category] = totals.get(category, Decimal("0")) + amount.amount
+
+        for flight in trip.flights:
+            if flight.is_confirmed():
+                add(FLIGHTS_CATEGORY, flight.price)
+        for accommodation in trip.accommodations:
+            if accommodation.is_confirmed():
+                add(ACCOMMODATION_CATEGORY, accommodation.total_price)
+        for activity in trip.activities:
+            if activity.is_booked():
+                add(activity.category, activity.cost)
+
+        currency = trip.budget.total.currency if trip.budget else "USD"
+        return [
+            cls(category=category, spent=Money(amount=amount, currency=currency))
+            for category, amount in sorted(totals.items())
+            if amount
+        ]
@@ -50,3 +50,9 @@ class Money:
         if self.currency != other.currency:
             raise ValueError("Cannot add money with different currencies")
         return Money(amount=self.amount + other.amount, currency=self.currency)
+
+    def __sub__(self, other: "Money") -> "Money":
+        """Subtract Money; raises ValueError if the result would be negative"""
+        if self.currency != other.currency:
+            raise ValueError("Cannot subtract money with different currencies")
+        return Money(amount=self.amount - other.amount, currency=self.currency)
@@ -0,0 +1,101 @@
+"""
+Trip Change Tracking
+
+Snapshot of a Trip as it was persisted, and the difference between that
+snapshot and the trip's current state: dirty fields plus added, removed
+and modified children. Repositories use it to write only what changed.
+"""
+import copy
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from ..entities.trip import Trip
+
+# Trip fields a repository has to write when they change (id and owner_id
+# never change; updated_at is bumped by every save)
+TRACKED_FIELDS = ("name", "destination", "start_date", "end_date", "status", "budget")
+
+CHILD_COLLECTIONS = ("travelers", "flights", "accommodations", "activities")
+
+
+def _copy(value: Any) -> Any:
+    """
+    Copy of a child entity or budget, detached from later in-place edits.
+
+    Entities only hold immutable values (Money, Airport, dates, str) apart
+    from lists, so a shallow copy with copied lists is enough.
+    """
+    if value is None:
+        return None
+    duplicate = copy.copy(value)
+    for f in fields(duplicate):
+        item = getattr(duplicate, f.name)
+        if isinstance(item, list):
+            object.__setattr__(duplicate, f.name, list(item))
+    return duplicate
+
+
+@dataclass(frozen=True)
+class ChildChanges:
+    """Changes to one child collection, children compared by id"""
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    modified: List[Tuple[Any, Any]] = field(default_factory=list)  # (before, after)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+@dataclass(frozen=True)
+class TripChanges:
+    """
+    Everything that changed on a Trip since it was last persisted
+
+    ``fields`` maps each dirty tracked field to its (before, after) values.
+    ``children`` maps each collection name to its ChildChanges.
+    """
+    fields: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+    children: Dict[str, ChildChanges] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.fields) or any(self.children.values())
+
+
+@dataclass(frozen=True)
+class TripSnapshot:
+    """The persisted state of a Trip, as of its last load or save"""
+    values: Dict[str, Any]
+    children: Dict[str, Dict[str, Any]]
+
+    @classmethod
+    def of(cls, trip: "Trip") -> "TripSnapshot":
+        return cls(
+            values={name: _copy(getattr(trip, name)) if name == "budget" else getattr(trip, name)
+                    for name in TRACKED_FIELDS},
+            children={
+                collection: {child.id: _copy(child) for child in getattr(trip, collection)}
+                for collection in CHILD_COLLECTIONS
+            },
+        )
+
+    def diff(self, trip: "Trip") -> TripChanges:
+        dirty = {
+            name: (before, getattr(trip, name))
+            for name, before in self.values.items()
+            if getattr(trip, name) != before
+        }
+        children = {}
+        for collection in CHILD_COLLECTIONS:
+            before = self.children[collection]
+            current = getattr(trip, collection)
+            current_ids = {child.id for child in current}
+            children[collection] = ChildChanges(
+                added=[child for child in current if child.id not in before],
+                removed=[child for child_id, child in before.items() if child_id not in current_ids],
+                modified=[
+                    (before[child.id], child) for child in current
+                    if child.id in before and before[child.id] != child
+                ],
+            )
+        return TripChanges(fields=dirty, children=children)
@@ -0,0 +1,120 @@
+"""
+Trip Query Value Objects
+
+Filters and keyset pagination for trip lists.
+"""
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, List, Optional
+
+from .trip_status import TripStatus
+from ....shared.domain.exceptions import ValidationError
+
+
+@dataclass(frozen=True)
+class TripCursor:
+    """
+    Position in a trip list ordered by (start_date, id)
+
+    The next page holds the trips strictly after this key, so pages stay
+    stable while trips are added or removed, and reaching page N costs the
+    same as reaching page 1 (no OFFSET scan).
+    """
+    start_date: date
+    id: int
+
+    def encode(self) -> str:
+        """Opaque, URL-safe token for API clients"""
+        raw = f"{self.start_date.isoformat()}:{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TripCursor":
+        """
+        Parse a token produced by encode().
+
+        Raises:
+            ValidationError: if the token is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            start_date, trip_id = raw.split(":")
+            return cls(start_date=date.fromisoformat(start_date), id=int(trip_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError(f"Invalid cursor: {token}")
+
+
+@dataclass(frozen=True)
+class TripQuery:
+    """
+    Filters and page bounds for listing an owner's trips
+
+    ``date_from``/``date_to`` select trips overlapping that range.
+    ``destination`` matches case-insensitively anywhere in the destination.
+    A ``limit`` of None returns every match in one page.
+    """
+    status: Optional[TripStatus] = None
+    destination: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    limit: Optional[int] = None
+    after: Optional[TripCursor] = None
+    include_total: bool = False
+
+    def __post_init__(self):
+        """Validate query bounds"""
+        if self.limit is not None and self.limit < 1:
+            raise ValidationError("Page limit must be positive")
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValidationError("date_from must not be after date_to")
+
+    def matches(self, trip: Any) -> bool:
+        """Whether a trip (or trip summary) passes the filters"""
+        if self.status is not None and trip.status != self.status:
+            return False
+        if self.destination and self.destination.lower() not in trip.destination.lower():
+            return False
+        if self.date_from is not None and trip.end_date < self.date_from:
+            return False
+        if self.date_to is not None and trip.start_date > self.date_to:
+            return False
+        return True
+
+    def is_after_cursor(self, trip: Any) -> bool:
+        """Whether a trip sorts after the query's cursor"""
+        if self.after is None:
+            return True
+        return (trip.start_date, trip.id) > (self.after.start_date, self.after.id)
+
+
+@dataclass(frozen=True)
+class TripPage:
+    """
+    One page of a trip list
+
+    ``items`` are Trips or TripSummaries. ``next_cursor`` is None on the
+    last page; ``total`` counts every match across pages and is only set
+    when it was requested or comes for free.
+    """
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[TripCursor] = None
+    total: Optional[int] = None
+
+    @classmethod
+    def of(cls, rows: List[Any], query: TripQuery, total: Optional[int] = None) -> "TripPage":
+        """
+        Build a page from rows fetched in (start_date, id) order.
+
+        Repositories fetch ``limit + 1`` rows: the extra row only tells us
+        that another page exists and is not returned.
+        """
+        if query.limit is not None and len(rows) > query.limit:
+            items = rows[:query.limit]
+            last = items[-1]
+            return cls(items=items, next_cursor=TripCursor(last.start_date, last.id), total=total)
+        if total is None and query.after is None:
+            # the first and only page: everything matched is here
+            total = len(rows)
+        return cls(items=rows, total=total)
@@ -0,0 +1,64 @@
+"""
+Trip Summary Value Object
+
+Read model for trip lists: the trip's own columns plus child counts and
+budget totals, without the child collections themselves.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Optional
+
+from .money import Money
+from .trip_status import TripStatus
+
+if TYPE_CHECKING:
+    from ..entities.trip import Trip
+
+
+@dataclass(frozen=True)
+class TripSummary:
+    """
+    Immutable projection of a Trip for list views
+
+    ``budget_spent`` follows the same rule as ``Budget.recalculate_spent``
+    (confirmed flights + confirmed accommodations + booked activities).
+    Both budget fields are None when the trip has no budget.
+    """
+    id: int
+    owner_id: str
+    name: str
+    destination: str
+    start_date: date
+    end_date: date
+    status: TripStatus
+    traveler_count: int = 0
+    flight_count: int = 0
+    accommodation_count: int = 0
+    activity_count: int = 0
+    budget_total: Optional[Money] = None
+    budget_spent: Optional[Money] = None
+
+    @classmethod
+    def of(cls, trip: "Trip") -> "TripSummary":
+        """Summarize a fully loaded Trip aggregate"""
+        budget_total = budget_spent = None
+        if trip.budget is not None:
+            budget_total = trip.budget.total
+            budget_spent = trip.budget.recalculate_spent(
+                trip.flights, trip.accommodations, trip.activities
+            ).spent
+        return cls(
+            id=trip.id,
+            owner_id=trip.owner_id,
+            name=trip.name,
+            destination=trip.destination,
+            start_date=trip.start_date,
+            end_date=trip.end_date,
+            status=TripStatus(trip.status),
+            traveler_count=len(trip.travelers),
+            flight_count=len(trip.flights),
+            accommodation_count=len(trip.accommodations),
+            activity_count=len(trip.activities),
+            budget_total=budget_total,
+            budget_spent=budget_spent,
+        )
@@ -0,0 +1,84 @@
+"""
+Cached Trip Repository
+
+ITripRepository decorators around the trip cache: CachedTripRepository
+serves find_by_owner from it, and both invalidate it on every write.
+Everything else goes to the wrapped repository.
+"""
+from typing import List, Optional
+
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.repositories.trip_repository import ITripRepository
+from src.trips.domain.value_objects.category_spend import CategorySpend
+from src.trips.domain.value_objects.trip_query import TripPage, TripQuery
+from src.trips.infrastructure.cache.trip_cache import TripCache
+
+
+class InvalidatingTripRepository(ITripRepository):
+    """
+    Wrapper around another ITripRepository that invalidates the trip cache
+    on every write but never reads from it
+
+    For read-modify-write use cases: a trip loaded from a cached copy up to
+    the local TTL old would fail its save's version check.
+
+    Writes are invalidated as they are made, before the transaction commits:
+    readers then skip the cache until the new version is committed and
+    reloaded. A rolled-back write only costs cache misses until the version
+    key expires.
+    """
+
+    def __init__(self, repository: ITripRepository, cache: TripCache):
+        self._repository = repository
+        self._cache = cache
+
+    async def save(self, trip: Trip) -> Trip:
+        saved = await self._repository.save(trip)
+        await self._cache.invalidate(saved.id, saved.version)
+        return saved
+
+    async def find_by_id(self, trip_id: int) -> Optional[Trip]:
+        return await self._repository.find_by_id(trip_id)
+
+    async def find_by_owner(self, trip_id: int, owner_id: str) -> Optional[Trip]:
+        return await self._repository.find_by_owner(trip_id, owner_id)
+
+    async def find_all_by_owner(self, owner_id: str) -> List[Trip]:
+        return await self._repository.find_all_by_owner(owner_id)
+
+    async def find_page_by_owner(self, owner_id: str, query: TripQuery) -> TripPage:
+        return await self._repository.find_page_by_owner(owner_id, query)
+
+    async def find_summaries_by_owner(
+        self, owner_id: str, query: Optional[TripQuery] = None
+    ) -> TripPage:
+        return await self._repository.find_summaries_by_owner(owner_id, query)
+
+    async def find_category_spend(
+        self, trip_id: int, owner_id: str
+    ) -> Optional[List[CategorySpend]]:
+        return await self._repository.find_category_spend(trip_id, owner_id)
+
+    async def delete(self, trip_id: int) -> bool:
+        deleted = await self._repository.delete(trip_id)
+        if deleted:
+            await self._cache.invalidate(trip_id)
+        return deleted
+
+    async def exists(self, trip_id: int) -> bool:
+        return await self._repository.exists(trip_id)
+
+    async def update_status(self, trip_id: int, owner_id: str, status: str) -> Optional[Trip]:
+        trip = await self._repository.update_status(trip_id, owner_id, status)
+        if trip is not None:
+            await self._cache.invalidate(trip.id, trip.version)
+        return trip
+
+
+class CachedTripRepository(InvalidatingTripRepository):
+    """Cache-aside wrapper around another ITripRepository, for reads"""
+
+    async def find_by_owner(self, trip_id: int, owner_id: str) -> Optional[Trip]:
+        return await self._cache.get(
+            trip_id, owner_id, lambda: self._repository.find_by_owner(trip_id, owner_id)
+        )
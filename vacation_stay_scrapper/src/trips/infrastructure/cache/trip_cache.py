@@ -0,0 +1,206 @@
+"""
+Trip Cache
+
+Process-wide read-through cache of trip aggregates: a short-lived local
+cache (L1) in front of a shared CacheStore such as Redis (L2).
+
+Shared keys, for trip 42 of owner "u1":
+
+* ``trip:42:version``: the trip's current version, bumped by every write
+  (0 once the trip is deleted);
+* ``trip:u1:42``: the encoded trip, tagged with the version it was read at;
+* ``trip:u1:42:lock``: held by the process reloading a missing entry.
+
+An entry is only served when its version matches the version key. Writers
+invalidate by setting the version key, so an entry written by a reader that
+raced a write is never served, and a deleted trip cannot be cached again.
+"""
+import asyncio
+from typing import Awaitable, Callable, Optional, Tuple
+
+from src.shared.infrastructure.cache.cache_store import CacheStore
+from src.shared.infrastructure.cache.local_cache import LocalCache, SingleFlight
+from src.shared.infrastructure.logging.logger import setup_logger
+from src.trips.domain.entities.trip import Trip
+from src.trips.infrastructure.cache.trip_cache_codec import TripCacheCodec
+
+logger = setup_logger(logger_name=__name__)
+
+DELETED = 0  # version key of a deleted trip
+
+
+def _version_key(trip_id: int) -> str:
+    return f"trip:{trip_id}:version"
+
+
+def _entry_key(trip_id: int, owner_id: str) -> str:
+    return f"trip:{owner_id}:{trip_id}"
+
+
+class TripCache:
+    """
+    Read-through cache of Trips by (owner, trip id), validated by version
+
+    Shared by every request of the process: it holds the L1 and the loads
+    in flight. Cache failures never fail a read; they are logged and the
+    trip is loaded from the database instead.
+    """
+
+    def __init__(
+        self,
+        store: CacheStore,
+        ttl: float = 300,
+        local_ttl: float = 1,
+        local_max_entries: int = 1024,
+        lock_ttl: float = 5,
+        lock_wait: float = 1,
+        lock_poll_interval: float = 0.05,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            store: Shared cache (L2)
+            ttl: Seconds an L2 entry, and a version key, live
+            local_ttl: Seconds an L1 entry lives; the staleness bound after
+                another process writes the trip
+            local_max_entries: L1 capacity, least recently used evicted first
+            lock_ttl: Seconds a reload lock is held at most
+            lock_wait: Seconds to wait for another process's reload before
+                loading from the database anyway
+            lock_poll_interval: Seconds between checks while waiting
+        """
+        self._store = store
+        self._ttl = ttl
+        self._local = LocalCache(ttl=local_ttl, max_entries=local_max_entries)
+        self._flights: SingleFlight[Optional[str]] = SingleFlight()
+        self._lock_ttl = lock_ttl
+        self._lock_wait = lock_wait
+        self._lock_poll_interval = lock_poll_interval
+
+    async def get(
+        self, trip_id: int, owner_id: str, load: Callable[[], Awaitable[Optional[Trip]]]
+    ) -> Optional[Trip]:
+        """
+        The owner's trip, from the cache or, on a miss, from ``load``
+
+        Every call returns a fresh Trip, safe to modify.
+
+        Args:
+            trip_id: Trip identifier
+            owner_id: Owner user ID
+            load: Reads the trip from the database (None if not found)
+
+        Returns:
+            Trip if found, None otherwise
+        """
+        local = self._local.get(trip_id)
+        if local is not None and local[0] == owner_id:
+            return TripCacheCodec.decode(local[1])
+
+        # Concurrent misses in this process share one L2 lookup and load.
+        loaded: Optional[Trip] = None
+
+        async def lookup() -> Optional[str]:
+            nonlocal loaded
+            encoded = await self._shared_get(trip_id, owner_id)
+            if encoded is None:
+                loaded = await self._load(trip_id, owner_id, load)
+                encoded = None if loaded is None else TripCacheCodec.encode(loaded)
+            return encoded
+
+        encoded = await self._flights.do((trip_id, owner_id), lookup)
+        if loaded is not None:
+            return loaded  # this call did the load: the Trip is its own
+        return None if encoded is None else TripCacheCodec.decode(encoded)
+
+    async def invalidate(self, trip_id: int, version: int = DELETED) -> None:
+        """
+        Mark every cached copy of a trip older than ``version`` as stale
+
+        Args:
+            trip_id: Trip identifier
+            version: The trip's version after the write; DELETED if it was deleted
+        """
+        self._local.pop(trip_id)
+        try:
+            await self._store.set(_version_key(trip_id), str(version), self._ttl)
+        except Exception as e:  # noqa: BLE001 - the write itself succeeded
+            logger.error(f"Trip cache invalidation failed for trip {trip_id}: {e!r}")
+
+    async def _shared_get(self, trip_id: int, owner_id: str) -> Optional[str]:
+        """The L2 entry, if it is current; caches it in L1"""
+        try:
+            version, entry = await self._store.get_many(
+                [_version_key(trip_id), _entry_key(trip_id, owner_id)]
+            )
+        except Exception as e:  # noqa: BLE001 - fall back to the database
+            logger.warning(f"Trip cache read failed for trip {trip_id}: {e!r}")
+            return None
+        if version is None or entry is None:
+            return None
+        entry_version, encoded = self._unpack(entry)
+        if entry_version != int(version) or entry_version == DELETED:
+            return None
+        self._local.put(trip_id, (owner_id, encoded))
+        return encoded
+
+    async def _load(
+        self, trip_id: int, owner_id: str, load: Callable[[], Awaitable[Optional[Trip]]]
+    ) -> Optional[Trip]:
+        """
+        Load from the database, letting one process at a time refill a
+        missing entry while the others wait for it (bounded by lock_wait)
+        """
+        lock = f"{_entry_key(trip_id, owner_id)}:lock"
+        try:
+            locked = await self._store.add(lock, "1", self._lock_ttl)
+        except Exception:  # noqa: BLE001 - the read already logged the outage
+            return await load()
+
+        if not locked:
+            waited = 0.0
+            while waited < self._lock_wait:
+                await asyncio.sleep(self._lock_poll_interval)
+                waited += self._lock_poll_interval
+                encoded = await self._shared_get(trip_id, owner_id)
+                if encoded is not None:
+                    return TripCacheCodec.decode(encoded)
+            return await load()
+
+        try:
+            trip = await load()
+            if trip is not None:
+                await self._put(trip)
+            return trip
+        finally:
+            try:
+                await self._store.delete(lock)
+            except Exception:  # noqa: BLE001 - the lock expires on its own
+                pass
+
+    async def _put(self, trip: Trip) -> None:
+        """Store a freshly loaded trip, unless a write has already superseded it"""
+        encoded = TripCacheCodec.encode(trip)
+        try:
+            version_key = _version_key(trip.id)
+            if not await self._store.add(version_key, str(trip.version), self._ttl):
+                (current,) = await self._store.get_many([version_key])
+                if current is None or int(current) != trip.version:
+                    return
+            await self._store.set(
+                _entry_key(trip.id, trip.owner_id), self._pack(trip.version, encoded), self._ttl
+            )
+        except Exception as e:  # noqa: BLE001 - the trip was loaded regardless
+            logger.warning(f"Trip cache write failed for trip {trip.id}: {e!r}")
+            return
+        self._local.put(trip.id, (trip.owner_id, encoded))
+
+    @staticmethod
+    def _pack(version: int, encoded: str) -> str:
+        return f"{version}\n{encoded}"
+
+    @staticmethod
+    def _unpack(entry: str) -> Tuple[int, str]:
+        version, encoded = entry.split("\n", 1)
+        return int(version), encoded
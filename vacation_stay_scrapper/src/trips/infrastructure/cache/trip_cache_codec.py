@@ -0,0 +1,100 @@
+"""
+Trip Cache Codec
+
+Lossless JSON form of a Trip aggregate for the trip cache. It reuses the
+ORM mapper's column values, so a decoded trip goes through
+TripOrmMapper.to_domain exactly like one loaded from the database (change
+tracking baseline). The encoded spent is always set, so decoding never
+recomputes it from the children.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+from sqlalchemy import inspect
+
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.value_objects.trip_changes import TRACKED_FIELDS
+from src.trips.infrastructure.persistence.mappers.trip_orm_mapper import CHILD_TABLES, TripOrmMapper
+from src.trips.infrastructure.persistence.models.budget_category import BudgetCategory as BudgetCategoryOrm
+from src.trips.infrastructure.persistence.models.trip import Trip as TripOrm
+
+# Collection name -> ORM model, for every child list in the payload
+_CHILD_MODELS = {
+    "budget_categories": BudgetCategoryOrm,
+    **{collection: model for collection, (model, _) in CHILD_TABLES.items()},
+}
+
+_PARSERS: Dict[type, Callable[[Any], Any]] = {
+    date: date.fromisoformat,
+    datetime: datetime.fromisoformat,
+    Decimal: Decimal,
+}
+
+
+def _column_parsers(model) -> Dict[str, Callable[[Any], Any]]:
+    """Attribute name -> parser, for the columns JSON cannot carry natively"""
+    parsers = {}
+    for attribute in inspect(model).column_attrs:
+        try:
+            python_type = attribute.columns[0].type.python_type
+        except NotImplementedError:
+            continue
+        if python_type in _PARSERS:
+            parsers[attribute.key] = _PARSERS[python_type]
+    return parsers
+
+
+_TRIP_PARSERS = _column_parsers(TripOrm)
+_CHILD_PARSERS = {collection: _column_parsers(model) for collection, model in _CHILD_MODELS.items()}
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _parsed(columns: Dict[str, Any], parsers: Dict[str, Callable[[Any], Any]]) -> Dict[str, Any]:
+    return {
+        name: parsers[name](value) if value is not None and name in parsers else value
+        for name, value in columns.items()
+    }
+
+
+class TripCacheCodec:
+    """Encodes Trips to JSON strings and back"""
+
+    @staticmethod
+    def encode(trip: Trip) -> str:
+        payload = {
+            "trip": dict(
+                id_=trip.id,
+                owner_id=trip.owner_id,
+                created_at=trip.created_at,
+                updated_at=trip.updated_at,
+                version=trip.version,
+                **TripOrmMapper.trip_columns(trip, TRACKED_FIELDS),
+            ),
+            "budget_categories": [
+                TripOrmMapper.budget_category_columns(bc)
+                for bc in (trip.budget.categories if trip.budget else [])
+            ],
+        }
+        for collection, (_, columns) in CHILD_TABLES.items():
+            payload[collection] = [columns(child) for child in getattr(trip, collection)]
+        return json.dumps(payload, default=_default, separators=(",", ":"))
+
+    @staticmethod
+    def decode(encoded: str) -> Trip:
+        payload = json.loads(encoded)
+        model = TripOrm(**_parsed(payload["trip"], _TRIP_PARSERS))
+        for collection, child_model in _CHILD_MODELS.items():
+            parsers = _CHILD_PARSERS[collection]
+            setattr(model, collection, [
+                child_model(**_parsed(columns, parsers)) for columns in payload[collection]
+            ])
+        return TripOrmMapper.to_domain(model)
@@ -8,6 +8,11 @@ from datetime import date
 
 from ...domain.entities.trip import Trip
 from ...domain.repositories.trip_repository import ITripRepository
+from ...domain.value_objects.category_spend import CategorySpend
+from ...domain.value_objects.trip_query import TripPage, TripQuery
+from ...domain.value_objects.trip_status import TripStatus
+from ...domain.value_objects.trip_summary import TripSummary
+from ....shared.domain.exceptions import ConcurrentModification, EntityNotFound
 
 
 class InMemoryTripRepository(ITripRepository):
@@ -31,11 +36,23 @@ class InMemoryTripRepository(ITripRepository):
             
         Returns:
             Saved trip
+
+        Raises:
+            EntityNotFound: If an existing trip was deleted or has another owner
+            ConcurrentModification: If the stored trip's version moved on
+                since this one was loaded
         """
-        # Assign ID if not yet persisted
+        # Assign ID if not yet persisted, otherwise bump the version
         if trip.id is None:
             trip.id = self._next_id
             self._next_id += 1
+        else:
+            stored = self._storage.get(trip.id)
+            if stored is None or stored.owner_id != trip.owner_id:
+                raise EntityNotFound(entity_type="Trip", entity_id=str(trip.id))
+            if stored.version != trip.version:
+                raise ConcurrentModification(entity_type="Trip", entity_id=str(trip.id))
+            trip.version += 1
 
         # Update timestamps
         if trip.created_at is None:
@@ -85,6 +102,50 @@ class InMemoryTripRepository(ITripRepository):
             List of trips owned by the user
         """
         return [trip for trip in self._storage.values() if trip.owner_id == owner_id]
+
+    async def find_page_by_owner(self, owner_id: str, query: TripQuery) -> TripPage:
+        """
+        Get one page of an owner's trips, filtered and ordered by
+        (start_date, id).
+
+        Args:
+            owner_id: Owner user ID
+            query: Filters, page size and cursor
+
+        Returns:
+            Page of trips
+        """
+        matches = sorted(
+            (
+                trip for trip in self._storage.values()
+                if trip.owner_id == owner_id and query.matches(trip)
+            ),
+            key=lambda trip: (trip.start_date, trip.id),
+        )
+        rows = [trip for trip in matches if query.is_after_cursor(trip)]
+        if query.limit is not None:
+            rows = rows[:query.limit + 1]
+        return TripPage.of(rows, query, total=len(matches) if query.include_total else None)
+
+    async def find_summaries_by_owner(
+        self, owner_id: str, query: Optional[TripQuery] = None
+    ) -> TripPage:
+        """
+        Get one page of summaries of an owner's trips.
+
+        Args:
+            owner_id: Owner user ID
+            query: Filters, page size and cursor (all trips when omitted)
+
+        Returns:
+            Page of trip summaries
+        """
+        page = await self.find_page_by_owner(owner_id, query or TripQuery())
+        return TripPage(
+            items=[TripSummary.of(trip) for trip in page.items],
+            next_cursor=page.next_cursor,
+            total=page.total,
+        )
     
     async def delete(self, trip_id: int) -> bool:
         """
@@ -101,6 +162,22 @@ class InMemoryTripRepository(ITripRepository):
             return True
         return False
 
+    async def find_category_spend(
+        self, trip_id: int, owner_id: str
+    ) -> Optional[List[CategorySpend]]:
+        """
+        Committed spend of an owner's trip, per category
+
+        Args:
+            trip_id: Trip integer identifier
+            owner_id: Owner user ID
+
+        Returns:
+            Category totals, or None if not found or owned by another user
+        """
+        trip = await self.find_by_owner(trip_id, owner_id)
+        return CategorySpend.of(trip) if trip is not None else None
+
     async def exists(self, trip_id: int) -> bool:
         """
         Check if trip exists
@@ -113,23 +190,25 @@ class InMemoryTripRepository(ITripRepository):
         """
         return trip_id in self._storage
 
-    async def update_status(self, trip_id: int, status: str) -> bool:
+    async def update_status(self, trip_id: int, owner_id: str, status: str) -> Optional[Trip]:
         """
-        Update the status of a trip
+        Update the status of a trip owned by the given user
 
         Args:
             trip_id: Trip integer identifier
+            owner_id: Owner user ID
             status: New status value
 
         Returns:
-            True if updated, False if not found
+            Updated trip, or None if not found or owned by another user
         """
-        trip = self._storage.get(trip_id)
+        trip = await self.find_by_owner(trip_id, owner_id)
         if trip is None:
-            return False
-        trip.status = status
+            return None
+        trip.status = TripStatus(status)
         trip.updated_at = date.today()
-        return True
+        trip.version += 1
+        return trip
     
     def count(self) -> int:
         """Get total number of trips"""
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from typing import Iterable
 
 from src.trips.domain.entities.accommodation import Accommodation
 from src.trips.domain.entities.activity import Activity
@@ -8,6 +9,7 @@ from src.trips.domain.entities.trip import Trip
 from src.trips.domain.value_objects.airport import Airport
 from src.trips.domain.value_objects.budget import Budget, BudgetCategory
 from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_changes import TRACKED_FIELDS
 from src.trips.domain.value_objects.trip_status import TripStatus
 from src.trips.infrastructure.persistence.models.accommodation import Accommodation as AccommodationOrm
 from src.trips.infrastructure.persistence.models.activity import Activity as ActivityOrm
@@ -102,7 +104,7 @@ class TripOrmMapper:
                 categories=categories,
             )
 
-        return Trip(
+        trip = Trip(
             id=model.id_,
             owner_id=model.owner_id,
             name=model.name,
@@ -117,103 +119,143 @@ class TripOrmMapper:
             budget=budget,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            version=model.version,
         )
+        trip.mark_clean()
+        if budget is not None and model.budget_spent_amount is None:
+            # Spent never stored (rows from before it was maintained): computed
+            # once, after mark_clean so that the next save writes it. Stored
+            # totals are trusted; PostgresTripRepository.reconcile_budgets
+            # checks them.
+            trip.reconcile_budget()
+        return trip
 
     @staticmethod
     def to_model(trip: Trip) -> TripOrm:
         model = TripOrm(
             owner_id=trip.owner_id,
-            name=trip.name,
-            destination=trip.destination,
-            start_date=trip.start_date,
-            end_date=trip.end_date,
-            status=trip.status.value,
             created_at=trip.created_at,
             updated_at=trip.updated_at,
+            version=trip.version,
+            **TripOrmMapper.trip_columns(trip, TRACKED_FIELDS),
         )
 
         if trip.id is not None:
             model.id_ = trip.id
 
         if trip.budget is not None:
-            model.budget_total_amount = trip.budget.total.amount
-            model.budget_total_currency = trip.budget.total.currency
-            model.budget_spent_amount = trip.budget.spent.amount
-            model.budget_spent_currency = trip.budget.spent.currency
             model.budget_categories = [
-                BudgetCategoryOrm(
-                    category=bc.category,
-                    planned_amount=bc.planned.amount,
-                    planned_currency=bc.planned.currency,
-                    spent_amount=bc.spent.amount,
-                    spent_currency=bc.spent.currency,
-                )
+                BudgetCategoryOrm(**TripOrmMapper.budget_category_columns(bc))
                 for bc in trip.budget.categories
             ]
 
-        model.travelers = [
-            TravelerOrm(
-                id_=t.id,
-                name=t.name,
-                email=t.email,
-                role=t.role,
-                avatar=t.avatar,
-            )
-            for t in trip.travelers
+        model.travelers = [TravelerOrm(**TripOrmMapper.traveler_columns(t)) for t in trip.travelers]
+        model.flights = [FlightOrm(**TripOrmMapper.flight_columns(f)) for f in trip.flights]
+        model.accommodations = [
+            AccommodationOrm(**TripOrmMapper.accommodation_columns(a)) for a in trip.accommodations
         ]
+        model.activities = [ActivityOrm(**TripOrmMapper.activity_columns(act)) for act in trip.activities]
 
-        model.flights = [
-            FlightOrm(
-                id_=f.id,
-                airline=f.airline,
-                flight_number=f.flight_number,
-                departure_airport_code=f.departure_airport.code,
-                departure_airport_city=f.departure_airport.city,
-                departure_time=f.departure_time,
-                arrival_airport_code=f.arrival_airport.code,
-                arrival_airport_city=f.arrival_airport.city,
-                arrival_time=f.arrival_time,
-                duration=f.duration,
-                price_amount=f.price.amount,
-                price_currency=f.price.currency,
-                stops=f.stops,
-                cabin_class=f.cabin_class,
-                status=f.status,
-            )
-            for f in trip.flights
-        ]
+        return model
 
-        model.accommodations = [
-            AccommodationOrm(
-                id_=a.id,
-                name=a.name,
-                type=a.type,
-                check_in=a.check_in,
-                check_out=a.check_out,
-                price_per_night_amount=a.price_per_night.amount,
-                price_per_night_currency=a.price_per_night.currency,
-                total_price_amount=a.total_price.amount,
-                total_price_currency=a.total_price.currency,
-                rating=a.rating,
-                amenities=a.amenities,
-                status=a.status,
-                image=a.image,
-            )
-            for a in trip.accommodations
-        ]
+    # Column values, keyed by ORM attribute name. Shared by to_model and the
+    # repository's targeted UPDATE/INSERT statements.
 
-        model.activities = [
-            ActivityOrm(
-                id_=act.id,
-                name=act.name,
-                date=act.date,
-                cost_amount=act.cost.amount,
-                cost_currency=act.cost.currency,
-                category=act.category,
-                status=act.status,
-                description=act.description,
-            )
-            for act in trip.activities
-        ]
+    @staticmethod
+    def trip_columns(trip: Trip, field_names: Iterable[str]) -> dict:
+        """Columns of the trips row backing the given Trip fields"""
+        columns = {}
+        for name in field_names:
+            if name == "status":
+                columns["status"] = trip.status.value
+            elif name == "budget":
+                budget = trip.budget
+                columns.update(
+                    budget_total_amount=budget.total.amount if budget else None,
+                    budget_total_currency=budget.total.currency if budget else None,
+                    budget_spent_amount=budget.spent.amount if budget else None,
+                    budget_spent_currency=budget.spent.currency if budget else None,
+                )
+            else:
+                columns[name] = getattr(trip, name)
+        return columns
 
-        return model
+    @staticmethod
+    def traveler_columns(t: Traveler) -> dict:
+        return dict(
+            id_=t.id,
+            name=t.name,
+            email=t.email,
+            role=t.role,
+            avatar=t.avatar,
+        )
+
+    @staticmethod
+    def flight_columns(f: Flight) -> dict:
+        return dict(
+            id_=f.id,
+            airline=f.airline,
+            flight_number=f.flight_number,
+            departure_airport_code=f.departure_airport.code,
+            departure_airport_city=f.departure_airport.city,
+            departure_time=f.departure_time,
+            arrival_airport_code=f.arrival_airport.code,
+            arrival_airport_city=f.arrival_airport.city,
+            arrival_time=f.arrival_time,
+            duration=f.duration,
+            price_amount=f.price.amount,
+            price_currency=f.price.currency,
+            stops=f.stops,
+            cabin_class=f.cabin_class,
+            status=f.status,
+        )
+
+    @staticmethod
+    def accommodation_columns(a: Accommodation) -> dict:
+        return dict(
+            id_=a.id,
+            name=a.name,
+            type=a.type,
+            check_in=a.check_in,
+            check_out=a.check_out,
+            price_per_night_amount=a.price_per_night.amount,
+            price_per_night_currency=a.price_per_night.currency,
+            total_price_amount=a.total_price.amount,
+            total_price_currency=a.total_price.currency,
+            rating=a.rating,
+            amenities=a.amenities,
+            status=a.status,
+            image=a.image,
+        )
+
+    @staticmethod
+    def activity_columns(act: Activity) -> dict:
+        return dict(
+            id_=act.id,
+            name=act.name,
+            date=act.date,
+            cost_amount=act.cost.amount,
+            cost_currency=act.cost.currency,
+            category=act.category,
+            status=act.status,
+            description=act.description,
+        )
+
+    @staticmethod
+    def budget_category_columns(bc: BudgetCategory) -> dict:
+        return dict(
+            category=bc.category,
+            planned_amount=bc.planned.amount,
+            planned_currency=bc.planned.currency,
+            spent_amount=bc.spent.amount,
+            spent_currency=bc.spent.currency,
+        )
+
+
+# Child collection name -> (ORM model, column mapper)
+CHILD_TABLES = {
+    "travelers": (TravelerOrm, TripOrmMapper.traveler_columns),
+    "flights": (FlightOrm, TripOrmMapper.flight_columns),
+    "accommodations": (AccommodationOrm, TripOrmMapper.accommodation_columns),
+    "activities": (ActivityOrm, TripOrmMapper.activity_columns),
+}
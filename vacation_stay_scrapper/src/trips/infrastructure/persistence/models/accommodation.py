@@ -2,7 +2,7 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import BigInteger, Date, Float, ForeignKey, Numeric, String
+from sqlalchemy import BigInteger, Date, Float, ForeignKey, Index, Numeric, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -14,6 +14,10 @@ if TYPE_CHECKING:
 
 class Accommodation(Base):
     __tablename__ = "accommodations"
+    __table_args__ = (
+        # trip_id lookups and index-only committed-spend sums (migration 0003)
+        Index("ix_accommodations_trip_id_status", "trip_id", "status", postgresql_include=["total_price_amount"]),
+    )
 
     id_: Mapped[str] = mapped_column("id", String, primary_key=True)
     trip_id: Mapped[int] = mapped_column(
@@ -2,7 +2,7 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import BigInteger, Date, ForeignKey, Numeric, String
+from sqlalchemy import BigInteger, Date, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.infrastructure.database.base import Base
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
 
 class Activity(Base):
     __tablename__ = "activities"
+    __table_args__ = (
+        # trip_id lookups and index-only committed-spend sums (migration 0003)
+        Index("ix_activities_trip_id_status", "trip_id", "status", postgresql_include=["cost_amount"]),
+    )
 
     id_: Mapped[str] = mapped_column("id", String, primary_key=True)
     trip_id: Mapped[int] = mapped_column(
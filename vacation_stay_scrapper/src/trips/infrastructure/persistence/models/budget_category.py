@@ -1,7 +1,7 @@
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, ForeignKey, Numeric, String
+from sqlalchemy import BigInteger, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.infrastructure.database.base import Base
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
 class BudgetCategory(Base):
     __tablename__ = "budget_categories"
+    __table_args__ = (Index("ix_budget_categories_trip_id", "trip_id"),)  # migration 0003
 
     id_: Mapped[int] = mapped_column("id", BigInteger, primary_key=True, autoincrement=True)
     trip_id: Mapped[int] = mapped_column(
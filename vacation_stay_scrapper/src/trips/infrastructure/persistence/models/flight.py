@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.infrastructure.database.base import Base
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
 
 class Flight(Base):
     __tablename__ = "flights"
+    __table_args__ = (
+        # trip_id lookups and index-only committed-spend sums (migration 0003)
+        Index("ix_flights_trip_id_status", "trip_id", "status", postgresql_include=["price_amount"]),
+    )
 
     id_: Mapped[str] = mapped_column("id", String, primary_key=True)
     trip_id: Mapped[int] = mapped_column(
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import BigInteger, ForeignKey, String
+from sqlalchemy import BigInteger, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.infrastructure.database.base import Base
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
 class Traveler(Base):
     __tablename__ = "travelers"
+    __table_args__ = (Index("ix_travelers_trip_id", "trip_id"),)  # migration 0003
 
     id_: Mapped[str] = mapped_column("id", String, primary_key=True)
     trip_id: Mapped[int] = mapped_column(
@@ -2,7 +2,7 @@ from datetime import date
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import BigInteger, Date, Numeric, String
+from sqlalchemy import BigInteger, Date, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.infrastructure.database.base import Base
@@ -10,6 +10,19 @@ from src.shared.infrastructure.database.base import Base
 
 class Trip(Base):
     __tablename__ = "trips"
+    __table_args__ = (
+        # keyset pagination of an owner's trips, optionally by status; the
+        # first covers the summary projection (migrations 0002, 0003)
+        Index(
+            "ix_trips_owner_id_start_date_id_summary",
+            "owner_id", "start_date", "id",
+            postgresql_include=[
+                "name", "destination", "end_date", "status",
+                "budget_total_amount", "budget_total_currency",
+            ],
+        ),
+        Index("ix_trips_owner_id_status_start_date_id", "owner_id", "status", "start_date", "id"),
+    )
 
     id_: Mapped[int] = mapped_column("id", BigInteger, primary_key=True, autoincrement=True)
     owner_id: Mapped[str] = mapped_column(String, nullable=False)
@@ -28,6 +41,7 @@ class Trip(Base):
     # Metadata
     created_at: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     updated_at: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
     travelers: Mapped[List["Traveler"]] = relationship(
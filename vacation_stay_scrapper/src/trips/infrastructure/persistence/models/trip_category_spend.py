@@ -0,0 +1,21 @@
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, ForeignKey, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.shared.infrastructure.database.base import Base
+
+
+class TripCategorySpend(Base):
+    """
+    Committed spend per (trip, category), kept current by database triggers
+    on flights, accommodations and activities (migration 0005). Read-only
+    for the application.
+    """
+    __tablename__ = "trip_category_spend"
+
+    trip_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("trips.id", ondelete="CASCADE"), primary_key=True
+    )
+    category: Mapped[str] = mapped_column(String, primary_key=True)
+    spent_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
@@ -1,13 +1,119 @@
+import dataclasses
 from datetime import date
-from typing import List, Optional
+from decimal import Decimal
+from typing import List, Optional, Tuple
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import Select, and_, delete, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
 
+from src.shared.domain.exceptions import ConcurrentModification, EntityNotFound
 from src.trips.domain.entities.trip import Trip
 from src.trips.domain.repositories.trip_repository import ITripRepository
-from src.trips.infrastructure.persistence.mappers.trip_orm_mapper import TripOrmMapper
+from src.trips.domain.value_objects.budget import Budget
+from src.trips.domain.value_objects.category_spend import CategorySpend
+from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_changes import TripChanges
+from src.trips.domain.value_objects.trip_query import TripPage, TripQuery
+from src.trips.domain.value_objects.trip_status import TripStatus
+from src.trips.domain.value_objects.trip_summary import TripSummary
+from src.trips.infrastructure.persistence.mappers.trip_orm_mapper import CHILD_TABLES, TripOrmMapper
+from src.trips.infrastructure.persistence.models.accommodation import Accommodation as AccommodationOrm
+from src.trips.infrastructure.persistence.models.activity import Activity as ActivityOrm
+from src.trips.infrastructure.persistence.models.budget_category import BudgetCategory as BudgetCategoryOrm
+from src.trips.infrastructure.persistence.models.flight import Flight as FlightOrm
+from src.trips.infrastructure.persistence.models.traveler import Traveler as TravelerOrm
 from src.trips.infrastructure.persistence.models.trip import Trip as TripOrm
+from src.trips.infrastructure.persistence.models.trip_category_spend import (
+    TripCategorySpend as TripCategorySpendOrm,
+)
+
+
+def _spent_delta(before: Optional[Budget], after: Optional[Budget]) -> Optional[Decimal]:
+    """
+    How much ``spent`` moved, if that is the only difference between two
+    budgets (a child status change); None for any other budget edit.
+    """
+    if before is None or after is None or before.spent.currency != after.spent.currency:
+        return None
+    if dataclasses.replace(before, spent=after.spent) != after:
+        return None
+    return after.spent.amount - before.spent.amount
+
+
+def _count(child):
+    return (
+        select(func.count())
+        .where(child.trip_id == TripOrm.id_)
+        .correlate(TripOrm)
+        .scalar_subquery()
+    )
+
+
+def _committed_total():
+    # trigger-maintained per-category totals (migration 0005), not the children
+    return (
+        select(func.coalesce(func.sum(TripCategorySpendOrm.spent_amount), 0))
+        .where(TripCategorySpendOrm.trip_id == TripOrm.id_)
+        .correlate(TripOrm)
+        .scalar_subquery()
+    )
+
+
+def _drifted_budget():
+    # a budget whose stored spent is missing or disagrees with the triggers' totals
+    return and_(
+        TripOrm.budget_total_amount.is_not(None),
+        TripOrm.budget_spent_amount.is_distinct_from(_committed_total()),
+    )
+
+
+# Trip columns plus one correlated subquery per count/total: a single
+# round trip, and no child rows leave the database (see TripSummary).
+SUMMARY_COLUMNS = (
+    TripOrm.id_.label("id"),
+    TripOrm.owner_id,
+    TripOrm.name,
+    TripOrm.destination,
+    TripOrm.start_date,
+    TripOrm.end_date,
+    TripOrm.status,
+    TripOrm.budget_total_amount,
+    TripOrm.budget_total_currency,
+    _count(TravelerOrm).label("traveler_count"),
+    _count(FlightOrm).label("flight_count"),
+    _count(AccommodationOrm).label("accommodation_count"),
+    _count(ActivityOrm).label("activity_count"),
+    _committed_total().label("budget_spent_amount"),
+)
+
+
+def _filtered(statement: Select, owner_id: str, query: TripQuery) -> Select:
+    statement = statement.where(TripOrm.owner_id == owner_id)
+    if query.status is not None:
+        statement = statement.where(TripOrm.status == query.status.value)
+    if query.destination:
+        statement = statement.where(TripOrm.destination.icontains(query.destination, autoescape=True))
+    if query.date_from is not None:
+        statement = statement.where(TripOrm.end_date >= query.date_from)
+    if query.date_to is not None:
+        statement = statement.where(TripOrm.start_date <= query.date_to)
+    return statement
+
+
+def _paged(statement: Select, query: TripQuery) -> Select:
+    # Keyset pagination: the row comparison walks the (owner_id, [status,]
+    # start_date, id) indexes from the cursor instead of counting past an OFFSET.
+    if query.after is not None:
+        statement = statement.where(
+            tuple_(TripOrm.start_date, TripOrm.id_)
+            > tuple_(query.after.start_date, query.after.id)
+        )
+    statement = statement.order_by(TripOrm.start_date, TripOrm.id_)
+    if query.limit is not None:
+        # one extra row tells TripPage whether there is a next page
+        statement = statement.limit(query.limit + 1)
+    return statement
 
 
 class PostgresTripRepository(ITripRepository):
@@ -20,25 +126,164 @@ class PostgresTripRepository(ITripRepository):
             trip.created_at = date.today()
         trip.updated_at = date.today()
 
-        model = TripOrmMapper.to_model(trip)
+        changes = trip.changes()
 
         if trip.id is None:
             # New trip: let the database assign the autoincrement id.
+            model = TripOrmMapper.to_model(trip)
             self._session.add(model)
             await self._session.flush()
             trip.id = model.id_
+        elif changes is not None:
+            # Loaded through a repository: write only what changed since.
+            await self._write_changes(trip, changes)
         else:
-            # Existing trip: merge the full desired state onto the persistent
-            # row and its child collections. merge() reconciles children by
-            # primary key (insert/update) and, with the delete-orphan cascade,
-            # removes children no longer present — all without creating a
-            # duplicate parent (which previously caused a trips_pkey conflict).
-            merged = await self._session.merge(model)
+            # Existing trip whose persisted state is unknown: merge the full
+            # desired state onto the persistent row and its child collections.
+            # merge() reconciles children by primary key (insert/update) and,
+            # with the delete-orphan cascade, removes children no longer
+            # present — all without creating a duplicate parent (which
+            # previously caused a trips_pkey conflict). merge() itself is not
+            # owner-scoped, so the row is checked to be the owner's first.
+            result = await self._session.execute(
+                select(TripOrm.id_).where(TripOrm.id_ == trip.id, TripOrm.owner_id == trip.owner_id)
+            )
+            if result.scalar_one_or_none() is None:
+                raise EntityNotFound(entity_type="Trip", entity_id=str(trip.id))
+            trip.version += 1
+            merged = await self._session.merge(TripOrmMapper.to_model(trip))
             await self._session.flush()
             trip.id = merged.id_
 
+        trip.mark_clean()
         return trip
 
+    async def _write_changes(self, trip: Trip, changes: TripChanges) -> None:
+        """
+        Targeted statements for a tracked trip: one UPDATE of the trips row,
+        then per child collection one DELETE of removed rows, one UPDATE per
+        modified row (changed columns only) and one INSERT of added rows.
+
+        The trips UPDATE is scoped to the trip's owner and conditional on the
+        version the trip was loaded with, so a trip that was deleted, is not
+        the owner's or was changed meanwhile is rejected before any child is
+        touched. A child status change is therefore two statements: this
+        UPDATE (bumping the version and adding the spent delta) and the
+        child's UPDATE, itself conditional on the status it was loaded with.
+
+        Raises:
+            EntityNotFound: if no trip with this id belongs to its owner
+            ConcurrentModification: if the trip or child changed since loaded
+        """
+        if not changes:
+            return
+
+        result = await self._execute(
+            update(TripOrm)
+            .where(
+                TripOrm.id_ == trip.id,
+                TripOrm.owner_id == trip.owner_id,
+                TripOrm.version == trip.version,
+            )
+            .values(
+                updated_at=trip.updated_at,
+                version=TripOrm.version + 1,
+                **self._trip_values(trip, changes),
+            )
+            .returning(TripOrm.version)
+        )
+        version = result.scalar_one_or_none()
+        if version is None:
+            raise await self._rejected(trip)
+
+        for collection, child_changes in changes.children.items():
+            model, columns = CHILD_TABLES[collection]
+            if child_changes.removed:
+                await self._execute(
+                    delete(model).where(
+                        model.id_.in_([c.id for c in child_changes.removed]),
+                        model.trip_id == trip.id,
+                    )
+                )
+            for before, after in child_changes.modified:
+                old = columns(before)
+                statement = (
+                    update(model)
+                    .where(model.id_ == after.id, model.trip_id == trip.id)
+                    .values({k: v for k, v in columns(after).items() if old[k] != v})
+                )
+                if "status" not in old:
+                    await self._execute(statement)
+                    continue
+                result = await self._execute(
+                    statement.where(model.status == before.status).returning(model.id_)
+                )
+                if result.scalar_one_or_none() is None:
+                    raise ConcurrentModification(
+                        entity_type=type(after).__name__, entity_id=after.id
+                    )
+            if child_changes.added:
+                await self._execute(
+                    insert(model),
+                    [dict(columns(c), trip_id=trip.id) for c in child_changes.added],
+                )
+
+        if "budget" in changes.fields:
+            before, after = changes.fields["budget"]
+            categories = after.categories if after else []
+            if (before.categories if before else []) != categories:
+                await self._execute(
+                    delete(BudgetCategoryOrm).where(BudgetCategoryOrm.trip_id == trip.id)
+                )
+                if categories:
+                    await self._execute(insert(BudgetCategoryOrm), [
+                        dict(TripOrmMapper.budget_category_columns(bc), trip_id=trip.id)
+                        for bc in categories
+                    ])
+
+        trip.version = version
+        self._forget(trip.id)
+
+    @staticmethod
+    def _trip_values(trip: Trip, changes: TripChanges) -> dict:
+        """
+        trips columns for the dirty fields. A budget whose spent amount alone
+        changed is written as an increment of the stored amount.
+        """
+        fields = dict(changes.fields)
+        delta = _spent_delta(*fields.get("budget", (None, None)))
+        if delta is None:
+            return TripOrmMapper.trip_columns(trip, fields)
+        del fields["budget"]
+        return dict(
+            TripOrmMapper.trip_columns(trip, fields),
+            budget_spent_amount=func.coalesce(TripOrm.budget_spent_amount, 0) + delta,
+        )
+
+    async def _rejected(self, trip: Trip) -> Exception:
+        """Why the trips UPDATE matched no row: gone/not owned, or stale"""
+        result = await self._session.execute(
+            select(TripOrm.id_).where(TripOrm.id_ == trip.id, TripOrm.owner_id == trip.owner_id)
+        )
+        if result.scalar_one_or_none() is None:
+            return EntityNotFound(entity_type="Trip", entity_id=str(trip.id))
+        return ConcurrentModification(entity_type="Trip", entity_id=str(trip.id))
+
+    async def _execute(self, statement, params=None):
+        # The identity map is not kept in sync (see _forget).
+        return await self._session.execute(
+            statement.execution_options(synchronize_session=False), params
+        )
+
+    def _forget(self, trip_id: int) -> None:
+        """
+        Drop the trip's ORM graph from the session after targeted writes,
+        which bypass it, so a later load in this session reads fresh rows.
+        """
+        model = self._session.identity_map.get(identity_key(TripOrm, trip_id))
+        if model is not None:
+            self._session.expunge(model)
+
     async def find_by_id(self, trip_id: int) -> Optional[Trip]:
         result = await self._session.execute(
             select(TripOrm).where(TripOrm.id_ == trip_id)
@@ -62,6 +307,88 @@ class PostgresTripRepository(ITripRepository):
         )
         return [TripOrmMapper.to_domain(m) for m in result.scalars().all()]
 
+    async def find_page_by_owner(self, owner_id: str, query: TripQuery) -> TripPage:
+        result = await self._session.execute(
+            _paged(_filtered(select(TripOrm), owner_id, query), query)
+        )
+        rows = [TripOrmMapper.to_domain(m) for m in result.scalars().all()]
+        return TripPage.of(rows, query, total=await self._total(owner_id, query))
+
+    async def find_summaries_by_owner(
+        self, owner_id: str, query: Optional[TripQuery] = None
+    ) -> TripPage:
+        query = query or TripQuery()
+        result = await self._session.execute(
+            _paged(_filtered(select(*SUMMARY_COLUMNS), owner_id, query), query)
+        )
+        rows = [self._to_summary(row) for row in result.mappings().all()]
+        return TripPage.of(rows, query, total=await self._total(owner_id, query))
+
+    async def _total(self, owner_id: str, query: TripQuery) -> Optional[int]:
+        if not query.include_total:
+            return None
+        result = await self._session.execute(
+            _filtered(select(func.count()).select_from(TripOrm), owner_id, query)
+        )
+        return result.scalar_one()
+
+    async def find_category_spend(
+        self, trip_id: int, owner_id: str
+    ) -> Optional[List[CategorySpend]]:
+        # The owner's trip row, outer-joined to its summary rows: one small
+        # query, whatever the number of children.
+        result = await self._session.execute(
+            select(
+                TripOrm.budget_total_currency,
+                TripCategorySpendOrm.category,
+                TripCategorySpendOrm.spent_amount,
+            )
+            .select_from(TripOrm)
+            .outerjoin(
+                TripCategorySpendOrm,
+                (TripCategorySpendOrm.trip_id == TripOrm.id_)
+                & (TripCategorySpendOrm.spent_amount != 0),
+            )
+            .where(TripOrm.id_ == trip_id, TripOrm.owner_id == owner_id)
+            .order_by(TripCategorySpendOrm.category)
+        )
+        rows = result.all()
+        if not rows:
+            return None
+        return [
+            CategorySpend(
+                category=category,
+                spent=Money(amount=spent_amount, currency=currency or "USD"),
+            )
+            for currency, category, spent_amount in rows
+            if category is not None
+        ]
+
+    @staticmethod
+    def _to_summary(row) -> TripSummary:
+        budget_total = budget_spent = None
+        if row["budget_total_amount"] is not None:
+            currency = row["budget_total_currency"] or "USD"
+            budget_total = Money(amount=row["budget_total_amount"], currency=currency)
+            budget_spent = Money(
+                amount=Decimal(row["budget_spent_amount"] or 0), currency=currency
+            )
+        return TripSummary(
+            id=row["id"],
+            owner_id=row["owner_id"],
+            name=row["name"],
+            destination=row["destination"],
+            start_date=row["start_date"],
+            end_date=row["end_date"],
+            status=TripStatus(row["status"]),
+            traveler_count=row["traveler_count"],
+            flight_count=row["flight_count"],
+            accommodation_count=row["accommodation_count"],
+            activity_count=row["activity_count"],
+            budget_total=budget_total,
+            budget_spent=budget_spent,
+        )
+
     async def delete(self, trip_id: int) -> bool:
         result = await self._session.execute(
             delete(TripOrm).where(TripOrm.id_ == trip_id)
@@ -74,11 +401,46 @@ class PostgresTripRepository(ITripRepository):
         )
         return result.scalar_one_or_none() is not None
 
-    async def update_status(self, trip_id: int, status: str) -> bool:
+    async def update_status(self, trip_id: int, owner_id: str, status: str) -> Optional[Trip]:
+        # One owner-scoped UPDATE ... RETURNING; the children follow through
+        # the relationships' selectin loads, no separate ownership SELECT.
         result = await self._session.execute(
             update(TripOrm)
-            .where(TripOrm.id_ == trip_id)
-            .values(status=status, updated_at=date.today())
+            .where(TripOrm.id_ == trip_id, TripOrm.owner_id == owner_id)
+            .values(status=status, updated_at=date.today(), version=TripOrm.version + 1)
+            .returning(TripOrm)
+            .execution_options(populate_existing=True)
         )
-        await self._session.flush()
-        return result.rowcount > 0
+        model = result.scalar_one_or_none()
+        return TripOrmMapper.to_domain(model) if model else None
+
+    async def reconcile_budgets(self, fix: bool = True) -> List[Tuple[int, int]]:
+        """
+        Maintenance check of every trip's stored spent against the committed
+        totals in trip_category_spend (migration 0005).
+
+        Loads trust the stored spent, so this is the consistency check for
+        rows written outside the aggregate. With ``fix``, drifted trips get
+        the committed total and a new version in a single UPDATE.
+
+        Returns:
+            (id, version) of each drifted trip, the new version if fixed
+        """
+        if not fix:
+            result = await self._session.execute(
+                select(TripOrm.id_, TripOrm.version).where(_drifted_budget()).order_by(TripOrm.id_)
+            )
+            return [tuple(row) for row in result.all()]
+        result = await self._execute(
+            update(TripOrm)
+            .where(_drifted_budget())
+            .values(
+                budget_spent_amount=_committed_total(),
+                budget_spent_currency=func.coalesce(
+                    TripOrm.budget_spent_currency, TripOrm.budget_total_currency
+                ),
+                version=TripOrm.version + 1,
+            )
+            .returning(TripOrm.id_, TripOrm.version)
+        )
+        return sorted(tuple(row) for row in result.all())
@@ -0,0 +1,51 @@
+"""
+Budget consistency check.
+
+Trips are loaded with the spent total stored on the trips row, not a
+recompute over their children. This compares every stored total with the
+committed totals the child-table triggers keep in trip_category_spend,
+reports the trips that drifted and, unless ``--check`` is given, fixes
+them and invalidates their cache entries (with ``REDIS_URL`` set).
+
+Usage (from vacation_stay_scrapper/, against DATABASE_URL)::
+
+    python -m src.trips.infrastructure.persistence.reconcile_budgets --check
+    python -m src.trips.infrastructure.persistence.reconcile_budgets
+"""
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from config.settings import settings
+from src.shared.infrastructure.cache.redis_cache_store import RedisCacheStore
+from src.shared.infrastructure.database.session import AsyncSessionLocal, dispose_engines
+from src.trips.infrastructure.cache.trip_cache import TripCache
+from src.trips.infrastructure.persistence.postgres_trip_repository import PostgresTripRepository
+
+
+async def run(fix: bool) -> int:
+    async with AsyncSessionLocal() as session:
+        drifted = await PostgresTripRepository(session).reconcile_budgets(fix=fix)
+        await session.commit()
+    if fix and settings.redis_url:
+        cache = TripCache(RedisCacheStore(settings.redis_url), ttl=settings.trip_cache_ttl_seconds)
+        for trip_id, version in drifted:
+            await cache.invalidate(trip_id, version)
+    await dispose_engines()
+
+    for trip_id, _ in drifted:
+        print(f"trip {trip_id}: {'fixed' if fix else 'stored spent drifted'}")
+    print(f"{len(drifted)} drifted trip(s)")
+    return 1 if drifted and not fix else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--check", action="store_true",
+                        help="only report drifted trips; exit 1 if there are any")
+    return asyncio.run(run(fix=not parser.parse_args(argv).check))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,29 @@ FastAPI Dependencies
 
 Dependency injection for trip-related components.
 """
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.shared.infrastructure.database.session import get_db_session
+from config.settings import settings
+from src.shared.infrastructure.cache.redis_cache_store import RedisCacheStore
+from src.shared.infrastructure.database.session import get_db_session, get_read_session
+from ...infrastructure.cache.cached_trip_repository import (
+    CachedTripRepository,
+    InvalidatingTripRepository,
+)
+from ...infrastructure.cache.trip_cache import TripCache
 from ...infrastructure.persistence.postgres_trip_repository import PostgresTripRepository
 from ...domain.repositories.trip_repository import ITripRepository
 from ...application.use_cases.create_trip import CreateTripUseCase
-from ...application.use_cases.get_trip import GetTripUseCase, GetAllTripsUseCase
+from ...application.use_cases.get_trip import (
+    GetTripUseCase,
+    GetAllTripsUseCase,
+    GetTripSummariesUseCase,
+    GetTripSpendUseCase,
+)
 from ...application.use_cases.update_trip import UpdateTripUseCase
 from ...application.use_cases.delete_trip import DeleteTripUseCase
 from ...application.use_cases.update_flight_status import UpdateFlightStatusUseCase
@@ -18,10 +33,35 @@ from ...application.use_cases.update_accommodation_status import UpdateAccommoda
 from ...application.use_cases.update_activity_status import UpdateActivityStatusUseCase
 
 
+@lru_cache
+def get_trip_cache() -> Optional[TripCache]:
+    # One per process: it holds the local cache and the loads in flight
+    if not settings.redis_url:
+        return None
+    return TripCache(
+        RedisCacheStore(settings.redis_url),
+        ttl=settings.trip_cache_ttl_seconds,
+        local_ttl=settings.trip_cache_local_ttl_seconds,
+        local_max_entries=settings.trip_cache_local_max_entries,
+    )
+
+
 def get_trip_repository(
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_db_session),
+    cache: Optional[TripCache] = Depends(get_trip_cache),
+) -> ITripRepository:
+    # For use cases that write: their reads skip the cache, their writes invalidate it
+    repository = PostgresTripRepository(session)
+    return InvalidatingTripRepository(repository, cache) if cache else repository
+
+
+def get_read_trip_repository(
+    session: AsyncSession = Depends(get_read_session),
+    cache: Optional[TripCache] = Depends(get_trip_cache),
 ) -> ITripRepository:
-    return PostgresTripRepository(session)
+    # For use cases that never write: read-only session, on the replica if any
+    repository = PostgresTripRepository(session)
+    return CachedTripRepository(repository, cache) if cache else repository
 
 
 def get_create_trip_use_case(
@@ -31,17 +71,37 @@ def get_create_trip_use_case(
 
 
 def get_get_trip_use_case(
+    repository: ITripRepository = Depends(get_read_trip_repository)
+) -> GetTripUseCase:
+    return GetTripUseCase(repository)
+
+
+def get_get_trip_for_update_use_case(
     repository: ITripRepository = Depends(get_trip_repository)
 ) -> GetTripUseCase:
+    # read-modify-write: read in the writing session, on the primary and
+    # past the cache, so the version the PUT saves against is current
     return GetTripUseCase(repository)
 
 
 def get_get_all_trips_use_case(
-    repository: ITripRepository = Depends(get_trip_repository)
+    repository: ITripRepository = Depends(get_read_trip_repository)
 ) -> GetAllTripsUseCase:
     return GetAllTripsUseCase(repository)
 
 
+def get_get_trip_summaries_use_case(
+    repository: ITripRepository = Depends(get_read_trip_repository)
+) -> GetTripSummariesUseCase:
+    return GetTripSummariesUseCase(repository)
+
+
+def get_get_trip_spend_use_case(
+    repository: ITripRepository = Depends(get_read_trip_repository)
+) -> GetTripSpendUseCase:
+    return GetTripSpendUseCase(repository)
+
+
 def get_update_trip_use_case(
     repository: ITripRepository = Depends(get_trip_repository)
 ) -> UpdateTripUseCase:
@@ -5,9 +5,10 @@ FastAPI routes for trip management CRUD operations.
 """
 import logging
 
-from fastapi import APIRouter, Depends, status, HTTPException
-from typing import List, Annotated
+from fastapi import APIRouter, Depends, Query, status, HTTPException
+from typing import List, Annotated, Literal, Optional, Union
 
+from datetime import date
 from fastapi.security import HTTPBearer
 
 from src.shared.infrastructure.auth.dependencies import get_current_user
@@ -18,13 +19,19 @@ from .schemas import (
     UpdateTripStatusRequest,
     TripResponse,
     TripListResponse,
+    TripSummaryListResponse,
+    TripSpendResponse,
     MessageResponse,
-    ChildStatusUpdateRequest
+    ChildStatusUpdateRequest,
+    TripStatusType
 )
 from .dependencies import (
     get_create_trip_use_case,
     get_get_trip_use_case,
+    get_get_trip_for_update_use_case,
     get_get_all_trips_use_case,
+    get_get_trip_summaries_use_case,
+    get_get_trip_spend_use_case,
     get_update_trip_use_case,
     get_delete_trip_use_case,
     get_update_flight_status_use_case,
@@ -32,17 +39,26 @@ from .dependencies import (
     get_update_activity_status_use_case
 )
 from ...application.use_cases.create_trip import CreateTripUseCase
-from ...application.use_cases.get_trip import GetTripUseCase, GetAllTripsUseCase
+from ...application.use_cases.get_trip import (
+    GetTripUseCase,
+    GetAllTripsUseCase,
+    GetTripSummariesUseCase,
+    GetTripSpendUseCase,
+)
 from ...application.use_cases.update_trip import UpdateTripUseCase
 from ...application.use_cases.delete_trip import DeleteTripUseCase
 from ...application.use_cases.update_flight_status import UpdateFlightStatusUseCase
 from ...application.use_cases.update_accommodation_status import UpdateAccommodationStatusUseCase
 from ...application.use_cases.update_activity_status import UpdateActivityStatusUseCase
+from ...domain.value_objects.trip_query import TripCursor, TripQuery
 from ...domain.value_objects.trip_status import TripStatus
 from ..mappers.trip_mapper import TripMapper
 
 # Create router
 router = APIRouter(prefix="/api/trips", tags=["trips"])
+
+MAX_PAGE_SIZE = 200
+
 @router.post(
     "",
     response_model=TripResponse,
@@ -78,29 +94,74 @@ async def create_trip(
 
 @router.get(
     "",
-    response_model=TripListResponse,
+    response_model=Union[TripListResponse, TripSummaryListResponse],
     summary="Get all trips"
 )
 async def get_all_trips(
+        view: Literal["full", "summary"] = Query(
+            "full", description="'summary' returns counts and budget totals instead of child collections"
+        ),
+        trip_status: Optional[TripStatusType] = Query(None, alias="status"),
+        destination: Optional[str] = Query(None, min_length=1),
+        date_from: Optional[date] = Query(None, description="Trips ending on or after this date"),
+        date_to: Optional[date] = Query(None, description="Trips starting on or before this date"),
+        limit: Optional[int] = Query(
+            None, ge=1, le=MAX_PAGE_SIZE, description="Page size; every trip in one page when omitted"
+        ),
+        cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+        include_total: bool = Query(False, description="Count every matching trip"),
+        summaries_use_case: GetTripSummariesUseCase = Depends(get_get_trip_summaries_use_case),
         use_case: GetAllTripsUseCase = Depends(get_get_all_trips_use_case),
         current_user: dict = Depends(get_current_user)
-) -> TripListResponse:
+) -> Union[TripListResponse, TripSummaryListResponse]:
     """
-    Get all trips belonging to the authenticated user.
+    Get the authenticated user's trips, ordered by start date: all of them
+    (with their ``total``) unless a ``limit`` asks for pages.
+
+    By default each trip is complete, children included. ``?view=summary``
+    returns summaries instead (counts and budget totals, no child
+    collections), read in a single query.
 
     Args:
+        view: Full trip aggregates, or opt-in summaries
+        trip_status: Only trips with this status
+        destination: Only trips whose destination contains this text
+        date_from: Only trips ending on or after this date
+        date_to: Only trips starting on or before this date
+        limit: Page size; None returns every trip
+        cursor: Resume after the last trip of the previous page
+        include_total: Also count all matching trips (one extra query)
+        summaries_use_case: Get trip summaries use case (injected)
         use_case: Get all trips use case (injected)
         current_user: Decoded JWT claims from the authenticated user
 
     Returns:
-        List of trips owned by the current user
+        Page of trips owned by the current user
     """
     owner_id = current_user["sub"]
-    trips = await use_case.execute(owner_id=owner_id)
+    query = TripQuery(
+        status=TripStatus.from_string(trip_status) if trip_status else None,
+        destination=destination,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+        after=TripCursor.decode(cursor) if cursor else None,
+        include_total=include_total,
+    )
 
+    if view == "summary":
+        page = await summaries_use_case.execute(owner_id, query)
+        return TripSummaryListResponse(
+            trips=[TripMapper.to_summary_response(summary) for summary in page.items],
+            total=page.total,
+            nextCursor=page.next_cursor.encode() if page.next_cursor else None
+        )
+
+    page = await use_case.page(owner_id, query)
     return TripListResponse(
-        trips=[TripMapper.to_response(trip) for trip in trips],
-        total=len(trips)
+        trips=[TripMapper.to_response(trip) for trip in page.items],
+        total=page.total,
+        nextCursor=page.next_cursor.encode() if page.next_cursor else None
     )
 
 
@@ -130,6 +191,33 @@ async def get_trip(
     return TripMapper.to_response(trip)
 
 
+@router.get(
+    "/{trip_id}/spend",
+    response_model=TripSpendResponse,
+    summary="Get a trip's committed spend per category"
+)
+async def get_trip_spend(
+        trip_id: str,
+        use_case: GetTripSpendUseCase = Depends(get_get_trip_spend_use_case),
+        current_user: dict = Depends(get_current_user)
+) -> TripSpendResponse:
+    """
+    Committed spend of a trip per category (flights, accommodation and each
+    activity category), without loading the trip's children. Owner only.
+
+    Args:
+        trip_id: Trip identifier
+        use_case: Get trip spend use case (injected)
+        current_user: Decoded JWT claims from the authenticated user
+
+    Returns:
+        Spend per category and in total
+    """
+    owner_id = current_user["sub"]
+    spend = await use_case.execute(trip_id, owner_id=owner_id)
+    return TripMapper.to_spend_response(trip_id, spend)
+
+
 @router.put(
     "/{trip_id}",
     response_model=TripResponse,
@@ -139,7 +227,7 @@ async def update_trip(
         trip_id: str,
         request: TripUpdateRequest,
         use_case: UpdateTripUseCase = Depends(get_update_trip_use_case),
-        get_use_case: GetTripUseCase = Depends(get_get_trip_use_case),
+        get_use_case: GetTripUseCase = Depends(get_get_trip_for_update_use_case),
         current_user: dict = Depends(get_current_user)
 ) -> TripResponse:
     """
@@ -157,13 +245,13 @@ async def update_trip(
     """
     owner_id = current_user["sub"]
 
-    # Fetch existing trip scoped to owner
+    # Fetch existing trip scoped to owner (the only read in this request)
     existing_trip = await get_use_case.execute(trip_id, owner_id=owner_id)
 
     # Apply changes from request onto the existing entity
     updated_trip = TripMapper.update_from_request(existing_trip, request)
 
-    # Persist update, scoped to owner
+    # Persist what changed; the write itself is scoped to the owner
     result = await use_case.execute(trip_id, updated_trip, owner_id=owner_id)
 
     return TripMapper.to_response(result)
@@ -4,10 +4,12 @@ Trip API Schemas
 Pydantic models for FastAPI request/response validation.
 Matches frontend Models.ts interfaces exactly.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from datetime import date, datetime
 from typing import List, Optional, Literal
 
+from ...domain.value_objects.category_spend import RESERVED_CATEGORIES
+
 TripStatusType = Literal["planning", "confirmed", "in_progress", "completed", "cancelled"]
 
 
@@ -75,6 +77,13 @@ class ActivityCreateRequest(BaseModel):
     category: str = Field(..., min_length=1)
     description: Optional[str] = None
 
+    @field_validator("category")
+    @classmethod
+    def category_not_reserved(cls, category: str) -> str:
+        if category in RESERVED_CATEGORIES:
+            raise ValueError(f"'{category}' is reserved for the trip's own spend")
+        return category
+
 
 class BudgetCategoryRequest(BaseModel):
     """Request schema for budget category"""
@@ -194,6 +203,51 @@ class TripResponse(BaseModel):
         populate_by_name = True
 
 
+class BudgetTotalsResponse(BaseModel):
+    """Budget totals without the category breakdown"""
+    total: float
+    spent: float
+
+
+class CategorySpendResponse(BaseModel):
+    """Committed spend of one category"""
+    category: str
+    spent: float
+
+
+class TripSpendResponse(BaseModel):
+    """Committed spend of a trip, per category"""
+    trip_id: str = Field(alias="tripId")
+    currency: str
+    spent: float
+    categories: List[CategorySpendResponse] = []
+
+    class Config:
+        populate_by_name = True
+
+
+class TripSummaryResponse(BaseModel):
+    """
+    Slim trip for list views: counts instead of child collections.
+
+    Returned by the list endpoint with ``?view=summary``.
+    """
+    id: str
+    name: str
+    destination: str
+    start_date: date = Field(alias="startDate")
+    end_date: date = Field(alias="endDate")
+    status: TripStatusType
+    traveler_count: int = Field(alias="travelerCount")
+    flight_count: int = Field(alias="flightCount")
+    accommodation_count: int = Field(alias="accommodationCount")
+    activity_count: int = Field(alias="activityCount")
+    budget: BudgetTotalsResponse
+
+    class Config:
+        populate_by_name = True
+
+
 # ============================================================================
 # MAIN REQUEST SCHEMAS
 # ============================================================================
@@ -268,9 +322,30 @@ class UpdateTripStatusRequest(BaseModel):
 # ============================================================================
 
 class TripListResponse(BaseModel):
-    """Response schema for trip list"""
+    """
+    Response schema for trip list
+
+    ``nextCursor`` is passed back as ``?cursor=`` for the next page and is
+    null on the last one. ``total`` counts all matching trips; it is null
+    unless requested with ``?include_total=true`` or the first page holds
+    every match.
+    """
     trips: List[TripResponse]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+
+    class Config:
+        populate_by_name = True
+
+
+class TripSummaryListResponse(BaseModel):
+    """Response schema for the ``?view=summary`` trip list, paged like TripListResponse"""
+    trips: List[TripSummaryResponse]
+    total: Optional[int] = None
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+
+    class Config:
+        populate_by_name = True
 
 
 class MessageResponse(BaseModel):
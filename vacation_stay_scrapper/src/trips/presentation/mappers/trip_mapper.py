@@ -6,6 +6,7 @@ Ensures compatibility with frontend Models.ts
 Supports creating trips with nested objects (flights, accommodations, etc.)
 """
 from datetime import date as date_type
+from typing import List
 from uuid import uuid4
 
 from ...domain.entities.trip import Trip
@@ -17,8 +18,14 @@ from ...domain.value_objects.trip_status import TripStatus
 from ...domain.value_objects.budget import Budget, BudgetCategory
 from ...domain.value_objects.money import Money
 from ...domain.value_objects.airport import Airport
+from ...domain.value_objects.trip_summary import TripSummary
+from ...domain.value_objects.category_spend import CategorySpend
 from ..api.schemas import (
     TripResponse,
+    TripSummaryResponse,
+    BudgetTotalsResponse,
+    TripSpendResponse,
+    CategorySpendResponse,
     TripCreateRequest,
     TripUpdateRequest,
     FlightResponse,
@@ -75,6 +82,56 @@ class TripMapper:
                    else BudgetResponse(total=0, spent=0, categories=[])
         )
     
+    @staticmethod
+    def to_spend_response(trip_id: str, spend: List[CategorySpend]) -> TripSpendResponse:
+        """
+        Convert a trip's category spend to a response schema
+
+        Args:
+            trip_id: Trip identifier
+            spend: Committed spend per category
+
+        Returns:
+            TripSpendResponse schema
+        """
+        return TripSpendResponse(
+            tripId=trip_id,
+            currency=spend[0].spent.currency if spend else "USD",
+            spent=float(sum(item.spent.amount for item in spend)),
+            categories=[
+                CategorySpendResponse(category=item.category, spent=float(item.spent.amount))
+                for item in spend
+            ],
+        )
+
+    @staticmethod
+    def to_summary_response(summary: TripSummary) -> TripSummaryResponse:
+        """
+        Convert a TripSummary read model to the slim list response
+
+        Args:
+            summary: TripSummary read model
+
+        Returns:
+            TripSummaryResponse schema
+        """
+        return TripSummaryResponse(
+            id=str(summary.id),
+            name=summary.name,
+            destination=summary.destination,
+            startDate=summary.start_date,
+            endDate=summary.end_date,
+            status=str(summary.status),
+            travelerCount=summary.traveler_count,
+            flightCount=summary.flight_count,
+            accommodationCount=summary.accommodation_count,
+            activityCount=summary.activity_count,
+            budget=BudgetTotalsResponse(
+                total=float(summary.budget_total.amount) if summary.budget_total else 0,
+                spent=float(summary.budget_spent.amount) if summary.budget_spent else 0,
+            )
+        )
+    
     @staticmethod
     def from_create_request(request: TripCreateRequest, owner_id: str) -> Trip:
         """
@@ -0,0 +1,179 @@
+"""
+Integration tests for the trip_category_spend triggers (migration 0005).
+
+Drives real writes through PostgresTripRepository and checks that the
+trigger-maintained totals always equal CategorySpend.of() over the loaded
+aggregate. Skipped unless TEST_DATABASE_URL points at a scratch database
+(see test_query_plans.py).
+"""
+import asyncio
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.trips.domain.entities.activity import Activity
+from src.trips.domain.entities.flight import Flight
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.value_objects.airport import Airport
+from src.trips.domain.value_objects.budget import Budget
+from src.trips.domain.value_objects.category_spend import CategorySpend
+from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_status import TripStatus
+from src.trips.infrastructure.persistence.postgres_trip_repository import PostgresTripRepository
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+OWNER = "spend-test-owner"
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set (needs a scratch PostgreSQL)"
+)
+
+
+def make_trip() -> Trip:
+    trip = Trip(
+        id=None,
+        owner_id=OWNER,
+        name="Spend test",
+        destination="Lisbon",
+        start_date=date(2025, 7, 1),
+        end_date=date(2025, 7, 8),
+        status=TripStatus.PLANNING,
+        budget=Budget(total=Money(Decimal("5000")), spent=Money.zero()),
+    )
+    trip.add_flight(Flight(
+        id="spend-f1", airline="TAP", flight_number="TP1",
+        departure_airport=Airport(code="MAD", city="Madrid"),
+        departure_time=datetime(2025, 7, 1, 10, 0),
+        arrival_airport=Airport(code="LIS", city="Lisbon"),
+        arrival_time=datetime(2025, 7, 1, 11, 30),
+        duration="1h 30m", price=Money(Decimal("120.00")), status="confirmed",
+    ))
+    for activity_id, category, cost in [
+        ("spend-a1", "food", "30.00"), ("spend-a2", "food", "12.50"), ("spend-a3", "tours", "80.00"),
+    ]:
+        trip.add_activity(Activity(
+            id=activity_id, name="Activity", date=date(2025, 7, 2),
+            cost=Money(Decimal(cost)), category=category, status="pending",
+        ))
+    return trip
+
+
+async def _scenario(steps):
+    """Run each step in its own transaction; (expected, stored) spend after every step"""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    observed = []
+    try:
+        async with sessions() as session:
+            await session.execute(text("DELETE FROM trips WHERE owner_id = :owner"), {"owner": OWNER})
+            trip = await PostgresTripRepository(session).save(make_trip())
+            await session.commit()
+        for step in steps:
+            async with sessions() as session:
+                repository = PostgresTripRepository(session)
+                await step(repository, trip.id)
+                await session.commit()
+            async with sessions() as session:
+                repository = PostgresTripRepository(session)
+                loaded = await repository.find_by_owner(trip.id, OWNER)
+                stored = await repository.find_category_spend(trip.id, OWNER)
+                observed.append((CategorySpend.of(loaded) if loaded else None, stored))
+    finally:
+        async with sessions() as session:
+            await session.execute(text("DELETE FROM trips WHERE owner_id = :owner"), {"owner": OWNER})
+            await session.commit()
+        await engine.dispose()
+    return observed
+
+
+async def _noop(repository, trip_id):
+    pass
+
+
+def _book(activity_id):
+    async def step(repository, trip_id):
+        trip = await repository.find_by_owner(trip_id, OWNER)
+        trip.update_activity_status(activity_id, "booked")
+        await repository.save(trip)
+    return step
+
+
+async def _cancel_flight(repository, trip_id):
+    trip = await repository.find_by_owner(trip_id, OWNER)
+    trip.update_flight_status("spend-f1", "cancelled")
+    await repository.save(trip)
+
+
+async def _remove_activity(repository, trip_id):
+    trip = await repository.find_by_owner(trip_id, OWNER)
+    trip.remove_activity("spend-a1")
+    await repository.save(trip)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def migrated_database():
+    previous_url = os.environ.get("DATABASE_URL")
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    try:
+        config = Config(str(PROJECT_ROOT / "alembic.ini"))
+        config.set_main_option("script_location", str(PROJECT_ROOT / "migrations"))
+        command.upgrade(config, "head")
+    except (OSError, ConnectionError) as e:
+        pytest.skip(f"PostgreSQL at TEST_DATABASE_URL is unreachable: {e}")
+    finally:
+        if previous_url is None:
+            os.environ.pop("DATABASE_URL", None)
+        else:
+            os.environ["DATABASE_URL"] = previous_url
+
+
+class TestCategorySpendTriggers:
+
+    def test_totals_follow_inserts_status_changes_and_deletes(self):
+        steps = [
+            _noop,
+            _book("spend-a1"),
+            _book("spend-a2"),
+            _cancel_flight,
+            _remove_activity,
+        ]
+
+        observed = asyncio.run(_scenario(steps))
+
+        for expected, stored in observed:
+            assert stored == expected
+        assert [(s.category, s.spent.amount) for s in observed[2][1]] == [
+            ("flights", Decimal("120.00")), ("food", Decimal("42.50")),
+        ]
+        assert [(s.category, s.spent.amount) for s in observed[-1][1]] == [
+            ("food", Decimal("12.50")),
+        ]
+
+    def test_deleting_the_trip_removes_its_totals(self):
+        async def scenario():
+            engine = create_async_engine(TEST_DATABASE_URL)
+            sessions = async_sessionmaker(engine, expire_on_commit=False)
+            try:
+                async with sessions() as session:
+                    repository = PostgresTripRepository(session)
+                    trip = await repository.save(make_trip())
+                    await session.commit()
+                    await repository.delete(trip.id)
+                    await session.commit()
+                    result = await session.execute(
+                        text("SELECT count(*) FROM trip_category_spend WHERE trip_id = :id"),
+                        {"id": trip.id},
+                    )
+                    return result.scalar_one()
+            finally:
+                await engine.dispose()
+
+        assert asyncio.run(scenario()) == 0
@@ -0,0 +1,139 @@
+"""
+Unit tests for the in-process cache helpers and the in-memory CacheStore.
+"""
+import asyncio
+
+from src.shared.infrastructure.cache.cache_store import InMemoryCacheStore
+from src.shared.infrastructure.cache.local_cache import LocalCache, SingleFlight
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ---------------------------------------------------------------------------
+# LocalCache
+# ---------------------------------------------------------------------------
+
+class TestLocalCache:
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = LocalCache(ttl=1, max_entries=10, clock=clock)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        clock.now = 1.0
+        assert cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LocalCache(ttl=60, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_zero_ttl_disables_the_cache(self):
+        cache = LocalCache(ttl=0, max_entries=10)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+
+
+# ---------------------------------------------------------------------------
+# SingleFlight
+# ---------------------------------------------------------------------------
+
+class TestSingleFlight:
+
+    def test_concurrent_calls_share_one_load(self):
+        async def scenario():
+            flights, calls = SingleFlight(), 0
+
+            async def load():
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.01)
+                return "value"
+
+            results = await asyncio.gather(*(flights.do("k", load) for _ in range(5)))
+            return calls, results
+
+        calls, results = asyncio.run(scenario())
+
+        assert calls == 1
+        assert results == ["value"] * 5
+
+    def test_failures_reach_every_caller_and_are_not_kept(self):
+        async def scenario():
+            flights = SingleFlight()
+
+            async def failing():
+                await asyncio.sleep(0.01)
+                raise ConnectionError("down")
+
+            async def working():
+                return "value"
+
+            results = await asyncio.gather(
+                flights.do("k", failing), flights.do("k", failing), return_exceptions=True
+            )
+            return results, await flights.do("k", working)
+
+        results, retried = asyncio.run(scenario())
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert retried == "value"
+
+    def test_followers_reload_when_the_leader_is_cancelled(self):
+        async def scenario():
+            flights = SingleFlight()
+
+            async def load():
+                await asyncio.sleep(0.01)
+                return "value"
+
+            leader = asyncio.create_task(flights.do("k", load))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flights.do("k", load))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(scenario()) == "value"
+
+
+# ---------------------------------------------------------------------------
+# InMemoryCacheStore
+# ---------------------------------------------------------------------------
+
+class TestInMemoryCacheStore:
+
+    def test_add_only_stores_absent_keys(self):
+        async def scenario():
+            store = InMemoryCacheStore()
+            first = await store.add("k", "1", 10)
+            second = await store.add("k", "2", 10)
+            return first, second, await store.get_many(["k", "missing"])
+
+        assert asyncio.run(scenario()) == (True, False, ["1", None])
+
+    def test_expired_keys_are_absent(self):
+        async def scenario():
+            clock = FakeClock()
+            store = InMemoryCacheStore(clock=clock)
+            await store.set("k", "1", 5)
+            clock.now = 5.0
+            missing = await store.get_many(["k"])
+            return missing, await store.add("k", "2", 5)
+
+        assert asyncio.run(scenario()) == ([None], True)
@@ -0,0 +1,112 @@
+"""
+Unit tests for the database session layer: engine options built from the
+settings, and the writing vs. read-only session dependencies.
+
+No database is involved; engines connect lazily and sessions are mocked.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.shared.infrastructure.database import session as db_session
+
+
+def fake_sessionmaker(session):
+    @asynccontextmanager
+    async def open_session():
+        yield session
+    return open_session
+
+
+async def use(dependency, fail=False):
+    generator = dependency()
+    await generator.__anext__()
+    if fail:
+        with pytest.raises(RuntimeError):
+            await generator.athrow(RuntimeError("handler failed"))
+    else:
+        with pytest.raises(StopAsyncIteration):
+            await generator.__anext__()
+
+
+# ---------------------------------------------------------------------------
+# Engine options
+# ---------------------------------------------------------------------------
+
+class TestEngineOptions:
+
+    def test_pool_settings(self, monkeypatch):
+        monkeypatch.setattr(db_session.settings, "database_pool_size", 5)
+        monkeypatch.setattr(db_session.settings, "database_max_overflow", 2)
+        monkeypatch.setattr(db_session.settings, "database_pool_timeout", 3.5)
+        monkeypatch.setattr(db_session.settings, "database_pool_recycle", 600)
+        monkeypatch.setattr(db_session.settings, "database_pool_pre_ping", False)
+
+        options = db_session.engine_options("postgresql+asyncpg://u:p@db/app", "primary")
+
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 2
+        assert options["pool_timeout"] == 3.5
+        assert options["pool_recycle"] == 600
+        assert options["pool_pre_ping"] is False
+        assert options["pool_logging_name"] == "primary"
+
+    def test_asyncpg_statement_cache_size(self, monkeypatch):
+        monkeypatch.setattr(db_session.settings, "database_statement_cache_size", 0)
+
+        options = db_session.engine_options("postgresql+asyncpg://u:p@db/app", "primary")
+
+        assert options["connect_args"] == {"prepared_statement_cache_size": 0}
+
+    def test_other_drivers_get_no_asyncpg_arguments(self):
+        options = db_session.engine_options("postgresql+psycopg://u:p@db/app", "primary")
+
+        assert "connect_args" not in options
+
+    def test_pool_max_connections(self, monkeypatch):
+        assert db_session.pool_max_connections(db_session.engine) == (
+            db_session.settings.database_pool_size + db_session.settings.database_max_overflow
+        )
+
+        monkeypatch.setattr(db_session.settings, "database_max_overflow", -1)
+        assert db_session.pool_max_connections(db_session.engine) is None
+
+
+# ---------------------------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------------------------
+
+class TestSessions:
+
+    def test_read_engine_is_read_only_on_the_primary_pool_without_a_replica(self):
+        assert db_session.replica_engine is None
+        assert db_session.read_engine.get_execution_options()["postgresql_readonly"] is True
+        assert db_session.read_engine.pool is db_session.engine.pool
+        assert db_session.engines() == [db_session.engine]
+
+    def test_db_session_commits(self, monkeypatch):
+        session = AsyncMock()
+        monkeypatch.setattr(db_session, "AsyncSessionLocal", fake_sessionmaker(session))
+
+        asyncio.run(use(db_session.get_db_session))
+
+        session.commit.assert_awaited_once()
+
+    def test_db_session_rolls_back_on_error(self, monkeypatch):
+        session = AsyncMock()
+        monkeypatch.setattr(db_session, "AsyncSessionLocal", fake_sessionmaker(session))
+
+        asyncio.run(use(db_session.get_db_session, fail=True))
+
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    def test_read_session_never_commits(self, monkeypatch):
+        session = AsyncMock()
+        monkeypatch.setattr(db_session, "ReadSessionLocal", fake_sessionmaker(session))
+
+        asyncio.run(use(db_session.get_read_session))
+
+        session.commit.assert_not_awaited()
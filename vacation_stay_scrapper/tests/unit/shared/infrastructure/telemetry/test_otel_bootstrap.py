@@ -125,3 +125,22 @@ class TestConfig:
 
         assert status.enabled is False
         assert status.reason.startswith("SDK setup failed")
+
+
+class TestPoolMetrics:
+
+    def test_pool_capacity_is_reported_per_pool(self):
+        pytest.importorskip("opentelemetry.sdk.metrics")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+        from src.shared.infrastructure.database.session import engine, pool_max_connections
+
+        reader = InMemoryMetricReader()
+        otel.register_pool_metrics(MeterProvider(metric_readers=[reader]))
+
+        metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+        (points,) = [list(m.data.data_points) for m in metrics if m.name == "db.client.connections.max"]
+        assert [(p.value, dict(p.attributes)) for p in points] == [
+            (pool_max_connections(engine), {"pool.name": "primary"}),
+        ]
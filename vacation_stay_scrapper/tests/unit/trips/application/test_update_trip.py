@@ -3,6 +3,7 @@ Unit tests for UpdateTripUseCase.update_status.
 """
 import asyncio
 from datetime import date
+from typing import Optional
 from unittest.mock import AsyncMock
 
 import pytest
@@ -39,11 +40,30 @@ def make_repo(**method_returns) -> AsyncMock:
     return repo
 
 
+def make_repo_holding(trip: Optional[Trip]) -> AsyncMock:
+    """
+    Return a mock repository holding ``trip``.
+
+    Like the real repositories, update_status applies the status only to a
+    trip of the given owner and returns it, or returns None.
+    """
+    async def update_status(trip_id: int, owner_id: str, status: str) -> Optional[Trip]:
+        if trip is None or (trip.id, trip.owner_id) != (trip_id, owner_id):
+            return None
+        trip.status = TripStatus(status)
+        trip.updated_at = date.today()
+        return trip
+
+    repo = make_repo()
+    repo.update_status.side_effect = update_status
+    return repo
+
+
 class TestUpdateTripUseCaseStatus:
 
     def test_returns_updated_trip_with_new_status(self):
         trip = make_trip(trip_id=1, status=TripStatus.PLANNING)
-        repo = make_repo(find_by_owner=trip, update_status=True)
+        repo = make_repo_holding(trip)
 
         result = asyncio.run(
             UpdateTripUseCase(repo).update_status("1", "user-1", TripStatus.CONFIRMED)
@@ -54,7 +74,7 @@ class TestUpdateTripUseCaseStatus:
 
     def test_calls_update_status_on_repository(self):
         trip = make_trip(trip_id=1, status=TripStatus.PLANNING)
-        repo = make_repo(find_by_owner=trip, update_status=True)
+        repo = make_repo_holding(trip)
 
         asyncio.run(
             UpdateTripUseCase(repo).update_status("1", "user-1", TripStatus.CONFIRMED)
@@ -63,7 +83,7 @@ class TestUpdateTripUseCaseStatus:
         repo.update_status.assert_called_once()
 
     def test_raises_entity_not_found_when_trip_is_missing(self):
-        repo = make_repo(find_by_owner=None)
+        repo = make_repo_holding(None)
 
         with pytest.raises(EntityNotFound) as exc_info:
             asyncio.run(
@@ -74,26 +94,27 @@ class TestUpdateTripUseCaseStatus:
         assert exc_info.value.entity_id == "999"
 
     def test_raises_entity_not_found_when_trip_is_not_owned_by_user(self):
-        repo = make_repo(find_by_owner=None)
+        repo = make_repo_holding(make_trip(trip_id=42, owner_id="user-1"))
 
         with pytest.raises(EntityNotFound):
             asyncio.run(
                 UpdateTripUseCase(repo).update_status("42", "different-user", TripStatus.CONFIRMED)
             )
 
-    def test_does_not_call_update_status_when_trip_does_not_exist(self):
-        repo = make_repo(find_by_owner=None)
+    def test_raises_when_the_single_update_matches_no_trip(self):
+        repo = make_repo_holding(None)
 
-        with pytest.raises(EntityNotFound):
+        with pytest.raises(EntityNotFound) as exc_info:
             asyncio.run(
                 UpdateTripUseCase(repo).update_status("999", "user-1", TripStatus.CONFIRMED)
             )
 
-        repo.update_status.assert_not_called()
+        repo.update_status.assert_awaited_once_with(999, "user-1", "confirmed")
+        assert exc_info.value.entity_id == "999"
 
     def test_transitions_to_in_progress_status(self):
         trip = make_trip(trip_id=1, status=TripStatus.CONFIRMED)
-        repo = make_repo(find_by_owner=trip, update_status=True)
+        repo = make_repo_holding(trip)
 
         result = asyncio.run(
             UpdateTripUseCase(repo).update_status("1", "user-1", TripStatus.IN_PROGRESS)
@@ -103,7 +124,7 @@ class TestUpdateTripUseCaseStatus:
 
     def test_transitions_to_completed_status(self):
         trip = make_trip(trip_id=1, status=TripStatus.IN_PROGRESS)
-        repo = make_repo(find_by_owner=trip, update_status=True)
+        repo = make_repo_holding(trip)
 
         result = asyncio.run(
             UpdateTripUseCase(repo).update_status("1", "user-1", TripStatus.COMPLETED)
@@ -113,7 +134,7 @@ class TestUpdateTripUseCaseStatus:
 
     def test_transitions_to_cancelled_status(self):
         trip = make_trip(trip_id=1, status=TripStatus.PLANNING)
-        repo = make_repo(find_by_owner=trip, update_status=True)
+        repo = make_repo_holding(trip)
 
         result = asyncio.run(
             UpdateTripUseCase(repo).update_status("1", "user-1", TripStatus.CANCELLED)
@@ -123,7 +144,7 @@ class TestUpdateTripUseCaseStatus:
 
     def test_transitions_back_to_planning_status(self):
         trip = make_trip(trip_id=1, status=TripStatus.CANCELLED)
-        repo = make_repo(find_by_owner=trip, update_status=True)
+        repo = make_repo_holding(trip)
 
         result = asyncio.run(
             UpdateTripUseCase(repo).update_status("1", "user-1", TripStatus.PLANNING)
@@ -133,22 +154,22 @@ class TestUpdateTripUseCaseStatus:
 
     def test_passes_correct_trip_id_to_repository(self):
         trip = make_trip(trip_id=1)
-        repo = make_repo(find_by_owner=trip, update_status=True)
+        repo = make_repo_holding(trip)
 
         asyncio.run(
             UpdateTripUseCase(repo).update_status("1", "user-1", TripStatus.CONFIRMED)
         )
 
-        called_with = repo.find_by_owner.call_args[0][0]
+        called_with = repo.update_status.call_args[0][0]
         assert called_with == 1
 
     def test_passes_correct_owner_id_to_repository(self):
         trip = make_trip(trip_id=1)
-        repo = make_repo(find_by_owner=trip, update_status=True)
+        repo = make_repo_holding(trip)
 
         asyncio.run(
             UpdateTripUseCase(repo).update_status("1", "user-1", TripStatus.CONFIRMED)
         )
 
-        called_with = repo.find_by_owner.call_args[0][1]
+        called_with = repo.update_status.call_args[0][1]
         assert called_with == "user-1"
\ No newline at end of file
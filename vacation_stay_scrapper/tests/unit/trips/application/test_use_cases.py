@@ -14,6 +14,7 @@ References:
 """
 import asyncio
 from datetime import date
+from decimal import Decimal
 from unittest.mock import AsyncMock
 
 import pytest
@@ -21,9 +22,17 @@ import pytest
 from src.shared.domain.exceptions import EntityNotFound
 from src.trips.application.use_cases.create_trip import CreateTripUseCase
 from src.trips.application.use_cases.delete_trip import DeleteTripUseCase
-from src.trips.application.use_cases.get_trip import GetAllTripsUseCase, GetTripUseCase
+from src.trips.application.use_cases.get_trip import (
+    GetAllTripsUseCase,
+    GetTripSummariesUseCase,
+    GetTripSpendUseCase,
+    GetTripUseCase,
+)
 from src.trips.application.use_cases.update_trip import UpdateTripUseCase
 from src.trips.domain.entities.trip import Trip
+from src.trips.domain.value_objects.category_spend import CategorySpend
+from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_query import TripPage, TripQuery
 from src.trips.domain.value_objects.trip_status import TripStatus
 
 
@@ -132,6 +141,47 @@ class TestGetAllTripsUseCase:
         assert result == []
 
 
+# ---------------------------------------------------------------------------
+# GetTripSummariesUseCase
+# ---------------------------------------------------------------------------
+
+class TestGetTripSummariesUseCase:
+
+    def test_reads_summaries_not_full_trips(self):
+        page = TripPage(items=[object(), object()])
+        repo = make_repo(find_summaries_by_owner=page)
+        query = TripQuery(limit=10)
+
+        result = asyncio.run(GetTripSummariesUseCase(repo).execute("user-1", query))
+
+        assert result == page
+        repo.find_summaries_by_owner.assert_called_once_with("user-1", query)
+        repo.find_all_by_owner.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# GetTripSpendUseCase
+# ---------------------------------------------------------------------------
+
+class TestGetTripSpendUseCase:
+
+    def test_reads_category_totals_not_the_trip(self):
+        spend = [CategorySpend(category="flights", spent=Money(Decimal("150")))]
+        repo = make_repo(find_category_spend=spend)
+
+        result = asyncio.run(GetTripSpendUseCase(repo).execute("1", "user-1"))
+
+        assert result == spend
+        repo.find_category_spend.assert_called_once_with(1, "user-1")
+        repo.find_by_owner.assert_not_called()
+
+    def test_raises_entity_not_found_when_trip_is_missing_or_not_owned(self):
+        repo = make_repo(find_category_spend=None)
+
+        with pytest.raises(EntityNotFound):
+            asyncio.run(GetTripSpendUseCase(repo).execute("42", "user-1"))
+
+
 # ---------------------------------------------------------------------------
 # DeleteTripUseCase
 # ---------------------------------------------------------------------------
@@ -176,36 +226,45 @@ class TestDeleteTripUseCase:
 class TestUpdateTripUseCase:
 
     def test_returns_updated_trip(self):
-        existing = make_trip(trip_id=1)
         updated = make_trip(trip_id=1)
         updated.name = "Updated Name"
-        repo = make_repo(find_by_owner=existing, save=updated)
+        repo = make_repo(save=updated)
 
         result = asyncio.run(UpdateTripUseCase(repo).execute("1", updated, "user-1"))
 
         assert result == updated
 
-    def test_saves_the_updated_trip_to_repository(self):
-        existing = make_trip(trip_id=1)
+    def test_saves_without_reloading_the_trip(self):
         updated = make_trip(trip_id=1)
-        repo = make_repo(find_by_owner=existing, save=updated)
+        repo = make_repo(save=updated)
 
         asyncio.run(UpdateTripUseCase(repo).execute("1", updated, "user-1"))
 
         repo.save.assert_called_once_with(updated)
+        repo.find_by_owner.assert_not_called()
 
-    def test_raises_entity_not_found_when_trip_is_missing(self):
-        updated = make_trip()
-        repo = make_repo(find_by_owner=None)
+    def test_raises_entity_not_found_when_trip_belongs_to_another_user(self):
+        updated = make_trip(trip_id=1, owner_id="someone-else")
+        repo = make_repo()
 
         with pytest.raises(EntityNotFound):
-            asyncio.run(UpdateTripUseCase(repo).execute("999", updated, "user-1"))
+            asyncio.run(UpdateTripUseCase(repo).execute("1", updated, "user-1"))
 
-    def test_does_not_save_when_trip_does_not_exist(self):
-        updated = make_trip()
-        repo = make_repo(find_by_owner=None)
+        repo.save.assert_not_called()
+
+    def test_raises_entity_not_found_when_ids_disagree(self):
+        updated = make_trip(trip_id=1)
+        repo = make_repo()
 
         with pytest.raises(EntityNotFound):
             asyncio.run(UpdateTripUseCase(repo).execute("999", updated, "user-1"))
 
         repo.save.assert_not_called()
+
+    def test_propagates_entity_not_found_from_owner_scoped_write(self):
+        updated = make_trip(trip_id=1)
+        repo = make_repo()
+        repo.save.side_effect = EntityNotFound(entity_type="Trip", entity_id="1")
+
+        with pytest.raises(EntityNotFound):
+            asyncio.run(UpdateTripUseCase(repo).execute("1", updated, "user-1"))
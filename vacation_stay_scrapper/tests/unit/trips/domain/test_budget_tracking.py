@@ -0,0 +1,152 @@
+"""
+Unit tests for the Trip aggregate's incremental budget tracking (ADR-003).
+
+Child status changes add or subtract the child's amount instead of
+recomputing spent over every child; reconcile_budget() is the full
+recompute they must always agree with, which a property-based test checks
+over arbitrary sequences of transitions.
+"""
+from decimal import Decimal
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.shared.domain.exceptions import InvalidStatusTransition
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.services.child_status_transition import (
+    AccommodationStatusTransitionValidator,
+    ActivityStatusTransitionValidator,
+    FlightStatusTransitionValidator,
+)
+from src.trips.domain.value_objects.budget import Budget
+from src.trips.domain.value_objects.money import Money
+from tests.unit.trips import factories
+from tests.unit.trips.factories import make_accommodation, make_activity, make_flight
+
+
+def make_trip(spent: str = "0", currency: str = "USD") -> Trip:
+    return factories.make_trip(
+        budget=Budget(total=Money(Decimal("100000"), currency), spent=Money(Decimal(spent), currency)),
+    )
+
+
+def recomputed_spent(trip: Trip) -> Money:
+    return trip.budget.recalculate_spent(trip.flights, trip.accommodations, trip.activities).spent
+
+
+# (collection, validator, Trip update method)
+CHILD_KINDS = [
+    ("flights", FlightStatusTransitionValidator, Trip.update_flight_status),
+    ("accommodations", AccommodationStatusTransitionValidator, Trip.update_accommodation_status),
+    ("activities", ActivityStatusTransitionValidator, Trip.update_activity_status),
+]
+
+
+class TestIncrementalSpent:
+
+    def test_committing_adds_and_cancelling_subtracts_the_amount(self):
+        trip = make_trip()
+        trip.add_flight(make_flight("f1", price=Decimal("150.25")))
+        trip.add_activity(make_activity("act1", cost=Decimal("40")))
+
+        trip.update_flight_status("f1", "confirmed")
+        trip.update_activity_status("act1", "booked")
+        assert trip.budget.spent.amount == Decimal("190.25")
+
+        trip.update_flight_status("f1", "cancelled")
+        assert trip.budget.spent.amount == Decimal("40")
+
+    def test_moves_between_uncommitted_states_leave_spent_alone(self):
+        trip = make_trip(spent="12")  # deliberately off: nothing is committed
+        trip.add_flight(make_flight("f1", price=Decimal("150")))
+
+        trip.update_flight_status("f1", "cancelled")
+        trip.update_flight_status("f1", "pending")
+
+        assert trip.budget.spent.amount == Decimal("12")
+
+    def test_does_not_walk_the_children(self, monkeypatch):
+        trip = make_trip()
+        trip.add_activity(make_activity("act1", cost=Decimal("40")))
+        monkeypatch.setattr(
+            Budget, "recalculate_spent", lambda *args: pytest.fail("full recompute")
+        )
+
+        trip.update_activity_status("act1", "booked")
+
+        assert trip.budget.spent.amount == Decimal("40")
+
+    def test_underflow_falls_back_to_a_full_recompute(self):
+        trip = make_trip()  # spent 0, yet the accommodation is committed
+        trip.add_accommodation(make_accommodation("a1", total=Decimal("800"), status="confirmed"))
+        trip.add_flight(make_flight("f1", price=Decimal("150"), status="confirmed"))
+
+        trip.update_accommodation_status("a1", "cancelled")
+
+        assert trip.budget.spent.amount == Decimal("150")
+
+    def test_currency_mismatch_falls_back_to_a_full_recompute(self):
+        trip = make_trip(currency="EUR")
+        trip.add_flight(make_flight("f1", price=Decimal("150")))  # priced in USD
+
+        with pytest.raises(ValueError):
+            trip.update_flight_status("f1", "confirmed")  # recompute cannot mix either
+
+    def test_rejected_transition_leaves_spent_unchanged(self):
+        trip = make_trip()
+        trip.add_flight(make_flight("f1", price=Decimal("150"), status="confirmed"))
+
+        with pytest.raises(InvalidStatusTransition):
+            trip.update_flight_status("f1", "pending")
+
+        assert trip.budget.spent.amount == Decimal("0")
+
+
+class TestReconcileBudget:
+
+    def test_consistent_budget_is_left_alone(self):
+        trip = make_trip(spent="150")
+        trip.add_flight(make_flight("f1", price=Decimal("150"), status="confirmed"))
+
+        assert trip.reconcile_budget() is True
+        assert trip.budget.spent.amount == Decimal("150")
+
+    def test_inconsistent_budget_is_recomputed(self):
+        trip = make_trip(spent="999")
+        trip.add_flight(make_flight("f1", price=Decimal("150"), status="confirmed"))
+        trip.add_activity(make_activity("act1", cost=Decimal("40"), status="pending"))
+
+        assert trip.reconcile_budget() is False
+        assert trip.budget.spent.amount == Decimal("150")
+
+    def test_no_budget_is_consistent(self):
+        trip = make_trip()
+        trip.budget = None
+
+        assert trip.reconcile_budget() is True
+
+
+class TestIncrementalMatchesRecompute:
+    """Walks through the child state machines, checked at every step"""
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        prices=st.lists(st.decimals(min_value=0, max_value=1000, places=2), min_size=1, max_size=12),
+        data=st.data(),
+    )
+    def test_transitions_agree_with_full_recompute(self, prices, data):
+        trip = make_trip()
+        for n, price in enumerate(prices):
+            trip.add_flight(make_flight(f"f{n}", price=price))
+            trip.add_accommodation(make_accommodation(f"a{n}", total=price * 3))
+            trip.add_activity(make_activity(f"act{n}", cost=price / 4))
+
+        for _ in range(data.draw(st.integers(min_value=1, max_value=100), label="transitions")):
+            collection, validator, update = data.draw(st.sampled_from(CHILD_KINDS))
+            child = data.draw(st.sampled_from(getattr(trip, collection)))
+            target = data.draw(st.sampled_from(sorted(validator.VALID_TRANSITIONS[child.status])))
+
+            update(trip, child.id, target)
+
+            assert trip.budget.spent == recomputed_spent(trip)
+        assert trip.reconcile_budget() is True
@@ -0,0 +1,108 @@
+"""
+Unit tests for Trip change tracking (mark_clean / changes).
+
+Repositories mark a trip clean when they load or save it; changes() then
+reports dirty fields and added, removed and modified children, which is
+what the repository writes back.
+"""
+from datetime import date
+from decimal import Decimal
+
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.value_objects.budget import Budget, BudgetCategory
+from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_status import TripStatus
+from tests.unit.trips.factories import make_accommodation, make_flight
+
+
+def make_clean_trip() -> Trip:
+    trip = Trip(
+        id=1,
+        owner_id="user-1",
+        name="Summer Holiday",
+        destination="Barcelona",
+        start_date=date(2025, 7, 1),
+        end_date=date(2025, 7, 8),
+        status=TripStatus.PLANNING,
+        flights=[make_flight("f1"), make_flight("f2")],
+        accommodations=[make_accommodation()],
+        budget=Budget(
+            total=Money(Decimal("1000")),
+            spent=Money.zero(),
+            categories=[BudgetCategory("food", Money(Decimal("200")), Money.zero())],
+        ),
+    )
+    trip.mark_clean()
+    return trip
+
+
+class TestTripChanges:
+
+    def test_untracked_trip_has_no_changes(self):
+        trip = make_clean_trip()
+        trip._snapshot = None
+
+        assert trip.changes() is None
+
+    def test_clean_trip_has_empty_changes(self):
+        assert not make_clean_trip().changes()
+
+    def test_dirty_fields_keep_before_and_after(self):
+        trip = make_clean_trip()
+        trip.name = "Winter Holiday"
+        trip.status = TripStatus.CONFIRMED
+
+        changes = trip.changes()
+
+        assert changes.fields == {
+            "name": ("Summer Holiday", "Winter Holiday"),
+            "status": (TripStatus.PLANNING, TripStatus.CONFIRMED),
+        }
+        assert not any(changes.children.values())
+
+    def test_child_status_change_is_one_modified_child_and_the_budget(self):
+        trip = make_clean_trip()
+
+        trip.update_flight_status("f1", "confirmed")
+        changes = trip.changes()
+
+        [(before, after)] = changes.children["flights"].modified
+        assert (before.status, after.status) == ("pending", "confirmed")
+        assert not changes.children["flights"].added
+        assert not changes.children["flights"].removed
+        assert set(changes.fields) == {"budget"}
+
+    def test_added_and_removed_children(self):
+        trip = make_clean_trip()
+
+        trip.remove_flight("f2")
+        trip.add_flight(make_flight("f3"))
+        flights = trip.changes().children["flights"]
+
+        assert [f.id for f in flights.added] == ["f3"]
+        assert [f.id for f in flights.removed] == ["f2"]
+        assert flights.modified == []
+
+    def test_in_place_list_edits_are_detected(self):
+        trip = make_clean_trip()
+
+        trip.accommodations[0].amenities.append("pool")
+
+        [(before, after)] = trip.changes().children["accommodations"].modified
+        assert before.amenities == ["wifi"]
+        assert after.amenities == ["wifi", "pool"]
+
+    def test_mark_clean_resets_the_baseline(self):
+        trip = make_clean_trip()
+        trip.remove_flight("f1")
+
+        trip.mark_clean()
+
+        assert not trip.changes()
+
+    def test_snapshot_does_not_affect_equality(self):
+        tracked = make_clean_trip()
+        untracked = make_clean_trip()
+        untracked._snapshot = None
+
+        assert tracked == untracked
@@ -7,13 +7,18 @@ database or HTTP calls involved.
 """
 import pytest
 from datetime import date, datetime
+from decimal import Decimal
 
 from src.trips.domain.entities.trip import Trip
 from src.trips.domain.entities.traveler import Traveler
 from src.trips.domain.entities.flight import Flight
+from src.trips.domain.entities.activity import Activity
 from src.trips.domain.value_objects.trip_status import TripStatus
 from src.trips.domain.value_objects.airport import Airport
+from src.trips.domain.value_objects.budget import Budget
+from src.trips.domain.value_objects.category_spend import CategorySpend
 from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_summary import TripSummary
 
 
 # ---------------------------------------------------------------------------
@@ -207,3 +212,64 @@ class TestTripSummary:
         assert summary["travelers"] == 1
         assert summary["flights"] == 1
         assert summary["status"] == TripStatus.PLANNING.value
+
+
+class TestTripSummaryReadModel:
+
+    def test_counts_children_and_totals_committed_spend(self):
+        trip = make_trip(budget=Budget(total=Money.from_float(1000), spent=Money.zero()))
+        trip.add_traveler(make_traveler())
+        trip.add_flight(make_flight(status="confirmed"))
+
+        summary = TripSummary.of(trip)
+
+        assert summary.traveler_count == 1
+        assert summary.flight_count == 1
+        assert summary.activity_count == 0
+        assert summary.budget_total.amount == Decimal("1000")
+        assert summary.budget_spent.amount == Decimal("150")
+
+    def test_no_budget_totals_without_a_budget(self):
+        summary = TripSummary.of(make_trip())
+
+        assert summary.budget_total is None
+        assert summary.budget_spent is None
+
+
+class TestCategorySpend:
+
+    def test_groups_committed_children_by_category(self):
+        trip = make_trip(budget=Budget(total=Money(Decimal("1000"), "EUR"), spent=Money.zero("EUR")))
+        trip.add_flight(make_flight(status="confirmed"))
+        trip.add_flight(make_flight(status="pending"))
+        for activity_id, category, cost, status in [
+            ("act1", "food", "30", "booked"),
+            ("act2", "food", "12.50", "booked"),
+            ("act3", "tours", "80", "pending"),
+        ]:
+            trip.add_activity(Activity(
+                id=activity_id, name="Activity", date=date(2025, 7, 2),
+                cost=Money(Decimal(cost)), category=category, status=status,
+            ))
+
+        spend = CategorySpend.of(trip)
+
+        assert [(item.category, item.spent.amount) for item in spend] == [
+            ("flights", Decimal("150")),
+            ("food", Decimal("42.50")),
+        ]
+        assert {item.spent.currency for item in spend} == {"EUR"}
+
+    def test_nothing_committed_is_empty(self):
+        trip = make_trip()
+        trip.add_flight(make_flight(status="pending"))
+
+        assert CategorySpend.of(trip) == []
+
+    @pytest.mark.parametrize("category", ["flights", "accommodation"])
+    def test_activities_cannot_use_the_fixed_categories(self, category):
+        with pytest.raises(ValueError, match="reserved"):
+            Activity(
+                id="act1", name="Activity", date=date(2025, 7, 2),
+                cost=Money(Decimal("30")), category=category,
+            )
@@ -0,0 +1,84 @@
+"""
+Unit tests for the trip list query value objects (filters, keyset cursor, page).
+"""
+from datetime import date
+
+import pytest
+
+from src.shared.domain.exceptions import ValidationError
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.value_objects.trip_query import TripCursor, TripPage, TripQuery
+from src.trips.domain.value_objects.trip_status import TripStatus
+
+
+def make_trip(trip_id: int, start: date, **overrides) -> Trip:
+    defaults = dict(
+        id=trip_id,
+        owner_id="user-1",
+        name="Summer Holiday",
+        destination="Barcelona",
+        start_date=start,
+        end_date=date(2025, 12, 31),
+        status=TripStatus.PLANNING,
+    )
+    defaults.update(overrides)
+    return Trip(**defaults)
+
+
+class TestTripCursor:
+
+    def test_round_trips_through_its_token(self):
+        cursor = TripCursor(date(2025, 7, 1), 42)
+
+        assert TripCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not base64!", "MjAyNS0wNy0wMQ", "Zm9vOmJhcg"])
+    def test_rejects_malformed_tokens(self, token):
+        with pytest.raises(ValidationError):
+            TripCursor.decode(token)
+
+
+class TestTripQuery:
+
+    def test_rejects_inverted_date_range(self):
+        with pytest.raises(ValidationError):
+            TripQuery(date_from=date(2025, 8, 1), date_to=date(2025, 7, 1))
+
+    def test_matches_filters(self):
+        trip = make_trip(1, date(2025, 7, 1), end_date=date(2025, 7, 8))
+
+        assert TripQuery(destination="barc").matches(trip)
+        assert TripQuery(date_from=date(2025, 7, 8), date_to=date(2025, 7, 9)).matches(trip)
+        assert not TripQuery(status=TripStatus.CONFIRMED).matches(trip)
+        assert not TripQuery(date_from=date(2025, 7, 9)).matches(trip)
+        assert not TripQuery(date_to=date(2025, 6, 30)).matches(trip)
+
+    def test_cursor_breaks_start_date_ties_by_id(self):
+        query = TripQuery(after=TripCursor(date(2025, 7, 1), 5))
+
+        assert not query.is_after_cursor(make_trip(5, date(2025, 7, 1)))
+        assert query.is_after_cursor(make_trip(6, date(2025, 7, 1)))
+        assert query.is_after_cursor(make_trip(1, date(2025, 7, 2)))
+
+
+class TestTripPage:
+
+    def test_extra_row_becomes_the_next_cursor(self):
+        rows = [make_trip(i, date(2025, 7, i)) for i in (1, 2, 3)]
+
+        page = TripPage.of(rows, TripQuery(limit=2))
+
+        assert [t.id for t in page.items] == [1, 2]
+        assert page.next_cursor == TripCursor(date(2025, 7, 2), 2)
+        assert page.total is None
+
+    def test_single_first_page_knows_its_total(self):
+        page = TripPage.of([make_trip(1, date(2025, 7, 1))], TripQuery(limit=2))
+
+        assert page.next_cursor is None
+        assert page.total == 1
+
+    def test_last_page_after_a_cursor_leaves_total_unknown(self):
+        query = TripQuery(limit=2, after=TripCursor(date(2025, 6, 1), 1))
+
+        assert TripPage.of([make_trip(2, date(2025, 7, 1))], query).total is None
@@ -0,0 +1,72 @@
+"""
+Builders for trips and their children, shared by the trips unit tests.
+
+Every argument has a default, so a test only spells out what it checks.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+
+from src.trips.domain.entities.accommodation import Accommodation
+from src.trips.domain.entities.activity import Activity
+from src.trips.domain.entities.flight import Flight
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.value_objects.airport import Airport
+from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_status import TripStatus
+
+
+def make_trip(**overrides) -> Trip:
+    """Return a minimal valid Trip, allowing field overrides."""
+    defaults = dict(
+        id=1,
+        owner_id="user-1",
+        name="Summer Holiday",
+        destination="Barcelona",
+        start_date=date(2025, 7, 1),
+        end_date=date(2025, 7, 8),
+        status=TripStatus.PLANNING,
+    )
+    defaults.update(overrides)
+    return Trip(**defaults)
+
+
+def make_flight(flight_id: str = "f1", status: str = "pending", price: Decimal = Decimal("150")) -> Flight:
+    return Flight(
+        id=flight_id,
+        airline="Iberia",
+        flight_number="IB3166",
+        departure_airport=Airport(code="BCN", city="Barcelona"),
+        departure_time=datetime(2025, 7, 1, 10, 0),
+        arrival_airport=Airport(code="LHR", city="London"),
+        arrival_time=datetime(2025, 7, 1, 12, 30),
+        duration="2h 30m",
+        price=Money(price),
+        status=status,
+    )
+
+
+def make_accommodation(acc_id: str = "a1", status: str = "pending", total: Decimal = Decimal("800")) -> Accommodation:
+    """Four nights, ``total`` for the stay"""
+    return Accommodation(
+        id=acc_id,
+        name="Hotel Arts",
+        type="hotel",
+        check_in=date(2025, 7, 1),
+        check_out=date(2025, 7, 5),
+        price_per_night=Money(total / 4),
+        total_price=Money(total),
+        rating=4.5,
+        amenities=["wifi"],
+        status=status,
+    )
+
+
+def make_activity(activity_id: str = "act1", status: str = "pending", cost: Decimal = Decimal("50")) -> Activity:
+    return Activity(
+        id=activity_id,
+        name="Sagrada Familia Tour",
+        date=date(2025, 7, 2),
+        cost=Money(cost),
+        category="sightseeing",
+        status=status,
+    )
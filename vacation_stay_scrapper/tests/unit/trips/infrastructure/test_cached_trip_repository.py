@@ -0,0 +1,370 @@
+"""
+Unit tests for CachedTripRepository, InvalidatingTripRepository and TripCache.
+
+The shared cache is an InMemoryCacheStore and the database an
+InMemoryTripRepository — no Redis or PostgreSQL involved. Two TripCaches on
+one store stand for two processes sharing Redis.
+"""
+import asyncio
+import dataclasses
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.shared.infrastructure.cache.cache_store import InMemoryCacheStore
+from src.trips.domain.entities.trip import Trip
+from src.trips.domain.value_objects.budget import Budget, BudgetCategory
+from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_status import TripStatus
+from src.trips.infrastructure.cache.cached_trip_repository import (
+    CachedTripRepository,
+    InvalidatingTripRepository,
+)
+from src.trips.infrastructure.cache.trip_cache import TripCache
+from src.trips.infrastructure.cache.trip_cache_codec import TripCacheCodec
+from src.trips.infrastructure.persistence.in_memory_trip_repository import InMemoryTripRepository
+from tests.unit.trips.factories import make_activity, make_flight
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_trip(owner_id="user-1") -> Trip:
+    trip = Trip(
+        id=None,
+        owner_id=owner_id,
+        name="Summer Holiday",
+        destination="Barcelona",
+        start_date=date(2025, 7, 1),
+        end_date=date(2025, 7, 8),
+        status=TripStatus.PLANNING,
+        budget=Budget(
+            total=Money(Decimal("1000.00")),
+            spent=Money(Decimal("120.00")),  # the confirmed flight
+            categories=[BudgetCategory("food", Money(Decimal("200.00")), Money(Decimal("12.50")))],
+        ),
+    )
+    trip.add_flight(make_flight("f1", status="confirmed", price=Decimal("120.00")))
+    trip.add_activity(make_activity("a1", cost=Decimal("30.00")))
+    return trip
+
+
+def make_database() -> AsyncMock:
+    """InMemoryTripRepository whose calls can be counted"""
+    return AsyncMock(wraps=InMemoryTripRepository())
+
+
+def make_cache(store, **kwargs) -> TripCache:
+    kwargs.setdefault("lock_poll_interval", 0.01)
+    return TripCache(store, **kwargs)
+
+
+async def saved_trip(database) -> Trip:
+    trip = await database.save(make_trip())
+    database.reset_mock()
+    return trip
+
+
+# ---------------------------------------------------------------------------
+# TripCacheCodec
+# ---------------------------------------------------------------------------
+
+class TestTripCacheCodec:
+
+    def test_round_trip_is_lossless(self):
+        trip = make_trip()
+        trip.id = 7
+        trip.version = 3
+
+        decoded = TripCacheCodec.decode(TripCacheCodec.encode(trip))
+
+        assert decoded == trip
+        assert decoded.version == 3
+        assert decoded.budget.categories[0].spent == Money(Decimal("12.50"))
+        assert decoded.flights[0].departure_time == datetime(2025, 7, 1, 10, 0)
+
+    def test_decoded_trip_is_tracked_and_clean(self):
+        trip = make_trip()
+        trip.id = 7
+
+        decoded = TripCacheCodec.decode(TripCacheCodec.encode(trip))
+
+        assert decoded.changes() is not None
+        assert not decoded.changes()
+
+    def test_decoding_keeps_the_encoded_spent(self):
+        trip = make_trip()
+        trip.id = 7
+        trip.budget = dataclasses.replace(trip.budget, spent=Money(Decimal("999.00")))  # not the children's
+
+        decoded = TripCacheCodec.decode(TripCacheCodec.encode(trip))
+
+        assert decoded.budget.spent == Money(Decimal("999.00"))
+        assert not decoded.changes()
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+class TestCachedReads:
+
+    def test_second_read_is_served_from_the_cache(self):
+        async def scenario():
+            database = make_database()
+            trip = await saved_trip(database)
+            repository = CachedTripRepository(database, make_cache(InMemoryCacheStore()))
+
+            first = await repository.find_by_owner(trip.id, "user-1")
+            second = await repository.find_by_owner(trip.id, "user-1")
+            return database, first, second
+
+        database, first, second = asyncio.run(scenario())
+
+        assert database.find_by_owner.await_count == 1
+        assert second == first
+        assert second is not first
+
+    def test_other_processes_read_the_shared_entry(self):
+        async def scenario():
+            store, database = InMemoryCacheStore(), make_database()
+            trip = await saved_trip(database)
+
+            await CachedTripRepository(database, make_cache(store)).find_by_owner(trip.id, "user-1")
+            other = CachedTripRepository(database, make_cache(store))
+            return database, await other.find_by_owner(trip.id, "user-1")
+
+        database, found = asyncio.run(scenario())
+
+        assert database.find_by_owner.await_count == 1
+        assert found.name == "Summer Holiday"
+
+    def test_cached_trip_is_not_served_to_other_owners(self):
+        async def scenario():
+            database = make_database()
+            trip = await saved_trip(database)
+            repository = CachedTripRepository(database, make_cache(InMemoryCacheStore()))
+
+            await repository.find_by_owner(trip.id, "user-1")
+            return database, await repository.find_by_owner(trip.id, "intruder")
+
+        database, found = asyncio.run(scenario())
+
+        assert found is None
+        assert database.find_by_owner.await_count == 2
+
+    def test_missing_trip_is_not_cached(self):
+        async def scenario():
+            database = make_database()
+            repository = CachedTripRepository(database, make_cache(InMemoryCacheStore()))
+
+            await repository.find_by_owner(99, "user-1")
+            return database, await repository.find_by_owner(99, "user-1")
+
+        database, found = asyncio.run(scenario())
+
+        assert found is None
+        assert database.find_by_owner.await_count == 2
+
+    def test_store_failures_fall_back_to_the_database(self):
+        async def scenario():
+            database = make_database()
+            trip = await saved_trip(database)
+            store = AsyncMock(spec=InMemoryCacheStore)
+            for method in ("get_many", "set", "add", "delete"):
+                getattr(store, method).side_effect = ConnectionError("redis is down")
+            repository = CachedTripRepository(database, make_cache(store))
+
+            loaded = await repository.find_by_owner(trip.id, "user-1")
+            loaded.name = "Renamed"
+            await repository.save(loaded)
+            return database, await repository.find_by_owner(trip.id, "user-1")
+
+        database, found = asyncio.run(scenario())
+
+        assert found.name == "Renamed"
+        assert database.find_by_owner.await_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Invalidation
+# ---------------------------------------------------------------------------
+
+class TestInvalidation:
+
+    @pytest.mark.parametrize("local_ttl", [0, 60])
+    def test_save_invalidates_the_trip(self, local_ttl):
+        async def scenario():
+            database = make_database()
+            trip = await saved_trip(database)
+            repository = CachedTripRepository(
+                database, make_cache(InMemoryCacheStore(), local_ttl=local_ttl)
+            )
+
+            loaded = await repository.find_by_owner(trip.id, "user-1")
+            loaded.name = "Renamed"
+            await repository.save(loaded)
+            return database, await repository.find_by_owner(trip.id, "user-1")
+
+        database, found = asyncio.run(scenario())
+
+        assert found.name == "Renamed"
+        assert found.version == 2
+        assert database.find_by_owner.await_count == 2
+
+    def test_write_in_one_process_invalidates_the_shared_entry(self):
+        async def scenario():
+            store, database = InMemoryCacheStore(), make_database()
+            trip = await saved_trip(database)
+            reader = CachedTripRepository(database, make_cache(store, local_ttl=0))
+            writer = CachedTripRepository(database, make_cache(store))
+
+            await reader.find_by_owner(trip.id, "user-1")
+            await writer.update_status(trip.id, "user-1", "confirmed")
+            return await reader.find_by_owner(trip.id, "user-1")
+
+        found = asyncio.run(scenario())
+
+        assert found.status == TripStatus.CONFIRMED
+
+    def test_deleted_trip_is_not_served(self):
+        async def scenario():
+            database = make_database()
+            trip = await saved_trip(database)
+            repository = CachedTripRepository(database, make_cache(InMemoryCacheStore()))
+
+            await repository.find_by_owner(trip.id, "user-1")
+            await repository.delete(trip.id)
+            return await repository.find_by_owner(trip.id, "user-1")
+
+        assert asyncio.run(scenario()) is None
+
+    def test_entry_from_a_reader_that_raced_a_write_is_not_served(self):
+        async def scenario():
+            store, database = InMemoryCacheStore(), make_database()
+            trip = await saved_trip(database)
+            stale = TripCacheCodec.decode(TripCacheCodec.encode(trip))
+            cache = make_cache(store, local_ttl=0)
+
+            # a slow reader loads version 1, the trip is written meanwhile
+            async def slow_load():
+                trip.name = "Renamed"
+                await CachedTripRepository(database, cache).save(trip)
+                return stale
+
+            await cache.get(trip.id, "user-1", slow_load)
+            return await CachedTripRepository(database, cache).find_by_owner(trip.id, "user-1")
+
+        assert asyncio.run(scenario()).name == "Renamed"
+
+
+# ---------------------------------------------------------------------------
+# Write paths
+# ---------------------------------------------------------------------------
+
+class TestWritePaths:
+
+    def test_reads_skip_a_stale_local_copy(self):
+        async def scenario():
+            store, database = InMemoryCacheStore(), make_database()
+            trip = await saved_trip(database)
+            cache = make_cache(store, local_ttl=60)
+            await CachedTripRepository(database, cache).find_by_owner(trip.id, "user-1")
+            # another process writes the trip; this process's copy is now stale
+            await InvalidatingTripRepository(database, make_cache(store)).update_status(
+                trip.id, "user-1", "confirmed"
+            )
+
+            writer = InvalidatingTripRepository(database, cache)
+            loaded = await writer.find_by_owner(trip.id, "user-1")
+            loaded.name = "Renamed"
+            return await writer.save(loaded)
+
+        saved = asyncio.run(scenario())
+
+        assert saved.status == TripStatus.CONFIRMED
+        assert saved.version == 3
+
+    def test_writes_invalidate_the_cache(self):
+        async def scenario():
+            store, database = InMemoryCacheStore(), make_database()
+            trip = await saved_trip(database)
+            reader = CachedTripRepository(database, make_cache(store, local_ttl=0))
+            writer = InvalidatingTripRepository(database, make_cache(store))
+
+            await reader.find_by_owner(trip.id, "user-1")
+            loaded = await writer.find_by_owner(trip.id, "user-1")
+            loaded.name = "Renamed"
+            await writer.save(loaded)
+            return await reader.find_by_owner(trip.id, "user-1")
+
+        assert asyncio.run(scenario()).name == "Renamed"
+
+
+# ---------------------------------------------------------------------------
+# Stampede protection
+# ---------------------------------------------------------------------------
+
+class TestStampedeProtection:
+
+    def test_concurrent_misses_in_one_process_load_once(self):
+        async def scenario():
+            database = make_database()
+            trip = await saved_trip(database)
+            cache = make_cache(InMemoryCacheStore())
+            loads = 0
+
+            async def slow_load():
+                nonlocal loads
+                loads += 1
+                await asyncio.sleep(0.01)
+                return await database.find_by_owner(trip.id, "user-1")
+
+            found = await asyncio.gather(*(
+                cache.get(trip.id, "user-1", slow_load) for _ in range(20)
+            ))
+            return loads, found
+
+        loads, found = asyncio.run(scenario())
+
+        assert loads == 1
+        assert all(t.name == "Summer Holiday" for t in found)
+        assert len({id(t) for t in found}) == 20
+
+    def test_other_processes_wait_for_the_reload(self):
+        async def scenario():
+            store, database = InMemoryCacheStore(), make_database()
+            trip = await saved_trip(database)
+            loads = 0
+
+            async def slow_load():
+                nonlocal loads
+                loads += 1
+                await asyncio.sleep(0.05)
+                return await database.find_by_owner(trip.id, "user-1")
+
+            found = await asyncio.gather(*(
+                make_cache(store).get(trip.id, "user-1", slow_load) for _ in range(5)
+            ))
+            return loads, found
+
+        loads, found = asyncio.run(scenario())
+
+        assert loads == 1
+        assert all(t.name == "Summer Holiday" for t in found)
+
+    def test_waiters_load_themselves_when_the_reload_takes_too_long(self):
+        async def scenario():
+            store, database = InMemoryCacheStore(), make_database()
+            trip = await saved_trip(database)
+            await store.add(f"trip:user-1:{trip.id}:lock", "1", 60)  # a stuck process
+            cache = make_cache(store, lock_wait=0.05)
+
+            return await cache.get(
+                trip.id, "user-1", lambda: database.find_by_owner(trip.id, "user-1")
+            )
+
+        assert asyncio.run(scenario()).name == "Summer Holiday"
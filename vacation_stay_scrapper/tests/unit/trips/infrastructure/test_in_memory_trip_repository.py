@@ -0,0 +1,39 @@
+"""
+Unit tests for InMemoryTripRepository's optimistic locking.
+"""
+import asyncio
+import dataclasses
+
+import pytest
+
+from src.shared.domain.exceptions import ConcurrentModification
+from src.trips.infrastructure.persistence.in_memory_trip_repository import InMemoryTripRepository
+from tests.unit.trips.factories import make_trip
+
+
+class TestSaveVersioning:
+
+    def test_saving_a_stale_copy_is_rejected(self):
+        async def scenario():
+            repository = InMemoryTripRepository()
+            trip = await repository.save(make_trip(id=None))
+            stale = dataclasses.replace(trip)
+            await repository.update_status(trip.id, "user-1", "confirmed")
+            stale.name = "Renamed"
+            await repository.save(stale)
+
+        with pytest.raises(ConcurrentModification):
+            asyncio.run(scenario())
+
+    def test_saving_the_current_version_bumps_it(self):
+        async def scenario():
+            repository = InMemoryTripRepository()
+            trip = await repository.save(make_trip(id=None))
+            current = dataclasses.replace(trip)
+            current.name = "Renamed"
+            return await repository.save(current)
+
+        saved = asyncio.run(scenario())
+
+        assert saved.version == 2
+        assert saved.name == "Renamed"
@@ -10,10 +10,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.shared.domain.exceptions import ConcurrentModification, EntityNotFound
 from src.trips.domain.entities.trip import Trip
+from src.trips.domain.value_objects.budget import Budget
+from src.trips.domain.value_objects.money import Money
+from src.trips.domain.value_objects.trip_query import TripCursor, TripQuery
 from src.trips.domain.value_objects.trip_status import TripStatus
+from src.trips.infrastructure.persistence.mappers.trip_orm_mapper import TripOrmMapper
 from src.trips.infrastructure.persistence.models.trip import Trip as TripOrm
 from src.trips.infrastructure.persistence.postgres_trip_repository import PostgresTripRepository
+from tests.unit.trips.factories import make_flight
 
 
 # ---------------------------------------------------------------------------
@@ -56,9 +62,32 @@ def make_trip_model(trip_id=1, owner_id="user-1") -> TripOrm:
 def make_session() -> AsyncMock:
     session = AsyncMock()
     session.add = MagicMock()
+    session.expunge = MagicMock()
+    session.identity_map = {}
     return session
 
 
+def executed_sql(session) -> list:
+    """Verb and table of each executed statement, e.g. UPDATE flights"""
+    verbs = []
+    for call in session.execute.call_args_list:
+        words = str(call.args[0]).split()
+        if words[0] == "SELECT":
+            table = words[words.index("FROM") + 1]
+        else:
+            table = words[1] if words[0] == "UPDATE" else words[2]  # DELETE FROM / INSERT INTO
+        verbs.append(f"{words[0]} {table}")
+    return verbs
+
+
+def make_loaded_trip() -> Trip:
+    trip = make_trip(trip_id=1)
+    trip.flights = [make_flight("f1"), make_flight("f2")]
+    trip.budget = Budget(total=Money(Decimal("1000")), spent=Money.zero())
+    trip.mark_clean()
+    return trip
+
+
 def make_merge(return_model) -> AsyncMock:
     """A session.merge stub that echoes back a persistent-like model."""
     return AsyncMock(return_value=return_model)
@@ -70,6 +99,33 @@ def scalar_result(value):
     return result
 
 
+def mappings_result(rows):
+    result = MagicMock()
+    result.mappings.return_value.all.return_value = rows
+    return result
+
+
+def summary_row(**overrides) -> dict:
+    row = dict(
+        id=1,
+        owner_id="user-1",
+        name="Summer Holiday",
+        destination="Barcelona",
+        start_date=date(2025, 7, 1),
+        end_date=date(2025, 7, 8),
+        status="planning",
+        budget_total_amount=Decimal("2000.00"),
+        budget_total_currency="EUR",
+        traveler_count=2,
+        flight_count=1,
+        accommodation_count=0,
+        activity_count=3,
+        budget_spent_amount=Decimal("450.00"),
+    )
+    row.update(overrides)
+    return row
+
+
 def scalars_result(values):
     result = MagicMock()
     inner = MagicMock()
@@ -147,6 +203,7 @@ class TestSaveExistingTrip:
         updated_model = make_trip_model(trip_id=1)
         updated_model.name = "New Name"
 
+        session.execute.return_value = scalar_result(1)  # the owner's row
         session.merge = make_merge(updated_model)
         session.flush = AsyncMock()
 
@@ -170,6 +227,7 @@ class TestSaveExistingTrip:
         session = make_session()
         merged_model = make_trip_model(trip_id=7)
 
+        session.execute.return_value = scalar_result(7)
         session.merge = make_merge(merged_model)
         session.flush = AsyncMock()
 
@@ -184,6 +242,149 @@ class TestSaveExistingTrip:
         assert result.id == 7
 
 
+    def test_does_not_merge_another_owners_trip(self):
+        session = make_session()
+        session.execute.return_value = scalar_result(None)
+        session.merge = make_merge(make_trip_model(trip_id=1))
+
+        with pytest.raises(EntityNotFound):
+            asyncio.run(PostgresTripRepository(session).save(make_trip(trip_id=1, owner_id="intruder")))
+
+        session.merge.assert_not_called()
+
+# ---------------------------------------------------------------------------
+# save — tracked trip (loaded through a repository)
+# ---------------------------------------------------------------------------
+
+def make_tracked_session(*returned) -> AsyncMock:
+    """
+    Session for targeted writes: each statement's RETURNING yields the next
+    of ``returned`` (the new trip version, a child id, ...), then 2.
+    """
+    session = make_session()
+    results = [scalar_result(value) for value in returned]
+    session.execute.side_effect = lambda *args: results.pop(0) if results else scalar_result(2)
+    return session
+
+
+class TestSaveTrackedTrip:
+
+    def test_child_status_change_is_two_targeted_updates(self):
+        session = make_tracked_session()
+        trip = make_loaded_trip()
+        trip.update_flight_status("f1", "confirmed")
+
+        asyncio.run(PostgresTripRepository(session).save(trip))
+
+        assert executed_sql(session) == ["UPDATE trips", "UPDATE flights"]
+        flight_update = session.execute.call_args_list[1].args[0]
+        assert flight_update.compile().params == {
+            "status": "confirmed", "id_1": "f1", "trip_id_1": 1, "status_1": "pending",
+        }
+        session.merge.assert_not_called()
+
+    def test_child_status_change_adds_the_spent_delta_and_bumps_the_version(self):
+        session = make_tracked_session()
+        trip = make_loaded_trip()
+        trip.update_flight_status("f1", "confirmed")
+
+        asyncio.run(PostgresTripRepository(session).save(trip))
+
+        trip_update = session.execute.call_args_list[0].args[0]
+        sql = str(trip_update)
+        assert "budget_spent_amount=(coalesce(trips.budget_spent_amount" in sql
+        assert "version=(trips.version +" in sql
+        assert "budget_total_amount" not in sql
+        assert Decimal("150") in trip_update.compile().params.values()
+        assert trip.version == 2
+
+    def test_raises_concurrent_modification_when_version_is_stale(self):
+        session = make_tracked_session(None, 1)  # no row updated, but the owner's trip exists
+        trip = make_loaded_trip()
+        trip.name = "Renamed"
+
+        with pytest.raises(ConcurrentModification):
+            asyncio.run(PostgresTripRepository(session).save(trip))
+
+        assert executed_sql(session) == ["UPDATE trips", "SELECT trips"]
+
+    def test_raises_concurrent_modification_when_child_status_moved(self):
+        session = make_tracked_session(2, None)  # child no longer in the loaded status
+        trip = make_loaded_trip()
+        trip.update_flight_status("f1", "confirmed")
+
+        with pytest.raises(ConcurrentModification) as exc_info:
+            asyncio.run(PostgresTripRepository(session).save(trip))
+
+        assert exc_info.value.entity_type == "Flight"
+        assert exc_info.value.entity_id == "f1"
+
+    def test_added_and_removed_children_are_inserted_and_deleted(self):
+        session = make_tracked_session()
+        trip = make_loaded_trip()
+        trip.remove_flight("f2")
+        trip.add_flight(make_flight("f3"))
+
+        asyncio.run(PostgresTripRepository(session).save(trip))
+
+        assert executed_sql(session) == ["UPDATE trips", "DELETE flights", "INSERT flights"]
+        deleted = session.execute.call_args_list[1].args[0]
+        assert "flights.trip_id = " in str(deleted)
+        assert list(deleted.compile().params.values()) == [["f2"], 1]
+        [rows] = session.execute.call_args_list[2].args[1:]
+        assert [row["id_"] for row in rows] == ["f3"] and rows[0]["trip_id"] == 1
+
+    def test_trip_update_is_scoped_to_the_owner(self):
+        session = make_tracked_session()
+        trip = make_loaded_trip()
+        trip.name = "Renamed"
+
+        asyncio.run(PostgresTripRepository(session).save(trip))
+
+        trip_update = session.execute.call_args_list[0].args[0]
+        assert "trips.owner_id = " in str(trip_update)
+        assert "trips.version = " in str(trip_update)
+        assert "RETURNING trips.version" in str(trip_update)
+        assert "user-1" in trip_update.compile().params.values()
+
+    def test_raises_entity_not_found_when_owned_row_is_gone(self):
+        session = make_tracked_session(None, None)
+        trip = make_loaded_trip()
+        trip.update_flight_status("f1", "confirmed")
+
+        with pytest.raises(EntityNotFound):
+            asyncio.run(PostgresTripRepository(session).save(trip))
+
+        assert executed_sql(session) == ["UPDATE trips", "SELECT trips"]
+
+    def test_unchanged_trip_issues_no_statements(self):
+        session = make_tracked_session()
+
+        asyncio.run(PostgresTripRepository(session).save(make_loaded_trip()))
+
+        session.execute.assert_not_called()
+
+    def test_saved_trip_is_clean_again(self):
+        session = make_tracked_session()
+        trip = make_loaded_trip()
+        trip.name = "Renamed"
+
+        asyncio.run(PostgresTripRepository(session).save(trip))
+
+        assert not trip.changes()
+
+    def test_stale_orm_graph_is_dropped_from_the_session(self):
+        session = make_tracked_session()
+        model = make_trip_model(trip_id=1)
+        session.identity_map = {(TripOrm, (1,), None): model}
+        trip = make_loaded_trip()
+        trip.name = "Renamed"
+
+        asyncio.run(PostgresTripRepository(session).save(trip))
+
+        session.expunge.assert_called_once_with(model)
+
+
 # ---------------------------------------------------------------------------
 # find_by_id
 # ---------------------------------------------------------------------------
@@ -208,6 +409,35 @@ class TestFindById:
 
         assert result is None
 
+    def test_stored_spent_is_trusted_without_a_recompute(self):
+        session = make_session()
+        model = make_trip_model(trip_id=1)
+        model.budget_total_amount = Decimal("1000.00")
+        model.budget_total_currency = "USD"
+        model.budget_spent_amount = Decimal("450.00")  # no committed children
+        model.budget_spent_currency = "USD"
+        session.execute = AsyncMock(return_value=scalar_result(model))
+
+        result = asyncio.run(PostgresTripRepository(session).find_by_id(1))
+
+        assert result.budget.spent.amount == Decimal("450.00")
+        assert not result.changes()
+
+    def test_missing_stored_spent_is_computed_and_left_dirty(self):
+        session = make_session()
+        trip = make_trip(trip_id=1)
+        trip.flights = [make_flight("f1", status="confirmed", price=Decimal("150"))]
+        trip.budget = Budget(total=Money(Decimal("1000.00")), spent=Money.zero())
+        model = TripOrmMapper.to_model(trip)
+        model.budget_spent_amount = None
+        model.budget_spent_currency = None
+        session.execute = AsyncMock(return_value=scalar_result(model))
+
+        result = asyncio.run(PostgresTripRepository(session).find_by_id(1))
+
+        assert result.budget.spent.amount == Decimal("150")
+        assert set(result.changes().fields) == {"budget"}
+
 
 # ---------------------------------------------------------------------------
 # find_by_owner
@@ -258,6 +488,186 @@ class TestFindAllByOwner:
         assert result == []
 
 
+# ---------------------------------------------------------------------------
+# find_summaries_by_owner
+# ---------------------------------------------------------------------------
+
+class TestFindSummariesByOwner:
+
+    def test_single_column_query_without_loading_children(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=mappings_result([summary_row()]))
+
+        asyncio.run(PostgresTripRepository(session).find_summaries_by_owner("user-1"))
+
+        session.execute.assert_called_once()
+        statement = session.execute.call_args.args[0]
+        # columns only: selecting no ORM entity means no selectin child loads
+        assert all(d["type"] is not TripOrm for d in statement.column_descriptions)
+        sql = str(statement)
+        assert sql.count("count(*)") == 4
+        # spent comes from the trigger-maintained totals, not the children
+        assert "sum(trip_category_spend.spent_amount)" in sql
+        assert "flights.price_amount" not in sql
+
+    def test_maps_counts_and_budget_totals(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=mappings_result([summary_row()]))
+
+        [summary] = asyncio.run(
+            PostgresTripRepository(session).find_summaries_by_owner("user-1")
+        ).items
+
+        assert summary.id == 1
+        assert summary.status == TripStatus.PLANNING
+        assert (summary.traveler_count, summary.flight_count, summary.activity_count) == (2, 1, 3)
+        assert summary.budget_total.amount == Decimal("2000.00")
+        assert summary.budget_spent.amount == Decimal("450.00")
+        assert summary.budget_spent.currency == "EUR"
+
+    def test_no_budget_totals_when_trip_has_no_budget(self):
+        session = make_session()
+        row = summary_row(budget_total_amount=None, budget_total_currency=None)
+        session.execute = AsyncMock(return_value=mappings_result([row]))
+
+        [summary] = asyncio.run(
+            PostgresTripRepository(session).find_summaries_by_owner("user-1")
+        ).items
+
+        assert summary.budget_total is None
+        assert summary.budget_spent is None
+
+
+# ---------------------------------------------------------------------------
+# find_category_spend
+# ---------------------------------------------------------------------------
+
+def rows_result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class TestFindCategorySpend:
+
+    def test_one_owner_scoped_query_on_the_totals_table(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=rows_result([("USD", None, None)]))
+
+        asyncio.run(PostgresTripRepository(session).find_category_spend(1, "user-1"))
+
+        session.execute.assert_called_once()
+        sql = str(session.execute.call_args.args[0])
+        assert "LEFT OUTER JOIN trip_category_spend" in sql
+        assert "trips.owner_id = " in sql
+        assert "flights" not in sql and "activities" not in sql
+
+    def test_maps_rows_in_the_trip_currency(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=rows_result([
+            ("EUR", "flights", Decimal("300.00")),
+            ("EUR", "food", Decimal("42.50")),
+        ]))
+
+        spend = asyncio.run(PostgresTripRepository(session).find_category_spend(1, "user-1"))
+
+        assert [(s.category, s.spent.amount, s.spent.currency) for s in spend] == [
+            ("flights", Decimal("300.00"), "EUR"),
+            ("food", Decimal("42.50"), "EUR"),
+        ]
+
+    def test_owned_trip_without_committed_spend_is_empty(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=rows_result([(None, None, None)]))
+
+        spend = asyncio.run(PostgresTripRepository(session).find_category_spend(1, "user-1"))
+
+        assert spend == []
+
+    def test_returns_none_when_not_found_or_not_owned(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=rows_result([]))
+
+        spend = asyncio.run(PostgresTripRepository(session).find_category_spend(1, "other"))
+
+        assert spend is None
+
+
+# ---------------------------------------------------------------------------
+# keyset pagination
+# ---------------------------------------------------------------------------
+
+class TestTripPagination:
+
+    def test_fetches_one_extra_row_after_the_cursor(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=mappings_result([]))
+        query = TripQuery(limit=20, after=TripCursor(date(2025, 7, 1), 9))
+
+        asyncio.run(PostgresTripRepository(session).find_summaries_by_owner("user-1", query))
+
+        sql = str(session.execute.call_args.args[0])
+        assert "(trips.start_date, trips.id) > (" in sql
+        assert "ORDER BY trips.start_date, trips.id" in sql
+        assert "LIMIT" in sql and "OFFSET" not in sql
+        assert session.execute.call_args.args[0]._limit == 21
+
+    def test_next_cursor_points_at_the_last_returned_trip(self):
+        session = make_session()
+        rows = [summary_row(id=i, start_date=date(2025, 7, i)) for i in (1, 2, 3)]
+        session.execute = AsyncMock(return_value=mappings_result(rows))
+
+        page = asyncio.run(
+            PostgresTripRepository(session).find_summaries_by_owner("user-1", TripQuery(limit=2))
+        )
+
+        assert [s.id for s in page.items] == [1, 2]
+        assert page.next_cursor == TripCursor(date(2025, 7, 2), 2)
+        assert page.total is None
+
+    def test_applies_filters(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=mappings_result([]))
+        query = TripQuery(
+            status=TripStatus.CONFIRMED,
+            destination="barc",
+            date_from=date(2025, 7, 1),
+            date_to=date(2025, 8, 1),
+        )
+
+        asyncio.run(PostgresTripRepository(session).find_summaries_by_owner("user-1", query))
+
+        sql = str(session.execute.call_args.args[0])
+        assert "trips.status = " in sql
+        assert "trips.destination" in sql and "LIKE" in sql
+        assert "trips.end_date >= " in sql and "trips.start_date <= " in sql
+
+    def test_total_only_counted_on_demand(self):
+        session = make_session()
+        count = MagicMock()
+        count.scalar_one.return_value = 57
+        session.execute = AsyncMock(side_effect=[mappings_result([summary_row()]), count])
+
+        page = asyncio.run(PostgresTripRepository(session).find_summaries_by_owner(
+            "user-1", TripQuery(limit=1, include_total=True)
+        ))
+
+        assert page.total == 57
+        assert "count(*)" in str(session.execute.call_args_list[1].args[0])
+
+    def test_full_trip_page(self):
+        session = make_session()
+        models = [make_trip_model(trip_id=1), make_trip_model(trip_id=2)]
+        session.execute = AsyncMock(return_value=scalars_result(models))
+
+        page = asyncio.run(
+            PostgresTripRepository(session).find_page_by_owner("user-1", TripQuery(limit=1))
+        )
+
+        assert [t.id for t in page.items] == [1]
+        assert page.next_cursor == TripCursor(date(2025, 7, 1), 1)
+
+
 # ---------------------------------------------------------------------------
 # delete
 # ---------------------------------------------------------------------------
@@ -306,3 +716,71 @@ class TestExists:
         result = asyncio.run(PostgresTripRepository(session).exists(999))
 
         assert result is False
+
+
+# ---------------------------------------------------------------------------
+# update_status
+# ---------------------------------------------------------------------------
+
+class TestUpdateStatus:
+
+    def test_returns_updated_domain_trip(self):
+        session = make_session()
+        model = make_trip_model(trip_id=1)
+        model.status = "confirmed"
+        session.execute = AsyncMock(return_value=scalar_result(model))
+
+        result = asyncio.run(PostgresTripRepository(session).update_status(1, "user-1", "confirmed"))
+
+        assert isinstance(result, Trip)
+        assert result.status == TripStatus.CONFIRMED
+
+    def test_is_a_single_owner_scoped_update_returning_the_trip(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=scalar_result(make_trip_model(trip_id=1)))
+
+        asyncio.run(PostgresTripRepository(session).update_status(1, "user-1", "confirmed"))
+
+        session.execute.assert_called_once()
+        statement = str(session.execute.call_args.args[0])
+        assert statement.startswith("UPDATE trips")
+        assert "trips.owner_id = " in statement
+        assert "RETURNING" in statement
+
+    def test_returns_none_when_not_found_or_not_owned(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=scalar_result(None))
+
+        result = asyncio.run(PostgresTripRepository(session).update_status(1, "other", "confirmed"))
+
+        assert result is None
+
+
+# ---------------------------------------------------------------------------
+# reconcile_budgets
+# ---------------------------------------------------------------------------
+
+class TestReconcileBudgets:
+
+    def test_fix_is_one_update_against_the_committed_totals(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=rows_result([(7, 3), (2, 5)]))
+
+        drifted = asyncio.run(PostgresTripRepository(session).reconcile_budgets())
+
+        assert drifted == [(2, 5), (7, 3)]
+        session.execute.assert_called_once()
+        statement = str(session.execute.call_args.args[0])
+        assert statement.startswith("UPDATE trips")
+        assert "IS DISTINCT FROM (SELECT" in statement
+        assert "trip_category_spend" in statement
+        assert "version=(trips.version + " in statement
+
+    def test_check_only_selects(self):
+        session = make_session()
+        session.execute = AsyncMock(return_value=rows_result([(7, 2)]))
+
+        drifted = asyncio.run(PostgresTripRepository(session).reconcile_budgets(fix=False))
+
+        assert drifted == [(7, 2)]
+        assert executed_sql(session) == ["SELECT trips"]